@@ -0,0 +1,246 @@
+#  The AssetManager class.
+#  Loads the game's images, sounds and fonts once each, and can load them in the background ahead of time.
+
+import os
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Optional, Union
+
+import pygame
+
+import crawler.customlogger as customlogger
+
+#  A loaded image or sound.
+
+Asset = Union[pygame.Surface, pygame.mixer.Sound]
+
+
+class AssetManager:
+    """AssetManager
+
+    The AssetManager keeps every image and sound it has loaded, keyed by path, and every font, keyed by name and size,
+    so each is only loaded once however many times it is asked for.
+
+    Images and sounds can be preloaded by a worker thread, while the splash and intro screens are shown.
+    Asking for one that is still loading waits for it, and asking for one that was never preloaded loads it there and then.
+    Images are converted to the display's pixel format, on the main thread, the first time they are asked for
+    once there is a display, so they blit quickly.
+    """
+
+    def __init__(self) -> None:
+        """__init__
+
+        Initialise the AssetManager.
+        """
+
+        #  The loaded assets, and the ones still loading.
+
+        self._assets: dict[str, Asset] = {}
+        self._loading: dict[str, Future[tuple[Asset, float]]] = {}
+
+        #  The images that have been converted to the display's pixel format.
+
+        self._converted: set[str] = set()
+
+        #  The tinted copies of images, by path and tint.
+
+        self._tinted: dict[tuple[str, tuple[int, int, int]], pygame.Surface] = {}
+
+        #  The fonts, by name and size.
+
+        self._fonts: dict[tuple[str, int], pygame.font.Font] = {}
+
+        #  The worker that preloads, started the first time it is needed.
+
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+        #  Asked for and already loaded, asked for and loaded there and then, and the time spent loading;
+        #  the time is only added on the main thread, as the assets are collected, so the worker never writes to it.
+
+        self.hits: int = 0
+        self.misses: int = 0
+        self.waits: int = 0
+        self.load_time: float = 0
+
+    # HELPER METHODS ##########################################################
+
+    def load(self, path: str, volume: Optional[float]) -> tuple[Asset, float]:
+        """load
+
+        Loads an image or sound, on whichever thread calls it, and times it.
+
+        Args:
+            path (str): the file.
+            volume (Optional[float]): the volume to set a sound to, if any.
+
+        Returns:
+            tuple[Asset, float]: the image or sound, and the seconds it took to load.
+        """
+
+        _start: float = time.perf_counter()
+
+        _asset: Asset
+        if os.path.splitext(path)[1].lower() in (".wav", ".ogg", ".mp3"):
+            _asset = pygame.mixer.Sound(path)
+            if volume is not None:
+                _asset.set_volume(volume)
+        else:
+            _asset = pygame.image.load(path)
+
+        return (_asset, time.perf_counter() - _start)
+
+    def get(self, path: str, volume: Optional[float] = None) -> Asset:
+        """get
+
+        Gets an image or sound, waiting for it if it is being preloaded, or loading it if not.
+
+        Args:
+            path (str): the file.
+            volume (Optional[float]): the volume to set a sound to, when it is loaded. Defaults to None.
+
+        Returns:
+            Asset: the image or sound.
+        """
+
+        _asset: Optional[Asset] = self._assets.get(path)
+
+        if _asset is not None:
+            self.hits += 1
+            return _asset
+
+        _future: Optional[Future[tuple[Asset, float]]] = self._loading.pop(path, None)
+        _seconds: float
+
+        if _future is not None:
+            if not _future.done():
+                self.waits += 1
+            _asset, _seconds = _future.result()
+            self.hits += 1
+        else:
+            _asset, _seconds = self.load(path, volume)
+            self.misses += 1
+
+        self.load_time += _seconds
+        self._assets[path] = _asset
+
+        return _asset
+
+    # ASSET METHODS ###########################################################
+
+    def preload(self, paths: list[str], volume: Optional[float] = None) -> None:
+        """preload
+
+        Starts loading images or sounds in the background, unless they are loaded or loading already.
+
+        Args:
+            paths (list[str]): the files.
+            volume (Optional[float]): the volume to set the sounds to. Defaults to None.
+        """
+
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(1, thread_name_prefix="assets")
+
+        for _path in paths:
+            if _path not in self._assets and _path not in self._loading:
+                self._loading[_path] = self._executor.submit(self.load, _path, volume)
+
+    def image(self, path: str, tint: Optional[tuple[int, int, int]] = None) -> pygame.Surface:
+        """image
+
+        Gets an image, converted to the display's pixel format if there is a display, and tinted if need be.
+        The image is shared, so it must not be drawn on.
+
+        Args:
+            path (str): the file.
+            tint (Optional[tuple[int, int, int]]): the colour to multiply the image by, if any. Defaults to None.
+
+        Returns:
+            pygame.Surface: the image.
+        """
+
+        _image: pygame.Surface = self.get(path)  # type: ignore
+
+        if path not in self._converted and pygame.display.get_surface() is not None:
+            _image = _image.convert_alpha()
+            self._assets[path] = _image
+            self._converted.add(path)
+
+        if tint is None:
+            return _image
+
+        _tinted: Optional[pygame.Surface] = self._tinted.get((path, tint))
+
+        if _tinted is None:
+            _tinted = _image.copy()
+            _tinted.fill(tint, special_flags=pygame.BLEND_RGB_MULT)
+            self._tinted[(path, tint)] = _tinted
+
+        return _tinted
+
+    def sound(self, path: str, volume: Optional[float] = None) -> pygame.mixer.Sound:
+        """sound
+
+        Gets a sound. The sound is shared by everything that plays the file.
+
+        Args:
+            path (str): the file.
+            volume (Optional[float]): the volume to set the sound to, if it has to be loaded. Defaults to None.
+
+        Returns:
+            pygame.mixer.Sound: the sound.
+        """
+        return self.get(path, volume)  # type: ignore
+
+    def font(self, name: str, size: int) -> pygame.font.Font:
+        """font
+
+        Gets a system font, creating it if it hasn't been already.
+
+        Args:
+            name (str): the font name.
+            size (int): the font size.
+
+        Returns:
+            pygame.font.Font: the font.
+        """
+
+        _font: Optional[pygame.font.Font] = self._fonts.get((name, size))
+
+        if _font is not None:
+            self.hits += 1
+            return _font
+
+        _start: float = time.perf_counter()
+        _font = pygame.font.SysFont(name, size)
+        self.load_time += time.perf_counter() - _start
+        self.misses += 1
+
+        self._fonts[(name, size)] = _font
+
+        return _font
+
+    def stats(self) -> dict[str, Any]:
+        """stats
+
+        Gets the current state of the AssetManager.
+
+        Returns:
+            dict[str, Any]: the number of assets loaded and loading, the hits, misses and waits, and the load time.
+        """
+        return {
+            "assets": len(self._assets) + len(self._tinted) + len(self._fonts),
+            "loading": sum(1 for _future in self._loading.values() if not _future.done()),
+            "hits": self.hits,
+            "misses": self.misses,
+            "waits": self.waits,
+            "load_time": round(self.load_time, 3),
+        }
+
+    def log_stats(self) -> None:
+        #  Logs the current state of the AssetManager.
+        customlogger.log_message(f"Assets: {self.stats()}", customlogger.Levels.INFO)
+
+
+#  The asset manager shared by the whole game.
+
+asset_manager: AssetManager = AssetManager()
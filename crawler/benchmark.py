@@ -0,0 +1,398 @@
+#  The benchmark.py file times the game's fast paths against the code they stand in for, without a display;
+#  e.g. python -m crawler.benchmark fleet --crawlers 9 --large 5000
+
+import argparse
+import os
+import time
+import tracemalloc
+from typing import Optional
+
+import numpy as np
+import pygame
+
+import crawler.constants as c
+from crawler.asset_manager import AssetManager
+from crawler.crawler.fleet import Fleet
+from crawler.crawler.flow import solve, solve_array
+from crawler.crawler.kinematics import BOTTOM, LEFT, RIGHT, TOP, Kinematics
+from crawler.crawler.lod import LODScheduler
+from crawler.crawler.modules.reporting.log import Journal
+from crawler.crawler.rotation_atlas import RotationAtlas
+from crawler.crawler.scheduler import SystemScheduler
+from crawler.crawler.system import System
+from crawler.sim import Simulation
+
+
+def assets(options: argparse.Namespace) -> None:
+    """assets
+
+    Times preloading the game's images and sounds with an AssetManager, then asking for each of them.
+
+    Args:
+        options (argparse.Namespace): the number of times each file is asked for.
+    """
+
+    _paths: list[str] = sorted(
+        os.path.join(_directory, _file)
+        for _directory, _, _files in os.walk(os.path.join(os.path.dirname(__file__), "assets"))
+        for _file in _files
+        if os.path.splitext(_file)[1].lower() in (".png", ".wav")
+    )
+
+    pygame.mixer.init()
+
+    _manager: AssetManager = AssetManager()
+
+    _start: float = time.perf_counter()
+    _manager.preload(_paths)
+    _preloaded: float = time.perf_counter() - _start
+
+    _start = time.perf_counter()
+    for _ in range(options.repeats):
+        for _path in _paths:
+            _manager.get(_path)
+    _asked: float = time.perf_counter() - _start
+
+    print(
+        f"{len(_paths)} files, asked for {options.repeats} times each: preload returned in {_preloaded * 1000:.1f}ms,"
+        f" every request answered in {_asked * 1000:.1f}ms, {_manager.stats()}"
+    )
+
+
+def atlas(options: argparse.Namespace) -> None:
+    """atlas
+
+    Times rotating the crawler frames each time they are drawn, and getting them from a RotationAtlas.
+
+    Args:
+        options (argparse.Namespace): the number of crawlers and frames.
+    """
+
+    #  Stand in frames the size of the crawler images. Each crawler drives straight for a few seconds,
+    #  cycling through its frames, then turns for a second, at its own pace.
+
+    _images: list[pygame.Surface] = [pygame.Surface((64, 64), pygame.SRCALPHA) for _ in range(c.CRAWLER_FRAME_COUNT)]
+    _angles: list[list[int]] = [
+        [
+            (_frame // 400 * 100 + min(_frame % 400, 80)) * (_crawler + 1) * 3 // 4 % 360
+            for _frame in range(options.frames)
+        ]
+        for _crawler in range(options.crawlers)
+    ]
+
+    _start: float = time.perf_counter()
+    for _frame in range(options.frames):
+        for _crawler in range(options.crawlers):
+            pygame.transform.rotate(_images[_frame % c.CRAWLER_FRAME_COUNT], _angles[_crawler][_frame])
+    _rotated: float = time.perf_counter() - _start
+
+    _atlas: RotationAtlas = RotationAtlas()
+    _start = time.perf_counter()
+    for _frame in range(options.frames):
+        for _crawler in range(options.crawlers):
+            _atlas.get_image(
+                f"crawler{_crawler % 2}",
+                _frame % c.CRAWLER_FRAME_COUNT,
+                _images[_frame % c.CRAWLER_FRAME_COUNT],
+                _angles[_crawler][_frame],
+            )
+    _cached: float = time.perf_counter() - _start
+
+    _draws: int = options.frames * options.crawlers
+    print(
+        f"{options.crawlers} crawlers, {options.frames} frames: rotate {_rotated / _draws * 1e6:.1f}us,"
+        f" atlas {_cached / _draws * 1e6:.1f}us a crawler, {_atlas.stats()}"
+    )
+
+
+def fleet(options: argparse.Namespace) -> None:
+    """fleet
+
+    Times updating the systems of a fleet one at a time, with System.update, and all at once, with a Fleet.
+
+    Args:
+        options (argparse.Namespace): the number of crawlers, and of crawlers in the large fleet.
+    """
+
+    for _size in (options.crawlers, options.large):
+        _systems: list[System] = [System() for _ in range(_size)]
+        _fleet: Fleet = Fleet.from_systems(_systems)
+
+        _start: float = time.perf_counter()
+        for _system in _systems:
+            _system.update()
+        _objects: float = time.perf_counter() - _start
+
+        _start = time.perf_counter()
+        _fleet.step()
+        _arrays: float = time.perf_counter() - _start
+
+        print(f"{_size} crawlers: System.update {_objects * 1000:.2f}ms, Fleet.step {_arrays * 1000:.2f}ms")
+
+
+def flow(options: argparse.Namespace) -> None:
+    """flow
+
+    Times resolving supplies that can't meet every request, one at a time with solve, and all at once with solve_array.
+
+    Args:
+        options (argparse.Namespace): the number of supplies.
+    """
+
+    _random: np.random.Generator = np.random.default_rng(0)
+    _level: np.ndarray = _random.integers(0, 100, size=options.supplies)
+    _lowest: np.ndarray = np.zeros(options.supplies, dtype=np.int64)
+    _highest: np.ndarray = np.full(options.supplies, 100, dtype=np.int64)
+    _accepts: np.ndarray = np.ones(options.supplies, dtype=bool)
+    _withdrawal: np.ndarray = _random.integers(0, 30, size=(options.supplies, 8))
+    _withdrawal_essential: np.ndarray = _random.random((options.supplies, 8)) < 0.5
+    _deposit: np.ndarray = _random.integers(0, 30, size=(options.supplies, 8))
+    _deposit_essential: np.ndarray = _random.random((options.supplies, 8)) < 0.5
+
+    _start: float = time.perf_counter()
+    for _row in range(options.supplies):
+        solve(
+            int(_level[_row]),
+            (0, 100),
+            True,
+            list(zip(_withdrawal[_row].tolist(), _withdrawal_essential[_row].tolist())),
+            list(zip(_deposit[_row].tolist(), _deposit_essential[_row].tolist())),
+        )
+    _lists: float = time.perf_counter() - _start
+
+    _start = time.perf_counter()
+    solve_array(
+        _level, _lowest, _highest, _accepts, _withdrawal, _withdrawal_essential, _deposit, _deposit_essential
+    )
+    _arrays: float = time.perf_counter() - _start
+
+    print(f"{options.supplies} supplies: solve {_lists * 1000:.2f}ms, solve_array {_arrays * 1000:.2f}ms")
+
+
+def journal(options: argparse.Namespace) -> None:
+    """journal
+
+    Times logging messages to a Journal.
+
+    Args:
+        options (argparse.Namespace): the number of messages.
+    """
+
+    _journal: Journal = Journal()
+    _start: float = time.perf_counter()
+    for _index in range(options.messages):
+        _journal.log(f"Module {_index % 6 + 1}", f"Message {_index % 5}", 50, _index % 4)
+    _logged: float = time.perf_counter() - _start
+
+    print(
+        f"{options.messages} messages: {_logged / options.messages * 1e6:.2f}us each,"
+        f" {len(_journal)} kept of {_journal.capacity}"
+    )
+
+
+def kinematics(options: argparse.Namespace) -> None:
+    """kinematics
+
+    Times moving crawlers one at a time with Vector2, as Crawler used to, and all at once with a Kinematics.
+
+    Args:
+        options (argparse.Namespace): the number of crawlers and steps.
+    """
+
+    _kinematics: Kinematics = Kinematics()
+    _rows: np.ndarray = np.array([_kinematics.add() for _ in range(options.crawlers)])
+    _kinematics.position[_rows] = 1000
+    _kinematics.rot[_rows] = _rows % 360
+    _kinematics.moving[_rows] = True
+    _dt: np.ndarray = np.full(options.crawlers, c.SIMULATION_STEP)
+
+    _start: float = time.perf_counter()
+    for _ in range(options.steps):
+        _kinematics.integrate(_rows, _dt)
+    _arrays: float = time.perf_counter() - _start
+
+    _positions: list[pygame.Vector2] = [pygame.Vector2(1000, 1000) for _ in range(options.crawlers)]
+    _start = time.perf_counter()
+    for _ in range(options.steps):
+        for _index, _position in enumerate(_positions):
+            _position += pygame.Vector2(100, 0).rotate(-(_index % 360)) * c.SIMULATION_STEP
+            _position.x = min(max(_position.x, LEFT), RIGHT)
+            _position.y = min(max(_position.y, TOP), BOTTOM)
+    _vectors: float = time.perf_counter() - _start
+
+    print(
+        f"{options.crawlers} crawlers, {options.steps} steps: Vector2 {_vectors / options.steps * 1e6:.1f}us,"
+        f" Kinematics {_arrays / options.steps * 1e6:.1f}us a step"
+    )
+
+
+def lod(options: argparse.Namespace) -> None:
+    """lod
+
+    Times the crawlers on the map with a LODScheduler, standing still and dispatched, all in view and with only one.
+
+    Args:
+        options (argparse.Namespace): the number of frames and crawlers.
+    """
+
+    for _mode in ("stationary", "dispatched"):
+        for _margin in (10**9, 0):
+            _simulation: Simulation = Simulation(crawlers=options.crawlers)
+            if _mode == "dispatched":
+                _simulation.dispatch(c.MAP_OBJECT_SALVAGE)
+
+            #  With a huge margin every crawler is in view, with none only the selected crawler.
+
+            _lod: LODScheduler = LODScheduler(_simulation.crawlers, margin=_margin)
+
+            _start: float = time.perf_counter()
+            for _ in range(options.frames):
+                _lod.update(_simulation.clock, _simulation.clock.advance(1 / 60), pygame.Rect(0, 0, 1, 1), 0)
+                if _simulation.dispatcher is not None:
+                    _simulation.dispatcher.update()
+            _elapsed: float = time.perf_counter() - _start
+
+            _simulation.stop()
+
+            print(
+                f"{_mode}, {'all' if _margin else 'one'} in view: {_elapsed / options.frames * 1e6:.0f}us a frame"
+                f" for {len(_simulation.crawlers)} crawlers, {_lod.stats()}"
+            )
+
+
+def scheduler(options: argparse.Namespace) -> None:
+    """scheduler
+
+    Times moving a system on with System.update, one update at a time, and with a SystemScheduler.
+
+    Args:
+        options (argparse.Namespace): the number of updates.
+    """
+
+    _system: System = System()
+    _start: float = time.perf_counter()
+    for _ in range(options.updates):
+        _system.update()
+    _plain: float = time.perf_counter() - _start
+
+    _scheduler: SystemScheduler = SystemScheduler(System())
+    _start = time.perf_counter()
+    _scheduler.advance(options.updates)
+    _scheduled: float = time.perf_counter() - _start
+
+    print(
+        f"{options.updates} updates: System.update {_plain * 1000:.1f}ms,"
+        f" SystemScheduler {_scheduled * 1000:.1f}ms ({_scheduler.updates} run, {_scheduler.skipped} skipped)"
+    )
+
+
+def system(options: argparse.Namespace) -> None:
+    """system
+
+    Measures a system's memory, and times System.update, and long_report built and cached.
+
+    Args:
+        options (argparse.Namespace): the number of systems to measure, and of updates to time.
+    """
+
+    System()
+
+    tracemalloc.start()
+    _before: int = tracemalloc.get_traced_memory()[0]
+    _systems: list[System] = [System() for _ in range(options.systems)]
+    _memory: float = (tracemalloc.get_traced_memory()[0] - _before) / options.systems
+    tracemalloc.stop()
+
+    _system: System = _systems[0]
+    _runs: int = options.updates // 5
+
+    #  Take the best of five runs of each, as the timings are noisy.
+
+    _update: float = float("inf")
+    _report: float = float("inf")
+    _cached: float = float("inf")
+
+    for _ in range(5):
+        _start: float = time.perf_counter()
+        for _ in range(_runs):
+            _system.update()
+        _update = min(_update, (time.perf_counter() - _start) / _runs)
+
+        _start = time.perf_counter()
+        for _ in range(_runs):
+            _system.changed()
+            _system.long_report()
+        _report = min(_report, (time.perf_counter() - _start) / _runs)
+
+        _start = time.perf_counter()
+        for _ in range(_runs):
+            _system.long_report()
+        _cached = min(_cached, (time.perf_counter() - _start) / _runs)
+
+    print(
+        f"{_memory / 1024:.1f}KiB a system, System.update {_update * 1e6:.1f}us,"
+        f" long_report {_report * 1e6:.1f}us built, {_cached * 1e6:.2f}us cached"
+    )
+
+
+def main(args: Optional[list[str]] = None) -> None:
+    """main
+
+    The benchmark program entry.
+
+    Args:
+        args (Optional[list[str]]): the command line arguments. Defaults to sys.argv.
+    """
+
+    _parser: argparse.ArgumentParser = argparse.ArgumentParser(
+        prog="python -m crawler.benchmark", description="Time the game's fast paths against the code they stand in for."
+    )
+    _benchmarks = _parser.add_subparsers(dest="benchmark", required=True)
+
+    _assets: argparse.ArgumentParser = _benchmarks.add_parser("assets", help="preloading and asking for the assets")
+    _assets.add_argument("--repeats", type=int, default=9, help="number of times each file is asked for")
+    _assets.set_defaults(run=assets)
+
+    _atlas: argparse.ArgumentParser = _benchmarks.add_parser("atlas", help="rotating frames against a RotationAtlas")
+    _atlas.add_argument("--crawlers", type=int, default=9, help="number of crawlers")
+    _atlas.add_argument("--frames", type=int, default=2000, help="number of frames")
+    _atlas.set_defaults(run=atlas)
+
+    _fleet: argparse.ArgumentParser = _benchmarks.add_parser("fleet", help="System.update against Fleet.step")
+    _fleet.add_argument("--crawlers", type=int, default=9, help="number of crawlers")
+    _fleet.add_argument("--large", type=int, default=5000, help="number of crawlers in the large fleet")
+    _fleet.set_defaults(run=fleet)
+
+    _flow: argparse.ArgumentParser = _benchmarks.add_parser("flow", help="solve against solve_array")
+    _flow.add_argument("--supplies", type=int, default=5000, help="number of supplies")
+    _flow.set_defaults(run=flow)
+
+    _journal: argparse.ArgumentParser = _benchmarks.add_parser("journal", help="logging to a Journal")
+    _journal.add_argument("--messages", type=int, default=10000, help="number of messages")
+    _journal.set_defaults(run=journal)
+
+    _kinematics: argparse.ArgumentParser = _benchmarks.add_parser("kinematics", help="Vector2 against Kinematics")
+    _kinematics.add_argument("--crawlers", type=int, default=120, help="number of crawlers")
+    _kinematics.add_argument("--steps", type=int, default=2000, help="number of steps")
+    _kinematics.set_defaults(run=kinematics)
+
+    _lod: argparse.ArgumentParser = _benchmarks.add_parser("lod", help="the crawlers on the map with a LODScheduler")
+    _lod.add_argument("--frames", type=int, default=2000, help="number of frames")
+    _lod.add_argument("--crawlers", type=int, default=c.DEFAULT_FLEET_SIZE, help="number of crawlers")
+    _lod.set_defaults(run=lod)
+
+    _scheduler: argparse.ArgumentParser = _benchmarks.add_parser("scheduler", help="System.update against SystemScheduler")
+    _scheduler.add_argument("--updates", type=int, default=20000, help="number of updates")
+    _scheduler.set_defaults(run=scheduler)
+
+    _system: argparse.ArgumentParser = _benchmarks.add_parser("system", help="a system's memory, update and report")
+    _system.add_argument("--systems", type=int, default=100, help="number of systems to measure")
+    _system.add_argument("--updates", type=int, default=20000, help="number of updates to time")
+    _system.set_defaults(run=system)
+
+    _options: argparse.Namespace = _parser.parse_args(args)
+    _options.run(_options)
+
+
+if __name__ == "__main__":
+    main()
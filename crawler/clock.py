@@ -0,0 +1,93 @@
+#  The SimulationClock class.
+#  Turns the time between frames into a whole number of fixed simulation steps.
+
+import crawler.constants as c
+
+
+class SimulationClock:
+    """SimulationClock
+
+    The SimulationClock accumulates the time between frames and hands it out as fixed steps,
+    so the simulation runs at the same speed, and gives the same results, whatever the frame rate.
+    Time left over at the end of a frame is kept for the next, and the fraction of a step
+    it represents is used to interpolate what is drawn between the last two steps.
+
+    At most max_steps are run in a frame, so a slow frame can't stall the ones after it,
+    and any time still owed is caught up over the following frames.
+    Only time owed beyond max_backlog, such as after the window has been dragged, is dropped.
+    """
+
+    def __init__(
+        self,
+        step: float = c.SIMULATION_STEP,
+        max_steps: int = c.SIMULATION_MAX_STEPS,
+        max_backlog: float = c.SIMULATION_MAX_BACKLOG,
+    ) -> None:
+        """__init__
+
+        Initialise the SimulationClock.
+
+        Args:
+            step (float): the length of a step, in seconds. Defaults to c.SIMULATION_STEP.
+            max_steps (int): the most steps to run in a frame. Defaults to c.SIMULATION_MAX_STEPS.
+            max_backlog (float): the most time to owe, in seconds. Defaults to c.SIMULATION_MAX_BACKLOG.
+        """
+
+        self.step: float = step
+        self.max_steps: int = max_steps
+        self.max_backlog: float = max_backlog
+
+        #  The speed of the simulation, 2 runs it twice as fast, and 0 pauses it.
+
+        self.speed: float = 1
+
+        self.accumulator: float = 0
+        self.ticks: int = 0
+        self.dropped: float = 0
+
+    @property
+    def alpha(self) -> float:
+        """alpha
+
+        Gets how far the clock is between the last step and the next.
+
+        Returns:
+            float: 0 at the last step, up to 1 at the next.
+        """
+        return min(self.accumulator / self.step, 1)
+
+    @property
+    def time(self) -> float:
+        """time
+
+        Gets the simulation time.
+
+        Returns:
+            float: the time of the last step, in seconds.
+        """
+        return self.ticks * self.step
+
+    def advance(self, dt: float) -> int:
+        """advance
+
+        Adds the time since the last frame, and gets the number of steps to run for it.
+
+        Args:
+            dt (float): delta time.
+
+        Returns:
+            int: the number of steps.
+        """
+
+        self.accumulator += dt * self.speed
+
+        if self.accumulator > self.max_backlog:
+            self.dropped += self.accumulator - self.max_backlog
+            self.accumulator = self.max_backlog
+
+        _steps: int = min(int(self.accumulator / self.step), self.max_steps)
+
+        self.accumulator -= _steps * self.step
+        self.ticks += _steps
+
+        return _steps
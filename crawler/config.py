@@ -7,6 +7,7 @@ import pygame
 
 import crawler.constants as c
 import crawler.customlogger as customlogger
+from crawler.asset_manager import asset_manager
 
 
 class RootConfig:
@@ -34,6 +35,7 @@ class RootConfig:
             #  The config file does not exist, so create it and set the default logging level.
 
             self.root_config["logging"] = {"logging_level": c.DEFAULT_LOGGING_LEVEL}
+            self.root_config["fleet"] = {"size": str(c.DEFAULT_FLEET_SIZE)}
             with open(_filename, "w") as configfile:
                 self.root_config.write(configfile)
 
@@ -51,6 +53,28 @@ class RootConfig:
                 customlogger.Levels.WARNING,
             )
 
+    @property
+    def fleet_size(self) -> int:
+        #  Returns the number of crawlers, from the fleet section, if there is one and it is a whole number above zero.
+
+        try:
+            _size: int = self.root_config.getint("fleet", "size", fallback=c.DEFAULT_FLEET_SIZE)
+        except ValueError:
+            _size = 0
+
+        if _size < 1:
+
+            #  Log the invalid 'fleet/size' entry.
+
+            customlogger.log_message(
+                f"Config file 'fleet/size' entry '{self.root_config.get('fleet', 'size')}' is invalid"
+                f" - default used '{c.DEFAULT_FLEET_SIZE}'.",
+                customlogger.Levels.WARNING,
+            )
+            _size = c.DEFAULT_FLEET_SIZE
+
+        return _size
+
 
 class LayoutConfig:
 
@@ -108,6 +132,41 @@ class LayoutConfig:
         self.buzz_sound_name: str = ""
         self.ambient_sound_name: str = ""
 
+        #  The sound files, which the asset manager loads in the background.
+
+        self.alarm_sound_path: str = ""
+        self.key_sound_path: str = ""
+        self.button_sound_path: str = ""
+        self.scan_sound_path: str = ""
+        self.buzz_sound_path: str = ""
+        self.ambient_sound_path: str = ""
+
+    #  The sounds, waiting for them if they are still loading.
+
+    @property
+    def alarm_sound(self) -> pygame.mixer.Sound:
+        return asset_manager.sound(self.alarm_sound_path)
+
+    @property
+    def key_sound(self) -> pygame.mixer.Sound:
+        return asset_manager.sound(self.key_sound_path)
+
+    @property
+    def button_sound(self) -> pygame.mixer.Sound:
+        return asset_manager.sound(self.button_sound_path)
+
+    @property
+    def scan_sound(self) -> pygame.mixer.Sound:
+        return asset_manager.sound(self.scan_sound_path)
+
+    @property
+    def buzz_sound(self) -> pygame.mixer.Sound:
+        return asset_manager.sound(self.buzz_sound_path, volume=0.3)
+
+    @property
+    def ambient_sound(self) -> pygame.mixer.Sound:
+        return asset_manager.sound(self.ambient_sound_path, volume=0.1)
+
     @customlogger.log_trace(customlogger.Levels.INFO)
     def get_config(self) -> None:
         """get_config
@@ -256,15 +315,15 @@ class LayoutConfig:
 
         #  Generate the required font objects.
 
-        self.font: pygame.font.Font = pygame.font.SysFont(
+        self.font: pygame.font.Font = asset_manager.font(
             self.font_name, self.font_size
         )
 
-        self.small_font_obj: pygame.font.Font = pygame.font.SysFont(
+        self.small_font_obj: pygame.font.Font = asset_manager.font(
             self.font_name, self.font_small_size
         )
 
-        self.large_font_obj: pygame.font.Font = pygame.font.SysFont(
+        self.large_font_obj: pygame.font.Font = asset_manager.font(
             self.font_name, self.font_large_size
         )
 
@@ -659,17 +718,17 @@ class LayoutConfig:
             str: font name.
         """
 
-        self.font: pygame.font.Font = pygame.font.SysFont(
+        self.font: pygame.font.Font = asset_manager.font(
             layout_config["console_layout"]["font"],
             int(layout_config["console_layout"]["font_size"]),
         )
 
-        self.small_font: pygame.font.Font = pygame.font.SysFont(
+        self.small_font: pygame.font.Font = asset_manager.font(
             layout_config["console_layout"]["font"],
             int(layout_config["console_layout"]["font_small_size"]),
         )
 
-        self.large_font: pygame.font.Font = pygame.font.SysFont(
+        self.large_font: pygame.font.Font = asset_manager.font(
             layout_config["console_layout"]["font"],
             int(layout_config["console_layout"]["font_large_size"]),
         )
@@ -692,7 +751,7 @@ class LayoutConfig:
             int: font size.
         """
 
-        self.font: pygame.font.Font = pygame.font.SysFont(
+        self.font: pygame.font.Font = asset_manager.font(
             layout_config["console_layout"]["font"],
             int(layout_config["console_layout"]["font_size"]),
         )
@@ -715,7 +774,7 @@ class LayoutConfig:
             int: font small size.
         """
 
-        self.small_font: pygame.font.Font = pygame.font.SysFont(
+        self.small_font: pygame.font.Font = asset_manager.font(
             layout_config["console_layout"]["font"],
             int(layout_config["console_layout"]["font_small_size"]),
         )
@@ -738,7 +797,7 @@ class LayoutConfig:
             int: font large size.
         """
 
-        self.large_font: pygame.font.Font = pygame.font.SysFont(
+        self.large_font: pygame.font.Font = asset_manager.font(
             layout_config["console_layout"]["font"],
             int(layout_config["console_layout"]["font_large_size"]),
         )
@@ -761,7 +820,7 @@ class LayoutConfig:
             int: font banner size.
         """
 
-        self.banner_font: pygame.font.Font = pygame.font.SysFont(
+        self.banner_font: pygame.font.Font = asset_manager.font(
             layout_config["console_layout"]["font"],
             int(layout_config["console_layout"]["font_banner_size"]),
         )
@@ -1253,7 +1312,7 @@ class LayoutConfig:
         """generate_alarm_sound_name_value
 
         Reads the alarm sound from the layout configuration.
-        Generates the sound object.
+        Starts loading the sound.
 
         Args:
             layout_config (configparser.ConfigParser): the layout configuration.
@@ -1261,14 +1320,13 @@ class LayoutConfig:
         Returns:
             str: alarm_sound name.
         """
-        self.alarm_sound = pygame.mixer.Sound(
-            os.path.join(
-                "crawler",
-                c.DIR_ASSETS,
-                c.DIR_SOUNDS,
-                layout_config["console_layout"]["alarm_sound_name"],
-            )
+        self.alarm_sound_path = os.path.join(
+            "crawler",
+            c.DIR_ASSETS,
+            c.DIR_SOUNDS,
+            layout_config["console_layout"]["alarm_sound_name"],
         )
+        asset_manager.preload([self.alarm_sound_path])
 
         return layout_config["console_layout"]["alarm_sound_name"]
 
@@ -1279,7 +1337,7 @@ class LayoutConfig:
         """generate_scan_sound_name_value
 
         Reads the scan sound from the layout configuration.
-        Generates the soun dobject.
+        Starts loading the sound.
 
         Args:
             layout_config (configparser.ConfigParser): the layout configuration.
@@ -1287,14 +1345,13 @@ class LayoutConfig:
         Returns:
             str: scan_sound name.
         """
-        self.scan_sound = pygame.mixer.Sound(
-            os.path.join(
-                "crawler",
-                c.DIR_ASSETS,
-                c.DIR_SOUNDS,
-                layout_config["console_layout"]["scanner_sound_name"],
-            )
+        self.scan_sound_path = os.path.join(
+            "crawler",
+            c.DIR_ASSETS,
+            c.DIR_SOUNDS,
+            layout_config["console_layout"]["scanner_sound_name"],
         )
+        asset_manager.preload([self.scan_sound_path])
 
         return layout_config["console_layout"]["scanner_sound_name"]
 
@@ -1305,7 +1362,7 @@ class LayoutConfig:
         """generate_key_sound_name_value
 
         Reads the key sound from the layout configuration.
-        Generates the sound object.
+        Starts loading the sound.
 
         Args:
             layout_config (configparser.ConfigParser): the layout configuration.
@@ -1313,14 +1370,13 @@ class LayoutConfig:
         Returns:
             str: key_sound name.
         """
-        self.key_sound = pygame.mixer.Sound(
-            os.path.join(
-                "crawler",
-                c.DIR_ASSETS,
-                c.DIR_SOUNDS,
-                layout_config["console_layout"]["key_sound_name"],
-            )
+        self.key_sound_path = os.path.join(
+            "crawler",
+            c.DIR_ASSETS,
+            c.DIR_SOUNDS,
+            layout_config["console_layout"]["key_sound_name"],
         )
+        asset_manager.preload([self.key_sound_path])
 
         return layout_config["console_layout"]["key_sound_name"]
 
@@ -1331,7 +1387,7 @@ class LayoutConfig:
         """generate_button_sound_name_value
 
         Reads the button sound from the layout configuration.
-        Generates the sound object.
+        Starts loading the sound.
 
         Args:
             layout_config (configparser.ConfigParser): the layout configuration.
@@ -1339,14 +1395,13 @@ class LayoutConfig:
         Returns:
             str: button_sound name.
         """
-        self.button_sound = pygame.mixer.Sound(
-            os.path.join(
-                "crawler",
-                c.DIR_ASSETS,
-                c.DIR_SOUNDS,
-                layout_config["console_layout"]["button_sound_name"],
-            )
+        self.button_sound_path = os.path.join(
+            "crawler",
+            c.DIR_ASSETS,
+            c.DIR_SOUNDS,
+            layout_config["console_layout"]["button_sound_name"],
         )
+        asset_manager.preload([self.button_sound_path])
 
         return layout_config["console_layout"]["button_sound_name"]
 
@@ -1357,7 +1412,7 @@ class LayoutConfig:
         """generate_buzz_sound_name_value
 
         Reads the buzz sound from the layout configuration.
-        Generates the sound object.
+        Starts loading the sound.
 
         Args:
             layout_config (configparser.ConfigParser): the layout configuration.
@@ -1365,15 +1420,13 @@ class LayoutConfig:
         Returns:
             str: buzz_sound name.
         """
-        self.buzz_sound = pygame.mixer.Sound(
-            os.path.join(
-                "crawler",
-                c.DIR_ASSETS,
-                c.DIR_SOUNDS,
-                layout_config["console_layout"]["buzz_sound_name"],
-            )
+        self.buzz_sound_path = os.path.join(
+            "crawler",
+            c.DIR_ASSETS,
+            c.DIR_SOUNDS,
+            layout_config["console_layout"]["buzz_sound_name"],
         )
-        self.buzz_sound.set_volume(0.3)
+        asset_manager.preload([self.buzz_sound_path], volume=0.3)
 
         return layout_config["console_layout"]["buzz_sound_name"]
 
@@ -1384,7 +1437,7 @@ class LayoutConfig:
         """generate_ambient_sound_name_value
 
         Reads the ambient sound from the layout configuration.
-        Generates the sound object.
+        Starts loading the sound.
 
         Args:
             layout_config (configparser.ConfigParser): the layout configuration.
@@ -1392,15 +1445,13 @@ class LayoutConfig:
         Returns:
             str: ambient_sound name.
         """
-        self.ambient_sound = pygame.mixer.Sound(
-            os.path.join(
-                "crawler",
-                c.DIR_ASSETS,
-                c.DIR_MUSIC,
-                layout_config["console_layout"]["ambient_sound_name"],
-            )
+        self.ambient_sound_path = os.path.join(
+            "crawler",
+            c.DIR_ASSETS,
+            c.DIR_MUSIC,
+            layout_config["console_layout"]["ambient_sound_name"],
         )
-        self.ambient_sound.set_volume(0.1)
+        asset_manager.preload([self.ambient_sound_path], volume=0.1)
 
         return layout_config["console_layout"]["ambient_sound_name"]
 
@@ -1,7 +1,7 @@
 #  The Console class.
 
 from random import randint
-from typing import Callable
+from typing import Callable, Mapping
 
 import pygame
 
@@ -25,6 +25,7 @@ from crawler.console.status import Status
 from crawler.console.terminal import Terminal
 from crawler.crawler.system import ModuleInfo
 from crawler.map.map_manager import MapManager
+from crawler.map.object_registry import ObjectRegistry
 from crawler.terminal.terminal_manager import TerminalManager
 
 
@@ -38,11 +39,14 @@ class Console:
     """
 
     @customlogger.log_trace(customlogger.Levels.INFO)
-    def __init__(self, quit: Callable[[], None]) -> None:
+    def __init__(self, quit: Callable[[], None], fleet_size: int = c.DEFAULT_FLEET_SIZE) -> None:
         """__init__
 
         Initialises the Console.
 
+        Args:
+            quit (Callable[[], None]): the method to quit the game.
+            fleet_size (int): the number of crawlers. Defaults to c.DEFAULT_FLEET_SIZE.
         """
 
         #  Save quit method.
@@ -86,11 +90,15 @@ class Console:
         self.scanning: bool = False
         self.last_scan_mode: str = "p"
 
+        #  The scanner finds its targets in the map object registry.
+
+        self.registry: ObjectRegistry = ObjectRegistry()
+
         #  Initialise the confirmation Panel and side panels.
 
         self.confirmation: PanelWithTwoButtons = PanelWithTwoButtons()
         self.options_panel: OptionsPanel = OptionsPanel()
-        self.crawlers_panel: CrawlerPanel = CrawlerPanel()
+        self.crawlers_panel: CrawlerPanel = CrawlerPanel(fleet_size)
         self.module_status_panel: ModuleStatusPanel = ModuleStatusPanel()
         self.personnel_status_panel: PersonnelStatusPanel = PersonnelStatusPanel()
 
@@ -153,8 +161,10 @@ class Console:
                 self.toggle_crawlers()
                 return True
             elif self.crawlers_panel.showing is True:
-                self.crawlers_panel.handleKeyEvent(event)
+                _handled: bool = self.crawlers_panel.handleKeyEvent(event)
                 self.current_crawler_number = self.crawlers_panel.current_crawler_number
+                if _handled is True:
+                    return True
 
             elif (
                 (_keys[pygame.K_LCTRL] or _keys[pygame.K_RCTRL])
@@ -249,12 +259,10 @@ class Console:
         terminal_manager: TerminalManager,
         crawler_id: str,
         crawler_position: tuple[int, int],
-        short_reports: list[dict[str, int]],
+        short_reports: list[Mapping[str, int]],
         long_report: ModuleInfo,
         module_report: dict[str, tuple[str, int, int]],
         personnel_report: dict[str, tuple[str, int, int]],
-        pod_locations: list[tuple[int, int]],
-        salvage_locations: list[tuple[int, int]],
     ) -> None:
         """update
 
@@ -267,19 +275,16 @@ class Console:
             terminal_manager (TerminalManager): the terminal manager to display the terminal.
             crawler_id (str): the id of the crawler.
             crawler_position (tuple[int, int]): the posiiton of the crawler.
-            short_reports (list[dict[str, int]]): the short module infoe data from the crawlers.
+            short_reports (list[Mapping[str, int]]): the short module info of the crawlers on the crawler panel's page.
             long_report (ModuleInfo): the long module infoe data from the System.
             module_report (dict[str, tuple[str, int, int]]): the status of the optional modules.
             personnel_report (dict[str, tuple[str, int, int]]): the status of the personnel.
-            pod_locations (list[tuple[int, int]]): Location of pods for scanner.
-            salvage_locations (list[tuple[int, int]]): Location of salvage for scanner.
         """
 
         #  Save singal value and scan data.
 
         self.signal = signal
-        self.pod_locations: list[tuple[int, int]] = pod_locations
-        self.salvage_locations: list[tuple[int, int]] = salvage_locations
+        self.registry = map_manager.registry
         self.terminal_manager: TerminalManager = terminal_manager
 
         #  Update the delta time, and alternate blink_flag evey second.
@@ -509,9 +514,10 @@ class Console:
         """do_scan
 
         Starts the minimap scan, passing the coordinate of the targets to find.
+        The targets are the pods or salvage in the map object registry.
 
         Args:
-            scan_targets (list[tuple[int, int]]): scan targets
+            mode (str): "p" to scan for pods, "s" to scan for salvage.
         """
         if self.scanning is True:
             self.terminal_manager.message(2, "Scanning already in progress...")
@@ -521,10 +527,10 @@ class Console:
         _locations: list[tuple[int, int]] = []
 
         if mode == "p":
-            _locations: list[tuple[int, int]] = self.pod_locations
+            _locations: list[tuple[int, int]] = self.registry.positions(c.MAP_OBJECT_POD)
             self.terminal_manager.message(2, "Scanning for escape pods...")
         if mode == "s":
-            _locations: list[tuple[int, int]] = self.salvage_locations
+            _locations: list[tuple[int, int]] = self.registry.positions(c.MAP_OBJECT_SALVAGE)
             self.terminal_manager.message(2, "Scanning for salvage...")
         self.menu.disable_all()
         self.status.minimap.start_scan(scan_targets=_locations, callback=self.end_scan)
@@ -1,7 +1,7 @@
 #  The CrawlerLight class provides a light component.
 #  The CrawlerLight has three lines of text.
 
-from typing import Callable, Optional
+from typing import Callable, Mapping, Optional
 
 import pygame
 
@@ -130,7 +130,7 @@ class CrawlerLight(Base):
         self,
         rect: tuple[int, int, int, int],
         texts: tuple[str, str, str],
-        report: dict[str, int],
+        report: Mapping[str, int],
         selected: bool,
         blink_flag: bool = False,
         action: Optional[Callable[[], None]] = None,
@@ -143,7 +143,7 @@ class CrawlerLight(Base):
             rect (tuple[int, int, int, int]): the position and size of the CrawlerLight.
             texts (tuple[str, str, str]): the texts to display in the CrawlerLight. Defaults to ("NOP", "NOP", "NOP").
             level (int): the level (aka. colour) of the CrawlerLight. Defaults to 0.
-            report (dict[str, int]): the crawler report.
+            report (Mapping[str, int]): the crawler report.
             selected (bool): indicates if the button is selected.
             blink_flag (bool): indicates if we are in ablink cycle.
             action (Optional[Callable[[], None]]): method to call whn button is pressd. Defaults to None.
@@ -152,7 +152,7 @@ class CrawlerLight(Base):
 
         self.rect = rect
         self.texts = texts
-        self.report: dict[str, int] = report
+        self.report: Mapping[str, int] = report
         self.selected = selected
         self.action: Optional[Callable[[], None]] = action
 
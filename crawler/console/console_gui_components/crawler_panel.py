@@ -2,6 +2,7 @@
 #  that will slide into view from the edge of the map view.
 
 from functools import partial
+from typing import Mapping
 
 import pygame
 
@@ -17,6 +18,11 @@ from crawler.console.console_tools.calculate_panel_start_pos import \
     calculate_start_pos
 from crawler.console.console_tools.show_text import show_text
 
+#  Where the first crawler light sits below the top of the panel, and the distance from one light to the next.
+
+LIGHT_TOP = 34
+LIGHT_SPACING = 54
+
 
 class CrawlerPanel(Base):
     """CrawlerPanel
@@ -30,10 +36,14 @@ class CrawlerPanel(Base):
 
     def __init__(
         self,
+        fleet_size: int = c.DEFAULT_FLEET_SIZE,
     ) -> None:
         """__init__
 
         Intialises the CrawlerPanel class.
+
+        Args:
+            fleet_size (int): the number of crawlers. Defaults to c.DEFAULT_FLEET_SIZE.
         """
 
         #  Initialise the Base superclass.
@@ -46,21 +56,44 @@ class CrawlerPanel(Base):
         self.x_current_pos: int = c.PANEL_POS_UNSET
         self.y_current_pos: int = c.PANEL_POS_UNSET
         self.showing: bool = False
-        self.footer_message = "Select crawler 1 - 9"
+
+        #  The crawlers are shown a page at a time, so there are only lights for one page.
+
+        self.fleet_size: int = fleet_size
+        self.page: int = 0
+        self.pages: int = (fleet_size - 1) // c.CRAWLER_PANEL_PAGE_SIZE + 1
+        self.footer_message = self.page_message()
 
         #  Create crawler lights.
 
         self.crawler_lights: list[CrawlerLight] = []
-        for _ in range(9):
+        for _ in range(min(fleet_size, c.CRAWLER_PANEL_PAGE_SIZE)):
             self.crawler_lights.append(CrawlerLight())
 
-    def handleKeyEvent(self, event: pygame.event.Event) -> None:  # type: ignore
+    @property
+    def page_numbers(self) -> range:
+        """page_numbers
+
+        Gets the crawlers on the current page.
+
+        Returns:
+            range: the indexes of the crawlers, from 0.
+        """
+        return range(
+            self.page * c.CRAWLER_PANEL_PAGE_SIZE,
+            min((self.page + 1) * c.CRAWLER_PANEL_PAGE_SIZE, self.fleet_size),
+        )
+
+    def handleKeyEvent(self, event: pygame.event.Event) -> bool:  # type: ignore
         """handleKeyEvent
 
         Handles keyboard events.
 
         Args:
             event (pygame.event.Event): event to handle.
+
+        Returns:
+            bool: True if the event turned the page, so is not to be used for anything else.
         """
         #  Crawler selection options:
 
@@ -69,24 +102,23 @@ class CrawlerPanel(Base):
 
             char_keys_pressed: bool = any(_keys[pygame.K_a + i] for i in range(26))
 
-            if _keys[pygame.K_1]:
-                self.select_crawler(1)
-            elif _keys[pygame.K_2]:
-                self.select_crawler(2)
-            elif _keys[pygame.K_3]:
-                self.select_crawler(3)
-            elif _keys[pygame.K_4]:
-                self.select_crawler(4)
-            elif _keys[pygame.K_5]:
-                self.select_crawler(5)
-            elif _keys[pygame.K_6]:
-                self.select_crawler(6)
-            elif _keys[pygame.K_7]:
-                self.select_crawler(7)
-            elif _keys[pygame.K_8]:
-                self.select_crawler(8)
-            elif _keys[pygame.K_9]:
-                self.select_crawler(9)
+            #  The keys 1 - 9 select a crawler on the current page; there are no number keys for any after the ninth.
+
+            _slot: int = next(
+                (_index for _index in range(min(c.CRAWLER_PANEL_PAGE_SIZE, 9)) if _keys[pygame.K_1 + _index]), -1
+            )
+
+            if _slot >= 0:
+                if _slot < len(self.page_numbers):
+                    self.select_crawler(self.page_numbers[_slot] + 1)
+                else:
+                    layout_config.buzz_sound.play()
+
+            #  Page up and page down turn the page.
+
+            elif _keys[pygame.K_PAGEUP] or _keys[pygame.K_PAGEDOWN]:
+                self.turn_page(-1 if _keys[pygame.K_PAGEUP] else 1)
+                return True
             elif (
                 _keys[pygame.K_UP]
                 or _keys[pygame.K_DOWN]
@@ -112,6 +144,8 @@ class CrawlerPanel(Base):
             else:
                 layout_config.buzz_sound.play()
 
+        return False
+
     def handleMouseEvent(self, event: pygame.event.Event) -> None:  # type: ignore
         """handleMouseEvent
 
@@ -121,7 +155,7 @@ class CrawlerPanel(Base):
             event (pygame.event.Event): event to handle.
         """
         if event.type == pygame.MOUSEBUTTONDOWN:
-            for _module_light in self.crawler_lights:
+            for _module_light in self.crawler_lights[: len(self.page_numbers)]:
                 _module_light.checkClick(
                     event,
                     layout_config.map_position[0],
@@ -129,7 +163,7 @@ class CrawlerPanel(Base):
                 )
 
         if event.type == pygame.MOUSEMOTION:
-            for _module_light in self.crawler_lights:
+            for _module_light in self.crawler_lights[: len(self.page_numbers)]:
                 _module_light.checkHover(
                     event,
                     layout_config.map_position[0],
@@ -140,7 +174,7 @@ class CrawlerPanel(Base):
         self,
         dt: float,
         rect: tuple[int, int, int, int],
-        short_reports: list[dict[str, int]],
+        short_reports: list[Mapping[str, int]],
         appear: str = "top",
         blink_flag: bool = False,
     ) -> None:
@@ -151,7 +185,7 @@ class CrawlerPanel(Base):
         Args:
             dt (float): delta time.
             rect (tuple[int, int, int, int]): the position and size of the CrawlerPanel.
-            short_reports (list[dict[str, int]]): the short module infoe data from the crawlers.
+            short_reports (list[Mapping[str, int]]): the short module infoe data from the crawlers on the current page.
             appear (str): set where the CrawlerPanel appears from. Deafults to "top".
             blink_flag (bool): indicates if the lights are in blink_flag cycle. Defauls to False.
         """
@@ -194,25 +228,25 @@ class CrawlerPanel(Base):
             bar=True,
         )
 
-        #  Update the lights.
+        #  Update the lights of the crawlers on the current page.
 
         _selected: bool = True
 
-        for _index, _crawler_light in enumerate(self.crawler_lights):
+        for _slot, _index in enumerate(self.page_numbers):
 
             _selected = True if _index == self.current_crawler_number - 1 else False
 
-            _crawler_light.update_crawler_light(
+            self.crawler_lights[_slot].update_crawler_light(
                 self.base_to_display_rect(
                     (
                         4,
-                        34 + (54 * _index),
+                        LIGHT_TOP + (LIGHT_SPACING * _slot),
                         self.rect[2] - 8,
                         50,
                     )
                 ),
                 texts=(f"CRWLR{_index+1:02}", "", ""),
-                report=short_reports[_index],
+                report=short_reports[_slot],
                 selected=_selected,
                 blink_flag=blink_flag,
                 action=partial(self.select_crawler, _index + 1),
@@ -249,17 +283,19 @@ class CrawlerPanel(Base):
             centered=False,
         )
 
-        #  Render the lights.
+        #  Render the lights in use on the current page.
 
-        for _crawler_light in self.crawler_lights:
+        for _crawler_light in self.crawler_lights[: len(self.page_numbers)]:
             _crawler_light.render(subsurface)
 
+        #  Draw the footer's background below a full page of lights.
+
         pygame.draw.rect(
             subsurface,
             layout_config.colour,
             (
                 self.rect[0],
-                self.rect[1] + 519,
+                self.rect[1] + LIGHT_TOP + (LIGHT_SPACING * c.CRAWLER_PANEL_PAGE_SIZE) - 1,
                 self.rect[2],
                 30,
             ),
@@ -284,6 +320,29 @@ class CrawlerPanel(Base):
         self.footer_message = f"Selecting CRWLR{number:02}"
         # self.showing = False
 
+    def turn_page(self, change: int) -> None:
+        """turn_page
+
+        Shows the next or previous page of crawlers, if there is one.
+
+        Args:
+            change (int): 1 for the next page, -1 for the previous.
+        """
+
+        if not 0 <= self.page + change < self.pages:
+            layout_config.buzz_sound.play()
+            return
+
+        self.play_key_sound()
+        self.page += change
+        self.footer_message = self.page_message()
+
+    def page_message(self) -> str:
+        #  Returns the footer message for the current page.
+        if self.pages == 1:
+            return f"Select crawler 1 - {self.fleet_size}"
+        return f"Page {self.page + 1} of {self.pages} (pg up/dn)"
+
     def play_key_sound(self) -> None:
         if layout_config.key_sound_flag is True:
             layout_config.key_sound.play()
@@ -110,6 +110,10 @@ class Map(Base):
         if self.map_manager.camera is not None:
             self.map_manager.camera.update(crawler_position)
 
+        #  Redraw the map under the camera.
+
+        self.map_manager.update_view()
+
         #  Update CRT Scanlines.
 
         if self.scanlines_flag is True:
@@ -133,9 +137,16 @@ class Map(Base):
         #  Show text.
 
         if self.signal_flag is False:
+
+            #  Show how much of the map has loaded, while it is loading.
+
+            _text: str = "No signal"
+            if self.map_manager.loaded is False:
+                _text = f"No signal - {int(self.map_manager.progress * 100)}%"
+
             show_text(
                 display,
-                "No signal",
+                _text,
                 self.rect,
                 layout_config.font,
                 self.colour,
@@ -165,14 +176,39 @@ class Map(Base):
                 self.map_view.fill(c.BLACK)
 
                 # Display the sprites.
-
-                self.map_manager.map_image
-                for _sprite in self.map_manager.sprite_group:  # type: ignore
-
-                    if _sprite.name == "crawler":  # type: ignore
-                        self.map_view.blit(_sprite.image, self.map_manager.camera.apply(_sprite))  # type: ignore
-                    else:
-                        self.map_view.blit(_sprite.image, self.map_manager.camera.apply(_sprite), special_flags=pygame.BLEND_MAX)  # type: ignore
+                #  Only the part of each sprite inside the viewport is drawn, all in one batch.
+
+                _blits: list[tuple[pygame.Surface, tuple[int, int], pygame.Rect, int]] = []
+
+                for _sprite in self.map_manager.sprites_in_view():
+
+                    #  The map and grid images are already drawn for the view.
+
+                    if _sprite.name == "map" or _sprite.name == "grid":  # type: ignore
+                        _blits.append(
+                            (
+                                _sprite.image,  # type: ignore
+                                (0, 0),
+                                _sprite.image.get_rect(),  # type: ignore
+                                pygame.BLEND_MAX,
+                            )
+                        )
+                        continue
+
+                    _projected = self.map_manager.camera.project(_sprite)  # type: ignore
+                    if _projected is None:
+                        continue
+
+                    _blits.append(
+                        (
+                            _projected[0],
+                            _projected[1],
+                            _projected[2],
+                            0 if _sprite.name == "crawler" else pygame.BLEND_MAX,  # type: ignore
+                        )
+                    )
+
+                self.map_view.blits(_blits, doreturn=False)  # type: ignore
 
                 display.blit(self.map_view, (self.rect[0] + 1, self.rect[1] + 31))
 
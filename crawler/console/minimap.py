@@ -1,6 +1,6 @@
 #  The MiniMap class.
 
-from typing import Callable
+from typing import Callable, Optional
 
 import pygame
 
@@ -51,7 +51,7 @@ class MiniMap(Base):
     def update_minimap(
         self,
         dt: float,
-        mini_map: pygame.surface.Surface,
+        mini_map: Optional[pygame.surface.Surface],
         rect: tuple[int, int, int, int],
         crawler_position: tuple[int, int] = (0, 0),
         signal_flag: bool = False,
@@ -61,14 +61,14 @@ class MiniMap(Base):
         Updates the MiniMap.
         Args:
             dt (float): delta time.
-            mini_map (pygame.surface.Surface): the mini map image.
+            mini_map (Optional[pygame.surface.Surface]): the mini map image, None until it is created.
             rect (tuple[int, int, int, int]): the position and size of the MiniMap..
             crawler_posiion (tuple[int, int]): position of the crawler.
             signal_flag (bool): indications if there is a signal. Defaults to True.
         """
         #  Save MiniMap parameters.
 
-        self.mnini_map: pygame.surface.Surface = mini_map
+        self.mnini_map: Optional[pygame.surface.Surface] = mini_map
         self.rect: tuple[int, int, int, int] = rect
         self.crawler_position: tuple[int, int] = crawler_position
         self.signal_flag: bool = signal_flag
@@ -110,7 +110,7 @@ class MiniMap(Base):
 
         super().render(display)
 
-        if self.signal_flag is False:
+        if self.signal_flag is False or self.mnini_map is None:
             show_text(
                 display,
                 "No signal",
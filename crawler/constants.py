@@ -1,3 +1,5 @@
+from enum import IntEnum
+
 #  Game information
 
 GAME_TITLE = "Crawler"
@@ -11,6 +13,14 @@ GAME_NAME = "crawler"
 FPS = 80
 SCREEN_SIZE = (1920, 1080)
 
+#  Simulation clock.
+#  The simulation steps at a fixed rate, whatever the frame rate; the crawler systems update every 20 steps, 0.25s.
+
+SIMULATION_STEP = 1 / 80
+SIMULATION_MAX_STEPS = 8
+SIMULATION_MAX_BACKLOG = 0.5
+SYSTEM_UPDATE_STEPS = 20
+
 #  Game states
 
 GAME_SPLASH = "Splash"
@@ -50,27 +60,74 @@ DIR_CRAWLER = "crawler"
 
 LEVEL_ONE_MAP_FILENAME = "crawler.tmx"
 
+#  Compiled map cache.
+
+DIR_MAP_CACHE = "cache"
+MAP_CACHE_EXTENSION = ".mapcache"
+MAP_CACHE_VERSION = 1
+
+#  Statuses are whole numbers, compared many times an update,
+#  and show as their names, e.g. f"{status}" gives "OFFLINE3".
+#  Compare statuses of different kinds with is, as their values overlap.
+
+
+class PersonnelStatus(IntEnum):
+    OK = 0
+    DECEASED = 1
+
+    def __str__(self) -> str:
+        return self._name_
+
+
+class SalvageStatus(IntEnum):
+    OK = 0
+    DESTROYED = 1
+
+    def __str__(self) -> str:
+        return self._name_
+
+
+class ModuleStatus(IntEnum):
+    ONLINE = 0
+    OFFLINE = 1
+    OFFLINE1 = 2
+    OFFLINE2 = 3
+    OFFLINE3 = 4
+    OFFLINE4 = 5
+    OFFLINE5 = 6
+    OFFLINE6 = 7
+    FAILED = 8
+
+    def __str__(self) -> str:
+        return self._name_
+
+    @property
+    def offline(self) -> bool:
+        #  Returns True if the module is offline, by request or for lack or excess of a resource.
+        return ModuleStatus.OFFLINE <= self <= ModuleStatus.OFFLINE6
+
+
 #  Personnel.
 
-PERSONNEL_STATUS_OK = "OK"
-PERSONNEL_STATUS_DECEASED = "DECEASED"
+PERSONNEL_STATUS_OK = PersonnelStatus.OK
+PERSONNEL_STATUS_DECEASED = PersonnelStatus.DECEASED
 
 #  Salvage.
 
-SALVAGE_STATUS_OK = "OK"
-SALVAGE_STATUS_DESTROYED = "DESTROYED"
+SALVAGE_STATUS_OK = SalvageStatus.OK
+SALVAGE_STATUS_DESTROYED = SalvageStatus.DESTROYED
 
 #  Modules.
 
-MODULE_STATUS_ONLINE = "ONLINE"
-MODULE_STATUS_OFFLINE_BY_REQUEST = "OFFLINE"
-MODULE_STATUS_OFFLINE_DUE_TO_OXYGEN_DEFICIENCY = "OFFLINE1"
-MODULE_STATUS_OFFLINE_DUE_TO_OXYGEN_EXCESS = "OFFLINE2"
-MODULE_STATUS_OFFLINE_DUE_TO_POWER_DEFICIENCY = "OFFLINE3"
-MODULE_STATUS_OFFLINE_DUE_TO_POWER_EXCESS = "OFFLINE4"
-MODULE_STATUS_OFFLINE_DUE_TO_HEAT_DEFICIENCY = "OFFLINE5"
-MODULE_STATUS_OFFLINE_DUE_TO_HEAT_EXCESS = "OFFLINE6"
-MODULE_STATUS_FAILED_DUE_TO_HEAT_DAMAGE = "FAILED"
+MODULE_STATUS_ONLINE = ModuleStatus.ONLINE
+MODULE_STATUS_OFFLINE_BY_REQUEST = ModuleStatus.OFFLINE
+MODULE_STATUS_OFFLINE_DUE_TO_OXYGEN_DEFICIENCY = ModuleStatus.OFFLINE1
+MODULE_STATUS_OFFLINE_DUE_TO_OXYGEN_EXCESS = ModuleStatus.OFFLINE2
+MODULE_STATUS_OFFLINE_DUE_TO_POWER_DEFICIENCY = ModuleStatus.OFFLINE3
+MODULE_STATUS_OFFLINE_DUE_TO_POWER_EXCESS = ModuleStatus.OFFLINE4
+MODULE_STATUS_OFFLINE_DUE_TO_HEAT_DEFICIENCY = ModuleStatus.OFFLINE5
+MODULE_STATUS_OFFLINE_DUE_TO_HEAT_EXCESS = ModuleStatus.OFFLINE6
+MODULE_STATUS_FAILED_DUE_TO_HEAT_DAMAGE = ModuleStatus.FAILED
 
 #  Screen.
 
@@ -98,6 +155,37 @@ MAP_SIZE = (MAP_WIDTH, MAP_HEIGHT)
 MAP_VIEW_SIZE = (1260, 805)
 MAP_VIEW_SIZE_STREAMING = (960, 805)
 
+MAP_CHUNK_TILES = 16
+MAP_CHUNK_MEMORY_BUDGET = 64 * 1024 * 1024
+MAP_MIP_MEMORY_BUDGET = 32 * 1024 * 1024
+
+GRID_BLOCK_TILES = 10
+GRID_LABEL_CACHE_SIZE = 64
+GRID_LABEL_MAX_ZOOM = 1
+
+SPATIAL_INDEX_CELL_SIZE = 4 * MAP_TILE_SIZE
+
+MAP_OBJECT_SPAWNPOINT = "spawnpoint"
+MAP_OBJECT_POD = "pod"
+MAP_OBJECT_SALVAGE = "salvage"
+MAP_OBJECT_SOLID = "solid"
+MAP_OBJECT_TRIGGER = "trigger"
+MAP_OBJECT_TYPES = (
+    MAP_OBJECT_SPAWNPOINT,
+    MAP_OBJECT_POD,
+    MAP_OBJECT_SALVAGE,
+    MAP_OBJECT_SOLID,
+    MAP_OBJECT_TRIGGER,
+)
+DISPATCH_TARGET_TYPES = (MAP_OBJECT_POD, MAP_OBJECT_SALVAGE)
+
+TERRAIN_PROPERTY = "terrain"
+TERRAIN_LEVEL_MAX = 3
+
+PATH_TERRAIN_COSTS = (1.0, 100 / 75, 100 / 50, 100 / 25)
+PATH_CACHE_SIZE = 256
+PATH_WORKER_DISTANCE = 48
+
 MINIMAP_SIZE = (280, 280)
 
 #  Status panel.
@@ -127,6 +215,32 @@ CRAWLER_ANIMATION_FILENAME = "crawler"
 CRAWLER_FRAME_COUNT = 10
 CRAWLER_HIT_RECT = (0, 0, 50, 50)
 
+#  There is art for the first CRAWLER_ART_COUNT crawlers; those after them reuse it, tinted by each of CRAWLER_TINTS in turn.
+
+CRAWLER_ART_COUNT = 9
+CRAWLER_TINTS = (
+    (255, 170, 170),
+    (170, 255, 170),
+    (170, 190, 255),
+    (255, 240, 150),
+    (150, 255, 255),
+    (255, 160, 255),
+)
+
+#  The crawler images are rotated to whole numbers of CRAWLER_ROTATION_STEP degrees, and kept for reuse up to the budget.
+
+CRAWLER_ROTATION_STEP = 1
+CRAWLER_ROTATION_MEMORY_BUDGET = 16 * 1024 * 1024
+
+#  Crawlers out of the map view, or more than LOD_VIEW_MARGIN from it, are moved LOD_BACKGROUND_STEPS steps at a time,
+#  which must divide SYSTEM_UPDATE_STEPS, and aren't drawn.
+
+LOD_BACKGROUND_STEPS = 4
+LOD_VIEW_MARGIN = 96
+
+AUTOPILOT_ARRIVAL_DISTANCE = 12
+AUTOPILOT_TURN_TOLERANCE = 5
+
 #  Dials.
 
 DIAL_LAYOUTS = [
@@ -142,6 +256,12 @@ DIAL_LAYOUTS = [
 TERMINAL_LINES_TO_SHOW = 8
 TERMINAL_LINE_LENGTH = 80
 
+#  Journal.
+#  The most entries each crawler's journal keeps, and the most the log command shows.
+
+JOURNAL_CAPACITY = 256
+JOURNAL_LINES_TO_SHOW = 20
+
 #  Panels.
 
 PANEL_BUTTON_WIDTH = 150
@@ -149,6 +269,10 @@ PANEL_BUTTON_HEIGHT = 30
 PANEL_SPEED = 800
 PANEL_POS_UNSET = -10000
 
+#  The crawler panel shows the crawlers a page at a time, one for each of the keys 1 - 9.
+
+CRAWLER_PANEL_PAGE_SIZE = 9
+
 #  Slider.
 
 SLIDER_SIZE = (520, 30)
@@ -251,6 +375,7 @@ MAP_RIGHT_BOTTOM = (
 #  These constants are used to create the default .ini file.
 
 DEFAULT_LOGGING_LEVEL = "INFO"
+DEFAULT_FLEET_SIZE = 9
 DEFAULT_LAYOUT_FILENAME = "layout.ini"
 
 #  These constants are used to create the default .csl file.
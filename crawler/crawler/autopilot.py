@@ -0,0 +1,189 @@
+#  The Autopilot class.
+#  Follows a route from the Pathfinder, giving the crawler the next point to head for.
+
+from typing import Optional
+
+import pygame
+
+import crawler.constants as c
+from crawler.map.flow_field import FlowField
+from crawler.map.pathfinding import Pathfinder, PathRequest
+
+
+class Autopilot:
+    """Autopilot
+
+    The Autopilot holds the route a crawler is following.
+    The route is requested from the Pathfinder when the autopilot is engaged,
+    or the autopilot follows a FlowField to its target a tile at a time,
+    and the crawler asks for the next waypoint each update until the destination is reached.
+    """
+
+    def __init__(self) -> None:
+        """__init__
+
+        Initialise the Autopilot.
+        """
+
+        self.destination: Optional[tuple[int, int]] = None
+        self.waypoints: list[pygame.Vector2] = []
+        self.status: str = "OFF"
+        self.field: Optional[FlowField] = None
+        self._request: Optional[PathRequest] = None
+        self._next_tile: Optional[tuple[int, int]] = None
+
+    @property
+    def active(self) -> bool:
+        return self.destination is not None
+
+    @staticmethod
+    def tile_of(position: pygame.Vector2) -> tuple[int, int]:
+        """tile_of
+
+        Gets the tile a position is on.
+
+        Args:
+            position (pygame.Vector2): the position, in pixels.
+
+        Returns:
+            tuple[int, int]: the tile column and row.
+        """
+        return (int(position.x) // c.MAP_TILE_SIZE, int(position.y) // c.MAP_TILE_SIZE)
+
+    def engage(
+        self, pathfinder: Pathfinder, position: pygame.Vector2, destination: tuple[int, int]
+    ) -> None:
+        """engage
+
+        Requests a route to a tile.
+
+        Args:
+            pathfinder (Pathfinder): the pathfinder.
+            position (pygame.Vector2): the position of the crawler, in pixels.
+            destination (tuple[int, int]): the tile column and row to go to.
+        """
+        self.disengage()
+
+        self.destination = destination
+        self.status = "ROUTING"
+        self._request = pathfinder.request(self.tile_of(position), destination)
+
+        #  Short routes are found at once, so there may be no route already.
+
+        if self._request.done and self._request.waypoints is None:
+            self.disengage("NO ROUTE")
+
+    def follow(self, field: FlowField) -> None:
+        """follow
+
+        Follows a FlowField to its target.
+
+        Args:
+            field (FlowField): the field.
+        """
+        self.disengage()
+
+        self.destination = field.target
+        self.field = field
+        self.status = "ENGAGED"
+
+    def disengage(self, status: str = "OFF") -> None:
+        """disengage
+
+        Stops following the route.
+
+        Args:
+            status (str): the reason. Defaults to "OFF".
+        """
+        if self._request is not None:
+            self._request.cancelled = True
+
+        self.destination = None
+        self.waypoints = []
+        self.field = None
+        self.status = status
+        self._request = None
+        self._next_tile = None
+
+    def target(self, position: pygame.Vector2) -> Optional[pygame.Vector2]:
+        """target
+
+        Gets the point to head for, moving on to the next waypoint as each is reached.
+
+        Args:
+            position (pygame.Vector2): the position of the crawler, in pixels.
+
+        Returns:
+            Optional[pygame.Vector2]: the point, or None if there is nowhere to go yet, or any more.
+        """
+
+        if self.destination is None:
+            return None
+
+        if self.field is not None:
+            return self.target_from_field(position)
+
+        #  Wait for the route, then take the centre of each waypoint tile.
+
+        if self._request is not None:
+            if not self._request.done:
+                return None
+
+            if self._request.waypoints is None:
+                self.disengage("NO ROUTE")
+                return None
+
+            self.waypoints = [
+                pygame.Vector2(
+                    (_col + 0.5) * c.MAP_TILE_SIZE, (_row + 0.5) * c.MAP_TILE_SIZE
+                )
+                for _col, _row in self._request.waypoints
+            ]
+            self._request = None
+            self.status = "ENGAGED"
+
+        while self.waypoints and position.distance_to(self.waypoints[0]) <= c.AUTOPILOT_ARRIVAL_DISTANCE:
+            self.waypoints.pop(0)
+
+        if not self.waypoints:
+            self.disengage("ARRIVED")
+            return None
+
+        return self.waypoints[0]
+
+    def target_from_field(self, position: pygame.Vector2) -> Optional[pygame.Vector2]:
+        """target_from_field
+
+        Gets the point to head for when following a FlowField; the centre of the next tile.
+        The crawler heads for the centre of its own tile first, so that it never cuts a corner.
+
+        Args:
+            position (pygame.Vector2): the position of the crawler, in pixels.
+
+        Returns:
+            Optional[pygame.Vector2]: the point, or None if the target has been reached, or can't be.
+        """
+
+        if self._next_tile is None:
+            self._next_tile = self.tile_of(position)
+
+        _centre: pygame.Vector2 = pygame.Vector2(
+            (self._next_tile[0] + 0.5) * c.MAP_TILE_SIZE, (self._next_tile[1] + 0.5) * c.MAP_TILE_SIZE
+        )
+
+        while position.distance_to(_centre) <= c.AUTOPILOT_ARRIVAL_DISTANCE:
+            if self._next_tile == self.destination:
+                self.disengage("ARRIVED")
+                return None
+
+            _next_tile: Optional[tuple[int, int]] = self.field.next_tile(self._next_tile)  # type: ignore
+            if _next_tile is None:
+                self.disengage("NO ROUTE")
+                return None
+
+            self._next_tile = _next_tile
+            _centre = pygame.Vector2(
+                (_next_tile[0] + 0.5) * c.MAP_TILE_SIZE, (_next_tile[1] + 0.5) * c.MAP_TILE_SIZE
+            )
+
+        return _centre
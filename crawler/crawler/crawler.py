@@ -1,12 +1,23 @@
 #  The crawler.py file describes the Crawler class.
 
+import math
 import os
+from typing import Optional, Union
 
+import numpy as np
 import pygame
 
 import crawler.constants as c
 import crawler.customlogger as customlogger
+from crawler.asset_manager import asset_manager
+from crawler.crawler.autopilot import Autopilot
+from crawler.crawler.kinematics import Kinematics, Rows
+from crawler.crawler.rotation_atlas import rotation_atlas
+from crawler.crawler.scheduler import SystemScheduler
 from crawler.crawler.system import System
+from crawler.map.pathfinding import Pathfinder
+from crawler.map.spatial_index import SpatialIndex
+from crawler.map.terrain import TerrainMap
 
 
 class Crawler(pygame.sprite.Sprite):
@@ -22,7 +33,7 @@ class Crawler(pygame.sprite.Sprite):
         Returns:
             Vector2: position of crawler.
         """
-        return self._pos
+        return pygame.Vector2(*self.kinematics.position[self.row])
 
     @position.setter
     def position(self, value: tuple[int, int]) -> None:
@@ -31,8 +42,86 @@ class Crawler(pygame.sprite.Sprite):
         Args:
             value (tuple[int, int]): position of crawler.
         """
-        self._pos.x = value[0] + (c.MAP_TILE_SIZE / 2)
-        self._pos.y = value[1] + (c.MAP_TILE_SIZE / 2)
+        _kinematics: Kinematics = self.kinematics
+        _kinematics.position[self.row] = _kinematics.previous[self.row] = _kinematics.render[self.row] = (
+            value[0] + (c.MAP_TILE_SIZE / 2),
+            value[1] + (c.MAP_TILE_SIZE / 2),
+        )
+
+    @property
+    def render_position(self) -> pygame.Vector2:
+        """render_position
+
+        Returns:
+            Vector2: position of crawler as drawn, between the last two simulation steps.
+        """
+        return pygame.Vector2(*self.kinematics.render[self.row])
+
+    @property
+    def tile(self) -> tuple[int, int]:
+        """tile
+
+        Returns:
+            tuple[int, int]: column and row of the tile the crawler is on.
+        """
+        return Autopilot.tile_of(self.position)
+
+    @property
+    def idle(self) -> bool:
+        """idle
+
+        Returns:
+            bool: True if the crawler is neither being driven nor on autopilot.
+        """
+        return self._is_moving is False and self.autopilot.active is False
+
+    @property
+    def stationary(self) -> bool:
+        """stationary
+
+        Returns:
+            bool: True if the crawler is idle and not turning, so that updating it only updates its systems.
+        """
+        return self.idle and self._rot_speed == 0
+
+    #  The crawler's heading, rate of turn and whether it is moving, reversing or blocked
+    #  are held in its row of the fleet's Kinematics.
+
+    @property
+    def _rot(self) -> int:
+        return int(self.kinematics.rot[self.row])
+
+    @_rot.setter
+    def _rot(self, value: int) -> None:
+        self.kinematics.rot[self.row] = value
+
+    @property
+    def _rot_speed(self) -> float:
+        return float(self.kinematics.rot_speed[self.row])
+
+    @_rot_speed.setter
+    def _rot_speed(self, value: float) -> None:
+        self.kinematics.rot_speed[self.row] = value
+
+    @property
+    def _is_moving(self) -> bool:
+        return bool(self.kinematics.moving[self.row])
+
+    @_is_moving.setter
+    def _is_moving(self, value: bool) -> None:
+        self.kinematics.moving[self.row] = value
+
+    @property
+    def _is_reversing(self) -> bool:
+        return bool(self.kinematics.reversing[self.row])
+
+    @_is_reversing.setter
+    def _is_reversing(self, value: bool) -> None:
+        self.kinematics.reversing[self.row] = value
+
+    @property
+    def _is_blocked(self) -> bool:
+        return bool(self.kinematics.blocked[self.row])
 
     def __init__(self, number: int) -> None:  # type: ignore
         """__init__
@@ -49,8 +138,12 @@ class Crawler(pygame.sprite.Sprite):
 
         #  Initialise the Crawler.
 
-        self.timer: float = 0
+        self.steps: int = 0
         self.active: bool = False
+
+        #  Whether the crawler is in, or near, the map view, so is drawn; set by the LODScheduler.
+
+        self.in_view: bool = True
         self.number: int = number
         self.identifier: str = f"CRWLR{number+1:02}"
         position: tuple[int, int] = (0, 0)
@@ -58,14 +151,23 @@ class Crawler(pygame.sprite.Sprite):
         #  Initialise the crawler systems.
 
         self.system: System = System()
+        self.scheduler: SystemScheduler = SystemScheduler(self.system)
 
         customlogger.log_message(
             f"Initialised {self.identifier}.",
             customlogger.Levels.INFO,
         )
 
-        #  Load the crawler animation frames
+        #  Load the crawler animation frames, from the crawler's own art, or that of an earlier crawler, tinted.
+
+        self.art: int = number % c.CRAWLER_ART_COUNT
+        self.tint: Optional[tuple[int, int, int]] = None
+        self.asset: str = f"{c.DIR_CRAWLER}{self.art+1}"
 
+        if number >= c.CRAWLER_ART_COUNT:
+            _tint: int = (number // c.CRAWLER_ART_COUNT - 1) % len(c.CRAWLER_TINTS)
+            self.tint = c.CRAWLER_TINTS[_tint]
+            self.asset += f"-{_tint+1}"
         self._frames: list[pygame.Surface] = []
         self.loadFrames()
 
@@ -77,22 +179,28 @@ class Crawler(pygame.sprite.Sprite):
         self.image: pygame.Surface = self.crawlerImage
         self.rect: pygame.Rect = self.image.get_rect()
 
-        #  Initialise movement variables
+        #  Initialise movement variables, in a Kinematics of the crawler's own until it is joined to its fleet's.
+        #  The position, the position at the previous simulation step, and the position drawn between the two.
 
-        self._rot: int = 0
-        self._rot_speed: float = 0
+        self.kinematics: Kinematics = Kinematics()
+        self.row: int = self.kinematics.add()
 
         self._x_pos: int = position[0]
         self._y_pos: int = position[1]
-        self._vel: pygame.Vector2 = pygame.Vector2(0, 0)
-        self._pos: pygame.Vector2 = pygame.Vector2(
-            (self._x_pos * c.MAP_TILE_SIZE) - (c.MAP_TILE_SIZE / 2),  #  type: ignore
-            (self._y_pos * c.MAP_TILE_SIZE) - (c.MAP_TILE_SIZE / 2),  #  type: ignore
+        self.position = (
+            (self._x_pos * c.MAP_TILE_SIZE) - c.MAP_TILE_SIZE,
+            (self._y_pos * c.MAP_TILE_SIZE) - c.MAP_TILE_SIZE,
         )
 
-        self._is_moving: bool = False
-        self._is_reversing: bool = False
-        self._is_blocked: bool = False
+        #  The index of map objects and the terrain, set when the map is loaded.
+
+        self.spatial_index: Optional[SpatialIndex] = None
+        self.terrain_map: Optional[TerrainMap] = None
+        self.pathfinder: Optional[Pathfinder] = None
+
+        #  The autopilot drives the crawler along a route when it is not being driven.
+
+        self.autopilot: Autopilot = Autopilot()
 
     def handleKeyEvent(self, event: pygame.event.Event) -> None:
         """handleKeyEvent
@@ -102,6 +210,7 @@ class Crawler(pygame.sprite.Sprite):
         If moving foreward down arrow stops.
         If moving backward up arrow stops.
         Left and right arrows rotate.
+        Any of these disengages the autopilot.
 
         Args:
             event (Event): keyboard event
@@ -117,6 +226,7 @@ class Crawler(pygame.sprite.Sprite):
                 or _keys[pygame.K_RALT]
                 or _keys[pygame.K_LALT]
             ):
+                self.autopilot.disengage()
                 if self._is_reversing:
                     self._is_moving = False
                     self.system.engine.moving = False
@@ -125,7 +235,6 @@ class Crawler(pygame.sprite.Sprite):
                     self.system.engine.moving = True
                 self._is_reversing = False
                 self.system.engine.reversing = False
-                self._vel = self.adjustVelocity()
                 self._active_hit = False
             elif _keys[pygame.K_DOWN] and not (
                 _keys[pygame.K_LCTRL]
@@ -133,6 +242,7 @@ class Crawler(pygame.sprite.Sprite):
                 or _keys[pygame.K_RALT]
                 or _keys[pygame.K_LALT]
             ):
+                self.autopilot.disengage()
                 if not self._is_reversing:
                     if self._is_moving:
                         self._is_moving = False
@@ -149,121 +259,316 @@ class Crawler(pygame.sprite.Sprite):
                     self._is_reversing = True
                     self.system.engine.moving = True
                     self.system.engine.reversing = True
-                self._vel = self.adjustVelocity()
                 self._active_hit = False
             elif _keys[pygame.K_LEFT]:
+                self.autopilot.disengage()
                 self._rot_speed = c.CRAWLER_ROTATION_SPEED
-                self._vel = self.adjustVelocity()
-                self._vel = self._vel * 0.2
             elif _keys[pygame.K_RIGHT]:
+                self.autopilot.disengage()
                 self._rot_speed = -c.CRAWLER_ROTATION_SPEED
-                self._vel = self.adjustVelocity()
-                self._vel = self._vel * 0.2
-
-            self._vel += self._vel * -0.12
 
-    def update(self, dt: float) -> None:
+    def update(self, dt: float, steps: int = 1) -> None:
         """update
 
-        Updates the Crawler class.
+        Updates the Crawler class by a number of simulation steps at once.
+        Crawlers in view are updated one step at a time, those out of view a few steps at a time.
 
         Args:
-            dt (float): delta time.
+            dt (float): the length of a step, c.SIMULATION_STEP.
+            steps (int): the number of steps. Defaults to 1.
+        """
+        Crawler.update_all([self], dt, steps)
+
+    @staticmethod
+    def update_all(crawlers: list["Crawler"], dt: float, steps: Union[int, list[int]] = 1) -> None:
+        """update_all
+
+        Updates crawlers of the same fleet, each by a number of simulation steps at once.
+        The autopilot steers each crawler, then they are all turned and moved in one step of their Kinematics,
+        then those that have moved are kept out of solids, and each crawler's animation and systems are updated.
+
+        Args:
+            crawlers (list[Crawler]): the crawlers, which share a Kinematics and a map.
+            dt (float): the length of a step, c.SIMULATION_STEP.
+            steps (Union[int, list[int]]): the number of steps, the same for every crawler or one for each.
+                Defaults to 1.
+        """
+
+        if not crawlers:
+            return
+
+        _kinematics: Kinematics = crawlers[0].kinematics
+        _rows: Rows = Kinematics.rows_of(crawlers)
+        _steps: list[int] = [steps] * len(crawlers) if isinstance(steps, int) else steps
+
+        for _crawler, _count in zip(crawlers, _steps):
+            if _crawler.autopilot.active:
+                _crawler.followPath(dt * _count)
+
+        _moved: np.ndarray = _kinematics.integrate(_rows, dt * np.array(_steps, dtype=np.float64))
+
+        #  Don't move into a solid, unless already in one, so the crawler can always get out.
+        #  A crawler that hasn't moved can't have moved into one.
+
+        _kinematics.blocked[_rows] = False
+
+        for _index in np.flatnonzero(_moved).tolist():
+            _crawler: Crawler = crawlers[_index]
+            if _crawler.isBlocked(_crawler.position) and not _crawler.isBlocked(
+                pygame.Vector2(*_kinematics.previous[_crawler.row])
+            ):
+                _kinematics.position[_crawler.row] = _kinematics.previous[_crawler.row]
+                _kinematics.blocked[_crawler.row] = True
+
+        #  Set the engines' terrain from the tiles the crawlers are on.
+
+        _terrain: Optional[list[int]] = None
+        if crawlers[0].terrain_map is not None:
+            _terrain = _kinematics.look_up_terrain(_rows, crawlers[0].terrain_map).tolist()
+
+        _blocked: list[bool] = _kinematics.blocked[_rows].tolist()
+
+        for _index, (_crawler, _count) in enumerate(zip(crawlers, _steps)):
+            _crawler.setNextFrame(_count)
+
+            #  If the autopilot has driven in to a solid give up, rather than pushing against it.
+
+            if _blocked[_index] and _crawler.autopilot.active:
+                _crawler.autopilot.disengage("BLOCKED")
+                _crawler.stop()
+                _crawler.system.engine.moving = False
+
+            if _terrain is not None:
+                _crawler.system.engine.terrain = _terrain[_index]
+
+            _crawler.updateSystem(dt, _count)
+
+    def skip(self, dt: float, steps: int) -> None:
+        """skip
+
+        Moves a stationary crawler on by a number of simulation steps, updating only its systems,
+        which is all that stepping it would do, and skipping the updates its SystemScheduler finds steady.
+
+        Args:
+            dt (float): the length of a step, c.SIMULATION_STEP.
+            steps (int): the number of steps.
         """
 
-        self.adjustSpritePostion(dt)
-        self.setNextFrame()
+        self.updateTerrain()
+
+        _update: int = self.steps // c.SYSTEM_UPDATE_STEPS + 1
+        _last: int = (self.steps + steps) // c.SYSTEM_UPDATE_STEPS
+
+        while _update <= _last:
+            self.system.journal.time = _update * c.SYSTEM_UPDATE_STEPS * dt
+            _update += self.scheduler.update(_last - _update + 1)
+
+        self.steps += steps
+
+    def updateTerrain(self) -> None:
+        """updateTerrain
+
+        Sets the crawler's terrain, and its engine's, from the tile the crawler is on.
+        """
 
-        self.timer += dt
-        if self.timer > 0.25:
+        if self.terrain_map is not None:
+            self.kinematics.terrain[self.row] = self.system.engine.terrain = self.terrain_map.level_at(self.position)
 
+    def updateSystem(self, dt: float, steps: int) -> None:
+        """updateSystem
+
+        Counts the steps, and updates the systems each time the count reaches a multiple of c.SYSTEM_UPDATE_STEPS.
+
+        Args:
+            dt (float): the length of a step, c.SIMULATION_STEP.
+            steps (int): the number of steps.
+        """
+
+        for _update in range(
+            self.steps // c.SYSTEM_UPDATE_STEPS + 1, (self.steps + steps) // c.SYSTEM_UPDATE_STEPS + 1
+        ):
+            self.system.journal.time = _update * c.SYSTEM_UPDATE_STEPS * dt
             self.system.update()
 
-            self.timer = 0
+        self.steps += steps
+
+    def interpolate(self, alpha: float) -> None:
+        """interpolate
+
+        Places the sprite between the positions of the last two simulation steps, for drawing.
+
+        Args:
+            alpha (float): how far between the steps, 0 at the previous step and 1 at the last.
+        """
+        Crawler.interpolate_all([self], alpha)
+
+    @staticmethod
+    def interpolate_all(crawlers: list["Crawler"], alpha: float) -> None:
+        """interpolate_all
+
+        Places the sprites of crawlers of the same fleet between the positions of the last two simulation steps,
+        for drawing, all in one step of their Kinematics.
+
+        Args:
+            crawlers (list[Crawler]): the crawlers, which share a Kinematics.
+            alpha (float): how far between the steps, 0 at the previous step and 1 at the last.
+        """
+
+        if not crawlers:
+            return
+
+        _kinematics: Kinematics = crawlers[0].kinematics
+        _rows: Rows = Kinematics.rows_of(crawlers)
+
+        _kinematics.interpolate(_rows, alpha)
+
+        _centres: list[list[int]] = _kinematics.render[_rows].astype(np.int64).tolist()
+
+        #  The rotated frames come from the atlas shared by all the crawlers.
+
+        for _crawler, _centre in zip(crawlers, _centres):
+            _crawler.image = rotation_atlas.get_image(
+                _crawler.asset, _crawler._imageIndex, _crawler.crawlerImage, _crawler._rot
+            )
+            _crawler.rect = _crawler.image.get_rect()
+            _crawler.rect.center = _centre
 
     def stop(self) -> None:
         self._is_moving = False
         self._is_reversing = False
 
-    def adjustVelocity(self) -> pygame.Vector2:
-        """ "adjustVelocity
+    def goto(self, destination: tuple[int, int]) -> bool:
+        """goto
+
+        Engages the autopilot to drive the crawler to a tile.
 
-        Adjust the velocity of the crawler.
+        Args:
+            destination (tuple[int, int]): the tile column and row.
 
+        Returns:
+            bool: False if there is no map to find a route on.
         """
 
-        if not self._is_moving:
-            return pygame.Vector2(0, 0)
-        if self._is_reversing:
-            return pygame.Vector2(-self.system.engine.speed, 0).rotate(-self._rot)
+        if self.pathfinder is None:
+            return False
+
+        self.autopilot.engage(self.pathfinder, self.position, destination)
+
+        return True
+
+    def followPath(self, dt: float) -> None:
+        """followPath
+
+        Turns the crawler towards the next waypoint of the autopilot's route, and drives once it is facing it.
+
+        Args:
+            dt (float): delta time.
+        """
+
+        if not self.autopilot.active:
+            return
+
+        _position: pygame.Vector2 = self.position
+        _target: Optional[pygame.Vector2] = self.autopilot.target(_position)
+
+        if _target is None:
+            self.stop()
+            self._rot_speed = 0
+            self.system.engine.moving = False
+            self.system.engine.reversing = False
+            return
+
+        #  The crawler faces along Vector2(1, 0).rotate(-rot), so the heading is measured anticlockwise.
+
+        _heading: float = math.degrees(
+            math.atan2(-(_target.y - _position.y), _target.x - _position.x)
+        ) % 360
+        _turn: float = (_heading - self._rot + 180) % 360 - 180
+
+        if abs(_turn) <= c.CRAWLER_ROTATION_SPEED * dt:
+            self._rot = int(round(_heading)) % 360
+            self._rot_speed = 0
         else:
-            return pygame.Vector2(self.system.engine.speed, 0).rotate(-self._rot)
+            self._rot_speed = math.copysign(c.CRAWLER_ROTATION_SPEED, _turn)
+
+        self._is_moving = abs(_turn) < c.AUTOPILOT_TURN_TOLERANCE
+        self._is_reversing = False
+        self.system.engine.moving = self._is_moving
+        self.system.engine.reversing = False
 
-    def adjustSpritePostion(self, dt: float) -> None:
-        """adjustSpritePostion
+    def isBlocked(self, position: pygame.Vector2) -> bool:
+        """isBlocked
 
-        Adjusts the position of the sprite to account for collisions or
-        map boundaries.
+        Checks if the crawler would hit a solid at a position.
 
         Args:
-            dt (float): deltatime
+            position (pygame.Vector2): the position of the centre of the crawler.
+
+        Returns:
+            bool: True if there is a solid at the position.
         """
 
-        self._rot = int((self._rot + (self._rot_speed * dt)) % 360)
-        self.image = pygame.transform.rotate(self.crawlerImage, self._rot)
-        self.rect = self.image.get_rect()
-        self.rect.center = (int(self._pos[0]), int(self._pos[1]))
+        if self.spatial_index is None:
+            return False
 
-        self._vel = self.adjustVelocity()
-        self._pos += self._vel * dt
+        _hit_rect: pygame.Rect = pygame.Rect(c.CRAWLER_HIT_RECT)
+        _hit_rect.center = (int(position.x), int(position.y))
 
-        self._pos.x = max(self._pos.x, c.MAP_TILE_SIZE / 2)
-        self._pos.y = max(self._pos.y, c.MAP_TILE_SIZE / 2)
+        return len(self.spatial_index.query_rect(_hit_rect, c.MAP_OBJECT_SOLID)) > 0
 
-        self._pos.x = min(
-            self._pos.x,
-            (c.MAP_TILES_ACROSS * c.MAP_TILE_SIZE) - (c.MAP_TILE_SIZE / 2) - 3,
-        )
-        self._pos.y = min(
-            self._pos.y,
-            (c.MAP_TILES_DOWN * c.MAP_TILE_SIZE) - c.MAP_TILE_SIZE - 30,
-        )
+    @staticmethod
+    def frame_paths(art: int) -> list[str]:
+        """frame_paths
+
+        Gets the files of a crawler's animation frames.
+
+        Args:
+            art (int): the number of the crawler whose art it is, from 0.
+
+        Returns:
+            list[str]: the files, in frame order.
+        """
+        return [
+            os.path.join(
+                "crawler",
+                c.DIR_ASSETS,
+                c.DIR_CRAWLER,
+                f"{c.DIR_CRAWLER}{art+1}",
+                f"{c.CRAWLER_ANIMATION_FILENAME}_{art+1}_{_index:02}.png",
+            )
+            for _index in range(0, c.CRAWLER_FRAME_COUNT)
+        ]
 
     def loadFrames(self) -> None:
         """loadFrames
 
-        Loads the crawler animation frames
+        Loads the crawler animation frames, from the asset manager, so crawlers with the same asset share them.
 
         """
+        self._frames = [asset_manager.image(_path, self.tint) for _path in self.frame_paths(self.art)]
 
-        self._frames = []
-        for _index in range(0, c.CRAWLER_FRAME_COUNT):
-            self._frames.append(
-                pygame.image.load(
-                    os.path.join(
-                        "crawler",
-                        c.DIR_ASSETS,
-                        c.DIR_CRAWLER,
-                        f"{c.DIR_CRAWLER}{self.number+1}",
-                        f"{c.CRAWLER_ANIMATION_FILENAME}_{self.number+1}_{_index:02}.png",
-                    )
-                )
-            )
-
-    def setNextFrame(self) -> None:
+    def setNextFrame(self, steps: int = 1) -> None:
         """setNextFrame
 
-        Sets the next crawler animation frame.
+        Sets the crawler animation frame, a number of steps on.
+        The frame changes every ten steps while the crawler is moving.
 
+        Args:
+            steps (int): the number of steps. Defaults to 1.
         """
 
-        if self._vel.x != 0 or self._vel.y != 0:
+        _velocity: list[float] = self.kinematics.velocity[self.row].tolist()
+
+        if _velocity[0] != 0 or _velocity[1] != 0:
+
+            #  The frame changes each time the modifier passes zero, the first of which is _first steps on.
+
             if self.system.engine.reversing is False:
-                self._ImageIndexModfier = (self._ImageIndexModfier - 1) % 10
-                if self._ImageIndexModfier == 0:
-                    self._imageIndex = (self._imageIndex - 1) % 10
+                _first: int = (self._ImageIndexModfier - 1) % 10 + 1
+                self._ImageIndexModfier = (self._ImageIndexModfier - steps) % 10
+                self._imageIndex = (self._imageIndex - (steps + 10 - _first) // 10) % 10
             else:
-                self._ImageIndexModfier = (self._ImageIndexModfier + 1) % 10
-                if self._ImageIndexModfier == 0:
-                    self._imageIndex = (self._imageIndex + 1) % 10
+                _first = (-self._ImageIndexModfier - 1) % 10 + 1
+                self._ImageIndexModfier = (self._ImageIndexModfier + steps) % 10
+                self._imageIndex = (self._imageIndex + (steps + 10 - _first) // 10) % 10
             self.crawlerImage = self._frames[self._imageIndex]
@@ -0,0 +1,651 @@
+#  The Fleet class.
+#  Holds the modules of every crawler in arrays, and updates them all together.
+
+from typing import Optional
+
+import numpy as np
+
+import crawler.constants as c
+from crawler.crawler.flow import solve_array
+from crawler.crawler.modules.module import Module
+from crawler.crawler.system import System
+
+#  The module statuses, by code.
+
+STATUSES: tuple[c.ModuleStatus, ...] = (
+    c.MODULE_STATUS_ONLINE,
+    c.MODULE_STATUS_OFFLINE_BY_REQUEST,
+    c.MODULE_STATUS_OFFLINE_DUE_TO_OXYGEN_DEFICIENCY,
+    c.MODULE_STATUS_OFFLINE_DUE_TO_OXYGEN_EXCESS,
+    c.MODULE_STATUS_OFFLINE_DUE_TO_POWER_DEFICIENCY,
+    c.MODULE_STATUS_OFFLINE_DUE_TO_POWER_EXCESS,
+    c.MODULE_STATUS_OFFLINE_DUE_TO_HEAT_DEFICIENCY,
+    c.MODULE_STATUS_OFFLINE_DUE_TO_HEAT_EXCESS,
+    c.MODULE_STATUS_FAILED_DUE_TO_HEAT_DAMAGE,
+)
+
+ONLINE: int = STATUSES.index(c.MODULE_STATUS_ONLINE)
+FAILED: int = STATUSES.index(c.MODULE_STATUS_FAILED_DUE_TO_HEAT_DAMAGE)
+
+#  The resources, and the status codes of a module offline due to a deficiency or an excess of each.
+
+OXYGEN: int = 0
+POWER: int = 1
+HEAT: int = 2
+
+DEFICIENCY: tuple[int, int, int] = (
+    STATUSES.index(c.MODULE_STATUS_OFFLINE_DUE_TO_OXYGEN_DEFICIENCY),
+    STATUSES.index(c.MODULE_STATUS_OFFLINE_DUE_TO_POWER_DEFICIENCY),
+    STATUSES.index(c.MODULE_STATUS_OFFLINE_DUE_TO_HEAT_DEFICIENCY),
+)
+EXCESS: tuple[int, int, int] = (
+    STATUSES.index(c.MODULE_STATUS_OFFLINE_DUE_TO_OXYGEN_EXCESS),
+    STATUSES.index(c.MODULE_STATUS_OFFLINE_DUE_TO_POWER_EXCESS),
+    STATUSES.index(c.MODULE_STATUS_OFFLINE_DUE_TO_HEAT_EXCESS),
+)
+
+#  The module slots, in the order System.update updates them, followed by the optional modules.
+#  The oxygen supply and heat sink are held as levels, not slots.
+
+SLOT_CELLS: int = 0
+SLOT_HOLD: int = 1
+SLOT_ENGINE: int = 2
+SLOT_COOLER: int = 3
+SLOT_LIFE_SUPPORT: int = 4
+SLOT_OPTIONAL: int = 5
+
+
+def percent(actual: np.ndarray, maximum: np.ndarray) -> np.ndarray:
+    """percent
+
+    Gets levels as whole percentages of their maximums, as the modules' properties do.
+
+    Args:
+        actual (np.ndarray): the levels.
+        maximum (np.ndarray): the maximums.
+
+    Returns:
+        np.ndarray: the percentages, rounded towards zero.
+    """
+    return np.trunc(actual / maximum * 100).astype(np.int64)
+
+
+def from_percent(value: int, maximum: np.ndarray) -> np.ndarray:
+    """from_percent
+
+    Gets the levels that are a percentage of their maximums, as the modules' setters do.
+
+    Args:
+        value (int): the percentage.
+        maximum (np.ndarray): the maximums.
+
+    Returns:
+        np.ndarray: the levels, rounded towards zero.
+    """
+    return np.trunc(maximum / 100 * value).astype(np.int64)
+
+
+class Fleet:
+    """Fleet
+
+    The Fleet holds the modules, personnel and salvage of any number of crawlers as arrays,
+    one row per crawler, and steps them all at once, as System.update steps a single crawler.
+    With the flow solver, every module's withdrawals and deposits are resolved together, as FlowSolver does.
+    Without it, the modules are updated one slot at a time, in the same order, because each one draws on
+    the supplies left by the ones before it, but each slot is updated for the whole fleet together.
+
+    The Fleet does not write to the crawlers' journals; write_back copies the state back into the
+    systems, and their properties and reports then work as before.
+    """
+
+    def __init__(
+        self,
+        crawlers: int,
+        slots: int,
+        personnel: int,
+        salvage: int,
+    ) -> None:
+        """__init__
+
+        Initialise an empty Fleet. Use from_systems to fill one from the crawlers' systems.
+
+        Args:
+            crawlers (int): the number of crawlers.
+            slots (int): the number of module slots, including the optional modules.
+            personnel (int): the number of personnel slots.
+            salvage (int): the number of salvage slots.
+        """
+
+        _shape: tuple[int, int] = (crawlers, slots)
+
+        #  The oxygen, power and heat of each crawler, and their maximums.
+
+        self.levels: np.ndarray = np.zeros((3, crawlers), dtype=np.int64)
+        self.capacity: np.ndarray = np.ones((3, crawlers), dtype=np.int64)
+
+        #  How each module draws on each resource.
+
+        self.connected: np.ndarray = np.zeros((3, *_shape), dtype=bool)
+        self.withdrawal: np.ndarray = np.zeros((3, *_shape), dtype=np.int64)
+        self.withdrawal_essential: np.ndarray = np.zeros((3, *_shape), dtype=bool)
+        self.deposit: np.ndarray = np.zeros((3, *_shape), dtype=np.int64)
+        self.deposit_essential: np.ndarray = np.zeros((3, *_shape), dtype=bool)
+
+        #  The engine's heat deposit is multiplied by the terrain it is crossing.
+
+        self.terrain: np.ndarray = np.zeros(crawlers, dtype=np.int64)
+        self.terrain_scaled: np.ndarray = np.zeros(_shape, dtype=bool)
+        self.heat_damage: np.ndarray = np.zeros(crawlers, dtype=np.int64)
+
+        #  The modules.
+
+        self.present: np.ndarray = np.zeros(_shape, dtype=bool)
+        self.status: np.ndarray = np.full(_shape, ONLINE, dtype=np.int8)
+        self.health: np.ndarray = np.zeros(_shape, dtype=np.int64)
+        self.max_health: np.ndarray = np.ones(_shape, dtype=np.int64)
+        self.mitigation: np.ndarray = np.full(_shape, -1, dtype=np.int32)
+
+        #  The personnel, with their names, roles and mitigations as codes into self.words.
+
+        self.person_present: np.ndarray = np.zeros((crawlers, personnel), dtype=bool)
+        self.person_name: np.ndarray = np.full((crawlers, personnel), -1, dtype=np.int32)
+        self.person_role: np.ndarray = np.full((crawlers, personnel), -1, dtype=np.int32)
+        self.person_mitigation: np.ndarray = np.full((crawlers, personnel), -1, dtype=np.int32)
+        self.person_health: np.ndarray = np.zeros((crawlers, personnel), dtype=np.int64)
+        self.person_max_health: np.ndarray = np.ones((crawlers, personnel), dtype=np.int64)
+        self.person_deceased: np.ndarray = np.zeros((crawlers, personnel), dtype=bool)
+
+        #  The salvage.
+
+        self.salvage_present: np.ndarray = np.zeros((crawlers, salvage), dtype=bool)
+        self.salvage_health: np.ndarray = np.zeros((crawlers, salvage), dtype=np.int64)
+        self.salvage_destroyed: np.ndarray = np.zeros((crawlers, salvage), dtype=bool)
+
+        self.words: dict[str, int] = {}
+
+        #  Whether the withdrawals and deposits are resolved by the flow solver, or slot by slot.
+
+        self.solver: bool = True
+
+    def __len__(self) -> int:
+        return self.levels.shape[1]
+
+    def code(self, word: str) -> int:
+        """code
+
+        Gets the code of a name, role or mitigation, adding it if it is new.
+
+        Args:
+            word (str): the name, role or mitigation.
+
+        Returns:
+            int: the code.
+        """
+        return self.words.setdefault(word, len(self.words))
+
+    @staticmethod
+    def modules_of(system: System) -> list[Module]:
+        """modules_of
+
+        Gets the modules of a system in slot order.
+
+        Args:
+            system (System): the system.
+
+        Returns:
+            list[Module]: the modules.
+        """
+        return [
+            system.cells,
+            system.hold,
+            system.engine,
+            system.cooler,
+            system.life_support,
+            *system.optional_modules,
+        ]
+
+    @classmethod
+    def from_systems(cls, systems: list[System]) -> "Fleet":
+        """from_systems
+
+        Creates a Fleet holding the state of the crawlers' systems.
+
+        Args:
+            systems (list[System]): the system of each crawler.
+
+        Raises:
+            ValueError: if a module draws on another crawler's supplies, or has an unknown status,
+                or only some of the systems use the flow solver.
+
+        Returns:
+            Fleet: the fleet.
+        """
+
+        _fleet: Fleet = cls(
+            len(systems),
+            max((len(cls.modules_of(_system)) for _system in systems), default=SLOT_OPTIONAL),
+            max((len(_system.hold.personnel_slots) for _system in systems), default=0),
+            max((len(_system.hold.salvage_slots) for _system in systems), default=0),
+        )
+
+        _solvers: set[bool] = {_system.flow_solver is not None for _system in systems}
+        if len(_solvers) > 1:
+            raise ValueError("Only some of the systems use the flow solver.")
+        _fleet.solver = _solvers != {False}
+
+        for _row, _system in enumerate(systems):
+            _supplies: tuple[object, object, object] = (_system.oxygen, _system.cells, _system.heat_sink)
+
+            _fleet.levels[:, _row] = (
+                _system.oxygen.actual_oxygen,
+                _system.cells.actual_power,
+                _system.heat_sink.actual_heat,
+            )
+            _fleet.capacity[:, _row] = (
+                _system.oxygen.max_oxygen,
+                _system.cells.max_power,
+                _system.heat_sink.max_heat,
+            )
+            _fleet.terrain[_row] = _system.engine.terrain
+            _fleet.heat_damage[_row] = _system.heat_sink.damage_amount
+
+            for _slot, _module in enumerate(cls.modules_of(_system)):
+                if _module.status not in STATUSES:
+                    raise ValueError(f"{_module.name} has an unknown status {_module.status}.")
+
+                _fleet.present[_row, _slot] = True
+                _fleet.status[_row, _slot] = STATUSES.index(_module.status)
+                _fleet.health[_row, _slot] = _module.actual_health
+                _fleet.max_health[_row, _slot] = _module.max_health
+                _fleet.mitigation[_row, _slot] = _fleet.code(_module.mitigation)
+                _fleet.terrain_scaled[_row, _slot] = _slot == SLOT_ENGINE
+
+                for _resource, (_supply, _prefix) in enumerate(
+                    zip((_module.oxygen_supply, _module.power_supply, _module.heat_sink), ("oxygen", "power", "heat"))
+                ):
+                    if _supply is None:
+                        continue
+                    if _supply is not _supplies[_resource]:
+                        raise ValueError(f"{_module.name} draws {_prefix} from another crawler.")
+
+                    _fleet.connected[_resource, _row, _slot] = True
+                    _fleet.withdrawal[_resource, _row, _slot] = getattr(_module, f"{_prefix}_withdrawal")
+                    _fleet.withdrawal_essential[_resource, _row, _slot] = getattr(
+                        _module, f"{_prefix}_withdrawal_essential"
+                    )
+                    _fleet.deposit[_resource, _row, _slot] = getattr(_module, f"{_prefix}_deposit")
+                    _fleet.deposit_essential[_resource, _row, _slot] = getattr(
+                        _module, f"{_prefix}_deposit_essential"
+                    )
+
+            for _index, _person in enumerate(_system.hold.personnel_slots):
+                _fleet.person_present[_row, _index] = True
+                _fleet.person_name[_row, _index] = _fleet.code(_person.name)
+                _fleet.person_role[_row, _index] = _fleet.code(_person.role)
+                _fleet.person_mitigation[_row, _index] = _fleet.code(_person.mitigation)
+                _fleet.person_health[_row, _index] = _person.actual_health
+                _fleet.person_max_health[_row, _index] = _person.max_health
+                _fleet.person_deceased[_row, _index] = _person.status == c.PERSONNEL_STATUS_DECEASED
+
+            for _index, _salvage in enumerate(_system.hold.salvage_slots):
+                _fleet.salvage_present[_row, _index] = True
+                _fleet.salvage_health[_row, _index] = _salvage.health
+                _fleet.salvage_destroyed[_row, _index] = _salvage.status == c.SALVAGE_STATUS_DESTROYED
+
+        return _fleet
+
+    def write_back(self, systems: list[System]) -> None:
+        """write_back
+
+        Copies the state of the Fleet back into the crawlers' systems.
+
+        Args:
+            systems (list[System]): the system of each crawler, in the order the Fleet was created from.
+        """
+
+        _levels: list[list[int]] = self.levels.T.tolist()
+        _status: list[list[int]] = self.status.tolist()
+        _health: list[list[int]] = self.health.tolist()
+
+        for _row, _system in enumerate(systems):
+            (
+                _system.oxygen.actual_oxygen,
+                _system.cells.actual_power,
+                _system.heat_sink.actual_heat,
+            ) = _levels[_row]
+
+            for _slot, _module in enumerate(self.modules_of(_system)):
+                _module.status = STATUSES[_status[_row][_slot]]
+                _module.actual_health = _health[_row][_slot]
+
+            for _index, _person in enumerate(_system.hold.personnel_slots):
+                _person.actual_health = int(self.person_health[_row, _index])
+                if self.person_deceased[_row, _index]:
+                    _person.status = c.PERSONNEL_STATUS_DECEASED
+
+            for _index, _salvage in enumerate(_system.hold.salvage_slots):
+                if self.salvage_destroyed[_row, _index]:
+                    _salvage.destroy()
+
+            _system.changed()
+
+    def state(self) -> dict[str, np.ndarray]:
+        """state
+
+        Gets the arrays that change as the Fleet is stepped.
+
+        Returns:
+            dict[str, np.ndarray]: the arrays, by name.
+        """
+        return {
+            "levels": self.levels,
+            "status": self.status,
+            "health": self.health,
+            "person_health": self.person_health,
+            "person_deceased": self.person_deceased,
+            "salvage_health": self.salvage_health,
+            "salvage_destroyed": self.salvage_destroyed,
+        }
+
+    def mitigated(self, mitigation: np.ndarray) -> np.ndarray:
+        """mitigated
+
+        Works out which mitigations are met by the living personnel of each crawler,
+        where a mitigation is met by a person with that name or role.
+
+        Args:
+            mitigation (np.ndarray): the mitigation codes, one row per crawler.
+
+        Returns:
+            np.ndarray: True where the mitigation is met.
+        """
+
+        _alive: np.ndarray = self.person_present & (percent(self.person_health, self.person_max_health) > 0)
+        _wanted: np.ndarray = mitigation[:, :, np.newaxis]
+
+        return np.any(
+            _alive[:, np.newaxis, :]
+            & ((self.person_name[:, np.newaxis, :] == _wanted) | (self.person_role[:, np.newaxis, :] == _wanted)),
+            axis=2,
+        )
+
+    def step(self, terrain: Optional[np.ndarray] = None) -> None:
+        """step
+
+        Updates every crawler once, as System.update does.
+
+        Args:
+            terrain (Optional[np.ndarray]): the terrain each crawler is crossing. Defaults to the terrain already held.
+        """
+
+        if terrain is not None:
+            self.terrain[:] = terrain
+
+        #  The mitigations are those of the personnel alive at the start of the update.
+
+        _mitigated: np.ndarray = self.mitigated(self.mitigation)
+        _person_mitigated: np.ndarray = self.mitigated(self.person_mitigation)
+
+        #  The oxygen supply and cells draw on nothing, so the heat sink can be updated before the other slots.
+
+        self.update_heat_sink(_mitigated, _person_mitigated)
+
+        if self.solver:
+            self.update_flows()
+
+            #  Personnel are harmed while life-support is offline, and nobody can mitigate it.
+
+            self.damage_personnel(
+                self.status[:, SLOT_LIFE_SUPPORT] != ONLINE,
+                np.ones(len(self), dtype=np.int64),
+                np.zeros_like(_person_mitigated),
+            )
+            return
+
+        for _slot in range(self.status.shape[1]):
+            self.update_resource(OXYGEN, _slot)
+            self.update_resource(POWER, _slot)
+            self.update_resource(HEAT, _slot)
+
+            #  Personnel are harmed while life-support is offline, and nobody can mitigate it.
+
+            if _slot == SLOT_LIFE_SUPPORT:
+                self.damage_personnel(
+                    self.status[:, _slot] != ONLINE,
+                    np.ones(len(self), dtype=np.int64),
+                    np.zeros_like(_person_mitigated),
+                )
+
+    def limit(self, resource: int, rows: np.ndarray) -> None:
+        """limit
+
+        Keeps levels of a resource within range, as the supplies' limit methods do.
+        Oxygen and power are kept between zero and the maximum, and heat between 20% and 100%.
+
+        Args:
+            resource (int): OXYGEN, POWER or HEAT.
+            rows (np.ndarray): the crawlers to limit.
+        """
+
+        _level: np.ndarray = self.levels[resource, rows]
+        _capacity: np.ndarray = self.capacity[resource, rows]
+
+        if resource == HEAT:
+            _level = np.trunc(_capacity / 100 * np.maximum(percent(_level, _capacity), 20)).astype(np.int64)
+            _level = np.trunc(_capacity / 100 * np.minimum(percent(_level, _capacity), 100)).astype(np.int64)
+        else:
+            _level = np.clip(_level, 0, _capacity)
+
+        self.levels[resource, rows] = _level
+
+    def update_resource(self, resource: int, slot: int) -> None:
+        """update_resource
+
+        Updates one slot's use of a resource across the fleet, as Module.update_oxygen,
+        update_power and update_heat do; first the withdrawal, then the deposit.
+
+        Args:
+            resource (int): OXYGEN, POWER or HEAT.
+            slot (int): the module slot.
+        """
+
+        _connected: np.ndarray = self.connected[resource, :, slot]
+        if not _connected.any():
+            return
+
+        _status: np.ndarray = self.status[:, slot]
+        _level: np.ndarray = self.levels[resource]
+        _deficiency: int = DEFICIENCY[resource]
+        _excess: int = EXCESS[resource]
+
+        #  Withdraw, if online or offline due to a deficiency.
+
+        _rows: np.ndarray = np.flatnonzero(_connected & ((_status == ONLINE) | (_status == _deficiency)))
+        _amount: np.ndarray = self.withdrawal[resource, _rows, slot]
+        _withdrawn: np.ndarray = _level[_rows] >= _amount
+
+        _level[_rows] -= _amount
+        self.limit(resource, _rows)
+
+        _was_deficient: np.ndarray = _status[_rows] == _deficiency
+        _offline: np.ndarray = self.withdrawal_essential[resource, _rows, slot] & ~_withdrawn & ~_was_deficient
+        _online: np.ndarray = _withdrawn & _was_deficient
+
+        _status[_rows[_offline]] = _deficiency
+        _status[_rows[_online]] = ONLINE
+
+        #  A module that has just gone offline or online makes no deposit.
+
+        _done: np.ndarray = np.zeros(len(self), dtype=bool)
+        _done[_rows[_offline | _online]] = True
+
+        #  Deposit, if online or offline due to an excess.
+        #  Heat can only be deposited while the heat is at or below 85%, and the engine's deposit rises with the terrain.
+
+        _rows = np.flatnonzero(_connected & ~_done & ((_status == ONLINE) | (_status == _excess)))
+        _amount = self.deposit[resource, _rows, slot]
+
+        if resource == HEAT:
+            _amount = _amount * np.where(self.terrain_scaled[_rows, slot], self.terrain[_rows], 1)
+            _deposited: np.ndarray = percent(_level[_rows], self.capacity[resource, _rows]) <= 85
+            _rows_changed: np.ndarray = _rows[_deposited]
+            _level[_rows_changed] += _amount[_deposited]
+            self.limit(resource, _rows_changed)
+        else:
+            _deposited = (self.capacity[resource, _rows] - _level[_rows]) >= _amount
+            _level[_rows] += _amount
+            self.limit(resource, _rows)
+
+        _was_excess: np.ndarray = _status[_rows] == _excess
+        _offline = self.deposit_essential[resource, _rows, slot] & ~_deposited & ~_was_excess
+        _online = _deposited & _was_excess
+
+        _status[_rows[_offline]] = _excess
+        _status[_rows[_online]] = ONLINE
+
+    def update_flows(self) -> None:
+        """update_flows
+
+        Resolves every module's withdrawals and deposits across the fleet at once, as FlowSolver does,
+        then takes modules offline or online by how their requests went.
+        """
+
+        _status: np.ndarray = self.status
+        _outcomes: list[tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]] = []
+
+        #  Collect the requests, going by the statuses at the start of the update, and resolve each resource.
+
+        for _resource in (OXYGEN, POWER, HEAT):
+            _withdraws: np.ndarray = self.connected[_resource] & (
+                (_status == ONLINE) | (_status == DEFICIENCY[_resource])
+            )
+            _deposits: np.ndarray = self.connected[_resource] & ((_status == ONLINE) | (_status == EXCESS[_resource]))
+
+            _level: np.ndarray = self.levels[_resource]
+            _capacity: np.ndarray = self.capacity[_resource]
+            _deposit: np.ndarray = self.deposit[_resource]
+
+            #  Heat is kept between 20% and 100%, can only be deposited while at or below 85%,
+            #  and the engine's deposit rises with the terrain.
+
+            if _resource == HEAT:
+                _lowest: np.ndarray = from_percent(20, _capacity)
+                _highest: np.ndarray = from_percent(100, _capacity)
+                _accepts: np.ndarray = percent(_level, _capacity) <= 85
+                _deposit = _deposit * np.where(self.terrain_scaled, self.terrain[:, np.newaxis], 1)
+            else:
+                _lowest = np.zeros_like(_capacity)
+                _highest = _capacity
+                _accepts = np.ones(len(self), dtype=bool)
+
+            self.levels[_resource], _withdrawn, _deposited = solve_array(
+                _level,
+                _lowest,
+                _highest,
+                _accepts,
+                np.where(_withdraws, self.withdrawal[_resource], 0),
+                self.withdrawal_essential[_resource],
+                np.where(_deposits, _deposit, 0),
+                self.deposit_essential[_resource],
+            )
+            _outcomes.append((_withdraws, _withdrawn, _deposits, _deposited))
+
+        #  A module changes status at most once, over the first resource that moves it.
+
+        _changed: np.ndarray = np.zeros(_status.shape, dtype=bool)
+
+        for _resource, (_withdraws, _withdrawn, _deposits, _deposited) in enumerate(_outcomes):
+            _deficiency: int = DEFICIENCY[_resource]
+            _excess: int = EXCESS[_resource]
+
+            _rows: np.ndarray = _withdraws & ~_changed
+            _was_deficient: np.ndarray = _status == _deficiency
+            _offline: np.ndarray = _rows & self.withdrawal_essential[_resource] & ~_withdrawn & ~_was_deficient
+            _online: np.ndarray = _rows & _withdrawn & _was_deficient
+
+            _status[_offline] = _deficiency
+            _status[_online] = ONLINE
+            _changed |= _offline | _online
+
+            _rows = _deposits & ~_changed
+            _was_excess: np.ndarray = _status == _excess
+            _offline = _rows & self.deposit_essential[_resource] & ~_deposited & ~_was_excess
+            _online = _rows & _deposited & _was_excess
+
+            _status[_offline] = _excess
+            _status[_online] = ONLINE
+            _changed |= _offline | _online
+
+    def update_heat_sink(self, mitigated: np.ndarray, person_mitigated: np.ndarray) -> None:
+        """update_heat_sink
+
+        Updates the heat sinks, as HeatSink.update does; crawlers over 80% heat damage all their modules,
+        which destroys salvage that no longer fits in the hold, and harms the personnel.
+
+        Args:
+            mitigated (np.ndarray): True where a module's mitigation is met.
+            person_mitigated (np.ndarray): True where a person's mitigation is met.
+        """
+
+        self.limit(HEAT, np.arange(len(self)))
+
+        _hot: np.ndarray = percent(self.levels[HEAT], self.capacity[HEAT]) > 80
+        if not _hot.any():
+            return
+
+        #  Only modules that are online take damage.
+
+        _damaged: np.ndarray = (
+            _hot[:, np.newaxis] & self.present & (self.status == ONLINE) & (self.heat_damage > 0)[:, np.newaxis]
+        )
+        self.health[_damaged] -= np.broadcast_to(self.heat_damage[:, np.newaxis], self.health.shape)[_damaged]
+
+        _stabilised: np.ndarray = _damaged & mitigated & (percent(self.health, self.max_health) < 25)
+        self.health[_stabilised] = from_percent(25, self.max_health[_stabilised])
+
+        _failed: np.ndarray = _damaged & (self.health <= 0)
+        self.health[_failed] = 0
+        self.status[_failed] = FAILED
+
+        #  The hold has a salvage slot for each 10% of its health.
+
+        _hold: np.ndarray = _hot & self.present[:, SLOT_HOLD]
+        _slots: np.ndarray = percent(self.health[:, SLOT_HOLD], self.max_health[:, SLOT_HOLD]) // 10
+        _destroyed: np.ndarray = (
+            _hold[:, np.newaxis]
+            & self.salvage_present
+            & (np.arange(self.salvage_present.shape[1])[np.newaxis, :] >= _slots[:, np.newaxis])
+        )
+        self.salvage_health[_destroyed] = 0
+        self.salvage_destroyed[_destroyed] = True
+
+        #  Life-support passes the damage on to the personnel, whether it is online or not.
+
+        self.damage_personnel(_hot & self.present[:, SLOT_LIFE_SUPPORT], self.heat_damage, person_mitigated)
+
+    def damage_personnel(self, rows: np.ndarray, amount: np.ndarray, mitigated: np.ndarray) -> None:
+        """damage_personnel
+
+        Damages the personnel of some crawlers, as Personnel.damage does.
+
+        Args:
+            rows (np.ndarray): True for each crawler whose personnel are damaged.
+            amount (np.ndarray): the damage, for each crawler.
+            mitigated (np.ndarray): True where a person's mitigation is met.
+        """
+
+        _damaged: np.ndarray = (rows & (amount > 0))[:, np.newaxis] & self.person_present
+        if not _damaged.any():
+            return
+
+        self.person_health[_damaged] -= np.broadcast_to(amount[:, np.newaxis], self.person_health.shape)[_damaged]
+
+        _stabilised: np.ndarray = (
+            _damaged & mitigated & (percent(self.person_health, self.person_max_health) < 25)
+        )
+        self.person_health[_stabilised] = from_percent(25, self.person_max_health[_stabilised])
+
+        _deceased: np.ndarray = _damaged & (self.person_health <= 0)
+        self.person_health[_deceased] = 0
+        self.person_deceased[_deceased] = True
+
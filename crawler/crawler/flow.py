@@ -0,0 +1,351 @@
+#  The FlowSolver class.
+#  Resolves every module's withdrawals and deposits on each supply at once,
+#  so the outcome doesn't depend on the order the modules are updated in.
+
+from typing import Any, Optional
+
+import numpy as np
+
+import crawler.constants as c
+from crawler.crawler.modules.module import Module
+
+#  The resources, the attribute holding the level of each resource's supply,
+#  and the attribute connecting a module to the supply.
+
+RESOURCES: tuple[tuple[str, str, str], ...] = (
+    ("oxygen", "actual_oxygen", "oxygen_supply"),
+    ("power", "actual_power", "power_supply"),
+    ("heat", "actual_heat", "heat_sink"),
+)
+
+#  The statuses of a module offline due to a deficiency or an excess of each resource.
+
+DEFICIENCY: tuple[c.ModuleStatus, ...] = (
+    c.MODULE_STATUS_OFFLINE_DUE_TO_OXYGEN_DEFICIENCY,
+    c.MODULE_STATUS_OFFLINE_DUE_TO_POWER_DEFICIENCY,
+    c.MODULE_STATUS_OFFLINE_DUE_TO_HEAT_DEFICIENCY,
+)
+EXCESS: tuple[c.ModuleStatus, ...] = (
+    c.MODULE_STATUS_OFFLINE_DUE_TO_OXYGEN_EXCESS,
+    c.MODULE_STATUS_OFFLINE_DUE_TO_POWER_EXCESS,
+    c.MODULE_STATUS_OFFLINE_DUE_TO_HEAT_EXCESS,
+)
+
+#  The attributes of a module's withdrawal and deposit of each resource;
+#  the engine's heat deposit rises with the terrain.
+
+ATTRIBUTES: tuple[tuple[str, str, str, str], ...] = tuple(
+    (
+        f"{_name}_withdrawal",
+        f"{_name}_withdrawal_essential",
+        "actual_heat_deposit" if _name == "heat" else f"{_name}_deposit",
+        f"{_name}_deposit_essential",
+    )
+    for _name in ("oxygen", "power", "heat")
+)
+
+
+def allocate(requests: list[tuple[int, bool]], budget: int, keys: Optional[list[int]] = None) -> list[int]:
+    """allocate
+
+    Shares out an amount of a resource between requests. The essential requests are met first,
+    then the rest; if a class of requests can't all be met in full, the amount left is shared
+    between them in proportion to what they asked for, rounded down, and what rounding leaves over
+    is given out a unit at a time to the requests with the largest remainders, ties going to the lowest key,
+    so the amount is all used and the order of the requests doesn't matter.
+
+    Args:
+        requests (list[tuple[int, bool]]): each amount asked for, and whether it is essential.
+        budget (int): the amount to share out.
+        keys (Optional[list[int]]): a distinct key for each request, to break ties. Defaults to their positions.
+
+    Returns:
+        list[int]: the amount given to each request.
+    """
+
+    _keys: list[int] = list(range(len(requests))) if keys is None else keys
+    _granted: list[int] = [0] * len(requests)
+    _budget: int = max(budget, 0)
+
+    for _essential in (True, False):
+        _indices: list[int] = [_index for _index, (_, _class) in enumerate(requests) if _class == _essential]
+        _total: int = sum(requests[_index][0] for _index in _indices)
+
+        if _total <= _budget:
+            for _index in _indices:
+                _granted[_index] = requests[_index][0]
+            _budget -= _total
+            continue
+
+        for _index in _indices:
+            _granted[_index] = requests[_index][0] * _budget // _total
+
+        _left: int = _budget - sum(_granted[_index] for _index in _indices)
+        _indices.sort(key=lambda _index: (-(requests[_index][0] * _budget % _total), _keys[_index]))
+        for _index in _indices[:_left]:
+            _granted[_index] += 1
+
+        _budget = 0
+
+    return _granted
+
+
+def solve(
+    level: int,
+    bounds: tuple[int, int],
+    accepts_deposits: bool,
+    withdrawals: list[tuple[int, bool]],
+    deposits: list[tuple[int, bool]],
+    keys: Optional[list[int]] = None,
+) -> tuple[int, list[bool], list[bool]]:
+    """solve
+
+    Resolves the withdrawals and deposits made on a supply in one update, as if they were all made at once.
+    If the level they would leave is within bounds they are all met. If it would be too low, the deposits
+    are all met and the withdrawals share what there is, and if it would be too high, the withdrawals are
+    all met and the deposits share the room there is.
+
+    Args:
+        level (int): the level of the supply.
+        bounds (tuple[int, int]): the lowest and highest the level can be.
+        accepts_deposits (bool): False if the supply refuses all deposits.
+        withdrawals (list[tuple[int, bool]]): each amount to withdraw, and whether it is essential.
+        deposits (list[tuple[int, bool]]): each amount to deposit, and whether it is essential.
+        keys (Optional[list[int]]): a distinct key for each module making a withdrawal and deposit, to break ties
+            when sharing out. Defaults to their positions.
+
+    Returns:
+        tuple[int, list[bool], list[bool]]: the new level, and whether each withdrawal and deposit was met in full.
+    """
+
+    _lowest, _highest = bounds
+
+    _withdrawn: list[int] = [_amount for _amount, _ in withdrawals]
+    _deposited: list[int] = [_amount if accepts_deposits else 0 for _amount, _ in deposits]
+
+    _withdrawal: int = sum(_withdrawn)
+    _deposit: int = sum(_deposited)
+    _level: int = level + _deposit - _withdrawal
+
+    if _level < _lowest:
+        _withdrawn = allocate(withdrawals, level - _lowest + _deposit, keys)
+    elif _level > _highest:
+        _deposited = allocate(
+            [(_amount, _essential) for (_, _essential), _amount in zip(deposits, _deposited)],
+            _highest - level + _withdrawal,
+            keys,
+        )
+
+    return (
+        level + sum(_deposited) - sum(_withdrawn),
+        [_given >= _amount for _given, (_amount, _) in zip(_withdrawn, withdrawals)],
+        [accepts_deposits and _given >= _amount for _given, (_amount, _) in zip(_deposited, deposits)],
+    )
+
+
+def allocate_array(requested: np.ndarray, essential: np.ndarray, budget: np.ndarray) -> np.ndarray:
+    """allocate_array
+
+    Shares out an amount of a resource between requests, as allocate does, for many supplies at once;
+    ties are broken by column, lowest first.
+
+    Args:
+        requested (np.ndarray): the amounts asked for, one row per supply.
+        essential (np.ndarray): True where a request is essential.
+        budget (np.ndarray): the amount to share out, for each supply.
+
+    Returns:
+        np.ndarray: the amount given to each request.
+    """
+
+    _granted: np.ndarray = np.zeros_like(requested)
+    _budget: np.ndarray = np.maximum(budget, 0)
+
+    _columns: np.ndarray = np.broadcast_to(np.arange(requested.shape[1]), requested.shape)
+
+    for _class in (essential, ~essential):
+        _amount: np.ndarray = np.where(_class, requested, 0)
+        _total: np.ndarray = _amount.sum(axis=1)
+        _full: np.ndarray = _total <= _budget
+
+        _shared: np.ndarray = _amount * _budget[:, np.newaxis]
+        _divisor: np.ndarray = np.maximum(_total, 1)[:, np.newaxis]
+        _share: np.ndarray = np.where(_full[:, np.newaxis], _amount, _shared // _divisor)
+
+        #  Give what rounding leaves over to the largest remainders, then the lowest columns.
+
+        _left: np.ndarray = np.where(_full, 0, _budget - _share.sum(axis=1))
+        _order: np.ndarray = np.lexsort((_columns, -(_shared % _divisor)), axis=-1)
+        _rank: np.ndarray = np.empty_like(_order)
+        np.put_along_axis(_rank, _order, _columns, axis=1)
+        _share += _rank < _left[:, np.newaxis]
+
+        _granted += _share
+        _budget = np.where(_full, _budget - _total, 0)
+
+    return _granted
+
+
+def solve_array(
+    level: np.ndarray,
+    lowest: np.ndarray,
+    highest: np.ndarray,
+    accepts_deposits: np.ndarray,
+    withdrawal: np.ndarray,
+    withdrawal_essential: np.ndarray,
+    deposit: np.ndarray,
+    deposit_essential: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """solve_array
+
+    Resolves the withdrawals and deposits made on many supplies in one update, as solve does.
+
+    Args:
+        level (np.ndarray): the level of each supply.
+        lowest (np.ndarray): the lowest each level can be.
+        highest (np.ndarray): the highest each level can be.
+        accepts_deposits (np.ndarray): False for each supply that refuses all deposits.
+        withdrawal (np.ndarray): the amounts to withdraw, one row per supply, zero for no withdrawal.
+        withdrawal_essential (np.ndarray): True where a withdrawal is essential.
+        deposit (np.ndarray): the amounts to deposit, one row per supply, zero for no deposit.
+        deposit_essential (np.ndarray): True where a deposit is essential.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray, np.ndarray]: the new levels,
+            and True where each withdrawal and deposit was met in full.
+    """
+
+    _withdrawn: np.ndarray = withdrawal.copy()
+    _deposited: np.ndarray = np.where(accepts_deposits[:, np.newaxis], deposit, 0)
+
+    _withdrawal: np.ndarray = _withdrawn.sum(axis=1)
+    _deposit: np.ndarray = _deposited.sum(axis=1)
+    _level: np.ndarray = level + _deposit - _withdrawal
+
+    _short: np.ndarray = _level < lowest
+    if _short.any():
+        _withdrawn[_short] = allocate_array(
+            withdrawal[_short],
+            withdrawal_essential[_short],
+            (level - lowest + _deposit)[_short],
+        )
+
+    _over: np.ndarray = _level > highest
+    if _over.any():
+        _deposited[_over] = allocate_array(
+            _deposited[_over],
+            deposit_essential[_over],
+            (highest - level + _withdrawal)[_over],
+        )
+
+    return (
+        level + _deposited.sum(axis=1) - _withdrawn.sum(axis=1),
+        _withdrawn >= withdrawal,
+        accepts_deposits[:, np.newaxis] & (_deposited >= deposit),
+    )
+
+
+class FlowSolver:
+    """FlowSolver
+
+    The FlowSolver stands in for the modules' update_oxygen, update_power and update_heat.
+    Each update it collects the withdrawals and deposits every module would make on each supply,
+    going by the statuses at the start of the update, resolves each supply with solve,
+    sets the supply levels and then tells each module how its requests went, so it can go offline or online.
+
+    A module that goes offline, or online, over one resource keeps the outcome of the others
+    but doesn't change status again in the same update.
+    The modules are grouped by the supplies they are connected to when the FlowSolver is created.
+    """
+
+    def __init__(self, modules: list[Module]) -> None:
+        """__init__
+
+        Initialise the FlowSolver.
+
+        Args:
+            modules (list[Module]): the modules that draw on the supplies.
+        """
+
+        self.modules: list[Module] = modules
+
+        #  The modules connected to each supply, by their index, for each resource.
+
+        self.networks: list[list[tuple[Any, list[int]]]] = []
+
+        for _, _, _connection in RESOURCES:
+            _networks: dict[int, tuple[Any, list[int]]] = {}
+            for _index, _module in enumerate(modules):
+                _supply: Any = getattr(_module, _connection)
+                if _supply is not None:
+                    _networks.setdefault(id(_supply), (_supply, []))[1].append(_index)
+            self.networks.append(list(_networks.values()))
+
+    def update(self) -> None:
+        """update
+
+        Resolves one update's withdrawals and deposits.
+        """
+
+        _modules: list[Module] = self.modules
+
+        #  The requests go by the statuses at the start of the update, and each module changes status at most once.
+
+        _statuses: list[c.ModuleStatus] = [_module.status for _module in _modules]
+        _changed: list[bool] = [False] * len(_modules)
+
+        for _resource, (_name, _attribute, _) in enumerate(RESOURCES):
+            _deficiency: c.ModuleStatus = DEFICIENCY[_resource]
+            _excess: c.ModuleStatus = EXCESS[_resource]
+            _requesting: tuple[tuple[c.ModuleStatus, c.ModuleStatus], tuple[c.ModuleStatus, c.ModuleStatus]] = (
+                (c.MODULE_STATUS_ONLINE, _deficiency),
+                (c.MODULE_STATUS_ONLINE, _excess),
+            )
+            _withdrawal, _withdrawal_essential, _deposit, _deposit_essential = ATTRIBUTES[_resource]
+
+            for _supply, _indices in self.networks[_resource]:
+                _withdraws: list[bool] = [_statuses[_index] in _requesting[0] for _index in _indices]
+                _deposits: list[bool] = [_statuses[_index] in _requesting[1] for _index in _indices]
+
+                _level, _withdrawn, _deposited = solve(
+                    getattr(_supply, _attribute),
+                    _supply.bounds(),
+                    _supply.accepts_deposits(),
+                    [
+                        (
+                            getattr(_modules[_index], _withdrawal) if _made else 0,
+                            getattr(_modules[_index], _withdrawal_essential),
+                        )
+                        for _index, _made in zip(_indices, _withdraws)
+                    ],
+                    [
+                        (
+                            getattr(_modules[_index], _deposit) if _made else 0,
+                            getattr(_modules[_index], _deposit_essential),
+                        )
+                        for _index, _made in zip(_indices, _deposits)
+                    ],
+                    _indices,
+                )
+                setattr(_supply, _attribute, _level)
+
+                #  Tell the modules how their requests went. Only a request that wasn't met in full,
+                #  or one that was met for a module offline for want of it, can change a status.
+
+                for _index, _withdraws_made, _withdrawal_met, _deposit_made, _deposit_met in zip(
+                    _indices, _withdraws, _withdrawn, _deposits, _deposited
+                ):
+                    if _changed[_index]:
+                        continue
+                    if (
+                        _withdraws_made
+                        and (not _withdrawal_met or _statuses[_index] == _deficiency)
+                        and _modules[_index].settle_withdrawal(_name, _withdrawal_met)
+                    ):
+                        _changed[_index] = True
+                    elif (
+                        _deposit_made
+                        and (not _deposit_met or _statuses[_index] == _excess)
+                        and _modules[_index].settle_deposit(_name, _deposit_met)
+                    ):
+                        _changed[_index] = True
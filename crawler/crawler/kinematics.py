@@ -0,0 +1,239 @@
+#  The Kinematics class.
+#  Holds the positions, headings and speeds of a fleet of crawlers in arrays, and moves them all in one step.
+
+from types import SimpleNamespace
+from typing import Union
+
+import numpy as np
+import pygame
+
+import crawler.constants as c
+from crawler.crawler.modules.engine import Engine
+from crawler.map.terrain import TerrainMap
+
+#  The direction a crawler faces at each whole heading, from Vector2.rotate, so they match it exactly.
+
+UNIT: np.ndarray = np.array([tuple(pygame.Vector2(1, 0).rotate(-_heading)) for _heading in range(360)])
+
+#  The speed of the engine on each terrain level, forwards and, negated, in reverse,
+#  from Engine.speed itself, so they can't drift apart.
+
+SPEEDS: np.ndarray = np.array(
+    [
+        [
+            (-1 if _reversing else 1)
+            * Engine.speed.fget(SimpleNamespace(moving=True, reversing=_reversing, terrain=_terrain))  # type: ignore
+            for _terrain in range(c.TERRAIN_LEVEL_MAX + 1)
+        ]
+        for _reversing in (False, True)
+    ],
+    dtype=np.float64,
+)
+
+#  The limits of the map the crawlers' centres are kept within.
+
+LEFT: float = c.MAP_TILE_SIZE / 2
+TOP: float = c.MAP_TILE_SIZE / 2
+RIGHT: float = (c.MAP_TILES_ACROSS * c.MAP_TILE_SIZE) - (c.MAP_TILE_SIZE / 2) - 3
+BOTTOM: float = (c.MAP_TILES_DOWN * c.MAP_TILE_SIZE) - c.MAP_TILE_SIZE - 30
+
+TOP_LEFT: np.ndarray = np.array((LEFT, TOP))
+BOTTOM_RIGHT: np.ndarray = np.array((RIGHT, BOTTOM))
+
+#  The rows of some crawlers, as a slice where they are next to each other, which is quicker to index by.
+
+Rows = Union[slice, np.ndarray]
+
+#  A crawler has moved if it has moved at least this far along either axis, as Vector2 compares them.
+
+EPSILON: float = 1e-6
+
+
+class Kinematics:
+    """Kinematics
+
+    The Kinematics holds, for each crawler of a fleet, its position, the position at the previous step,
+    the position drawn between the two, its velocity, heading and rate of turn, the terrain under it,
+    and whether it is moving, reversing or blocked, each in an array with a row for every crawler.
+
+    Each crawler starts with a Kinematics of its own, and a fleet is joined in one, so that all its crawlers
+    can be turned, sped up or slowed down for the terrain, moved and kept on the map in one step,
+    however many there are. Where they are drawn is worked out in one step too.
+    """
+
+    #  The arrays, their types, and the shape of each row.
+
+    FIELDS: tuple[tuple[str, type, tuple[int, ...]], ...] = (
+        ("position", np.float64, (2,)),
+        ("previous", np.float64, (2,)),
+        ("render", np.float64, (2,)),
+        ("velocity", np.float64, (2,)),
+        ("rot", np.int64, ()),
+        ("rot_speed", np.float64, ()),
+        ("terrain", np.int64, ()),
+        ("moving", np.bool_, ()),
+        ("reversing", np.bool_, ()),
+        ("blocked", np.bool_, ()),
+    )
+
+    def __init__(self, capacity: int = 1) -> None:
+        """__init__
+
+        Initialise the Kinematics, with no crawlers.
+
+        Args:
+            capacity (int): the number of crawlers to make room for. Defaults to 1.
+        """
+
+        self.count: int = 0
+
+        self.position: np.ndarray
+        self.previous: np.ndarray
+        self.render: np.ndarray
+        self.velocity: np.ndarray
+        self.rot: np.ndarray
+        self.rot_speed: np.ndarray
+        self.terrain: np.ndarray
+        self.moving: np.ndarray
+        self.reversing: np.ndarray
+        self.blocked: np.ndarray
+
+        for _name, _type, _shape in self.FIELDS:
+            setattr(self, _name, np.zeros((max(capacity, 1), *_shape), dtype=_type))
+
+    def __len__(self) -> int:
+        return self.count
+
+    def add(self) -> int:
+        """add
+
+        Adds a crawler, standing still at the top left of the map, making more room if need be.
+
+        Returns:
+            int: the crawler's row.
+        """
+
+        _capacity: int = len(self.position)
+
+        if self.count == _capacity:
+            for _name, _type, _shape in self.FIELDS:
+                _array: np.ndarray = np.zeros((_capacity * 2, *_shape), dtype=_type)
+                _array[: self.count] = getattr(self, _name)
+                setattr(self, _name, _array)
+
+        self.count += 1
+
+        return self.count - 1
+
+    @classmethod
+    def join(cls, crawlers: list) -> "Kinematics":  # type: ignore
+        """join
+
+        Moves the crawlers of a fleet in to one Kinematics, each keeping its movement,
+        in the row of its index in the fleet.
+
+        Args:
+            crawlers (list[Crawler]): the crawlers, which are given their new kinematics and rows.
+
+        Returns:
+            Kinematics: the Kinematics.
+        """
+
+        _kinematics: Kinematics = cls(len(crawlers))
+
+        for _crawler in crawlers:
+            _row: int = _kinematics.add()
+            for _name, _, _ in cls.FIELDS:
+                getattr(_kinematics, _name)[_row] = getattr(_crawler.kinematics, _name)[_crawler.row]
+            _crawler.kinematics = _kinematics
+            _crawler.row = _row
+
+        return _kinematics
+
+    @staticmethod
+    def rows_of(crawlers: list) -> Rows:  # type: ignore
+        """rows_of
+
+        Gets the rows of crawlers.
+
+        Args:
+            crawlers (list[Crawler]): the crawlers.
+
+        Returns:
+            Rows: the rows, as a slice if they are in order and next to each other.
+        """
+
+        _rows: list[int] = [_crawler.row for _crawler in crawlers]
+
+        if _rows and _rows == list(range(_rows[0], _rows[0] + len(_rows))):
+            return slice(_rows[0], _rows[0] + len(_rows))
+
+        return np.array(_rows, dtype=np.int64)
+
+    def integrate(self, rows: Rows, dt: np.ndarray) -> np.ndarray:
+        """integrate
+
+        Turns the crawlers, sets their velocities from their headings and the terrain they are on,
+        moves them, and keeps them on the map. Their positions before moving are kept as their previous positions.
+
+        Args:
+            rows (Rows): the rows of the crawlers.
+            dt (np.ndarray): the time to move each crawler by, in seconds.
+
+        Returns:
+            np.ndarray: for each crawler, whether it has moved.
+        """
+
+        _rot: np.ndarray = ((self.rot[rows] + self.rot_speed[rows] * dt) % 360).astype(np.int64)
+        self.rot[rows] = _rot
+
+        _speed: np.ndarray = SPEEDS[self.reversing[rows].astype(np.int64), self.terrain[rows]] * self.moving[rows]
+        _velocity: np.ndarray = UNIT[_rot] * _speed[:, None]
+        self.velocity[rows] = _velocity
+
+        _previous: np.ndarray = self.position[rows]
+        _position: np.ndarray = np.minimum(
+            np.maximum(_previous + _velocity * dt[:, None], TOP_LEFT), BOTTOM_RIGHT
+        )
+        #  Indexed by a slice, _previous is a view of the positions, so compare them before they are moved.
+
+        _moved: np.ndarray = (np.abs(_position - _previous) >= EPSILON).any(axis=1)
+
+        self.previous[rows] = _previous
+        self.position[rows] = _position
+
+        return _moved
+
+    def look_up_terrain(self, rows: Rows, terrain_map: TerrainMap) -> np.ndarray:
+        """look_up_terrain
+
+        Sets the terrain of the crawlers from the tiles they are on, as TerrainMap.level_at does.
+
+        Args:
+            rows (Rows): the rows of the crawlers.
+            terrain_map (TerrainMap): the terrain.
+
+        Returns:
+            np.ndarray: the terrain level of each crawler.
+        """
+
+        _tiles: np.ndarray = np.minimum(
+            np.maximum(self.position[rows].astype(np.int64) // (terrain_map.tile_width, terrain_map.tile_height), 0),
+            (terrain_map.cols - 1, terrain_map.rows - 1),
+        )
+
+        _terrain: np.ndarray = terrain_map.data[_tiles[:, 1], _tiles[:, 0]].astype(np.int64)
+        self.terrain[rows] = _terrain
+
+        return _terrain
+
+    def interpolate(self, rows: Rows, alpha: float) -> None:
+        """interpolate
+
+        Places the crawlers between their positions at the last two steps, for drawing, as Vector2.lerp does.
+
+        Args:
+            rows (Rows): the rows of the crawlers.
+            alpha (float): how far between the steps, 0 at the previous step and 1 at the last.
+        """
+        self.render[rows] = self.previous[rows] * (1 - alpha) + self.position[rows] * alpha
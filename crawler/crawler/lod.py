@@ -0,0 +1,166 @@
+#  The LODScheduler class.
+#  Updates the crawlers in view every step, and those out of view a few steps at a time.
+
+from typing import Any, Optional
+
+import pygame
+
+import crawler.constants as c
+from crawler.clock import SimulationClock
+from crawler.crawler.crawler import Crawler
+from crawler.crawler.kinematics import Kinematics
+
+
+class LODScheduler:
+    """LODScheduler
+
+    The LODScheduler stands in for updating every crawler every simulation step and interpolating it every frame.
+
+    Crawlers in, or near, the map view, and the crawler being driven, are in the foreground;
+    they are updated every step, and placed and rotated for drawing every frame.
+    The others are in the background, aren't drawn, and owe the steps they haven't been updated for;
+    a moving crawler is updated once it owes c.LOD_BACKGROUND_STEPS steps, all at once,
+    so it is moved in bigger steps and its animation frame moved on by all of them,
+    and a stationary crawler is only moved on when its systems are next due to update, which is exact;
+    its SystemScheduler then skips the updates that would only move its levels on.
+    A crawler settles any steps it owes before it comes in to view, or starts or stops moving.
+
+    The background steps are aligned to multiples of c.LOD_BACKGROUND_STEPS, which divides c.SYSTEM_UPDATE_STEPS,
+    so the systems of background crawlers still update on time.
+
+    The crawlers are joined in one Kinematics, so the foreground crawlers are moved together each step,
+    and the background crawlers due an update together, however many steps each owes.
+    """
+
+    def __init__(
+        self,
+        crawlers: list[Crawler],
+        background_steps: int = c.LOD_BACKGROUND_STEPS,
+        margin: int = c.LOD_VIEW_MARGIN,
+    ) -> None:
+        """__init__
+
+        Initialise the LODScheduler.
+
+        Args:
+            crawlers (list[Crawler]): the crawlers.
+            background_steps (int): the steps to update background crawlers by at once. Defaults to c.LOD_BACKGROUND_STEPS.
+            margin (int): how far out of the view a crawler is still in the foreground. Defaults to c.LOD_VIEW_MARGIN.
+        """
+
+        self.crawlers: list[Crawler] = crawlers
+        self.kinematics: Kinematics = Kinematics.join(crawlers)
+
+        self.background_steps: int = background_steps
+        self.margin: int = margin
+
+        #  The steps each crawler owes, and whether it was stationary for them.
+
+        self.owed: list[int] = [0] * len(crawlers)
+        self.owed_stationary: list[bool] = [False] * len(crawlers)
+
+        #  The number of updates of crawlers in the foreground and background, and of steps skipped.
+
+        self.foreground_updates: int = 0
+        self.background_updates: int = 0
+        self.skips: int = 0
+
+    def settle(self, index: int, step: float, steps: int) -> None:
+        """settle
+
+        Updates a crawler by some of the steps it owes.
+
+        Args:
+            index (int): the index of the crawler.
+            step (float): the length of a step.
+            steps (int): the number of steps.
+        """
+
+        if self.owed_stationary[index]:
+            self.crawlers[index].skip(step, steps)
+            self.skips += 1
+        else:
+            self.crawlers[index].update(step, steps)
+            self.background_updates += 1
+
+        self.owed[index] -= steps
+
+    def update(self, clock: SimulationClock, steps: int, viewport: Optional[pygame.Rect], selected: int) -> None:
+        """update
+
+        Updates the crawlers by the steps the clock has run this frame, and places those in view for drawing.
+
+        Args:
+            clock (SimulationClock): the clock.
+            steps (int): the number of steps to run.
+            viewport (Optional[pygame.Rect]): the area of the map in view, if there is one.
+            selected (int): the index of the crawler being driven, which is always in the foreground.
+        """
+
+        _view: Optional[pygame.Rect] = None if viewport is None else viewport.inflate(self.margin * 2, self.margin * 2)
+
+        #  The crawlers in the foreground, and the background crawlers due an update and by how many steps.
+
+        _foreground: list[Crawler] = []
+        _due: dict[int, int] = {}
+
+        #  The positions, and whether the crawlers are moving or turning, read from the Kinematics all at once;
+        #  joining put each crawler in the row of its index.
+
+        _count: int = len(self.crawlers)
+        _positions: list[list[float]] = self.kinematics.position[:_count].tolist()
+        _still: list[bool] = (~self.kinematics.moving[:_count] & (self.kinematics.rot_speed[:_count] == 0)).tolist()
+
+        for _index, _crawler in enumerate(self.crawlers):
+            _in_view: bool = _index == selected or (_view is not None and _view.collidepoint(_positions[_index]))
+            _stationary: bool = _still[_index] and _crawler.autopilot.active is False
+
+            #  Settle the steps owed if the crawler has come in to view, or started or stopped moving.
+
+            if self.owed[_index] and (_in_view or _stationary is not self.owed_stationary[_index]):
+                self.settle(_index, clock.step, self.owed[_index])
+
+            _crawler.in_view = _in_view
+
+            if _in_view:
+                _foreground.append(_crawler)
+                continue
+
+            self.owed[_index] += steps
+            self.owed_stationary[_index] = _stationary
+
+            #  A stationary crawler is moved on once its systems are due to update, a moving one
+            #  up to each multiple of the background steps.
+
+            if _stationary:
+                if (_crawler.steps + self.owed[_index]) // c.SYSTEM_UPDATE_STEPS > _crawler.steps // c.SYSTEM_UPDATE_STEPS:
+                    self.settle(_index, clock.step, self.owed[_index])
+            elif self.owed[_index] >= self.background_steps - _crawler.steps % self.background_steps:
+                _due[_index] = self.background_steps - _crawler.steps % self.background_steps
+
+        for _ in range(steps):
+            Crawler.update_all(_foreground, clock.step)
+        Crawler.interpolate_all(_foreground, clock.alpha)
+        self.foreground_updates += steps * len(_foreground)
+
+        while _due:
+            Crawler.update_all([self.crawlers[_index] for _index in _due], clock.step, list(_due.values()))
+            for _index, _steps in _due.items():
+                self.owed[_index] -= _steps
+            self.background_updates += len(_due)
+            _due = {_index: self.background_steps for _index in _due if self.owed[_index] >= self.background_steps}
+
+    def stats(self) -> dict[str, Any]:
+        """stats
+
+        Gets the current state of the LODScheduler.
+
+        Returns:
+            dict[str, Any]: the number of crawlers in view, and the updates in the foreground and background, and skips.
+        """
+        return {
+            "in_view": sum(1 for _crawler in self.crawlers if _crawler.in_view),
+            "foreground_updates": self.foreground_updates,
+            "background_updates": self.background_updates,
+            "skips": self.skips,
+        }
@@ -14,6 +14,8 @@ class Cooler(Module):
         Module: The Cooler subclasses the Module class.
     """
 
+    __slots__ = ()
+
     def __init__(self, *args: Any, **kwargs: Any) -> None:
 
         super().__init__(*args, **kwargs)
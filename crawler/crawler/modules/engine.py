@@ -10,10 +10,51 @@ class Engine(Module):
 
     Represents the crawler's engine.
 
+    The crawler sets the terrain, and whether it is moving or reversing, every step,
+    so the engine counts how many times they have actually changed, for the system's version.
+
     Args:
         Module: The Engine subclasses the Module class.
     """
 
+    __slots__ = ("_terrain", "_moving", "_reversing", "changes")
+
+    @property
+    def terrain(self) -> int:
+        #  Returns the terrain level of the tile the crawler is on, 0 to 3.
+        return self._terrain
+
+    @terrain.setter
+    def terrain(self, value: int) -> None:
+        #  Set the terrain, counting it as a change if it is different.
+        if value != self._terrain:
+            self._terrain = value
+            self.changes += 1
+
+    @property
+    def moving(self) -> bool:
+        #  Returns True if the crawler is moving.
+        return self._moving
+
+    @moving.setter
+    def moving(self, value: bool) -> None:
+        #  Set whether the crawler is moving, counting it as a change if it is different.
+        if value != self._moving:
+            self._moving = value
+            self.changes += 1
+
+    @property
+    def reversing(self) -> bool:
+        #  Returns True if the crawler is reversing.
+        return self._reversing
+
+    @reversing.setter
+    def reversing(self, value: bool) -> None:
+        #  Set whether the crawler is reversing, counting it as a change if it is different.
+        if value != self._reversing:
+            self._reversing = value
+            self.changes += 1
+
     @property
     def actual_heat_deposit(self) -> int:
         #  Returns the actual heat deposit.
@@ -94,6 +135,7 @@ class Engine(Module):
 
         super().__init__(*args, **kwargs)
 
-        self.terrain: int = 0
-        self.moving: bool = False
-        self.reversing: bool = False
+        self._terrain: int = 0
+        self._moving: bool = False
+        self._reversing: bool = False
+        self.changes: int = 0
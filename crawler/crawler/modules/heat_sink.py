@@ -2,7 +2,7 @@
 
 from typing import Any
 
-from crawler.crawler.modules.module import Module
+from crawler.crawler.modules.module import Module, warning_level
 
 
 class HeatSink(Module):
@@ -14,10 +14,24 @@ class HeatSink(Module):
         Module: The HeatSink subclasses the Module class.
     """
 
+    __slots__ = ("max_heat", "_actual_heat", "_heat", "_level", "damagable_modules", "damage_amount")
+
+    @property
+    def actual_heat(self) -> int:
+        #  Returns the heat level.
+        return self._actual_heat
+
+    @actual_heat.setter
+    def actual_heat(self, value: int) -> None:
+        #  Set the heat level, and its percentage and warning level; the hotter the heat sink the higher the warning.
+        self._actual_heat = value
+        self._heat = int((value / self.max_heat) * 100)
+        self._level = 3 - warning_level(self._heat)
+
     @property
     def heat(self) -> int:
         #  Returns the heat level as a percetage of the maximum.
-        return int((self.actual_heat / self.max_heat) * 100)
+        return self._heat
 
     @heat.setter
     def heat(self, value: int) -> None:
@@ -27,19 +41,27 @@ class HeatSink(Module):
     @property
     def level(self) -> int:
         #  Returns the heat warning level. 3 = Danger, 2 = Warning, 1 = Notice, 0 = Normal.
-        if self.heat <= 25:
-            return 0
-        elif self.heat <= 50:
-            return 1
-        elif self.heat <= 75:
-            return 2
-        else:
-            return 3
+        return self._level
 
     def limit(self) -> None:
         self.heat = 20 if self.heat < 20 else self.heat
         self.heat = 100 if self.heat > 100 else self.heat
 
+    def rounded(self, value: int) -> int:
+        #  Returns the actual value limit leaves in place of one within bounds;
+        #  setting the heat twice rounds it down to a whole percentage, twice.
+        for _ in range(2):
+            value = int((self.max_heat / 100) * int((value / self.max_heat) * 100))
+        return value
+
+    def bounds(self) -> tuple[int, int]:
+        #  Returns the lowest and highest the actual value can be, as set by limit.
+        return (int((self.max_heat / 100) * 20), int((self.max_heat / 100) * 100))
+
+    def accepts_deposits(self) -> bool:
+        #  Heat can only be deposited if the heat is below 85%.
+        return self.heat <= 85
+
     def withdraw(self, amount: int) -> bool:
         #  Receives a request to withdraw heat.
         #  If the request is successful the method returns True.
@@ -58,7 +80,7 @@ class HeatSink(Module):
         #  Heat can only be deposited if the heat is below 85%.
         #  If the request is successful the method returns True.
 
-        if self.heat <= 85:
+        if self.accepts_deposits():
             self.actual_heat += amount
             self.limit()
             return True
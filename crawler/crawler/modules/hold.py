@@ -4,7 +4,6 @@ from typing import Any
 
 from crawler.crawler.modules.module import Module
 from crawler.crawler.modules.personnel import Personnel
-from crawler.crawler.modules.reporting.log import module_logger
 from crawler.crawler.modules.salvage import Salvage
 
 
@@ -17,6 +16,8 @@ class Hold(Module):
         Module: The Hold subclasses the Module class.
     """
 
+    __slots__ = ("salvage_slots", "personnel_slots")
+
     @property
     def number_of_salvage_slots(self) -> int:
         #  Returns the number of available salvage slots.
@@ -35,7 +36,7 @@ class Hold(Module):
         for _index, _salvage in enumerate(
             self.salvage_slots[self.number_of_salvage_slots :]
         ):
-            module_logger.log(
+            self.journal.log(
                 _salvage.name,
                 f"{_salvage.name} in hold slot {_index+1} has been destroyed.",
                 self.health,
@@ -2,6 +2,8 @@
 
 from typing import Any
 
+import crawler.constants as c
+
 from crawler.crawler.modules.hold import Hold
 from crawler.crawler.modules.module import Module
 from crawler.crawler.modules.personnel import Personnel
@@ -16,11 +18,17 @@ class LifeSupport(Module):
         Module: The LifeSupport subclasses the Module class.
     """
 
+    __slots__ = ("supported_personnel",)
+
     def update(self, mitigations: list[tuple[str, str]]) -> None:
 
         super().update(mitigations)
+        self.support_personnel()
+
+    def support_personnel(self) -> None:
+        #  If the life-support is not online the personnel are harmed, and there are no mitigations.
 
-        if self.status != "ONLINE":
+        if self.status != c.MODULE_STATUS_ONLINE:
             for _person in self.supported_personnel:
                 mitigations = []
                 _person.damage(1, mitigations)
@@ -3,7 +3,7 @@
 from typing import Optional, Protocol
 
 import crawler.constants as c
-from crawler.crawler.modules.reporting.log import module_logger
+from crawler.crawler.modules.reporting.log import Journal
 
 
 class OxygenSource(Protocol):
@@ -18,6 +18,14 @@ class OxygenSource(Protocol):
         #  Set the oxygen level as a percentage of the maximum.
         pass
 
+    def bounds(self) -> tuple[int, int]:  # type:ignore
+        #  Returns the lowest and highest the oxygen level can be.
+        pass
+
+    def accepts_deposits(self) -> bool:  # type:ignore
+        #  Returns True if oxygen can be deposited.
+        pass
+
     def withdraw(self, amount: int) -> bool:  # type:ignore
         #  Receives a request to withdraw oxygen.
         #  If the request is successful the method returns True.
@@ -41,6 +49,14 @@ class PowerSource(Protocol):
         #  Set the power level as a percentage of the maximum.
         pass
 
+    def bounds(self) -> tuple[int, int]:  # type:ignore
+        #  Returns the lowest and highest the power level can be.
+        pass
+
+    def accepts_deposits(self) -> bool:  # type:ignore
+        #  Returns True if power can be deposited.
+        pass
+
     def withdraw(self, amount: int) -> bool:  # type:ignore
         #  Receives a request to withdraw power.
         #  If the request is successful the method returns True.
@@ -64,6 +80,14 @@ class HeatSink(Protocol):
         #  Set the heat level as a percentage of the maximum.
         pass
 
+    def bounds(self) -> tuple[int, int]:  # type:ignore
+        #  Returns the lowest and highest the heat level can be.
+        pass
+
+    def accepts_deposits(self) -> bool:  # type:ignore
+        #  Returns True if heat can be deposited.
+        pass
+
     def withdraw(self, amount: int) -> bool:  # type:ignore
         #  Receives a request to withdraw heat.
         #  If the request is successful the method returns True.
@@ -75,21 +99,77 @@ class HeatSink(Protocol):
         pass
 
 
+def warning_level(percent: int) -> int:
+    #  Returns the warning level of a percentage. 3 = Danger, 2 = Warning, 1 = Notice, 0 = Normal.
+    if percent <= 25:
+        return 3
+    elif percent <= 50:
+        return 2
+    elif percent <= 75:
+        return 1
+    else:
+        return 0
+
+
 class Module:
     """Module
 
     Represents the module object.
+    The health percentage and level are worked out when the health is set, rather than each time they are read.
     """
 
+    __slots__ = (
+        "name",
+        "description",
+        "information",
+        "class_level",
+        "status",
+        "mitigation",
+        "mitigations",
+        "max_health",
+        "_actual_health",
+        "_health",
+        "_health_level",
+        "oxygen_supply",
+        "oxygen_withdrawal",
+        "oxygen_withdrawal_essential",
+        "oxygen_deposit",
+        "oxygen_deposit_essential",
+        "power_supply",
+        "power_withdrawal",
+        "power_withdrawal_essential",
+        "power_deposit",
+        "power_deposit_essential",
+        "heat_sink",
+        "heat_withdrawal",
+        "heat_withdrawal_essential",
+        "heat_deposit",
+        "heat_deposit_essential",
+        "module_name",
+        "journal",
+    )
+
     @property
     def actual_heat_deposit(self) -> int:
         #  Returns the actual heat deposit.
         return self.heat_deposit
 
+    @property
+    def actual_health(self) -> int:
+        #  Returns the health.
+        return self._actual_health
+
+    @actual_health.setter
+    def actual_health(self, value: int) -> None:
+        #  Set the health, and its percentage and level.
+        self._actual_health = value
+        self._health = int((value / self.max_health) * 100)
+        self._health_level = warning_level(self._health)
+
     @property
     def health(self) -> int:
         #  Returns the health level as a percetage of the maximum.
-        return int((self.actual_health / self.max_health) * 100)
+        return self._health
 
     @health.setter
     def health(self, value: int) -> None:
@@ -99,28 +179,21 @@ class Module:
     @property
     def health_level(self) -> int:
         #  Returns the health level. 3 = Danger, 2 = Warning, 1 = Notice, 0 = Normal.
-        if self.health <= 25:
-            return 3
-        elif self.health <= 50:
-            return 2
-        elif self.health <= 75:
-            return 1
-        else:
-            return 0
+        return self._health_level
 
     def toggle_online(self) -> None:
         #  Toggles the module online / offline.
-        if self.status == "ONLINE":
+        if self.status == c.MODULE_STATUS_ONLINE:
             self.status = c.MODULE_STATUS_OFFLINE_BY_REQUEST
-            module_logger.log(
+            self.journal.log(
                 self.module_name,
                 f"{self.name} has been manually taken offline.",
                 self.health,
                 self.health_level,
             )
-        elif self.status.startswith("OFFLINE"):
-            self.status = "ONLINE"
-            module_logger.log(
+        elif self.status.offline:
+            self.status = c.MODULE_STATUS_ONLINE
+            self.journal.log(
                 self.module_name,
                 f"{self.name} has been manually taken online.",
                 self.health,
@@ -164,7 +237,7 @@ class Module:
                 and self.status != c.MODULE_STATUS_OFFLINE_DUE_TO_OXYGEN_DEFICIENCY
             ):
                 self.status = c.MODULE_STATUS_OFFLINE_DUE_TO_OXYGEN_DEFICIENCY
-                module_logger.log(
+                self.journal.log(
                     self.module_name,
                     f"{self.name} has gone offline due to oxygen deficiency.",
                     self.health,
@@ -177,8 +250,8 @@ class Module:
                 _oxygen_withdrawn is True
                 and self.status == c.MODULE_STATUS_OFFLINE_DUE_TO_OXYGEN_DEFICIENCY
             ):
-                self.status = "ONLINE"
-                module_logger.log(
+                self.status = c.MODULE_STATUS_ONLINE
+                self.journal.log(
                     self.module_name,
                     f"{self.name} has gone online due to restored oxygen.",
                     self.health,
@@ -203,7 +276,7 @@ class Module:
                 and self.status != c.MODULE_STATUS_OFFLINE_DUE_TO_OXYGEN_EXCESS
             ):
                 self.status = c.MODULE_STATUS_OFFLINE_DUE_TO_OXYGEN_EXCESS
-                module_logger.log(
+                self.journal.log(
                     self.module_name,
                     f"{self.name} has gone offline due to oxygen excess.",
                     self.health,
@@ -217,8 +290,8 @@ class Module:
                 _oxygen_deposited is True
                 and self.status == c.MODULE_STATUS_OFFLINE_DUE_TO_OXYGEN_EXCESS
             ):
-                self.status = "ONLINE"
-                module_logger.log(
+                self.status = c.MODULE_STATUS_ONLINE
+                self.journal.log(
                     self.module_name,
                     f"{self.name} has gone online due to reduced oxygen.",
                     self.health,
@@ -248,7 +321,7 @@ class Module:
                 and self.status != c.MODULE_STATUS_OFFLINE_DUE_TO_POWER_DEFICIENCY
             ):
                 self.status = c.MODULE_STATUS_OFFLINE_DUE_TO_POWER_DEFICIENCY
-                module_logger.log(
+                self.journal.log(
                     self.module_name,
                     f"{self.name} has gone offline due to power deficiency.",
                     self.health,
@@ -261,8 +334,8 @@ class Module:
                 _power_withdrawn is True
                 and self.status == c.MODULE_STATUS_OFFLINE_DUE_TO_POWER_DEFICIENCY
             ):
-                self.status = "ONLINE"
-                module_logger.log(
+                self.status = c.MODULE_STATUS_ONLINE
+                self.journal.log(
                     self.module_name,
                     f"{self.name} has gone online due to restored power.",
                     self.health,
@@ -287,7 +360,7 @@ class Module:
                 and self.status != c.MODULE_STATUS_OFFLINE_DUE_TO_POWER_EXCESS
             ):
                 self.status = c.MODULE_STATUS_OFFLINE_DUE_TO_POWER_EXCESS
-                module_logger.log(
+                self.journal.log(
                     self.module_name,
                     f"{self.name} has gone offline due to power excess.",
                     self.health,
@@ -301,8 +374,8 @@ class Module:
                 _power_deposited is True
                 and self.status == c.MODULE_STATUS_OFFLINE_DUE_TO_POWER_EXCESS
             ):
-                self.status = "ONLINE"
-                module_logger.log(
+                self.status = c.MODULE_STATUS_ONLINE
+                self.journal.log(
                     self.module_name,
                     f"The {self.name} has gone online due to reduced power.",
                     self.health,
@@ -332,7 +405,7 @@ class Module:
                 and self.status != c.MODULE_STATUS_OFFLINE_DUE_TO_HEAT_DEFICIENCY
             ):
                 self.status = c.MODULE_STATUS_OFFLINE_DUE_TO_HEAT_DEFICIENCY
-                module_logger.log(
+                self.journal.log(
                     self.module_name,
                     f"{self.name} has gone offline due to heat deficiency.",
                     self.health,
@@ -345,8 +418,8 @@ class Module:
                 _heat_withdrawn is True
                 and self.status == c.MODULE_STATUS_OFFLINE_DUE_TO_HEAT_DEFICIENCY
             ):
-                self.status = "ONLINE"
-                module_logger.log(
+                self.status = c.MODULE_STATUS_ONLINE
+                self.journal.log(
                     self.module_name,
                     f"{self.name} has gone online due to restored heat.",
                     self.health,
@@ -371,7 +444,7 @@ class Module:
                 and self.status != c.MODULE_STATUS_OFFLINE_DUE_TO_HEAT_EXCESS
             ):
                 self.status = c.MODULE_STATUS_OFFLINE_DUE_TO_HEAT_EXCESS
-                module_logger.log(
+                self.journal.log(
                     self.module_name,
                     f"{self.name} has gone offline due to heat excess.",
                     self.health,
@@ -385,8 +458,8 @@ class Module:
                 _heat_deposited is True
                 and self.status == c.MODULE_STATUS_OFFLINE_DUE_TO_HEAT_EXCESS
             ):
-                self.status = "ONLINE"
-                module_logger.log(
+                self.status = c.MODULE_STATUS_ONLINE
+                self.journal.log(
                     self.module_name,
                     f"{self.name} has gone online due to reduced heat.",
                     self.health,
@@ -394,6 +467,74 @@ class Module:
                 )
                 return
 
+    def settle_withdrawal(self, resource: str, withdrawn: bool) -> bool:
+        #  Receives the outcome of a withdrawal that the flow solver has resolved.
+        #  If the withdrawal is essential and the full amount was not withdrawn the module goes offline,
+        #  and if it was offline due to the deficiency and the full amount was withdrawn it goes back online.
+        #  If the status changes the method returns True.
+
+        _deficiency: c.ModuleStatus = getattr(c, f"MODULE_STATUS_OFFLINE_DUE_TO_{resource.upper()}_DEFICIENCY")
+
+        if (
+            getattr(self, f"{resource}_withdrawal_essential")
+            and withdrawn is not True
+            and self.status != _deficiency
+        ):
+            self.status = _deficiency
+            self.journal.log(
+                self.module_name,
+                f"{self.name} has gone offline due to {resource} deficiency.",
+                self.health,
+                self.health_level,
+            )
+            return True
+
+        if withdrawn is True and self.status == _deficiency:
+            self.status = c.MODULE_STATUS_ONLINE
+            self.journal.log(
+                self.module_name,
+                f"{self.name} has gone online due to restored {resource}.",
+                self.health,
+                self.health_level,
+            )
+            return True
+
+        return False
+
+    def settle_deposit(self, resource: str, deposited: bool) -> bool:
+        #  Receives the outcome of a deposit that the flow solver has resolved.
+        #  If the deposit is essential and the full amount was not deposited the module goes offline,
+        #  and if it was offline due to the excess and the full amount was deposited it goes back online.
+        #  If the status changes the method returns True.
+
+        _excess: c.ModuleStatus = getattr(c, f"MODULE_STATUS_OFFLINE_DUE_TO_{resource.upper()}_EXCESS")
+
+        if (
+            getattr(self, f"{resource}_deposit_essential")
+            and deposited is not True
+            and self.status != _excess
+        ):
+            self.status = _excess
+            self.journal.log(
+                self.module_name,
+                f"{self.name} has gone offline due to {resource} excess.",
+                self.health,
+                self.health_level,
+            )
+            return True
+
+        if deposited is True and self.status == _excess:
+            self.status = c.MODULE_STATUS_ONLINE
+            self.journal.log(
+                self.module_name,
+                f"{self.name} has gone online due to reduced {resource}.",
+                self.health,
+                self.health_level,
+            )
+            return True
+
+        return False
+
     def damage(self, damage_amount: int, mitigations: list[tuple[str, str]]) -> None:
         #  Applies damage to the module.
         #  If the health drops below 25% and there is a mitigating value then the health is fixed at 25%.
@@ -407,14 +548,14 @@ class Module:
             _mitigation: Optional[tuple[str, str]] = self.get_mitigation(mitigations)
             if self.health < 25 and _mitigation is not None:
                 self.health = 25
-                module_logger.log(
+                self.journal.log(
                     self.module_name,
                     f"{self.name} is stablised at 25% by {_mitigation[1]}, {_mitigation[0]}.",
                     self.health,
                     self.health_level,
                 )
             else:
-                module_logger.log(
+                self.journal.log(
                     self.module_name,
                     f"{self.name} is taking heat damage.",
                     self.health,
@@ -423,16 +564,15 @@ class Module:
             if self.actual_health <= 0:
                 self.actual_health = 0
                 self.status = c.MODULE_STATUS_FAILED_DUE_TO_HEAT_DAMAGE
-                module_logger.log(
+                self.journal.log(
                     self.module_name,
                     f"{self.name} has failed due to heat damage.",
                     self.health,
                     self.health_level,
                 )
 
-        module_logger.log(
+        self.journal.refresh(
             self.module_name,
-            module_logger.messages[self.module_name][0],
             self.health,
             self.health_level,
         )
@@ -461,7 +601,7 @@ class Module:
         description: str = "This is a crawler module",
         information: str = "",
         class_level: int = 1,
-        status: str = c.MODULE_STATUS_ONLINE,
+        status: c.ModuleStatus = c.MODULE_STATUS_ONLINE,
         mitigation: str = "",
         max_health: int = 1000,
         oxygen_supply: Optional[OxygenSource] = None,
@@ -480,13 +620,14 @@ class Module:
         heat_deposit: int = 0,
         heat_deposit_essential: bool = False,
         module_index: int = 0,
+        journal: Optional[Journal] = None,
     ) -> None:
 
         self.name: str = name
         self.description: str = description
         self.information: str = information
         self.class_level: int = class_level
-        self.status: str = status
+        self.status: c.ModuleStatus = status
         self.mitigation: str = mitigation
         self.max_health: int = max_health
         self.actual_health: int = max_health
@@ -515,21 +656,23 @@ class Module:
         self.heat_deposit: int = heat_deposit
         self.heat_deposit_essential: bool = heat_deposit_essential
 
-        #  Set name for logger.
+        #  Set name, and journal, for logging.
 
         self.module_name: str = self.name
         if module_index != 0:
             self.module_name = f"Module {module_index}"
 
-        if self.status != "ONLINE":
-            module_logger.log(
+        self.journal: Journal = journal if journal is not None else Journal()
+
+        if self.status != c.MODULE_STATUS_ONLINE:
+            self.journal.log(
                 self.module_name,
                 f"{self.name} is offline.",
                 self.health,
                 self.health_level,
             )
         else:
-            module_logger.log(
+            self.journal.log(
                 self.module_name,
                 f"{self.name} is functioning normally.",
                 self.health,
@@ -2,7 +2,7 @@
 
 from typing import Any
 
-from crawler.crawler.modules.module import Module
+from crawler.crawler.modules.module import Module, warning_level
 
 
 class OxygenSource(Module):
@@ -14,10 +14,24 @@ class OxygenSource(Module):
         Module: The OxygenSource subclasses the Module class.
     """
 
+    __slots__ = ("max_oxygen", "_actual_oxygen", "_oxygen", "_level")
+
+    @property
+    def actual_oxygen(self) -> int:
+        #  Returns the oxygen level.
+        return self._actual_oxygen
+
+    @actual_oxygen.setter
+    def actual_oxygen(self, value: int) -> None:
+        #  Set the oxygen level, and its percentage and warning level.
+        self._actual_oxygen = value
+        self._oxygen = int((value / self.max_oxygen) * 100)
+        self._level = warning_level(self._oxygen)
+
     @property
     def oxygen(self) -> int:
         #  Returns the oxygen level as a percetage of the maximum.
-        return int((self.actual_oxygen / self.max_oxygen) * 100)
+        return self._oxygen
 
     @oxygen.setter
     def oxygen(self, value: int) -> None:
@@ -27,14 +41,7 @@ class OxygenSource(Module):
     @property
     def level(self) -> int:
         #  Returns the oxygen warning level. 3 = Danger, 2 = Warning, 1 = Notice, 0 = Normal.
-        if self.oxygen <= 25:
-            return 3
-        elif self.oxygen <= 50:
-            return 2
-        elif self.oxygen <= 75:
-            return 1
-        else:
-            return 0
+        return self._level
 
     def limit(self) -> None:
         #  Keep actual value between 0 and max.
@@ -45,6 +52,14 @@ class OxygenSource(Module):
             else self.actual_oxygen
         )
 
+    def bounds(self) -> tuple[int, int]:
+        #  Returns the lowest and highest the actual value can be.
+        return (0, self.max_oxygen)
+
+    def accepts_deposits(self) -> bool:
+        #  Deposits are always accepted, up to the maximum.
+        return True
+
     def withdraw(self, amount: int) -> bool:
         #  Receives a request to withdraw oxygen.
         #  If the request is successful, ie the full amount is withdrawn, the method returns True.
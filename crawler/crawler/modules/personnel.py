@@ -1,19 +1,48 @@
 #  Represents the personnel in the crawler's hold.
 
+from typing import Optional
+
 import crawler.constants as c
-from crawler.crawler.modules.reporting.log import module_logger
+from crawler.crawler.modules.module import warning_level
+from crawler.crawler.modules.reporting.log import Journal
 
 
 class Personnel:
     """Personnel
 
     Represents the personnel in the crawler's hold.
+    The health percentage and level are worked out when the health is set, rather than each time they are read.
     """
 
+    __slots__ = (
+        "name",
+        "role",
+        "mitigation",
+        "max_health",
+        "_actual_health",
+        "_health",
+        "_health_level",
+        "status",
+        "location_name",
+        "journal",
+    )
+
+    @property
+    def actual_health(self) -> int:
+        #  Returns the health.
+        return self._actual_health
+
+    @actual_health.setter
+    def actual_health(self, value: int) -> None:
+        #  Set the health, and its percentage and level.
+        self._actual_health = value
+        self._health = int((value / self.max_health) * 100)
+        self._health_level = warning_level(self._health)
+
     @property
     def health(self) -> int:
         #  Returns the health level as a percetage of the maximum.
-        return int((self.actual_health / self.max_health) * 100)
+        return self._health
 
     @health.setter
     def health(self, value: int) -> None:
@@ -23,14 +52,7 @@ class Personnel:
     @property
     def health_level(self) -> int:
         #  Returns the health level. 3 = Danger, 2 = Warning, 1 = Notice, 0 = Normal.
-        if self.health <= 25:
-            return 3
-        elif self.health <= 50:
-            return 2
-        elif self.health <= 75:
-            return 1
-        else:
-            return 0
+        return self._health_level
 
     def damage(self, damage_amount: int, mitigations: list[tuple[str, str]]) -> None:
         #  Receives an instruction to apply damage.
@@ -66,7 +88,7 @@ class Personnel:
                         f"{self.name} is working hard to stay alive and functional."
                     )
 
-                module_logger.log(
+                self.journal.log(
                     self.location_name,
                     _message,
                     self.health,
@@ -76,16 +98,15 @@ class Personnel:
             if self.actual_health <= 0:
                 self.actual_health = 0
                 self.status = c.PERSONNEL_STATUS_DECEASED
-                module_logger.log(
+                self.journal.log(
                     self.location_name,
                     f"{self.name}, {self.role}, is deceased.",
                     self.health,
                     self.health_level,
                 )
 
-        module_logger.log(
+        self.journal.refresh(
             self.location_name,
-            module_logger.messages[self.location_name][0],
             self.health,
             self.health_level,
         )
@@ -98,20 +119,22 @@ class Personnel:
         max_health: int,
         actual_health: int,
         mitigation: str,
+        journal: Optional[Journal] = None,
     ) -> None:
 
         self.name: str = name
         self.role: str = role
-        self.mitigation = mitigation
+        self.mitigation: str = mitigation
 
         self.max_health: int = max_health
         self.actual_health: int = actual_health
 
-        self.status: str = c.PERSONNEL_STATUS_OK
+        self.status: c.PersonnelStatus = c.PERSONNEL_STATUS_OK
 
         self.location_name: str = f"Personnel {str(index)}"
+        self.journal: Journal = journal if journal is not None else Journal()
 
-        module_logger.log(
+        self.journal.log(
             self.location_name,
             f"{self.name} has been installed in life-support.",
             self.health,
@@ -2,7 +2,7 @@
 
 from typing import Any
 
-from crawler.crawler.modules.module import Module
+from crawler.crawler.modules.module import Module, warning_level
 
 
 class PowerSource(Module):
@@ -14,10 +14,24 @@ class PowerSource(Module):
         Module: The PowerSource subclasses the Module class.
     """
 
+    __slots__ = ("max_power", "_actual_power", "_power", "_level")
+
+    @property
+    def actual_power(self) -> int:
+        #  Returns the power level.
+        return self._actual_power
+
+    @actual_power.setter
+    def actual_power(self, value: int) -> None:
+        #  Set the power level, and its percentage and warning level.
+        self._actual_power = value
+        self._power = int((value / self.max_power) * 100)
+        self._level = warning_level(self._power)
+
     @property
     def power(self) -> int:
         #  Returns the power level as a percetage of the maximum.
-        return int((self.actual_power / self.max_power) * 100)
+        return self._power
 
     @power.setter
     def power(self, value: int) -> None:
@@ -27,14 +41,7 @@ class PowerSource(Module):
     @property
     def level(self) -> int:
         #  Returns the power warning level. 3 = Danger, 2 = Warning, 1 = Notice, 0 = Normal.
-        if self.power <= 25:
-            return 3
-        elif self.power <= 50:
-            return 2
-        elif self.power <= 75:
-            return 1
-        else:
-            return 0
+        return self._level
 
     def limit(self) -> None:
         #  Keep actual value between 0 and max.
@@ -43,6 +50,14 @@ class PowerSource(Module):
             self.max_power if self.actual_power > self.max_power else self.actual_power
         )
 
+    def bounds(self) -> tuple[int, int]:
+        #  Returns the lowest and highest the actual value can be.
+        return (0, self.max_power)
+
+    def accepts_deposits(self) -> bool:
+        #  Deposits are always accepted, up to the maximum.
+        return True
+
     def withdraw(self, amount: int) -> bool:
         #  Receives a request to withdraw power.
         #  If the request is successful, ie the full amount is withdrawn, the method returns True.
@@ -1,13 +1,154 @@
-#  The module logger, keeps the latest message for each module.
+#  The Journal class.
+#  Keeps a crawler's module, personnel and salvage messages; the latest for each, and a bounded history.
 
+from typing import Optional
 
-class ModuleLogger:
+import crawler.constants as c
+
+#  A journal entry; the time in seconds, the subsystem, the severity and the message.
+
+Entry = tuple[float, str, int, str]
+
+
+class Journal:
+    """Journal
+
+    The Journal keeps the latest message for each subsystem, with its percent and level, for the status panels,
+    and a history of the messages in a ring buffer of fixed capacity, overwriting the oldest once it is full.
+    The severity of an entry is the subsystem's warning level when it was logged.
+
+    A message is only added to the history when it, or its severity, differs from the subsystem's last,
+    so a module taking damage every update doesn't push everything else out.
+    Entries are stamped with the journal's time, which whoever updates the system sets first.
+    """
+
+    def __init__(self, capacity: int = c.JOURNAL_CAPACITY) -> None:
+        """__init__
+
+        Initialise the Journal.
+
+        Args:
+            capacity (int): the most entries to keep. Defaults to c.JOURNAL_CAPACITY.
+        """
+
+        self.capacity: int = capacity
+
+        #  The time the next entries are stamped with, in seconds.
+
+        self.time: float = 0
+
+        #  The latest message, percent and level of each subsystem.
 
-    def __init__(self) -> None:
         self.messages: dict[str, tuple[str, int, int]] = {}
 
-    def log(self, module: str, message: str, percent: int, level: int) -> None:
-        self.messages[module] = (message, percent, level)
+        #  The ring buffer; the next slot to write, and the number of entries in it.
+
+        self._entries: list[Optional[Entry]] = [None] * capacity
+        self._next: int = 0
+        self._count: int = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def log(self, subsystem: str, message: str, percent: int, level: int) -> None:
+        """log
+
+        Logs a message for a subsystem.
+
+        Args:
+            subsystem (str): the subsystem, e.g. "Module 1" or "Personnel 2".
+            message (str): the message.
+            percent (int): the subsystem's health, or level, as a percentage.
+            level (int): the subsystem's warning level, which is the severity of the entry.
+        """
+
+        _latest: Optional[tuple[str, int, int]] = self.messages.get(subsystem)
+        self.messages[subsystem] = (message, percent, level)
+
+        if _latest is not None and _latest[0] == message and _latest[2] == level:
+            return
+
+        self._entries[self._next] = (self.time, subsystem, level, message)
+        self._next = (self._next + 1) % self.capacity
+        if self._count < self.capacity:
+            self._count += 1
+
+    def refresh(self, subsystem: str, percent: int, level: int) -> None:
+        """refresh
+
+        Updates the percent and level of a subsystem's latest message, without adding to the history.
+
+        Args:
+            subsystem (str): the subsystem.
+            percent (int): the subsystem's health, or level, as a percentage.
+            level (int): the subsystem's warning level.
+        """
+        self.messages[subsystem] = (self.messages[subsystem][0], percent, level)
+
+    def reserve(self, subsystem: str) -> None:
+        """reserve
+
+        Shows an empty slot as unused, without adding to the history.
+
+        Args:
+            subsystem (str): the subsystem.
+        """
+        self.messages[subsystem] = ("Unused", 0, 0)
+
+    def entry(self, index: int) -> Entry:
+        """entry
+
+        Gets an entry by its position in the history.
+
+        Args:
+            index (int): the position, 0 being the oldest entry kept.
+
+        Returns:
+            Entry: the entry.
+        """
+        return self._entries[(self._next - self._count + index) % self.capacity]  # type: ignore
+
+    def latest(self, count: int) -> list[Entry]:
+        """latest
+
+        Gets the most recent entries.
+
+        Args:
+            count (int): the most entries to get.
+
+        Returns:
+            list[Entry]: the entries, oldest first.
+        """
+        return [self.entry(_index) for _index in range(max(self._count - count, 0), self._count)]
+
+    def between(self, start: float, end: float = float("inf")) -> list[Entry]:
+        """between
+
+        Gets the entries logged between two times.
+        The entries are in time order, so the first is found by a binary search.
+
+        Args:
+            start (float): the earliest time, in seconds.
+            end (float): the latest time, in seconds. Defaults to no limit.
+
+        Returns:
+            list[Entry]: the entries, oldest first.
+        """
+
+        _low: int = 0
+        _high: int = self._count
+        while _low < _high:
+            _middle: int = (_low + _high) // 2
+            if self.entry(_middle)[0] < start:
+                _low = _middle + 1
+            else:
+                _high = _middle
 
+        _entries: list[Entry] = []
+        for _index in range(_low, self._count):
+            _entry: Entry = self.entry(_index)
+            if _entry[0] > end:
+                break
+            _entries.append(_entry)
 
-module_logger = ModuleLogger()
+        return _entries
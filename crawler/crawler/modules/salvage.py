@@ -1,25 +1,33 @@
 #  Represents a salvage item in the crawler's hold.
 
 import crawler.constants as c
+from crawler.crawler.modules.module import warning_level
 
 
 class Salvage:
     """Salvage
 
     Represents a salvage item in the crawler's hold.
+    The health level is worked out when the health is set, rather than each time it is read.
     """
 
+    __slots__ = ("name", "description", "_health", "_health_level", "status")
+
+    @property
+    def health(self) -> int:
+        #  Returns the health as a percentage.
+        return self._health
+
+    @health.setter
+    def health(self, value: int) -> None:
+        #  Set the health as a percentage, and its level.
+        self._health = value
+        self._health_level = warning_level(value)
+
     @property
     def health_level(self) -> int:
         #  Returns the health level. 3 = Danger, 2 = Warning, 1 = Notice, 0 = Normal.
-        if self.health <= 25:
-            return 3
-        elif self.health <= 50:
-            return 2
-        elif self.health <= 75:
-            return 1
-        else:
-            return 0
+        return self._health_level
 
     def destroy(self) -> None:
 
@@ -31,11 +39,11 @@ class Salvage:
         name: str,
         description: str,
         health: int,
-        status: str = c.SALVAGE_STATUS_OK,
+        status: c.SalvageStatus = c.SALVAGE_STATUS_OK,
     ) -> None:
 
         self.name: str = name
         self.description: str = description
 
         self.health: int = health
-        self.status: str = status
+        self.status: c.SalvageStatus = status
@@ -0,0 +1,122 @@
+#  The RotationAtlas class.
+#  Keeps the rotated crawler images, so each is only rotated once rather than every frame.
+
+from collections import OrderedDict
+from typing import Any, Optional
+
+import pygame
+
+import crawler.constants as c
+
+
+class RotationAtlas:
+    """RotationAtlas
+
+    The RotationAtlas holds the crawler animation frames rotated to each angle they have been drawn at,
+    keyed by the crawler's asset, the animation frame and the angle, rounded to a whole number of steps.
+    Crawlers that use the same asset share the same images.
+
+    An image is only rotated when it is first needed, and the least recently used images are evicted
+    when the memory budget is reached.
+    """
+
+    def __init__(
+        self,
+        step: int = c.CRAWLER_ROTATION_STEP,
+        memory_budget: int = c.CRAWLER_ROTATION_MEMORY_BUDGET,
+    ) -> None:
+        """__init__
+
+        Initialise the RotationAtlas.
+
+        Args:
+            step (int): the angle the rotations are rounded to, in degrees. Defaults to c.CRAWLER_ROTATION_STEP.
+            memory_budget (int): the maximum number of bytes of images to keep.
+                Defaults to c.CRAWLER_ROTATION_MEMORY_BUDGET.
+        """
+
+        self.step: int = step
+
+        #  The atlas itself, oldest first.
+
+        self.memory_budget: int = memory_budget
+        self.memory_used: int = 0
+        self._images: OrderedDict[tuple[str, int, int], pygame.Surface] = OrderedDict()
+
+        self.hits: int = 0
+        self.misses: int = 0
+
+    def get_image(self, asset: str, frame: int, image: pygame.Surface, angle: float) -> pygame.Surface:
+        """get_image
+
+        Gets an animation frame rotated to an angle, rotating it if it is not in the atlas.
+
+        Args:
+            asset (str): the crawler asset the frame is from.
+            frame (int): the index of the animation frame.
+            image (pygame.Surface): the frame.
+            angle (float): the angle, in degrees anticlockwise.
+
+        Returns:
+            pygame.Surface: the rotated frame.
+        """
+
+        _angle: int = int(round(angle / self.step)) * self.step % 360
+        _key: tuple[str, int, int] = (asset, frame, _angle)
+
+        _image: Optional[pygame.Surface] = self._images.get(_key)
+
+        if _image is not None:
+            self._images.move_to_end(_key)
+            self.hits += 1
+            return _image
+
+        self.misses += 1
+
+        _image = pygame.transform.rotate(image, _angle)
+
+        self._images[_key] = _image
+        self.memory_used += self.surface_bytes(_image)
+
+        #  Evict the least recently used images, but never the one just rotated.
+
+        while self.memory_used > self.memory_budget and len(self._images) > 1:
+            _, _evicted = self._images.popitem(last=False)
+            self.memory_used -= self.surface_bytes(_evicted)
+
+        return _image
+
+    @staticmethod
+    def surface_bytes(surface: pygame.Surface) -> int:
+        """surface_bytes
+
+        Gets the memory used by the pixels of a surface.
+
+        Args:
+            surface (pygame.Surface): the surface.
+
+        Returns:
+            int: number of bytes.
+        """
+        return surface.get_pitch() * surface.get_height()
+
+    def stats(self) -> dict[str, Any]:
+        """stats
+
+        Gets the current state of the atlas.
+
+        Returns:
+            dict[str, Any]: number of images, memory used, and the hits and misses.
+        """
+        return {
+            "images": len(self._images),
+            "memory_used": self.memory_used,
+            "memory_budget": self.memory_budget,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+#  The atlas shared by all the crawlers.
+
+rotation_atlas: RotationAtlas = RotationAtlas()
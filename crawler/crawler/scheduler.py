@@ -0,0 +1,318 @@
+#  The SystemScheduler class.
+#  Updates a crawler's system only when something is going to change, and applies the steady drain in between.
+
+import sys
+from typing import Any, Optional
+
+import crawler.constants as c
+from crawler.crawler.fleet import Fleet
+from crawler.crawler.flow import ATTRIBUTES, DEFICIENCY, EXCESS, RESOURCES
+from crawler.crawler.modules.heat_sink import HeatSink
+from crawler.crawler.modules.module import Module
+from crawler.crawler.system import System
+
+#  The heat, as a percentage, above which the heat sink damages modules at the start of an update;
+#  it refuses deposits a little above that, at 85%.
+
+HEAT_DAMAGE_LEVEL = 80
+
+
+class SystemScheduler:
+    """SystemScheduler
+
+    The SystemScheduler stands in for calling System.update over and over.
+    Each real update runs System.update once, then works out how many more updates would change
+    nothing but the oxygen, power and heat levels, by the same amount each time; those are steady,
+    and are skipped by moving the levels on without updating.
+
+    The steady updates run until the next event; a supply running dry, or filling up, or the heat sink
+    reaching its floor, or 80%, above which it damages modules and then refuses deposits,
+    which is when a module's withdrawal or deposit would next fail, or a status or health change.
+    Health and statuses must be unchanged by the real update for any to be steady,
+    so damage, and modules going offline or online, are always real updates.
+    A level left where it was by the real update stays there; once nothing changes, every later update is steady.
+
+    The steady updates found are kept for later calls, as long as nothing else changes the system in between;
+    a change of terrain, a module toggled, or the system updated some other way, moves its version on.
+    """
+
+    def __init__(self, system: System) -> None:
+        """__init__
+
+        Initialise the SystemScheduler.
+
+        Args:
+            system (System): the system to update.
+        """
+
+        self.system: System = system
+
+        #  The steady updates left, how much each moves the levels, and the version of the system they are for.
+
+        self.steady: int = 0
+        self.change: list[int] = [0] * len(RESOURCES)
+        self.version: int = -1
+
+        #  The maximum heat, the steady range of the heat sink and the levels within it that it rounds.
+
+        self.rounded: Optional[tuple[int, int, int, list[int]]] = None
+
+        #  The number of updates run, and the number skipped.
+
+        self.updates: int = 0
+        self.skipped: int = 0
+
+    def state(self) -> tuple[Any, ...]:
+        """state
+
+        Gets everything that System.update can change, or depends on, other than the supply levels.
+
+        Returns:
+            tuple[Any, ...]: the state.
+        """
+        _system: System = self.system
+
+        return (
+            _system.engine.terrain,
+            _system.engine.moving,
+            _system.engine.reversing,
+            tuple((_module.status, _module.actual_health) for _module in Fleet.modules_of(_system)),
+            tuple((_person.status, _person.actual_health) for _person in _system.hold.personnel_slots),
+            tuple((_salvage.status, _salvage.health) for _salvage in _system.hold.salvage_slots),
+        )
+
+    def supply(self, resource: int) -> Module:
+        """supply
+
+        Gets a supply.
+
+        Args:
+            resource (int): the index of the supply in RESOURCES.
+
+        Returns:
+            Module: the oxygen supply, the cells or the heat sink.
+        """
+        return (self.system.oxygen, self.system.cells, self.system.heat_sink)[resource]
+
+    def levels(self) -> list[int]:
+        """levels
+
+        Gets the oxygen, power and heat levels.
+
+        Returns:
+            list[int]: the levels, in the order of RESOURCES.
+        """
+        return [getattr(self.supply(_resource), RESOURCES[_resource][1]) for _resource in range(len(RESOURCES))]
+
+    def steady_range(self, resource: int) -> tuple[int, int, list[int]]:
+        """steady_range
+
+        Gets the range a supply's level can move within without anything but the level changing.
+
+        Args:
+            resource (int): the index of the supply in RESOURCES.
+
+        Returns:
+            tuple[int, int, list[int]]: the lowest and highest level, and the levels within them that the supply
+                rounds to another level.
+        """
+
+        _supply: Module = self.supply(resource)
+        _lowest, _highest = _supply.bounds()
+
+        if not isinstance(_supply, HeatSink):
+            return (_lowest, _highest, [])
+
+        #  The heat sink damages modules above 80%, and rounds its heat to whole percentages,
+        #  which moves some levels even where the maximum is 100.
+
+        if self.rounded is None or self.rounded[0] != _supply.max_heat:
+            _highest = int((_supply.max_heat / 100) * HEAT_DAMAGE_LEVEL)
+            self.rounded = (
+                _supply.max_heat,
+                _lowest,
+                _highest,
+                [_level for _level in range(_lowest, _highest + 1) if _supply.rounded(_level) != _level],
+            )
+
+        return self.rounded[1:]
+
+    def operations(self, resource: int) -> Optional[list[int]]:
+        """operations
+
+        Gets the withdrawals, as negative amounts, and deposits, as positive amounts, that the modules
+        make from a supply in an update, in order, as long as none of them changes a module's status.
+
+        Args:
+            resource (int): the index of the supply in RESOURCES.
+
+        Returns:
+            Optional[list[int]]: the amounts, or None if a module draws on another supply.
+        """
+
+        _connection: str = RESOURCES[resource][2]
+        _withdrawal, _, _deposit, _ = ATTRIBUTES[resource]
+        _supply: Module = self.supply(resource)
+
+        _operations: list[int] = []
+
+        #  The modules in the order System.update updates them; the heat sink doesn't draw on the supplies.
+
+        for _module in [self.system.oxygen, *Fleet.modules_of(self.system)]:
+            _connected: Optional[Module] = getattr(_module, _connection)
+            if _connected is None:
+                continue
+            if _connected is not _supply:
+                return None
+
+            if _module.status in (c.MODULE_STATUS_ONLINE, DEFICIENCY[resource]):
+                _operations.append(-getattr(_module, _withdrawal))
+            if _module.status in (c.MODULE_STATUS_ONLINE, EXCESS[resource]):
+                _operations.append(getattr(_module, _deposit))
+
+        return _operations
+
+    def steady_updates(self, before: list[int], after: list[int]) -> int:
+        """steady_updates
+
+        Works out how many more updates would change the levels by the same amounts as the last one,
+        with every withdrawal and deposit succeeding.
+
+        Args:
+            before (list[int]): the levels before the last update.
+            after (list[int]): the levels after it.
+
+        Returns:
+            int: the number of updates, or 0 if the last update wasn't steady.
+        """
+
+        _steady: int = sys.maxsize
+
+        for _resource in range(len(RESOURCES)):
+
+            #  A level the update left where it was is left there by every update, until a status changes.
+
+            if after[_resource] == before[_resource]:
+                continue
+
+            _operations: Optional[list[int]] = self.operations(_resource)
+            if _operations is None:
+                return 0
+
+            _bottom, _top, _rounded = self.steady_range(_resource)
+
+            #  Where the level is within an update, relative to where it started, after each withdrawal and deposit.
+            #  Every withdrawal succeeds while the lowest is within the range, and every deposit
+            #  while the highest is, and then nothing is clamped.
+
+            _offsets: list[int] = [0]
+            for _amount in _operations:
+                _offsets.append(_offsets[-1] + _amount)
+            _lowest: int = min(_offsets)
+            _highest: int = max(_offsets)
+            _total: int = _offsets[-1]
+
+            #  The last update must have gone that way too.
+
+            if (
+                after[_resource] - before[_resource] != _total
+                or before[_resource] + _lowest < _bottom
+                or before[_resource] + _highest > _top
+                or any(before[_resource] + _offset in _rounded for _offset in _offsets)
+            ):
+                return 0
+
+            #  Count the updates before the level would leave that range, or reach either end of it,
+            #  so those are always real updates.
+
+            if _total < 0:
+                _room: int = min(after[_resource] + _lowest - _bottom, after[_resource] + _total - 1 - _bottom)
+            else:
+                _room = min(_top - (after[_resource] + _highest), _top - (after[_resource] + _total) - 1)
+
+            _steady = min(_steady, max(_room // abs(_total) + 1, 0))
+
+            #  And before the level would pass through one that is rounded, counting the updates
+            #  after which the level is that far from it, in steps of the total.
+
+            for _level in _rounded:
+                for _offset in _offsets:
+                    _distance: int = _level - (after[_resource] + _offset)
+                    if _distance % _total == 0 and _distance // _total >= 0:
+                        _steady = min(_steady, _distance // _total)
+
+        return _steady
+
+    def skip(self, updates: int) -> int:
+        """skip
+
+        Skips some of the steady updates, moving the levels on by them.
+
+        Args:
+            updates (int): the number of updates, no more than are steady.
+
+        Returns:
+            int: the number of updates.
+        """
+
+        if updates and any(self.change):
+            for _resource, (_, _attribute, _) in enumerate(RESOURCES):
+                if self.change[_resource]:
+                    setattr(
+                        self.supply(_resource),
+                        _attribute,
+                        getattr(self.supply(_resource), _attribute) + updates * self.change[_resource],
+                    )
+            self.system.changed()
+
+        self.steady -= updates
+        self.skipped += updates
+        self.version = self.system.version
+
+        return updates
+
+    def update(self, limit: int) -> int:
+        """update
+
+        Skips the steady updates left over from the last call, or runs System.update
+        then skips as many of the following updates as are steady.
+
+        Args:
+            limit (int): the most updates to run and skip.
+
+        Returns:
+            int: the number of updates run and skipped, at least 1.
+        """
+
+        if self.steady and self.system.version == self.version:
+            return self.skip(min(self.steady, limit))
+
+        _state: tuple[Any, ...] = self.state()
+        _before: list[int] = self.levels()
+
+        self.system.update()
+        self.updates += 1
+
+        self.steady = 0
+        self.version = self.system.version
+
+        if self.state() != _state:
+            return 1
+
+        _after: list[int] = self.levels()
+
+        self.change = [_to - _from for _from, _to in zip(_before, _after)]
+        self.steady = self.steady_updates(_before, _after)
+
+        return 1 + self.skip(min(self.steady, limit - 1))
+
+    def advance(self, updates: int) -> None:
+        """advance
+
+        Moves the system on by a number of updates.
+
+        Args:
+            updates (int): the number of updates.
+        """
+        while updates > 0:
+            updates -= self.update(updates)
@@ -1,8 +1,11 @@
 #  The ModuleInfo and System classes..
 
-from dataclasses import dataclass, field
-from typing import Callable, Optional
+from dataclasses import dataclass
+from functools import partial
+from types import MappingProxyType
+from typing import Callable, Mapping, Optional
 
+from crawler.crawler.flow import FlowSolver
 from crawler.crawler.modules.cooler import Cooler
 from crawler.crawler.modules.engine import Engine
 from crawler.crawler.modules.heat_sink import HeatSink
@@ -12,7 +15,7 @@ from crawler.crawler.modules.module import Module
 from crawler.crawler.modules.oxygen_source import OxygenSource
 from crawler.crawler.modules.personnel import Personnel
 from crawler.crawler.modules.power_source import PowerSource
-from crawler.crawler.modules.reporting.log import module_logger
+from crawler.crawler.modules.reporting.log import Journal
 from crawler.crawler.modules.salvage import Salvage
 from crawler.crawler.test_all import create_test_modules
 from crawler.crawler.test_cells import create_cells_test_modules
@@ -41,43 +44,45 @@ LIFESUPPORT_HEAT_DEPOSIT = 1
 
 TEST = "ALL"  # "ALL", "OXYGEN", "POWER", "CELLS"
 
+#  "SOLVER" resolves the modules' withdrawals and deposits all at once, with essential modules first,
+#  "ORDERED" lets each module take what it can in the order they are updated.
 
-@dataclass
+FLOW = "SOLVER"  # "SOLVER", "ORDERED"
+
+
+@dataclass(frozen=True)
 class ModuleInfo:
-    """<oduleInfo
+    """ModuleInfo
 
     The module info class holds together all the information about the module
     that is needed to display on the console.
+    It is a snapshot of the system at one version, so it can't be changed, and is shared until the version moves on.
     """
 
-    warning_light_levels: list[int] = field(default_factory=list)
+    warning_light_levels: tuple[int, ...] = ()
 
-    dial_light_levels: list[int] = field(default_factory=list)
-    dial_light_percent: list[int] = field(default_factory=list)
+    dial_light_levels: tuple[int, ...] = ()
+    dial_light_percent: tuple[int, ...] = ()
 
-    system_light_levels: list[int] = field(default_factory=list)
-    system_light_percent: list[int] = field(default_factory=list)
-    system_light_status: list[str] = field(default_factory=list)
+    system_light_levels: tuple[int, ...] = ()
+    system_light_percent: tuple[int, ...] = ()
+    system_light_status: tuple[str, ...] = ()
 
-    personnel_light_texts: list[tuple[str, str]] = field(default_factory=list)
-    personnel_light_levels: list[int] = field(default_factory=list)
-    personnel_light_percent: list[int] = field(default_factory=list)
-    personnel_light_status: list[str] = field(default_factory=list)
+    personnel_light_texts: tuple[tuple[str, str], ...] = ()
+    personnel_light_levels: tuple[int, ...] = ()
+    personnel_light_percent: tuple[int, ...] = ()
+    personnel_light_status: tuple[str, ...] = ()
 
-    salvage_light_texts: list[tuple[str, str]] = field(default_factory=list)
-    salvage_light_levels: list[int] = field(default_factory=list)
-    salvage_light_percent: list[int] = field(default_factory=list)
-    salvage_light_status: list[str] = field(default_factory=list)
+    salvage_light_texts: tuple[tuple[str, str], ...] = ()
+    salvage_light_levels: tuple[int, ...] = ()
+    salvage_light_percent: tuple[int, ...] = ()
+    salvage_light_status: tuple[str, ...] = ()
 
-    optional_module_light_texts: list[tuple[str, str, str]] = field(
-        default_factory=list
-    )
-    optional_module_light_levels: list[int] = field(default_factory=list)
-    optional_module_light_percent: list[int] = field(default_factory=list)
-    optional_module_light_status: list[str] = field(default_factory=list)
-    optional_module_light_actions: list[Optional[Callable[[], None]]] = field(
-        default_factory=list
-    )
+    optional_module_light_texts: tuple[tuple[str, str, str], ...] = ()
+    optional_module_light_levels: tuple[int, ...] = ()
+    optional_module_light_percent: tuple[int, ...] = ()
+    optional_module_light_status: tuple[str, ...] = ()
+    optional_module_light_actions: tuple[Optional[Callable[[], None]], ...] = ()
 
 
 class System:
@@ -93,6 +98,10 @@ class System:
 
         """
 
+        #  The crawler's journal, which all its modules and personnel log to.
+
+        self.journal: Journal = Journal()
+
         #  Initialiase system modules.
 
         self.oxygen: OxygenSource = OxygenSource(
@@ -100,6 +109,7 @@ class System:
             description="The crawler's oxygen supply",
             max_oxygen=MAX_OXYGEN_SUPPLY,
             mitigation="Habitat Technician",
+            journal=self.journal,
         )
         self.heat_sink: HeatSink = HeatSink(
             name="Heat Sink",
@@ -107,6 +117,7 @@ class System:
             max_heat=MAX_HEAT_SINK_HEAT,
             damage_amount=HEAT_SINK_DAMAGE,
             mitigation="Energy Specialist",
+            journal=self.journal,
         )
         self.cells: PowerSource = PowerSource(
             name="Power Cells Module",
@@ -115,6 +126,7 @@ class System:
             max_health=MAX_CELLS_HEALTH,
             max_power=MAX_CELLS_SUPPLY,
             mitigation="Energy Specialist",
+            journal=self.journal,
         )
         self.hold: Hold = Hold(
             name="Hold",
@@ -122,6 +134,7 @@ class System:
             information="This is the default hold configuration for the crawler",
             max_health=MAX_HOLD_HEALTH,
             mitigation="Structural Engineer",
+            journal=self.journal,
         )
         self.engine: Engine = Engine(
             name="Engine Module",
@@ -135,6 +148,7 @@ class System:
             heat_deposit=ENGINE_HEAT_DEPOSIT,
             heat_deposit_essential=False,
             mitigation="Engineer",
+            journal=self.journal,
         )
         self.cooler: Cooler = Cooler(
             name="Cooler Module",
@@ -148,6 +162,7 @@ class System:
             heat_withdrawal=COOLER_HEAT_WITHDRAWL,
             heat_withdrawal_essential=False,
             mitigation="Habitat Technician",
+            journal=self.journal,
         )
         self.life_support: LifeSupport = LifeSupport(
             name="Life-Support Module",
@@ -165,47 +180,48 @@ class System:
             heat_deposit=LIFESUPPORT_HEAT_DEPOSIT,
             heat_deposit_essential=False,
             mitigation="Habitat Technician",
+            journal=self.journal,
         )
 
         for _index in range(10):
-            module_logger.log(f"Personnel {str(_index+1)}", "Unused", 0, 0)
+            self.journal.reserve(f"Personnel {str(_index+1)}")
 
         for _index in range(6):
-            module_logger.log(f"Module {str(_index+1)}", "Unused", 0, 0)
+            self.journal.reserve(f"Module {str(_index+1)}")
 
         #  TEST MODULES
 
         if TEST == "ALL":  #  type: ignore
             self.optional_modules: list[Module] = create_test_modules(
-                self.oxygen, self.cells, self.heat_sink
+                self.oxygen, self.cells, self.heat_sink, self.journal
             )
 
         if TEST == "OXYGEN":  #  type: ignore
             self.optional_modules: list[Module] = create_oxygen_test_modules(
-                self.oxygen
+                self.oxygen, self.journal
             )
 
         if TEST == "POWER":  #  type: ignore
-            self.optional_modules: list[Module] = create_cells_test_modules(self.cells)
+            self.optional_modules: list[Module] = create_cells_test_modules(self.cells, self.journal)
 
         if TEST == "HEAT":  #  type: ignore
             self.optional_modules: list[Module] = create_heat_test_modules(
-                self.heat_sink
+                self.heat_sink, self.journal
             )
 
         #  TEST PERSONNEL
 
         self.hold.personnel_slots.append(
-            Personnel("Keith White", 1, "Engineer", 100, 76, "Medic")
+            Personnel("Keith White", 1, "Engineer", 100, 76, "Medic", self.journal)
         )
         self.hold.personnel_slots.append(
-            Personnel("Jane WIlson", 2, "Habitat Technician", 100, 45, "Medic")
+            Personnel("Jane WIlson", 2, "Habitat Technician", 100, 45, "Medic", self.journal)
         )
         self.hold.personnel_slots.append(
-            Personnel("Claire Samson", 3, "Medic", 100, 68, "Medic")
+            Personnel("Claire Samson", 3, "Medic", 100, 68, "Medic", self.journal)
         )
         self.hold.personnel_slots.append(
-            Personnel("Simon Dupont", 4, "System Specialist", 100, 23, "Medic")
+            Personnel("Simon Dupont", 4, "System Specialist", 100, 23, "Medic", self.journal)
         )
 
         #  TEST SALVAGE
@@ -240,12 +256,52 @@ class System:
         for _index, _module in enumerate(self.optional_modules):
             self.heat_sink.damagable_modules.append(_module)
 
+        #  The flow solver, if the modules' withdrawals and deposits are resolved all at once.
+
+        self.flow_solver: Optional[FlowSolver] = None
+        if FLOW == "SOLVER":  #  type: ignore
+            self.flow_solver = FlowSolver(
+                [
+                    self.oxygen,
+                    self.cells,
+                    self.hold,
+                    self.engine,
+                    self.cooler,
+                    self.life_support,
+                    *self.optional_modules,
+                ]
+            )
+
+        #  The version moves on each time something the reports are built from might have changed;
+        #  each update, each module toggled, and each change to the engine the crawler makes as it drives.
+        #  The last reports are kept with the version they were built at.
+
+        self._version: int = 0
+        self._short_report: Optional[tuple[int, Mapping[str, int]]] = None
+        self._long_report: Optional[tuple[int, ModuleInfo]] = None
+
+    @property
+    def version(self) -> int:
+        #  Returns the version of the system's state.
+        return self._version + self.engine.changes
+
+    def changed(self) -> None:
+        #  Moves the version on, after the state has been changed from outside the system.
+        self._version += 1
+
+    def toggle_online(self, module: Module) -> None:
+        #  Toggles a module online / offline.
+        module.toggle_online()
+        self.changed()
+
     def update(self) -> None:
         """update
 
         Updates all the crawler's modules.
         """
 
+        self._version += 1
+
         #  Extract mitigating personnel.
 
         _mitigations = [
@@ -256,6 +312,10 @@ class System:
 
         #  Update systems.
 
+        if self.flow_solver is not None:
+            self.update_flows(_mitigations)
+            return
+
         self.oxygen.update(_mitigations)
         self.cells.update(_mitigations)
         self.heat_sink.update(_mitigations)
@@ -267,20 +327,43 @@ class System:
         for _module in self.optional_modules:
             _module.update(_mitigations)
 
+    def update_flows(self, mitigations: list[tuple[str, str]]) -> None:
+        """update_flows
+
+        Updates all the crawler's modules, with the flow solver resolving their withdrawals and deposits.
+
+        Args:
+            mitigations (list[tuple[str, str]]): the names and roles of the personnel who can mitigate damage.
+        """
+
+        self.heat_sink.update(mitigations)
+
+        for _module in self.flow_solver.modules:  # type: ignore
+            _module.mitigations = mitigations
+
+        self.flow_solver.update()  # type: ignore
+
+        self.life_support.support_personnel()
+
     def module_report(self) -> dict[str, tuple[str, int, int]]:
-        return module_logger.messages
+        return self.journal.messages
 
     def personnel_report(self) -> dict[str, tuple[str, int, int]]:
-        return module_logger.messages
+        return self.journal.messages
 
-    def short_report(self) -> dict[str, int]:
+    def short_report(self) -> Mapping[str, int]:
         """short_report
 
-        Generates a short report for the crawler.
+        Gets a short report for the crawler, building it only if the system has changed since the last one.
+        The report is shared, so it is read-only.
 
         Returns:
-            dict[str, int]: The report.
+            Mapping[str, int]: The report.
         """
+
+        if self._short_report is not None and self._short_report[0] == self.version:
+            return self._short_report[1]
+
         _report: dict[str, int] = {}
         _report["cells"] = self.cells.level
         _report["oxygen"] = self.oxygen.level
@@ -293,102 +376,93 @@ class System:
         _report["life_support_health"] = self.life_support.health
         _report["hold_health"] = self.hold.health
 
-        return _report
+        self._short_report = (self.version, MappingProxyType(_report))
+
+        return self._short_report[1]
 
     def long_report(self) -> ModuleInfo:
         """long_report
 
-        Generates a long report for the crawler.
+        Gets a long report for the crawler, building it only if the system has changed since the last one.
 
         Returns:
             ModuleInfo: The report.
         """
-        _report: ModuleInfo = ModuleInfo()
-
-        #  Warning lights.
-
-        _report.warning_light_levels = [
-            self.cells.level,
-            self.oxygen.level,
-            self.engine.terrain,
-            self.heat_sink.level,
-            0,
-            0,
-        ]
-
-        #  System dials.
-
-        _report.dial_light_levels = [
-            self.cells.level,
-            self.oxygen.level,
-            self.engine.revs_level,
-            self.engine.speed_level,
-            self.heat_sink.level,
-        ]
-        _report.dial_light_percent = [
-            self.cells.power,
-            self.oxygen.oxygen,
-            self.engine.revs,
-            self.engine.speed,
-            self.heat_sink.heat,
-        ]
-
-        #  System lights.
-
-        _report.system_light_levels = [
-            self.cells.health_level,
-            self.engine.health_level,
-            self.cooler.health_level,
-            self.life_support.health_level,
-            self.hold.health_level,
-        ]
-        _report.system_light_percent = [
-            self.cells.health,
-            self.engine.health,
-            self.cooler.health,
-            self.life_support.health,
-            self.hold.health,
-        ]
-        _report.system_light_status = [
-            self.cells.status,
-            self.engine.status,
-            self.cooler.status,
-            self.life_support.status,
-            self.hold.status,
-        ]
-
-        #  Personnel.
-
-        for _person in self.hold.personnel_slots:
-            _report.personnel_light_texts.append((_person.name, f"{_person.role}"))
-        for _person in self.hold.personnel_slots:
-            _report.personnel_light_levels.append(_person.health_level)
-        for _person in self.hold.personnel_slots:
-            _report.personnel_light_percent.append(_person.health)
-        for _person in self.hold.personnel_slots:
-            _report.personnel_light_status.append(_person.status)
-
-        #  Salvage.
 
-        for _salvage in self.hold.salvage_slots:
-            _report.salvage_light_texts.append((_salvage.name, _salvage.description))
-        for _salvage in self.hold.salvage_slots:
-            _report.salvage_light_levels.append(_salvage.health_level)
-        for _salvage in self.hold.salvage_slots:
-            _report.salvage_light_percent.append(_salvage.health)
-        for _salvage in self.hold.salvage_slots:
-            _report.salvage_light_status.append(_salvage.status)
-
-        #  Optional modules.
-
-        for _index, _module in enumerate(self.optional_modules):
-            _report.optional_module_light_texts.append(
-                (_module.name, _module.description, str(_module.class_level))
-            )
-            _report.optional_module_light_percent.append(_module.health)
-            _report.optional_module_light_levels.append(_module.health_level)
-            _report.optional_module_light_status.append(_module.status)
+        if self._long_report is not None and self._long_report[0] == self.version:
+            return self._long_report[1]
+
+        _personnel: list[Personnel] = self.hold.personnel_slots
+        _salvage_slots: list[Salvage] = self.hold.salvage_slots
+        _modules: list[Module] = self.optional_modules
+
+        _report: ModuleInfo = ModuleInfo(
+            #  Warning lights.
+            warning_light_levels=(
+                self.cells.level,
+                self.oxygen.level,
+                self.engine.terrain,
+                self.heat_sink.level,
+                0,
+                0,
+            ),
+            #  System dials.
+            dial_light_levels=(
+                self.cells.level,
+                self.oxygen.level,
+                self.engine.revs_level,
+                self.engine.speed_level,
+                self.heat_sink.level,
+            ),
+            dial_light_percent=(
+                self.cells.power,
+                self.oxygen.oxygen,
+                self.engine.revs,
+                self.engine.speed,
+                self.heat_sink.heat,
+            ),
+            #  System lights, with the statuses as their names.
+            system_light_levels=(
+                self.cells.health_level,
+                self.engine.health_level,
+                self.cooler.health_level,
+                self.life_support.health_level,
+                self.hold.health_level,
+            ),
+            system_light_percent=(
+                self.cells.health,
+                self.engine.health,
+                self.cooler.health,
+                self.life_support.health,
+                self.hold.health,
+            ),
+            system_light_status=(
+                str(self.cells.status),
+                str(self.engine.status),
+                str(self.cooler.status),
+                str(self.life_support.status),
+                str(self.hold.status),
+            ),
+            #  Personnel.
+            personnel_light_texts=tuple([(_person.name, f"{_person.role}") for _person in _personnel]),
+            personnel_light_levels=tuple([_person.health_level for _person in _personnel]),
+            personnel_light_percent=tuple([_person.health for _person in _personnel]),
+            personnel_light_status=tuple([str(_person.status) for _person in _personnel]),
+            #  Salvage.
+            salvage_light_texts=tuple([(_salvage.name, _salvage.description) for _salvage in _salvage_slots]),
+            salvage_light_levels=tuple([_salvage.health_level for _salvage in _salvage_slots]),
+            salvage_light_percent=tuple([_salvage.health for _salvage in _salvage_slots]),
+            salvage_light_status=tuple([str(_salvage.status) for _salvage in _salvage_slots]),
+            #  Optional modules, toggled through the system so the version moves on.
+            optional_module_light_texts=tuple(
+                [(_module.name, _module.description, str(_module.class_level)) for _module in _modules]
+            ),
+            optional_module_light_percent=tuple([_module.health for _module in _modules]),
+            optional_module_light_levels=tuple([_module.health_level for _module in _modules]),
+            optional_module_light_status=tuple([str(_module.status) for _module in _modules]),
+            optional_module_light_actions=tuple([partial(self.toggle_online, _module) for _module in _modules]),
+        )
 
-            _report.optional_module_light_actions.append(_module.toggle_online)
+        self._long_report = (self.version, _report)
 
         return _report
@@ -1,13 +1,15 @@
 #  POWER TESTING !!!
 
+import crawler.constants as c
 from crawler.crawler.modules.heat_sink import HeatSink
 from crawler.crawler.modules.module import Module
 from crawler.crawler.modules.oxygen_source import OxygenSource
 from crawler.crawler.modules.power_source import PowerSource
+from crawler.crawler.modules.reporting.log import Journal
 
 
 def create_test_modules(
-    oxygen_supply: OxygenSource, power_supply: PowerSource, heat_sink: HeatSink
+    oxygen_supply: OxygenSource, power_supply: PowerSource, heat_sink: HeatSink, journal: Journal
 ) -> list[Module]:
 
     _optional_modules: list[Module] = []
@@ -20,8 +22,9 @@ def create_test_modules(
             oxygen_supply=oxygen_supply,
             oxygen_withdrawal=1000,
             oxygen_withdrawal_essential=False,
-            status="OFFLINE",
+            status=c.MODULE_STATUS_OFFLINE_BY_REQUEST,
             module_index=1,
+            journal=journal,
         )
     )
     _optional_modules.append(
@@ -32,8 +35,9 @@ def create_test_modules(
             oxygen_supply=oxygen_supply,
             oxygen_deposit=1000,
             oxygen_deposit_essential=False,
-            status="OFFLINE",
+            status=c.MODULE_STATUS_OFFLINE_BY_REQUEST,
             module_index=2,
+            journal=journal,
         )
     )
     _optional_modules.append(
@@ -44,8 +48,9 @@ def create_test_modules(
             power_supply=power_supply,
             power_withdrawal=1000,
             power_withdrawal_essential=False,
-            status="OFFLINE",
+            status=c.MODULE_STATUS_OFFLINE_BY_REQUEST,
             module_index=3,
+            journal=journal,
         )
     )
     _optional_modules.append(
@@ -56,8 +61,9 @@ def create_test_modules(
             power_supply=power_supply,
             power_deposit=1000,
             power_deposit_essential=False,
-            status="OFFLINE",
+            status=c.MODULE_STATUS_OFFLINE_BY_REQUEST,
             module_index=4,
+            journal=journal,
         )
     )
 
@@ -69,8 +75,9 @@ def create_test_modules(
             heat_sink=heat_sink,
             heat_withdrawal=0,
             heat_withdrawal_essential=False,
-            status="OFFLINE",
+            status=c.MODULE_STATUS_OFFLINE_BY_REQUEST,
             module_index=5,
+            journal=journal,
             mitigation="Habitiat Technician",
         )
     )
@@ -82,8 +89,9 @@ def create_test_modules(
             heat_sink=heat_sink,
             heat_deposit=1000,
             heat_deposit_essential=False,
-            status="OFFLINE",
+            status=c.MODULE_STATUS_OFFLINE_BY_REQUEST,
             module_index=6,
+            journal=journal,
         )
     )
     return _optional_modules
@@ -1,10 +1,12 @@
 #  POWER TESTING !!!
 
+import crawler.constants as c
 from crawler.crawler.modules.module import Module
 from crawler.crawler.modules.power_source import PowerSource
+from crawler.crawler.modules.reporting.log import Journal
 
 
-def create_cells_test_modules(power_supply: PowerSource) -> list[Module]:
+def create_cells_test_modules(power_supply: PowerSource, journal: Journal) -> list[Module]:
 
     _optional_modules: list[Module] = []
     _optional_modules.append(
@@ -15,8 +17,9 @@ def create_cells_test_modules(power_supply: PowerSource) -> list[Module]:
             power_supply=power_supply,
             power_withdrawal=1000,
             power_withdrawal_essential=False,
-            status="OFFLINE",
+            status=c.MODULE_STATUS_OFFLINE_BY_REQUEST,
             module_index=1,
+            journal=journal,
         )
     )
     _optional_modules.append(
@@ -27,8 +30,9 @@ def create_cells_test_modules(power_supply: PowerSource) -> list[Module]:
             power_supply=power_supply,
             power_withdrawal=10,
             power_withdrawal_essential=False,
-            status="OFFLINE",
+            status=c.MODULE_STATUS_OFFLINE_BY_REQUEST,
             module_index=2,
+            journal=journal,
         )
     )
     _optional_modules.append(
@@ -39,8 +43,9 @@ def create_cells_test_modules(power_supply: PowerSource) -> list[Module]:
             power_supply=power_supply,
             power_withdrawal=10,
             power_withdrawal_essential=True,
-            status="OFFLINE",
+            status=c.MODULE_STATUS_OFFLINE_BY_REQUEST,
             module_index=3,
+            journal=journal,
         )
     )
     _optional_modules.append(
@@ -51,8 +56,9 @@ def create_cells_test_modules(power_supply: PowerSource) -> list[Module]:
             power_supply=power_supply,
             power_deposit=1000,
             power_deposit_essential=False,
-            status="OFFLINE",
+            status=c.MODULE_STATUS_OFFLINE_BY_REQUEST,
             module_index=4,
+            journal=journal,
         )
     )
     _optional_modules.append(
@@ -63,8 +69,9 @@ def create_cells_test_modules(power_supply: PowerSource) -> list[Module]:
             power_supply=power_supply,
             power_deposit=100,
             power_deposit_essential=False,
-            status="OFFLINE",
+            status=c.MODULE_STATUS_OFFLINE_BY_REQUEST,
             module_index=5,
+            journal=journal,
         )
     )
     _optional_modules.append(
@@ -75,8 +82,9 @@ def create_cells_test_modules(power_supply: PowerSource) -> list[Module]:
             power_supply=power_supply,
             power_deposit=100,
             power_deposit_essential=True,
-            status="OFFLINE",
+            status=c.MODULE_STATUS_OFFLINE_BY_REQUEST,
             module_index=6,
+            journal=journal,
         )
     )
 
@@ -1,10 +1,12 @@
 #  HEAT TESTING !!!
 
+import crawler.constants as c
 from crawler.crawler.modules.heat_sink import HeatSink
 from crawler.crawler.modules.module import Module
+from crawler.crawler.modules.reporting.log import Journal
 
 
-def create_heat_test_modules(heat_sink: HeatSink) -> list[Module]:
+def create_heat_test_modules(heat_sink: HeatSink, journal: Journal) -> list[Module]:
 
     _optional_modules: list[Module] = []
     _optional_modules.append(
@@ -15,8 +17,9 @@ def create_heat_test_modules(heat_sink: HeatSink) -> list[Module]:
             heat_sink=heat_sink,
             heat_withdrawal=0,
             heat_withdrawal_essential=False,
-            status="OFFLINE",
+            status=c.MODULE_STATUS_OFFLINE_BY_REQUEST,
             module_index=1,
+            journal=journal,
             mitigation="Habitiat Technician",
         )
     )
@@ -28,8 +31,9 @@ def create_heat_test_modules(heat_sink: HeatSink) -> list[Module]:
             heat_sink=heat_sink,
             heat_withdrawal=10,
             heat_withdrawal_essential=False,
-            status="OFFLINE",
+            status=c.MODULE_STATUS_OFFLINE_BY_REQUEST,
             module_index=2,
+            journal=journal,
         )
     )
     _optional_modules.append(
@@ -40,8 +44,9 @@ def create_heat_test_modules(heat_sink: HeatSink) -> list[Module]:
             heat_sink=heat_sink,
             heat_withdrawal=10,
             heat_withdrawal_essential=True,
-            status="OFFLINE",
+            status=c.MODULE_STATUS_OFFLINE_BY_REQUEST,
             module_index=3,
+            journal=journal,
         )
     )
     _optional_modules.append(
@@ -52,8 +57,9 @@ def create_heat_test_modules(heat_sink: HeatSink) -> list[Module]:
             heat_sink=heat_sink,
             heat_deposit=1000,
             heat_deposit_essential=False,
-            status="OFFLINE",
+            status=c.MODULE_STATUS_OFFLINE_BY_REQUEST,
             module_index=4,
+            journal=journal,
         )
     )
     _optional_modules.append(
@@ -64,8 +70,9 @@ def create_heat_test_modules(heat_sink: HeatSink) -> list[Module]:
             heat_sink=heat_sink,
             heat_deposit=10,
             heat_deposit_essential=False,
-            status="OFFLINE",
+            status=c.MODULE_STATUS_OFFLINE_BY_REQUEST,
             module_index=5,
+            journal=journal,
         )
     )
     _optional_modules.append(
@@ -76,8 +83,9 @@ def create_heat_test_modules(heat_sink: HeatSink) -> list[Module]:
             heat_sink=heat_sink,
             heat_deposit=10,
             heat_deposit_essential=True,
-            status="OFFLINE",
+            status=c.MODULE_STATUS_OFFLINE_BY_REQUEST,
             module_index=6,
+            journal=journal,
         )
     )
 
@@ -1,10 +1,12 @@
 #  OXYGEN TESTING !!!
 
+import crawler.constants as c
 from crawler.crawler.modules.module import Module
 from crawler.crawler.modules.oxygen_source import OxygenSource
+from crawler.crawler.modules.reporting.log import Journal
 
 
-def create_oxygen_test_modules(oxygen_supply: OxygenSource) -> list[Module]:
+def create_oxygen_test_modules(oxygen_supply: OxygenSource, journal: Journal) -> list[Module]:
 
     _optional_modules: list[Module] = []
     _optional_modules.append(
@@ -15,7 +17,8 @@ def create_oxygen_test_modules(oxygen_supply: OxygenSource) -> list[Module]:
             oxygen_supply=oxygen_supply,
             oxygen_withdrawal=1000,
             oxygen_withdrawal_essential=False,
-            status="OFFLINE",
+            status=c.MODULE_STATUS_OFFLINE_BY_REQUEST,
+            journal=journal,
         )
     )
     _optional_modules.append(
@@ -26,7 +29,8 @@ def create_oxygen_test_modules(oxygen_supply: OxygenSource) -> list[Module]:
             oxygen_supply=oxygen_supply,
             oxygen_withdrawal=10,
             oxygen_withdrawal_essential=False,
-            status="OFFLINE",
+            status=c.MODULE_STATUS_OFFLINE_BY_REQUEST,
+            journal=journal,
         )
     )
     _optional_modules.append(
@@ -37,7 +41,8 @@ def create_oxygen_test_modules(oxygen_supply: OxygenSource) -> list[Module]:
             oxygen_supply=oxygen_supply,
             oxygen_withdrawal=10,
             oxygen_withdrawal_essential=True,
-            status="OFFLINE",
+            status=c.MODULE_STATUS_OFFLINE_BY_REQUEST,
+            journal=journal,
         )
     )
     _optional_modules.append(
@@ -48,7 +53,8 @@ def create_oxygen_test_modules(oxygen_supply: OxygenSource) -> list[Module]:
             oxygen_supply=oxygen_supply,
             oxygen_deposit=1000,
             oxygen_deposit_essential=False,
-            status="OFFLINE",
+            status=c.MODULE_STATUS_OFFLINE_BY_REQUEST,
+            journal=journal,
         )
     )
     _optional_modules.append(
@@ -59,7 +65,8 @@ def create_oxygen_test_modules(oxygen_supply: OxygenSource) -> list[Module]:
             oxygen_supply=oxygen_supply,
             oxygen_deposit=100,
             oxygen_deposit_essential=False,
-            status="OFFLINE",
+            status=c.MODULE_STATUS_OFFLINE_BY_REQUEST,
+            journal=journal,
         )
     )
     _optional_modules.append(
@@ -70,7 +77,8 @@ def create_oxygen_test_modules(oxygen_supply: OxygenSource) -> list[Module]:
             oxygen_supply=oxygen_supply,
             oxygen_deposit=100,
             oxygen_deposit_essential=True,
-            status="OFFLINE",
+            status=c.MODULE_STATUS_OFFLINE_BY_REQUEST,
+            journal=journal,
         )
     )
 
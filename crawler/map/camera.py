@@ -1,6 +1,8 @@
 #  The Camera class.
 
-from pygame import Rect, sprite
+from typing import Optional
+
+from pygame import Rect, Surface, sprite, transform
 
 import crawler.constants as c
 from crawler.config import layout_config
@@ -27,6 +29,32 @@ class Camera:
         self._width: int = size[0]
         self._height: int = size[1]
         self._camera: Rect = Rect(0, 0, self._width, self._height)
+        self._viewport: Rect = Rect(0, 0, c.MAP_VIEW_SIZE[0], c.MAP_VIEW_SIZE[1])
+        self.zoom: int = 0
+
+    #  PROPERTIES
+
+    @property
+    def viewport(self) -> Rect:
+        """viewport
+
+        Gets the area of the map currently shown by the camera.
+
+        Returns:
+            Rect: the viewport in map coordinates.
+        """
+        return self._viewport
+
+    @property
+    def scale(self) -> float:
+        """scale
+
+        Gets the scale at which the map is shown.
+
+        Returns:
+            float: 1 at full size, 0.5 at half size etc.
+        """
+        return 1 / (1 << self.zoom)
 
     # HELPER METHODS ##########################################################
 
@@ -47,6 +75,51 @@ class Camera:
         _rect: Rect = entity.rect.move(self._camera.topleft)  #  type: ignore
         return _rect  #  type: ignore
 
+    def project(
+        self, entity: sprite.Sprite
+    ) -> Optional[tuple[Surface, tuple[int, int], Rect]]:
+        """project
+
+        Gets the part of the sprite that is in the viewport, scaled for the zoom, and where to draw it.
+
+        Args:
+            entity (sprite.Sprite): sprite to project.
+
+        Returns:
+            Optional[tuple[Surface, tuple[int, int], Rect]]: the image, the position in the view and the area of the image,
+            or None if the sprite is not in the viewport.
+        """
+
+        _visible: Rect = entity.rect.clip(self._viewport)  #  type: ignore
+        if _visible.width == 0 or _visible.height == 0:
+            return None
+
+        if self.zoom == 0:
+            return (
+                entity.image,  #  type: ignore
+                (_visible.left - self._viewport.left, _visible.top - self._viewport.top),
+                _visible.move(-entity.rect.left, -entity.rect.top),  #  type: ignore
+            )
+
+        #  Scale the whole sprite, the view clips it.
+
+        _image: Surface = transform.scale(
+            entity.image,  #  type: ignore
+            (
+                max(1, entity.rect.width >> self.zoom),  #  type: ignore
+                max(1, entity.rect.height >> self.zoom),  #  type: ignore
+            ),
+        )
+
+        return (
+            _image,
+            (
+                (entity.rect.left >> self.zoom) - (self._viewport.left >> self.zoom),  #  type: ignore
+                (entity.rect.top >> self.zoom) - (self._viewport.top >> self.zoom),  #  type: ignore
+            ),
+            _image.get_rect(),
+        )
+
     # MAIN GAMELOOP METHODS ###################################################
 
     def update(self, position: tuple[int, int]) -> None:
@@ -66,6 +139,13 @@ class Camera:
         else:
             _map_view_size = c.MAP_VIEW_SIZE
 
+        #  When zoomed out the view covers more of the map.
+
+        _map_view_size = (
+            _map_view_size[0] << self.zoom,
+            _map_view_size[1] << self.zoom,
+        )
+
         #  Get center of srite
 
         _x = -(position[0] + 32) + int(_map_view_size[0] / 2)  #  type: ignore
@@ -78,6 +158,14 @@ class Camera:
         _x = max(-(self._width - _map_view_size[0]), _x)
         _y = max(-(self._height - _map_view_size[1]), _y)
 
+        #  Centre the map if it is smaller than the view.
+
+        if _map_view_size[0] > self._width:
+            _x = (_map_view_size[0] - self._width) // 2
+        if _map_view_size[1] > self._height:
+            _y = (_map_view_size[1] - self._height) // 2
+
         #  Reset camera rectanlge
 
         self._camera = Rect(_x, _y, self._width, self._height)
+        self._viewport = Rect(-_x, -_y, _map_view_size[0], _map_view_size[1])
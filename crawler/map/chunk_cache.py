@@ -0,0 +1,275 @@
+#  The ChunkCache class.
+#  Renders the map in fixed size chunks, on demand, keeping only the most recently used.
+
+from collections import OrderedDict
+from typing import Any, Callable, Iterator, Optional, Sequence
+
+import pygame
+
+import crawler.constants as c
+import crawler.customlogger as customlogger
+
+
+class ChunkCache:
+    """ChunkCache
+
+    The ChunkCache splits the map into fixed size chunks of tiles.
+    A chunk is only rendered from the tile data when it is first needed,
+    and the least recently used chunks are evicted when the memory budget is reached.
+    """
+
+    @customlogger.log_trace(customlogger.Levels.INFO)
+    def __init__(
+        self,
+        size: tuple[int, int],
+        tile_size: tuple[int, int],
+        layers: list[Sequence[Sequence[int]]],
+        get_tile_image: Callable[[int], Optional[pygame.Surface]],
+        alpha: int = 255,
+        chunk_tiles: int = c.MAP_CHUNK_TILES,
+        memory_budget: int = c.MAP_CHUNK_MEMORY_BUDGET,
+    ) -> None:
+        """__init__
+
+        Initialise the ChunkCache.
+
+        Args:
+            size (tuple[int, int]): size of the map in tiles.
+            tile_size (tuple[int, int]): size of each tile in pixels.
+            layers (list[Sequence[Sequence[int]]]): the tile layers, each is a grid of gids indexed [row][col].
+            get_tile_image (Callable[[int], Optional[pygame.Surface]]): returns the image for a gid.
+            alpha (int): the alpha to apply to each tile. Defaults to 255.
+            chunk_tiles (int): the width and height of a chunk in tiles. Defaults to c.MAP_CHUNK_TILES.
+            memory_budget (int): the maximum number of bytes of chunks to keep. Defaults to c.MAP_CHUNK_MEMORY_BUDGET.
+        """
+
+        #  Save map parameters.
+
+        self.cols: int = size[0]
+        self.rows: int = size[1]
+        self.tile_width: int = tile_size[0]
+        self.tile_height: int = tile_size[1]
+        self.width: int = self.cols * self.tile_width
+        self.height: int = self.rows * self.tile_height
+
+        self.layers: list[Sequence[Sequence[int]]] = layers
+        self.get_tile_image: Callable[[int], Optional[pygame.Surface]] = get_tile_image
+        self.alpha: int = alpha
+
+        #  Work out the chunk layout.
+
+        self.chunk_tiles: int = chunk_tiles
+        self.chunk_width: int = chunk_tiles * self.tile_width
+        self.chunk_height: int = chunk_tiles * self.tile_height
+        self.chunks_across: int = -(-self.cols // chunk_tiles)
+        self.chunks_down: int = -(-self.rows // chunk_tiles)
+
+        #  The cache itself, oldest first.
+
+        self.memory_budget: int = memory_budget
+        self.memory_used: int = 0
+        self._chunks: OrderedDict[tuple[int, int], pygame.Surface] = OrderedDict()
+
+        #  Tile images with the alpha applied, fetched once per gid.
+
+        self._tile_images: dict[int, Optional[pygame.Surface]] = {}
+
+    # HELPER METHODS ##########################################################
+
+    def chunk_rect(self, chunk: tuple[int, int]) -> pygame.Rect:
+        """chunk_rect
+
+        Gets the area of the map covered by a chunk, clipped to the map edges.
+
+        Args:
+            chunk (tuple[int, int]): the chunk column and row.
+
+        Returns:
+            pygame.Rect: the area of the map, in pixels.
+        """
+        _rect = pygame.Rect(
+            chunk[0] * self.chunk_width,
+            chunk[1] * self.chunk_height,
+            self.chunk_width,
+            self.chunk_height,
+        )
+        return _rect.clip(pygame.Rect(0, 0, self.width, self.height))
+
+    def chunks_in_rect(self, rect: pygame.Rect) -> Iterator[tuple[int, int]]:
+        """chunks_in_rect
+
+        Gets the chunks that overlap an area of the map.
+
+        Args:
+            rect (pygame.Rect): the area of the map, in pixels.
+
+        Yields:
+            tuple[int, int]: the chunk column and row.
+        """
+        _first_col: int = max(0, rect.left // self.chunk_width)
+        _first_row: int = max(0, rect.top // self.chunk_height)
+        _last_col: int = min(self.chunks_across - 1, (rect.right - 1) // self.chunk_width)
+        _last_row: int = min(self.chunks_down - 1, (rect.bottom - 1) // self.chunk_height)
+
+        for _row in range(_first_row, _last_row + 1):
+            for _col in range(_first_col, _last_col + 1):
+                yield (_col, _row)
+
+    def tile_image(self, gid: int) -> Optional[pygame.Surface]:
+        """tile_image
+
+        Gets the image for a gid, with the map alpha applied.
+
+        Args:
+            gid (int): the gid of the tile.
+
+        Returns:
+            Optional[pygame.Surface]: the image, or None if the gid has no image.
+        """
+        if gid not in self._tile_images:
+            _image: Optional[pygame.Surface] = self.get_tile_image(gid) if gid else None
+            if _image is not None:
+                _image.set_alpha(self.alpha)
+            self._tile_images[gid] = _image
+
+        return self._tile_images[gid]
+
+    def render_chunk(self, chunk: tuple[int, int]) -> pygame.Surface:
+        """render_chunk
+
+        Renders a chunk from the tile data, without caching it.
+
+        Args:
+            chunk (tuple[int, int]): the chunk column and row.
+
+        Returns:
+            pygame.Surface: the rendered chunk.
+        """
+        _rect: pygame.Rect = self.chunk_rect(chunk)
+        _surface: pygame.Surface = pygame.Surface(_rect.size)
+
+        #  Blit the tiles of each layer in turn.
+
+        _first_col: int = _rect.left // self.tile_width
+        _first_row: int = _rect.top // self.tile_height
+        _last_col: int = _rect.right // self.tile_width
+        _last_row: int = _rect.bottom // self.tile_height
+
+        for _layer in self.layers:
+            _blits: list[tuple[pygame.Surface, tuple[int, int]]] = []
+            for _row in range(_first_row, _last_row):
+                _gids = _layer[_row]
+                for _col in range(_first_col, _last_col):
+                    _tile: Optional[pygame.Surface] = self.tile_image(int(_gids[_col]))
+                    if _tile is not None:
+                        _blits.append(
+                            (
+                                _tile,
+                                (
+                                    (_col - _first_col) * self.tile_width,
+                                    (_row - _first_row) * self.tile_height,
+                                ),
+                            )
+                        )
+            _surface.blits(_blits, doreturn=False)  # type: ignore
+
+        return _surface
+
+    def peek_chunk(self, chunk: tuple[int, int]) -> Optional[pygame.Surface]:
+        """peek_chunk
+
+        Gets a chunk from the cache, if it is there, without marking it as used.
+
+        Args:
+            chunk (tuple[int, int]): the chunk column and row.
+
+        Returns:
+            Optional[pygame.Surface]: the rendered chunk, or None if it is not in the cache.
+        """
+        return self._chunks.get(chunk)
+
+    def get_chunk(self, chunk: tuple[int, int]) -> pygame.Surface:
+        """get_chunk
+
+        Gets a chunk from the cache, rendering it if it is not there.
+
+        Args:
+            chunk (tuple[int, int]): the chunk column and row.
+
+        Returns:
+            pygame.Surface: the rendered chunk.
+        """
+        _surface: Optional[pygame.Surface] = self._chunks.get(chunk)
+
+        if _surface is not None:
+            self._chunks.move_to_end(chunk)
+            return _surface
+
+        #  Render the chunk, converting it for fast blitting if there is a display.
+
+        _surface = self.render_chunk(chunk)
+        if pygame.display.get_surface() is not None:
+            _surface = _surface.convert()
+
+        self._chunks[chunk] = _surface
+        self.memory_used += self.surface_bytes(_surface)
+
+        #  Evict the least recently used chunks, but never the one just rendered.
+
+        while self.memory_used > self.memory_budget and len(self._chunks) > 1:
+            _, _evicted = self._chunks.popitem(last=False)
+            self.memory_used -= self.surface_bytes(_evicted)
+
+        return _surface
+
+    @staticmethod
+    def surface_bytes(surface: pygame.Surface) -> int:
+        """surface_bytes
+
+        Gets the memory used by the pixels of a surface.
+
+        Args:
+            surface (pygame.Surface): the surface.
+
+        Returns:
+            int: number of bytes.
+        """
+        return surface.get_pitch() * surface.get_height()
+
+    def stats(self) -> dict[str, Any]:
+        """stats
+
+        Gets the current state of the cache.
+
+        Returns:
+            dict[str, Any]: number of chunks and memory used.
+        """
+        return {
+            "chunks": len(self._chunks),
+            "memory_used": self.memory_used,
+            "memory_budget": self.memory_budget,
+        }
+
+    # MAIN GAMELOOP METHODS ###################################################
+
+    def draw(self, surface: pygame.Surface, viewport: pygame.Rect) -> None:
+        """draw
+
+        Draws the area of the map under the viewport on to the surface.
+
+        Args:
+            surface (pygame.Surface): the surface on to which to draw.
+            viewport (pygame.Rect): the area of the map to draw, in pixels.
+        """
+        _blits: list[tuple[pygame.Surface, tuple[int, int]]] = []
+
+        for _chunk in self.chunks_in_rect(viewport):
+            _rect: pygame.Rect = self.chunk_rect(_chunk)
+            _blits.append(
+                (
+                    self.get_chunk(_chunk),
+                    (_rect.left - viewport.left, _rect.top - viewport.top),
+                )
+            )
+
+        surface.blits(_blits, doreturn=False)  # type: ignore
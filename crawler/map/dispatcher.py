@@ -0,0 +1,153 @@
+#  The Dispatcher class.
+#  Sends idle crawlers to the nearest pods and salvage, and collects them when the crawlers arrive.
+
+import math
+from typing import Callable, Optional
+
+import crawler.constants as c
+import crawler.customlogger as customlogger
+from crawler.crawler.crawler import Crawler
+from crawler.map.flow_field import FlowFieldSet
+from crawler.map.object_registry import ObjectRegistry
+from crawler.map.pathfinding import CostGrid
+
+
+class Dispatcher:
+    """Dispatcher
+
+    The Dispatcher holds a FlowFieldSet for each type of target, the pods and the salvage.
+    Each target is claimed by the crawler sent to it, so no two crawlers are sent to the same target,
+    and is collected, and removed from the registry and the flow fields, when the crawler reaches it.
+    """
+
+    @customlogger.log_trace(customlogger.Levels.INFO)
+    def __init__(
+        self,
+        registry: ObjectRegistry,
+        grid: CostGrid,
+        report: Optional[Callable[[float], None]] = None,
+    ) -> None:
+        """__init__
+
+        Initialise the Dispatcher, working out the flow fields of the targets.
+
+        Args:
+            registry (ObjectRegistry): the map objects.
+            grid (CostGrid): the cost of each tile.
+            report (Optional[Callable[[float], None]]): called with the fraction of the flow fields worked out. Defaults to None.
+        """
+
+        self.registry: ObjectRegistry = registry
+        self.fields: dict[str, FlowFieldSet] = {}
+
+        #  The crawler each target has been claimed by, by target id.
+
+        self.claims: dict[int, Crawler] = {}
+
+        _targets: dict[str, dict[int, tuple[int, int]]] = {
+            _type: registry.table(_type).tiles() for _type in c.DISPATCH_TARGET_TYPES
+        }
+        _total: int = sum(len(_tiles) for _tiles in _targets.values()) or 1
+        _done: int = 0
+
+        for _type, _tiles in _targets.items():
+
+            def report_type(fraction: float) -> None:
+                if report is not None:
+                    report((_done + fraction * len(_tiles)) / _total)
+
+            self.fields[_type] = FlowFieldSet(grid, _tiles, report_type)
+            _done += len(_tiles)
+
+    def fork(self, registry: ObjectRegistry) -> "Dispatcher":
+        """fork
+
+        Gets a Dispatcher for another copy of the same map, sharing the flow fields,
+        so they are only worked out once. It starts with no claims.
+
+        Args:
+            registry (ObjectRegistry): the map objects of the copy, before any have been collected.
+
+        Returns:
+            Dispatcher: the new Dispatcher.
+        """
+        _dispatcher: Dispatcher = object.__new__(Dispatcher)
+        _dispatcher.registry = registry
+        _dispatcher.fields = {_type: _field_set.copy() for _type, _field_set in self.fields.items()}
+        _dispatcher.claims = {}
+
+        return _dispatcher
+
+    def dispatch(self, crawlers: list[Crawler], target_type: str) -> list[tuple[Crawler, int]]:
+        """dispatch
+
+        Sends each idle crawler to the nearest target not claimed by another crawler.
+        The closest crawler and target are paired first, then the next closest, and so on.
+
+        Args:
+            crawlers (list[Crawler]): the crawlers.
+            target_type (str): the type of target, c.MAP_OBJECT_POD or c.MAP_OBJECT_SALVAGE.
+
+        Returns:
+            list[tuple[Crawler, int]]: each crawler sent, and the id of its target.
+        """
+
+        _field_set: FlowFieldSet = self.fields[target_type]
+
+        _pairs: list[tuple[float, int, int]] = []
+        for _crawler in crawlers:
+            if not _crawler.idle:
+                continue
+            for _id, _field in _field_set.fields.items():
+                if _id in self.claims:
+                    continue
+                _distance: float = _field.distance_at(_crawler.tile)
+                if not math.isinf(_distance):
+                    _pairs.append((_distance, _crawler.number, _id))
+
+        _pairs.sort()
+
+        _dispatched: list[tuple[Crawler, int]] = []
+        _sent: set[int] = set()
+
+        for _, _number, _id in _pairs:
+            if _number in _sent or _id in self.claims:
+                continue
+
+            _crawler: Crawler = crawlers[_number]
+            _crawler.autopilot.follow(_field_set.fields[_id])
+
+            self.claims[_id] = _crawler
+            _sent.add(_number)
+            _dispatched.append((_crawler, _id))
+
+        return _dispatched
+
+    def update(self) -> list[tuple[Crawler, int]]:
+        """update
+
+        Collects the targets the crawlers have reached,
+        and releases the claims of crawlers that have stopped following their target.
+
+        Returns:
+            list[tuple[Crawler, int]]: each crawler that collected a target, and the id of the target.
+        """
+
+        _collected: list[tuple[Crawler, int]] = []
+
+        for _id, _crawler in list(self.claims.items()):
+            _table, _row = self.registry.lookup(_id)
+
+            if _crawler.autopilot.status == "ARRIVED" and _crawler.tile == _table.tile(_row):
+                del self.claims[_id]
+                self.registry.remove(_id)
+                self.fields[_table.type].collect(_id)
+                _collected.append((_crawler, _id))
+
+            elif (
+                _crawler.autopilot.field is None
+                or _crawler.autopilot.field is not self.fields[_table.type].fields.get(_id)
+            ):
+                del self.claims[_id]
+
+        return _collected
@@ -0,0 +1,246 @@
+#  The FlowField and FlowFieldSet classes.
+#  Hold the distance to a target from every tile of the map, and the step to take towards it.
+
+import copy
+import heapq
+import math
+from typing import Callable, Optional
+
+import numpy as np
+
+import crawler.customlogger as customlogger
+from crawler.map.pathfinding import DIRECTIONS, SQRT2, CostGrid
+
+
+class FlowField:
+    """FlowField
+
+    The FlowField holds, for every tile of the map, the cost of the cheapest route to a target,
+    and which of the eight directions to step in to follow it.
+    It is worked out once with Dijkstra's algorithm from the target outwards,
+    so any number of crawlers can then find their next step in constant time.
+    """
+
+    def __init__(self, grid: CostGrid, target: tuple[int, int]) -> None:
+        """__init__
+
+        Initialise the FlowField.
+
+        Args:
+            grid (CostGrid): the cost of each tile.
+            target (tuple[int, int]): the target tile column and row.
+        """
+
+        self.target: tuple[int, int] = target
+        self.version: int = grid.version
+
+        _rows, _cols = grid.walkable.shape
+        _size: int = _rows * _cols
+
+        _walkable: list[bool] = grid.walkable.ravel().tolist()
+        _cost: list[float] = grid.cost.ravel().tolist()
+        _distance: list[float] = [math.inf] * _size
+        _step: list[int] = [-1] * _size
+
+        #  Each direction as an offset in the flattened grid, its length,
+        #  and the index of the direction back again, which is the step to store.
+
+        _moves: list[tuple[int, int, int, float, int]] = [
+            (_dx, _dy, _dy * _cols + _dx, SQRT2 if _dx and _dy else 1, DIRECTIONS.index((-_dx, -_dy)))
+            for _dx, _dy in DIRECTIONS
+        ]
+
+        _start: int = target[1] * _cols + target[0]
+
+        if 0 <= target[0] < _cols and 0 <= target[1] < _rows and _walkable[_start]:
+            _distance[_start] = 0
+            _open: list[tuple[float, int]] = [(0, _start)]
+
+            while _open:
+                _current_distance, _index = heapq.heappop(_open)
+                if _current_distance > _distance[_index]:
+                    continue
+
+                _y, _x = divmod(_index, _cols)
+                _half_cost: float = _cost[_index] / 2
+
+                for _dx, _dy, _offset, _length, _back in _moves:
+                    _nx: int = _x + _dx
+                    _ny: int = _y + _dy
+                    if not (0 <= _nx < _cols and 0 <= _ny < _rows):
+                        continue
+
+                    _next: int = _index + _offset
+                    if not _walkable[_next]:
+                        continue
+
+                    #  Diagonal steps are only taken when both tiles beside them are walkable.
+
+                    if _dx and _dy and not (_walkable[_index + _dx] and _walkable[_index + _dy * _cols]):
+                        continue
+
+                    _next_distance: float = _current_distance + _length * (_half_cost + _cost[_next] / 2)
+                    if _next_distance < _distance[_next]:
+                        _distance[_next] = _next_distance
+                        _step[_next] = _back
+                        heapq.heappush(_open, (_next_distance, _next))
+
+        self.distance: np.ndarray = np.array(_distance, dtype=np.float32).reshape(_rows, _cols)
+        self.step: np.ndarray = np.array(_step, dtype=np.int8).reshape(_rows, _cols)
+
+    def distance_at(self, tile: tuple[int, int]) -> float:
+        """distance_at
+
+        Gets the cost of the route from a tile to the target.
+
+        Args:
+            tile (tuple[int, int]): the tile column and row.
+
+        Returns:
+            float: the cost, inf if the target can't be reached.
+        """
+        _rows, _cols = self.distance.shape
+        if not (0 <= tile[0] < _cols and 0 <= tile[1] < _rows):
+            return math.inf
+
+        return float(self.distance[tile[1], tile[0]])
+
+    def next_tile(self, tile: tuple[int, int]) -> Optional[tuple[int, int]]:
+        """next_tile
+
+        Gets the next tile on the route from a tile to the target.
+
+        Args:
+            tile (tuple[int, int]): the tile column and row.
+
+        Returns:
+            Optional[tuple[int, int]]: the next tile, or None at the target, or if the target can't be reached.
+        """
+        _rows, _cols = self.step.shape
+        if not (0 <= tile[0] < _cols and 0 <= tile[1] < _rows):
+            return None
+
+        _step: int = int(self.step[tile[1], tile[0]])
+        if _step < 0:
+            return None
+
+        return (tile[0] + DIRECTIONS[_step][0], tile[1] + DIRECTIONS[_step][1])
+
+
+class FlowFieldSet:
+    """FlowFieldSet
+
+    The FlowFieldSet holds a FlowField for each of a set of targets, such as the pods,
+    and from them the distance to the nearest target from every tile, and which target that is.
+    The nearest target map is the same as a single Dijkstra search from all of the targets,
+    but when a target is collected it is worked out again from the remaining fields, without searching.
+    """
+
+    @customlogger.log_trace(customlogger.Levels.INFO)
+    def __init__(
+        self,
+        grid: CostGrid,
+        targets: dict[int, tuple[int, int]],
+        report: Optional[Callable[[float], None]] = None,
+    ) -> None:
+        """__init__
+
+        Initialise the FlowFieldSet, working out the field of each target.
+
+        Args:
+            grid (CostGrid): the cost of each tile.
+            targets (dict[int, tuple[int, int]]): the tile of each target, by object id.
+            report (Optional[Callable[[float], None]]): called with the fraction of the fields worked out. Defaults to None.
+        """
+
+        self.shape: tuple[int, int] = grid.walkable.shape  # type: ignore
+        self.fields: dict[int, FlowField] = {}
+
+        for _number, (_id, _tile) in enumerate(targets.items()):
+            self.fields[_id] = FlowField(grid, _tile)
+            if report is not None:
+                report((_number + 1) / len(targets))
+
+        self.update()
+
+    def __len__(self) -> int:
+        return len(self.fields)
+
+    def __contains__(self, id: int) -> bool:
+        return id in self.fields
+
+    def copy(self) -> "FlowFieldSet":
+        """copy
+
+        Gets a copy of the FlowFieldSet, sharing the fields, so that targets can be collected from it separately.
+
+        Returns:
+            FlowFieldSet: the copy.
+        """
+        _copy: FlowFieldSet = copy.copy(self)
+        _copy.fields = dict(self.fields)
+
+        return _copy
+
+    def update(self) -> None:
+        """update
+
+        Works out the nearest target map from the fields.
+        """
+
+        self.ids: np.ndarray = np.array(list(self.fields), dtype=np.int32)
+
+        if len(self.fields) == 0:
+            self.distance: np.ndarray = np.full(self.shape, np.inf, dtype=np.float32)
+            self.nearest: np.ndarray = np.full(self.shape, -1, dtype=np.int16)
+            return
+
+        _distances: np.ndarray = np.stack([_field.distance for _field in self.fields.values()])
+
+        self.nearest = np.argmin(_distances, axis=0).astype(np.int16)
+        self.distance = np.take_along_axis(_distances, self.nearest[np.newaxis].astype(np.intp), axis=0)[0]
+        self.nearest[np.isinf(self.distance)] = -1
+
+    def collect(self, id: int) -> None:
+        """collect
+
+        Removes a target, once it has been collected.
+
+        Args:
+            id (int): the target object id.
+        """
+        if self.fields.pop(id, None) is not None:
+            self.update()
+
+    def nearest_target(self, tile: tuple[int, int]) -> Optional[int]:
+        """nearest_target
+
+        Gets the nearest target to a tile.
+
+        Args:
+            tile (tuple[int, int]): the tile column and row.
+
+        Returns:
+            Optional[int]: the target object id, or None if no target can be reached.
+        """
+        if not (0 <= tile[0] < self.shape[1] and 0 <= tile[1] < self.shape[0]):
+            return None
+
+        _nearest: int = int(self.nearest[tile[1], tile[0]])
+
+        return None if _nearest < 0 else int(self.ids[_nearest])
+
+    def next_tile(self, tile: tuple[int, int]) -> Optional[tuple[int, int]]:
+        """next_tile
+
+        Gets the next tile on the route from a tile to the nearest target.
+
+        Args:
+            tile (tuple[int, int]): the tile column and row.
+
+        Returns:
+            Optional[tuple[int, int]]: the next tile, or None at a target, or if no target can be reached.
+        """
+        _id: Optional[int] = self.nearest_target(tile)
+
+        return None if _id is None else self.fields[_id].next_tile(tile)
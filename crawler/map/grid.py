@@ -1,29 +1,304 @@
 #  The Grid class.
 #  The Grid is drawn over the map and other sprites.
 
+from collections import OrderedDict
+
 import pygame
 
+import crawler.constants as c
+from crawler.config import layout_config
+from crawler.console.console_tools.show_text import show_text
+
 
 class Grid(pygame.sprite.Sprite):
     """Grid
 
     The Grid class.
+    The Grid image only covers the camera viewport and is redrawn when the camera moves.
+    The grid repeats every ten tiles, so one block of ten by ten tiles is drawn once and reused,
+    along with a small cache of the labels drawn in the corner of each block.
 
     Args:
         pygame.sprite.Sprite: the Grid subclasses pygame.sprite.Sprite.
     """
 
-    def __init__(self, group: pygame.sprite.Group, grid: pygame.Surface) -> None:  # type: ignore
+    def __init__(
+        self,
+        group: pygame.sprite.Group,  # type: ignore
+        size: tuple[int, int],
+        alpha: int,
+    ) -> None:
         """__init__
 
         Initialise the Grid.
 
         Args:
             group (pygame.sprite.Group): the sprite groups to which the Grid belongs.
-            grid (pygame.Surface): the surface containing the Grid image.
+            size (tuple[int, int]): the size of the map in tiles.
+            alpha (int): the alpha of the grid lines.
         """
         super().__init__(group)  # type: ignore
 
         self.name: str = "grid"
-        self.image: pygame.Surface = grid
-        self.rect: pygame.rect.Rect = grid.get_rect()  # type: ignore
+        self.image: pygame.Surface = pygame.Surface((0, 0), pygame.SRCALPHA)
+        self.rect: pygame.rect.Rect = pygame.Rect(0, 0, 0, 0)
+
+        #  Save the Grid parameters.
+
+        self.cols: int = size[0]
+        self.rows: int = size[1]
+        self.alpha: int = alpha
+        self.block_size: int = c.GRID_BLOCK_TILES * c.MAP_TILE_SIZE
+
+        #  The block and labels are created when first needed.
+
+        self._block: pygame.Surface | None = None
+        self._scaled_blocks: dict[int, pygame.Surface] = {}
+        self.zoom: int = 0
+        self._labels: OrderedDict[tuple[int, int, int], pygame.Surface] = OrderedDict()
+
+    # HELPER METHODS ##########################################################
+
+    def create_tile(self, col: int, row: int) -> pygame.Surface:
+        """create_tile
+
+        Creates the grid image for a single tile.
+
+        Args:
+            col (int): the column of the tile.
+            row (int): the row of the tile.
+
+        Returns:
+            pygame.Surface: the tile image.
+        """
+        _tile = pygame.Surface((c.MAP_TILE_SIZE, c.MAP_TILE_SIZE), pygame.SRCALPHA)
+        if pygame.display.get_surface() is not None:
+            _tile = _tile.convert_alpha()
+        _tile.set_alpha(self.alpha)
+
+        #  Draw grid round each tile.
+
+        pygame.draw.line(_tile, c.GRAY, (0, 0), (5, 0), 1)
+        pygame.draw.line(_tile, c.GRAY, (0, 0), (0, 5), 1)
+        pygame.draw.line(_tile, c.GRAY, (59, 0), (64, 0), 1)
+        pygame.draw.line(_tile, c.GRAY, (0, 59), (0, 64), 1)
+
+        #  Draw a heavier line for every tenth tile.
+
+        if col % c.GRID_BLOCK_TILES == 0:
+            pygame.draw.line(_tile, c.GRAY, (0, 0), (0, 64), 1)
+
+        if row % c.GRID_BLOCK_TILES == 0:
+            pygame.draw.line(_tile, c.GRAY, (0, 0), (64, 0), 1)
+
+        return _tile
+
+    def get_block(self, zoom: int = 0) -> pygame.Surface:
+        """get_block
+
+        Gets the image of one block of ten by ten tiles.
+        The lower right tile is left empty as it is drawn with the block's label.
+
+        Args:
+            zoom (int): the zoom level, the block is scaled to 1 / 2 ** zoom size. Defaults to 0.
+
+        Returns:
+            pygame.Surface: the block image.
+        """
+        if self._block is None:
+            self._block = pygame.Surface(
+                (self.block_size, self.block_size), pygame.SRCALPHA
+            )
+            for _row in range(c.GRID_BLOCK_TILES):
+                for _col in range(c.GRID_BLOCK_TILES):
+                    if (_col, _row) == (c.GRID_BLOCK_TILES - 1, c.GRID_BLOCK_TILES - 1):
+                        continue
+                    self._block.blit(
+                        self.create_tile(_col, _row),
+                        (_col * c.MAP_TILE_SIZE, _row * c.MAP_TILE_SIZE),
+                    )
+
+        if zoom == 0:
+            return self._block
+
+        #  The scaled blocks are not smoothed, so the lines stay sharp.
+        #  Every line on a multiple of 2 ** zoom pixels, including the heavy lines, is kept.
+
+        if zoom not in self._scaled_blocks:
+            self._scaled_blocks[zoom] = pygame.transform.scale(
+                self._block, (self.block_size >> zoom, self.block_size >> zoom)
+            )
+
+        return self._scaled_blocks[zoom]
+
+    def get_label(self, col: int, row: int, zoom: int = 0) -> pygame.Surface:
+        """get_label
+
+        Gets the labelled tile for the lower right corner of a block.
+        The labels are kept at each zoom they are drawn at, so they are only scaled once.
+
+        Args:
+            col (int): the column of the tile.
+            row (int): the row of the tile.
+            zoom (int): the zoom level, the label is scaled to 1 / 2 ** zoom size. Defaults to 0.
+
+        Returns:
+            pygame.Surface: the labelled tile image.
+        """
+        _label: pygame.Surface | None = self._labels.get((col, row, zoom))
+
+        if _label is not None:
+            self._labels.move_to_end((col, row, zoom))
+            return _label
+
+        #  The scaled labels are smoothed, so the text stays readable.
+
+        if zoom > 0:
+            _label = pygame.transform.smoothscale(
+                self.get_label(col, row), (c.MAP_TILE_SIZE >> zoom, c.MAP_TILE_SIZE >> zoom)
+            )
+            self.cache_label(col, row, zoom, _label)
+            return _label
+
+        #  Add a label to the lower corner of the tile.
+
+        _label = self.create_tile(col, row)
+
+        pygame.draw.rect(
+            _label,
+            c.GRAY,
+            (0, _label.get_height() - 20, _label.get_width(), 20),
+        )
+
+        show_text(
+            _label,
+            f"{col+1}:{row+1}",
+            (0, _label.get_height() - 20, _label.get_width(), 20),
+            layout_config.font,
+            c.BLACK,
+            True,
+            y_offset=2,
+        )
+
+        #  The tile is composed on to a clear surface so it matches the block.
+
+        _composed = pygame.Surface(_label.get_size(), pygame.SRCALPHA)
+        _composed.blit(_label, (0, 0))
+
+        self.cache_label(col, row, zoom, _composed)
+
+        return _composed
+
+    def cache_label(self, col: int, row: int, zoom: int, label: pygame.Surface) -> None:
+        """cache_label
+
+        Keeps a labelled tile, dropping the least recently used once there are c.GRID_LABEL_CACHE_SIZE.
+
+        Args:
+            col (int): the column of the tile.
+            row (int): the row of the tile.
+            zoom (int): the zoom level the label is scaled to.
+            label (pygame.Surface): the labelled tile image.
+        """
+        self._labels[(col, row, zoom)] = label
+        while len(self._labels) > c.GRID_LABEL_CACHE_SIZE:
+            self._labels.popitem(last=False)
+
+    # MAIN GAMELOOP METHODS ###################################################
+
+    def update_view(self, viewport: pygame.Rect, zoom: int = 0) -> None:
+        """update_view
+
+        Redraws the Grid image if the viewport has moved or the zoom has changed.
+
+        Args:
+            viewport (pygame.Rect): the area of the map shown by the camera.
+            zoom (int): the zoom level, the grid is drawn at 1 / 2 ** zoom size. Defaults to 0.
+        """
+
+        if viewport == self.rect and zoom == self.zoom:
+            return
+
+        #  Resize the image if the view has changed size.
+
+        _view_size: tuple[int, int] = (viewport.width >> zoom, viewport.height >> zoom)
+
+        if _view_size != self.image.get_size():
+            self.image = pygame.Surface(_view_size, pygame.SRCALPHA)
+
+        self.rect = viewport.copy()
+        self.zoom = zoom
+        self.image.fill((0, 0, 0, 0))
+
+        #  Only draw the part of the viewport that is on the map.
+
+        _area: pygame.Rect = viewport.clip(
+            pygame.Rect(
+                0, 0, self.cols * c.MAP_TILE_SIZE, self.rows * c.MAP_TILE_SIZE
+            )
+        )
+        if _area.width == 0 or _area.height == 0:
+            return
+
+        self.image.set_clip(
+            pygame.Rect(
+                (_area.left >> zoom) - (viewport.left >> zoom),
+                (_area.top >> zoom) - (viewport.top >> zoom),
+                -(-_area.width >> zoom),
+                -(-_area.height >> zoom),
+            )
+        )
+
+        _block: pygame.Surface = self.get_block(zoom)
+        _blits: list[tuple[pygame.Surface, tuple[int, int], None, int]] = []
+
+        for _block_row in range(
+            _area.top // self.block_size, (_area.bottom - 1) // self.block_size + 1
+        ):
+            for _block_col in range(
+                _area.left // self.block_size, (_area.right - 1) // self.block_size + 1
+            ):
+                _blits.append(
+                    (
+                        _block,
+                        (
+                            ((_block_col * self.block_size) >> zoom) - (viewport.left >> zoom),
+                            ((_block_row * self.block_size) >> zoom) - (viewport.top >> zoom),
+                        ),
+                        None,
+                        pygame.BLEND_RGBA_MAX,
+                    )
+                )
+
+                #  Label the lower right tile of the block, if it is on the map,
+                #  and the labels are still readable at this zoom.
+
+                _col: int = (_block_col + 1) * c.GRID_BLOCK_TILES - 1
+                _row: int = (_block_row + 1) * c.GRID_BLOCK_TILES - 1
+                _label_rect = pygame.Rect(
+                    _col * c.MAP_TILE_SIZE,
+                    _row * c.MAP_TILE_SIZE,
+                    c.MAP_TILE_SIZE,
+                    c.MAP_TILE_SIZE,
+                )
+
+                if (
+                    zoom <= c.GRID_LABEL_MAX_ZOOM
+                    and _col < self.cols
+                    and _row < self.rows
+                    and _label_rect.colliderect(viewport)
+                ):
+                    _blits.append(
+                        (
+                            self.get_label(_col, _row, zoom),
+                            (
+                                (_label_rect.left >> zoom) - (viewport.left >> zoom),
+                                (_label_rect.top >> zoom) - (viewport.top >> zoom),
+                            ),
+                            None,
+                            pygame.BLEND_RGBA_MAX,
+                        )
+                    )
+
+        self.image.blits(_blits, doreturn=False)  # type: ignore
+        self.image.set_clip(None)
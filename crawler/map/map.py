@@ -2,27 +2,64 @@
 
 import pygame
 
+from crawler.map.mip_pyramid import MipPyramid
+
 
 class Map(pygame.sprite.Sprite):
     """Map
 
     The Map class.
+    The Map image only covers the camera viewport, and is drawn from the level of the mip pyramid for the zoom.
 
     Args:
         pygame.sprite.Sprite: the Map subclasses pygame.sprite.Sprite.
     """
 
-    def __init__(self, group: pygame.sprite.Group, map: pygame.Surface) -> None:  # type: ignore
+    def __init__(self, group: pygame.sprite.Group, pyramid: MipPyramid) -> None:  # type: ignore
         """__init__
 
         Initialise the Map.
 
         Args:
             groups (pygame.sprite.Group): the sprite groups to which the Map belongs.
-            map (pygame.Surface): the surface containing the Map image.
+            pyramid (MipPyramid): the mip pyramid from which to draw the Map image.
         """
         super().__init__(group)  # type: ignore
 
         self.name: str = "map"
-        self.image: pygame.Surface = map
-        self.rect: pygame.rect.Rect = map.get_rect()  # type: ignore
+        self.pyramid: MipPyramid = pyramid
+        self.zoom: int = 0
+        self.image: pygame.Surface = pygame.Surface((0, 0))
+        self.rect: pygame.rect.Rect = pygame.Rect(0, 0, 0, 0)
+
+    def update_view(self, viewport: pygame.Rect, zoom: int = 0) -> None:
+        """update_view
+
+        Redraws the Map image if the viewport has moved or the zoom has changed.
+
+        Args:
+            viewport (pygame.Rect): the area of the map shown by the camera.
+            zoom (int): the zoom level, the map is drawn at 1 / 2 ** zoom size. Defaults to 0.
+        """
+
+        if viewport == self.rect and zoom == self.zoom:
+            return
+
+        #  Resize the image if the view has changed size.
+
+        _view: pygame.Rect = pygame.Rect(
+            viewport.left >> zoom,
+            viewport.top >> zoom,
+            viewport.width >> zoom,
+            viewport.height >> zoom,
+        )
+
+        if _view.size != self.image.get_size():
+            self.image = pygame.Surface(_view.size)
+
+        #  Draw the chunks of the mip level under the viewport.
+
+        self.rect = viewport.copy()
+        self.zoom = zoom
+        self.image.fill((0, 0, 0))
+        self.pyramid.level(zoom).draw(self.image, _view)
@@ -0,0 +1,504 @@
+#  The compiled map cache.
+#  Compiles a Tiled map into a single binary file, so that the map can be loaded
+#  at startup without parsing the TMX and TSX files or cutting up the tileset image.
+
+import hashlib
+import json
+import os
+import struct
+import sys
+import xml.etree.ElementTree as ElementTree
+from dataclasses import dataclass, field
+from typing import Any, Callable, Optional
+
+import numpy as np
+import pygame
+
+import crawler.constants as c
+import crawler.customlogger as customlogger
+
+#  The cache file starts with the magic bytes and the length of the JSON header,
+#  the header is followed by the gid arrays and the tile atlas pixels.
+
+MAGIC = b"CRWLMAP\0"
+PREAMBLE = struct.Struct("<8sI")
+
+TILE_LAYER = "tiles"
+OBJECT_LAYER = "objects"
+
+
+@dataclass
+class MapObject:
+    """MapObject
+
+    An object from an object layer of the map.
+    """
+
+    id: int
+    name: Optional[str]
+    type: Optional[str]
+    x: float
+    y: float
+    width: float
+    height: float
+    visible: int
+    gid: int
+    properties: dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class MapLayer:
+    """MapLayer
+
+    A layer of the map; either a grid of tile gids, indexed [row][col], or a list of objects.
+    """
+
+    name: Optional[str]
+    kind: str
+    data: Optional[np.ndarray] = None
+    objects: list[MapObject] = field(default_factory=list)
+
+
+@dataclass
+class MapData:
+    """MapData
+
+    The map as loaded from the cache.
+    Holds the same parts of the map that were used from the pytmx TiledMap.
+    """
+
+    width: int
+    height: int
+    tilewidth: int
+    tileheight: int
+    layers: list[MapLayer] = field(default_factory=list)
+    tile_properties: dict[int, dict[str, Any]] = field(default_factory=dict)
+    images: list[Optional[pygame.Surface]] = field(default_factory=list)
+
+    @property
+    def tile_layers(self) -> list[MapLayer]:
+        """tile_layers
+
+        Gets the layers of tiles.
+
+        Returns:
+            list[MapLayer]: the tile layers.
+        """
+        return [_layer for _layer in self.layers if _layer.kind == TILE_LAYER]
+
+    @property
+    def objects(self) -> list[MapObject]:
+        """objects
+
+        Gets all the objects, from all the object layers.
+
+        Returns:
+            list[MapObject]: the objects.
+        """
+        return [_object for _layer in self.layers for _object in _layer.objects]
+
+    def get_tile_image_by_gid(self, gid: int) -> Optional[pygame.Surface]:
+        """get_tile_image_by_gid
+
+        Gets the image for a gid.
+
+        Args:
+            gid (int): the gid of the tile.
+
+        Raises:
+            ValueError: if there is no image for the gid.
+
+        Returns:
+            Optional[pygame.Surface]: the image, or None if the gid is not used.
+        """
+        if gid < 0 or gid >= len(self.images):
+            raise ValueError(f"GID not found: {gid}")
+
+        return self.images[gid]
+
+
+# HELPER FUNCTIONS ############################################################
+
+
+def get_map_path(filename: str) -> str:
+    """get_map_path
+
+    Gets the path to a map file.
+
+    Args:
+        filename (str): the filename of the map.
+
+    Returns:
+        str: the path to the map file.
+    """
+    return os.path.join("crawler", c.DIR_ASSETS, c.DIR_MAPS, filename)
+
+
+def get_cache_path(filename: str) -> str:
+    """get_cache_path
+
+    Gets the path to the compiled cache for a map file.
+
+    Args:
+        filename (str): the filename of the map.
+
+    Returns:
+        str: the path to the cache file.
+    """
+    return os.path.join(
+        "crawler",
+        c.DIR_ASSETS,
+        c.DIR_MAPS,
+        c.DIR_MAP_CACHE,
+        filename + c.MAP_CACHE_EXTENSION,
+    )
+
+
+def get_dependencies(map_path: str) -> list[str]:
+    """get_dependencies
+
+    Gets the files that the map is built from; the TMX file, any TSX files and the tileset images.
+    Only used when compiling, as it parses the XML.
+
+    Args:
+        map_path (str): the path to the map file.
+
+    Returns:
+        list[str]: the paths of the files, relative to the map file.
+    """
+    _dirname: str = os.path.dirname(map_path)
+    _dependencies: list[str] = [os.path.basename(map_path)]
+
+    for _tileset in ElementTree.parse(map_path).getroot().iter("tileset"):
+        _source: Optional[str] = _tileset.get("source")
+        _node: ElementTree.Element = _tileset
+
+        if _source is not None:
+            _dependencies.append(_source)
+            _node = ElementTree.parse(os.path.join(_dirname, _source)).getroot()
+
+        for _image in _node.iter("image"):
+            _image_source: Optional[str] = _image.get("source")
+            if _image_source is not None:
+                _dependencies.append(
+                    os.path.normpath(
+                        os.path.join(os.path.dirname(_source or ""), _image_source)
+                    )
+                )
+
+    return _dependencies
+
+
+def get_content_key(map_path: str, dependencies: list[str]) -> str:
+    """get_content_key
+
+    Gets the key for the cache, a hash of the contents of the files the map is built from.
+
+    Args:
+        map_path (str): the path to the map file.
+        dependencies (list[str]): the paths of the files, relative to the map file.
+
+    Returns:
+        str: the key.
+    """
+    _dirname: str = os.path.dirname(map_path)
+    _hash = hashlib.sha256(str(c.MAP_CACHE_VERSION).encode())
+
+    for _dependency in dependencies:
+        _hash.update(_dependency.encode())
+        with open(os.path.join(_dirname, _dependency), "rb") as _file:
+            _hash.update(_file.read())
+
+    return _hash.hexdigest()
+
+
+def image_loader(filename: str, colorkey: Optional[str], **kwargs: Any) -> Callable[..., pygame.Surface]:
+    """image_loader
+
+    The image loader given to pytmx when compiling.
+    Unlike the pytmx pygame loader this does not convert the images, so no display is needed.
+
+    Args:
+        filename (str): the tileset image.
+        colorkey (Optional[str]): the transparent colour of the tileset, if any.
+
+    Returns:
+        Callable[..., pygame.Surface]: function that cuts a tile out of the tileset image.
+    """
+    from pytmx.util_pygame import handle_transformation  # type: ignore
+
+    _image: pygame.Surface = pygame.image.load(filename)
+
+    if colorkey:
+        _image.set_colorkey(pygame.Color(f"#{colorkey}"))
+
+    def load_image(rect: Optional[tuple[int, int, int, int]] = None, flags: Any = None) -> pygame.Surface:
+        _tile: pygame.Surface = _image.subsurface(rect).copy() if rect else _image.copy()
+        if flags:
+            _tile = handle_transformation(_tile, flags)  # type: ignore
+        return _tile
+
+    return load_image
+
+
+# COMPILE AND LOAD ############################################################
+
+
+@customlogger.log_trace(customlogger.Levels.INFO)
+def compile_map(filename: str) -> str:
+    """compile_map
+
+    Compiles a map into the cache.
+    This is the only place the map is parsed by pytmx.
+
+    Args:
+        filename (str): the filename of the map.
+
+    Returns:
+        str: the path to the cache file.
+    """
+    import pytmx  # type: ignore
+
+    _map_path: str = get_map_path(filename)
+    _dependencies: list[str] = get_dependencies(_map_path)
+    _map_data: pytmx.TiledMap = pytmx.TiledMap(_map_path, image_loader=image_loader)
+
+    _blobs: list[bytes] = []
+    _offset: int = 0
+
+    def add_blob(blob: bytes) -> int:
+        nonlocal _offset
+        _blobs.append(blob)
+        _offset += len(blob)
+        return _offset - len(blob)
+
+    #  Store the tile layers as arrays of gids, and the object layers as lists of objects.
+
+    _layers: list[dict[str, Any]] = []
+
+    for _layer in _map_data.layers:  # type: ignore
+        if isinstance(_layer, pytmx.TiledTileLayer):
+            _gids: np.ndarray = np.array(_layer.data, dtype=np.uint32)  # type: ignore
+            if _gids.size and _gids.max() <= np.iinfo(np.uint16).max:
+                _gids = _gids.astype(np.uint16)
+            _layers.append(
+                {
+                    "name": _layer.name,  # type: ignore
+                    "kind": TILE_LAYER,
+                    "dtype": _gids.dtype.name,
+                    "shape": list(_gids.shape),
+                    "offset": add_blob(_gids.tobytes()),
+                }
+            )
+        elif isinstance(_layer, pytmx.TiledObjectGroup):
+            _layers.append(
+                {
+                    "name": _layer.name,  # type: ignore
+                    "kind": OBJECT_LAYER,
+                    "objects": [
+                        {
+                            "id": _object.id,
+                            "name": _object.name,
+                            "type": _object.type,
+                            "x": _object.x,
+                            "y": _object.y,
+                            "width": _object.width,
+                            "height": _object.height,
+                            "visible": int(_object.visible),
+                            "gid": _object.gid,
+                            "properties": _object.properties,
+                        }
+                        for _object in _layer  # type: ignore
+                    ],
+                }
+            )
+
+    #  Pack the tile images into a single row atlas.
+
+    _tiles: list[list[int]] = []
+    _atlas_width: int = 0
+    _atlas_height: int = 0
+
+    for _gid, _image in enumerate(_map_data.images):  # type: ignore
+        if _image is not None:
+            _tiles.append([_gid, _atlas_width, 0, _image.get_width(), _image.get_height()])
+            _atlas_width += _image.get_width()
+            _atlas_height = max(_atlas_height, _image.get_height())
+
+    _atlas: pygame.Surface = pygame.Surface(
+        (max(_atlas_width, 1), max(_atlas_height, 1)), pygame.SRCALPHA
+    )
+    _atlas.fill((0, 0, 0, 0))
+    for _gid, _x, _y, _, _ in _tiles:
+        _atlas.blit(_map_data.images[_gid], (_x, _y))  # type: ignore
+
+    _header: dict[str, Any] = {
+        "version": c.MAP_CACHE_VERSION,
+        "key": get_content_key(_map_path, _dependencies),
+        "dependencies": _dependencies,
+        "width": _map_data.width,
+        "height": _map_data.height,
+        "tilewidth": _map_data.tilewidth,
+        "tileheight": _map_data.tileheight,
+        "layers": _layers,
+        "tile_properties": {
+            str(_gid): _properties
+            for _gid, _properties in _map_data.tile_properties.items()  # type: ignore
+        },
+        "image_count": len(_map_data.images),  # type: ignore
+        "atlas": {
+            "size": list(_atlas.get_size()),
+            "tiles": _tiles,
+            "offset": add_blob(pygame.image.tobytes(_atlas, "RGBA")),
+        },
+    }
+
+    #  Write the cache, replacing any old one in a single step.
+
+    _cache_path: str = get_cache_path(filename)
+    os.makedirs(os.path.dirname(_cache_path), exist_ok=True)
+
+    _header_bytes: bytes = json.dumps(_header, default=str).encode()
+    with open(_cache_path + ".tmp", "wb") as _file:
+        _file.write(PREAMBLE.pack(MAGIC, len(_header_bytes)))
+        _file.write(_header_bytes)
+        for _blob in _blobs:
+            _file.write(_blob)
+    os.replace(_cache_path + ".tmp", _cache_path)
+
+    return _cache_path
+
+
+def read_map(filename: str) -> Optional[MapData]:
+    """read_map
+
+    Reads a map from the cache, if the cache is up to date.
+
+    Args:
+        filename (str): the filename of the map.
+
+    Returns:
+        Optional[MapData]: the map, or None if the cache is missing or out of date.
+    """
+    _cache_path: str = get_cache_path(filename)
+
+    if not os.path.exists(_cache_path):
+        return None
+
+    with open(_cache_path, "rb") as _file:
+        _buffer: bytes = _file.read()
+
+    #  Check the cache is one of ours and matches the current map files.
+
+    if len(_buffer) < PREAMBLE.size:
+        return None
+
+    _magic, _header_length = PREAMBLE.unpack_from(_buffer)
+    if _magic != MAGIC:
+        return None
+
+    _header: dict[str, Any] = json.loads(
+        _buffer[PREAMBLE.size : PREAMBLE.size + _header_length]
+    )
+    if _header.get("version") != c.MAP_CACHE_VERSION:
+        return None
+
+    try:
+        if _header["key"] != get_content_key(
+            get_map_path(filename), _header["dependencies"]
+        ):
+            return None
+    except OSError:
+        return None
+
+    _payload: memoryview = memoryview(_buffer)[PREAMBLE.size + _header_length :]
+
+    #  Create the layers.
+
+    _layers: list[MapLayer] = []
+
+    for _layer in _header["layers"]:
+        if _layer["kind"] == TILE_LAYER:
+            _layers.append(
+                MapLayer(
+                    _layer["name"],
+                    TILE_LAYER,
+                    data=np.frombuffer(
+                        _payload,
+                        dtype=np.dtype(_layer["dtype"]),
+                        count=_layer["shape"][0] * _layer["shape"][1],
+                        offset=_layer["offset"],
+                    ).reshape(_layer["shape"]),
+                )
+            )
+        else:
+            _layers.append(
+                MapLayer(
+                    _layer["name"],
+                    OBJECT_LAYER,
+                    objects=[MapObject(**_object) for _object in _layer["objects"]],
+                )
+            )
+
+    #  Cut the tile images out of the atlas.
+
+    _atlas_size: tuple[int, int] = tuple(_header["atlas"]["size"])  # type: ignore
+    _atlas_offset: int = _header["atlas"]["offset"]
+    _atlas: pygame.Surface = pygame.image.frombytes(
+        bytes(_payload[_atlas_offset : _atlas_offset + _atlas_size[0] * _atlas_size[1] * 4]),
+        _atlas_size,
+        "RGBA",
+    )
+    if pygame.display.get_surface() is not None:
+        _atlas = _atlas.convert_alpha()
+
+    _images: list[Optional[pygame.Surface]] = [None] * _header["image_count"]
+    for _gid, _x, _y, _width, _height in _header["atlas"]["tiles"]:
+        _images[_gid] = _atlas.subsurface((_x, _y, _width, _height))
+
+    return MapData(
+        _header["width"],
+        _header["height"],
+        _header["tilewidth"],
+        _header["tileheight"],
+        _layers,
+        {
+            int(_gid): _properties
+            for _gid, _properties in _header["tile_properties"].items()
+        },
+        _images,
+    )
+
+
+@customlogger.log_trace(customlogger.Levels.INFO)
+def load_map(filename: str) -> MapData:
+    """load_map
+
+    Loads a map from the cache, compiling it first if the cache is missing or out of date.
+
+    Args:
+        filename (str): the filename of the map.
+
+    Returns:
+        MapData: the map.
+    """
+    _map_data: Optional[MapData] = read_map(filename)
+
+    if _map_data is None:
+        customlogger.log_message(
+            f"Compiling map cache for {filename}.", customlogger.Levels.INFO
+        )
+        compile_map(filename)
+        _map_data = read_map(filename)
+
+    if _map_data is None:
+        raise RuntimeError(f"Unable to compile map cache for {filename}.")
+
+    return _map_data
+
+
+#  Compile the maps on demand, e.g. python -m crawler.map.map_cache crawler.tmx
+
+if __name__ == "__main__":
+    for _filename in sys.argv[1:] or [c.LEVEL_ONE_MAP_FILENAME]:
+        print(compile_map(_filename))
@@ -0,0 +1,139 @@
+#  The MapLoader class.
+#  Runs the stages of loading a map on a background thread, reporting progress,
+#  and hands the finished map over to the main thread.
+
+import queue
+import threading
+from typing import Any, Callable, Optional
+
+import crawler.customlogger as customlogger
+
+
+class LoadCancelled(Exception):
+    """LoadCancelled
+
+    Raised in the loading thread when the load has been cancelled.
+    """
+
+
+class MapLoader:
+    """MapLoader
+
+    The MapLoader runs a list of stages on a background thread.
+    Each stage is given a report function, which it can call with the fraction of the stage completed;
+    this also stops the stage if the load has been cancelled.
+    The stages share a dictionary of results, which is only handed over to the main thread,
+    through a queue, once every stage has finished. So the main thread never sees a partly loaded map.
+    """
+
+    @customlogger.log_trace(customlogger.Levels.INFO)
+    def __init__(
+        self,
+        stages: list[tuple[str, float, Callable[[dict[str, Any], Callable[[float], None]], None]]],
+        results: Optional[dict[str, Any]] = None,
+    ) -> None:
+        """__init__
+
+        Initialise the MapLoader and start the loading thread.
+
+        Args:
+            stages (list[tuple[str, float, Callable[[dict[str, Any], Callable[[float], None]], None]]]):
+                the name, relative weight and function of each stage.
+                Each function is passed the results dictionary and the report function.
+            results (Optional[dict[str, Any]]): results of an earlier load for the stages to build on. Defaults to None.
+        """
+
+        self.stages = stages
+        self.stage: str = ""
+        self._initial_results: dict[str, Any] = dict(results or {})
+
+        self._lock: threading.Lock = threading.Lock()
+        self._progress: float = 0
+        self._cancelled: threading.Event = threading.Event()
+        self._results: queue.Queue[dict[str, Any]] = queue.Queue(maxsize=1)
+        self._error: Optional[BaseException] = None
+
+        self._thread: threading.Thread = threading.Thread(
+            target=self.run, name="map_loader", daemon=True
+        )
+        self._thread.start()
+
+    @property
+    def progress(self) -> float:
+        """progress
+
+        Gets the fraction of the load completed.
+
+        Returns:
+            float: from 0 to 1.
+        """
+        with self._lock:
+            return self._progress
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled.is_set()
+
+    def cancel(self) -> None:
+        """cancel
+
+        Cancels the load, the loading thread stops at the next report.
+        """
+        self._cancelled.set()
+
+    def run(self) -> None:
+        """run
+
+        Runs the stages in turn, on the loading thread.
+        """
+
+        _total: float = sum(_weight for _, _weight, _ in self.stages) or 1
+        _done: float = 0
+        _results: dict[str, Any] = self._initial_results
+
+        try:
+            for _name, _weight, _function in self.stages:
+
+                self.stage = _name
+
+                def report(fraction: float) -> None:
+                    if self._cancelled.is_set():
+                        raise LoadCancelled()
+                    with self._lock:
+                        self._progress = (_done + _weight * min(max(fraction, 0), 1)) / _total
+
+                report(0)
+                _function(_results, report)
+                _done += _weight
+                report(0)
+
+            self._results.put(_results)
+
+        except LoadCancelled:
+            customlogger.log_message("Map load cancelled.", customlogger.Levels.INFO)
+
+        except Exception as _error:
+            customlogger.log_message(
+                f"Map load failed in stage {self.stage}: {_error!r}",
+                customlogger.Levels.ERROR,
+            )
+            self._error = _error
+
+    def poll(self) -> Optional[dict[str, Any]]:
+        """poll
+
+        Gets the results of the load, if it has finished. Called from the main thread.
+
+        Raises:
+            RuntimeError: if the load failed.
+
+        Returns:
+            Optional[dict[str, Any]]: the results, or None if the load is still running or was cancelled.
+        """
+        if self._error is not None:
+            raise RuntimeError(f"Map load failed in stage {self.stage}.") from self._error
+
+        try:
+            return self._results.get_nowait()
+        except queue.Empty:
+            return None
@@ -1,21 +1,26 @@
 #  The MapManager creates the Map and Grid and loads the sprites creating them as Objects.
 
-import os
-import threading
-from typing import Optional
+from typing import Any, Callable, Optional
 
 import pygame
-import pytmx  # type: ignore
 
 import crawler.constants as c
 import crawler.customlogger as customlogger
 from crawler.config import layout_config
-from crawler.console.console_tools.show_text import show_text
 from crawler.crawler.crawler import Crawler
 from crawler.map.camera import Camera
+from crawler.map.chunk_cache import ChunkCache
+from crawler.map.dispatcher import Dispatcher
 from crawler.map.grid import Grid
 from crawler.map.map import Map
+from crawler.map.map_cache import MapData, load_map
+from crawler.map.map_loader import MapLoader
+from crawler.map.mip_pyramid import MipPyramid
 from crawler.map.object import Object
+from crawler.map.object_registry import ObjectRegistry
+from crawler.map.pathfinding import CostField, Pathfinder
+from crawler.map.spatial_index import SpatialIndex
+from crawler.map.terrain import TerrainMap
 
 
 class MapManager:
@@ -41,26 +46,20 @@ class MapManager:
         self.object_alpha = 160
         self.grid_alpha = 80
 
-        self.map_image: Optional[pygame.Surface] = None
+        self.chunk_cache: Optional[ChunkCache] = None
+        self.pyramid: Optional[MipPyramid] = None
+        self.map: Optional[Map] = None
         self.mini_map_image: Optional[pygame.Surface] = None
-        self.grid_map_image: Optional[pygame.Surface] = None
+        self.grid: Optional[Grid] = None
+        self.terrain_map: Optional[TerrainMap] = None
+        self.pathfinder: Optional[Pathfinder] = None
 
         self.camera: Camera | None = None
         self.crawlers: list[Crawler] = crawlers
 
-        self.pod_locations: list[tuple[int, int]] = [
-            (4000, 4000),
-            (8800, 4000),
-            (6400, 6400),
-            (4000, 8800),
-            (8800, 8800),
-        ]
-        self.salvage_locations: list[tuple[int, int]] = [
-            (6400, 4000),
-            (4000, 6400),
-            (8800, 6400),
-            (6400, 8800),
-        ]
+        #  The objects of the map, by type, for the scanner, spawnpoints and gameplay.
+
+        self.registry: ObjectRegistry = ObjectRegistry()
 
         #  Set up the sprite gropups.
         #  Objects that have an image will be in the sprite_group.
@@ -70,188 +69,445 @@ class MapManager:
         self.sprite_group: pygame.sprite.Group = pygame.sprite.Group()  # type: ignore
         self.object_group: pygame.sprite.Group = pygame.sprite.Group()  # type: ignore
 
+        #  The objects in the object_group are also indexed by type and position,
+        #  so that they can be found without checking every object.
+
+        self.spatial_index: SpatialIndex = SpatialIndex()
+
         self.loaded: bool = False
 
-        #  Set a new thread to create map and grid.
+        #  Load the map in stages on a background thread.
+        #  Each stage only adds to the results, which are handed over in update().
 
-        def thread_function():
+        self.loader: MapLoader = MapLoader(
+            [
+                ("parse", 1, lambda results, report: self.load_stage_parse(filename, results)),
+                ("tiles", 1, self.load_stage_tiles),
+                ("objects", 1, self.load_stage_objects),
+                ("grid", 1, self.load_stage_grid),
+            ]
+        )
 
-            #  Load map data.
+        #  The mip pyramid and mini map are built on another thread once the map is showing.
 
-            _map_data: pytmx.TiledMap = self.load_map_data(filename)
+        self.mip_loader: Optional[MapLoader] = None
+        self.pyramid_ready: bool = False
 
-            #  Create map image loading appropriate images.
-            #  This will also create the othe rmap objects (solids, terrain etc.)
+        #  The flow fields to the pods and salvage are also worked out on another thread.
 
-            self.map_image = self.create_map(_map_data)
+        self.flow_loader: Optional[MapLoader] = None
+        self.dispatcher: Optional[Dispatcher] = None
 
-            #  Add the Map as a Sprite to the sprite group.
+    @property
+    def progress(self) -> float:
+        """progress
 
-            Map(self.sprite_group, self.map_image)  # type: ignore
+        Gets the fraction of the map loaded.
 
-            # #  Create map grid.
+        Returns:
+            float: from 0 to 1.
+        """
+        return 1 if self.loaded else self.loader.progress
 
-            self.grid_map_image = self.create_map_grid(_map_data)
+    def cancel(self) -> None:
+        """cancel
 
-            #  Add the Grid as a Sprite to the sprite group.
+        Cancels loading the map, if it is still loading.
+        """
+        self.loader.cancel()
 
-            Grid(self.sprite_group, self.grid_map_image)  # type: ignore
+        if self.mip_loader is not None:
+            self.mip_loader.cancel()
 
-            #  Create mini map image.
+        if self.flow_loader is not None:
+            self.flow_loader.cancel()
 
-            self.mini_map_image = self.create_mini_map(self.map_image)
+        if self.pathfinder is not None:
+            self.pathfinder.stop()
 
-            #  Indicate map is loaded.
+    # LOADING STAGES ##########################################################
+    #  These run on the loading thread, and must not change anything the main thread uses.
 
-            self.loaded = True
+    def load_stage_parse(self, filename: str, results: dict[str, Any]) -> None:
 
-            #  Create camera.
+        #  Load map data.
 
-            if self.map_image is not None:
-                self.camera = Camera(
-                    (
-                        self.map_image.get_width(),
-                        self.map_image.get_height(),
-                    )
-                )
+        results["map_data"] = self.load_map_data(filename)
 
-            #  Add crawlers to sprite group.
+    def load_stage_tiles(self, results: dict[str, Any], report: Callable[[float], None]) -> None:
 
-            for _crawler in self.crawlers:
-                self.sprite_group.add(_crawler)  # type: ignore
+        #  Create the chunk cache from which the map image is drawn.
 
-        #  Start new thread.
+        results["chunk_cache"] = self.create_map(results["map_data"])
+        results["pyramid"] = MipPyramid(results["chunk_cache"])
 
-        thread = threading.Thread(target=thread_function)
-        thread.start()
+        #  Fetch every tile image now, so that rendering chunks doesn't change the cache
+        #  while the mip pyramid is built alongside the main view.
 
-    @customlogger.log_trace(customlogger.Levels.INFO)
-    def load_map_data(self, filename: str) -> pytmx.TiledMap:
-
-        #  Load the map data from the data file.
-
-        _map_data: pytmx.TiledMap = pytmx.load_pygame(  # type: ignore
-            os.path.join(
-                "crawler",
-                c.DIR_ASSETS,
-                c.DIR_MAPS,
-                filename,
-            ),
-            pixelalpha=True,
+        for _gid in range(len(results["map_data"].images)):
+            results["chunk_cache"].tile_image(_gid)
+
+        #  Rasterise the terrain, so the crawlers can look up the terrain they are on.
+
+        results["terrain_map"] = TerrainMap(results["map_data"])
+
+    def load_stage_objects(self, results: dict[str, Any], report: Callable[[float], None]) -> None:
+
+        #  Create the other map objects (solids, terrain etc.) in new sprite groups,
+        #  which replace the current groups when the map is handed over.
+
+        results["registry"] = ObjectRegistry(results["map_data"].objects)
+        results["sprite_group"] = pygame.sprite.Group()  # type: ignore
+        results["object_group"] = pygame.sprite.Group()  # type: ignore
+        results["spatial_index"] = SpatialIndex()
+        self.create_objects(
+            results["map_data"],
+            results["registry"],
+            results["sprite_group"],
+            results["object_group"],
+            results["spatial_index"],
+        )
+
+        #  Work out the cost of crossing each tile, from the solids and the terrain, for finding routes.
+
+        results["pathfinder"] = Pathfinder(CostField(results["registry"], results["terrain_map"]))
+
+        #  Add the Map as a Sprite to the sprite group.
+
+        results["map"] = Map(results["sprite_group"], results["pyramid"])  # type: ignore
+
+    def load_stage_grid(self, results: dict[str, Any], report: Callable[[float], None]) -> None:
+
+        #  Add the Grid as a Sprite to the sprite group.
+        #  The Grid is drawn only for the viewport, so only the repeating block is created here.
+
+        results["grid"] = Grid(
+            results["sprite_group"],  # type: ignore
+            (results["map_data"].width, results["map_data"].height),
+            self.grid_alpha,
+        )
+        results["grid"].get_block()
+
+    def load_stage_minimap(self, results: dict[str, Any], report: Callable[[float], None]) -> None:
+
+        #  Create mini map image.
+        #  This only renders the mip levels, which the main thread doesn't use until it is finished.
+
+        results["mini_map_image"] = self.create_mini_map(results["pyramid"], report)
+
+    def load_stage_flow(self, results: dict[str, Any], report: Callable[[float], None]) -> None:
+
+        #  Work out the flow fields to the pods and salvage.
+        #  The fields are searched on the grid as it was when the map was handed over.
+
+        results["dispatcher"] = Dispatcher(
+            results["registry"], results["pathfinder"].cost_field.grid, report
+        )
+
+    # MAIN GAMELOOP METHODS ###################################################
+
+    def update(self) -> list[tuple[int, str]]:
+        """update
+
+        Takes over the map from the loading thread, once it has finished,
+        and then the mip pyramid and mini map, and the flow fields.
+        Must be called from the main thread.
+
+        Returns:
+            list[tuple[int, str]]: messages for the terminal.
+        """
+
+        if self.loaded is True:
+            if self.mip_loader is not None and self.pyramid_ready is False:
+                _mip_results: Optional[dict[str, Any]] = self.mip_loader.poll()
+                if _mip_results is not None:
+                    self.mini_map_image = _mip_results["mini_map_image"]
+                    self.pyramid_ready = True
+
+            if self.flow_loader is not None and self.dispatcher is None:
+                _flow_results: Optional[dict[str, Any]] = self.flow_loader.poll()
+                if _flow_results is not None:
+                    self.dispatcher = _flow_results["dispatcher"]
+
+            #  Collect the targets the crawlers have reached.
+
+            if self.dispatcher is not None:
+                return [
+                    (2, f"{_crawler.identifier} collected {self.registry.lookup(_id)[0].type} {_id}")
+                    for _crawler, _id in self.dispatcher.update()
+                ]
+
+            return []
+
+        _results: Optional[dict[str, Any]] = self.loader.poll()
+        if _results is None:
+            return []
+
+        self.chunk_cache = _results["chunk_cache"]
+        self.pyramid = _results["pyramid"]
+        self.map = _results["map"]
+        self.grid = _results["grid"]
+        self.terrain_map = _results["terrain_map"]
+        self.spatial_index = _results["spatial_index"]
+        self.registry = _results["registry"]
+        self.pathfinder = _results["pathfinder"]
+
+        #  Place the crawlers at, or around, their spawnpoints and let them use the map.
+
+        for _number, _position in self.pathfinder.cost_field.spawn_positions(  # type: ignore
+            self.registry.spawn_positions(), len(self.crawlers)
+        ).items():
+            self.crawlers[_number - 1].position = _position
+
+        for _crawler in self.crawlers:
+            _crawler.spatial_index = self.spatial_index
+            _crawler.terrain_map = self.terrain_map
+            _crawler.pathfinder = self.pathfinder
+
+        #  Create camera.
+
+        self.camera = Camera(
+            (
+                self.chunk_cache.width,  # type: ignore
+                self.chunk_cache.height,  # type: ignore
+            )
+        )
+
+        #  Add crawlers to sprite group, and swap in the new sprite groups.
+
+        for _crawler in self.crawlers:
+            _results["sprite_group"].add(_crawler)  # type: ignore
+
+        self.object_group = _results["object_group"]
+        self.sprite_group = _results["sprite_group"]
+
+        #  Indicate map is loaded, now that everything is in place.
+
+        self.loaded = True
+
+        #  Start building the mip pyramid and mini map.
+
+        self.mip_loader = MapLoader(
+            [("minimap", 1, self.load_stage_minimap)],
+            {"pyramid": self.pyramid},
+        )
+
+        self.flow_loader = MapLoader(
+            [("flow", 1, self.load_stage_flow)],
+            {"registry": self.registry, "pathfinder": self.pathfinder},
+        )
+
+        return []
+
+    def dispatch(self, mode: str) -> list[tuple[int, str]]:
+        """dispatch
+
+        Sends the idle crawlers to the nearest pods or salvage.
+
+        Args:
+            mode (str): "p" for pods, "s" for salvage.
+
+        Returns:
+            list[tuple[int, str]]: messages for the terminal.
+        """
+
+        if self.dispatcher is None:
+            return [(3, "*** Routes to targets not yet available")]
+
+        _target_type: str = c.MAP_OBJECT_POD if mode == "p" else c.MAP_OBJECT_SALVAGE
+        _dispatched = self.dispatcher.dispatch(self.crawlers, _target_type)
+
+        if len(_dispatched) == 0:
+            return [(2, f"No idle crawlers can reach an unclaimed {_target_type}")]
+
+        return [
+            (2, f"{_crawler.identifier} dispatched to {_target_type} {_id}")
+            for _crawler, _id in _dispatched
+        ]
+
+    def update_view(self) -> None:
+        """update_view
+
+        Redraws the map and grid images for the area of the map under the camera.
+        Must be called from the main thread, after the camera is updated.
+        """
+
+        if self.camera is not None and self.map is not None:
+            self.map.update_view(self.camera.viewport, self.camera.zoom)
+
+        if self.camera is not None and self.grid is not None:
+            self.grid.update_view(self.camera.viewport, self.camera.zoom)
+
+    def zoom(self, change: int) -> None:
+        """zoom
+
+        Zooms the map view in or out, one mip level at a time.
+
+        Args:
+            change (int): 1 to zoom out, -1 to zoom in.
+        """
+
+        if self.camera is None or self.pyramid is None or self.pyramid_ready is False:
+            return
+
+        self.camera.zoom = min(
+            max(self.camera.zoom + change, 0), len(self.pyramid.levels) - 1
         )
 
+    def sprites_in_view(self) -> list[pygame.sprite.Sprite]:
+        """sprites_in_view
+
+        Gets the sprites that may be in the camera viewport, in the order they are drawn.
+        The map objects are found through the spatial index, so only those near the viewport are checked.
+        Only the crawlers the LODScheduler has placed for drawing are included.
+
+        Returns:
+            list[pygame.sprite.Sprite]: the sprites.
+        """
+
+        if self.camera is None:
+            return []
+
+        _viewport: pygame.Rect = self.camera.viewport
+
+        _sprites: list[pygame.sprite.Sprite] = [
+            _sprite for _sprite in (self.map, self.grid) if _sprite is not None
+        ]
+        _sprites += [
+            _object
+            for _object in self.spatial_index.query_rect(_viewport)
+            if _object.image is not None
+        ]
+        _sprites += [
+            _crawler for _crawler in self.crawlers if _crawler.in_view and _crawler.rect.colliderect(_viewport)
+        ]
+
+        return _sprites
+
+    @customlogger.log_trace(customlogger.Levels.INFO)
+    def load_map_data(self, filename: str) -> MapData:
+
+        #  Load the map data from the compiled cache.
+        #  The map file is only parsed if the cache is missing or out of date.
+
+        _map_data: MapData = load_map(filename)
+
         return _map_data
 
     @customlogger.log_trace(customlogger.Levels.INFO)
-    def create_map(self, map_data: pytmx.TiledMap) -> pygame.Surface:
+    def create_map(self, map_data: MapData) -> ChunkCache:
         """
 
         There are two kinds of layers:
 
-            TiledTileLayer is just visible tiles making up the map design.
+            Tile layers are just visible tiles making up the map design, drawn on demand by the ChunkCache.
 
-            TiledObjectGroup represents the objects which can be:
-
-                Visible, i.e. they have associated images and should be displayed; pods, cannisters, spawnpoints etc.
-                Invisible, i.e. they acts as triggers or collision points; solids, terrain etc.
+            Object layers represent the objects, which are created by create_objects.
 
         """
 
-        #  Create a surface of the correct size for the map.
+        #  Create the chunk cache from the tile layers.
+        #  Chunks are only rendered when the camera first reaches them.
 
-        _surface: pygame.Surface = pygame.Surface(
-            (
-                map_data.width * map_data.tilewidth,
-                map_data.height * map_data.tileheight,
-            ),
-            # pygame.SRCALPHA,
+        _chunk_cache: ChunkCache = ChunkCache(
+            (map_data.width, map_data.height),
+            (map_data.tilewidth, map_data.tileheight),
+            [layer.data for layer in map_data.tile_layers],  # type: ignore
+            map_data.get_tile_image_by_gid,
+            alpha=self.map_alpha,
         )
 
-        #  Loop over the layers.
-
-        for layer in map_data.layers:  # type: ignore
-
-            #  Draw tiled layer and create the basic map.
-
-            if isinstance(layer, pytmx.TiledTileLayer):
-
-                #  Get the correct tile image and blit it to the map image surface.
-
-                for _x, _y, _gid in layer:  # type: ignore
-                    _tile: pygame.Surface = map_data.get_tile_image_by_gid(_gid)  # type: ignore
-                    if _tile:
-                        _tile.set_alpha(self.map_alpha)
-                        _surface.blit(
-                            _tile,
-                            (
-                                _x * map_data.tilewidth,  # type: ignore
-                                _y * map_data.tileheight,  # type: ignore
-                            ),
-                        )
-
-            #  Loop over the objects on the object layer creating appropriate objects.
-
-            if isinstance(layer, pytmx.TiledObjectGroup):
-
-                for _object in map_data.objects:  # type: ignore
-
-                    if _object.visible == 1:
-
-                        _object_surface: pygame.Surface = pygame.Surface(
-                            (
-                                c.MAP_TILE_SIZE,
-                                c.MAP_TILE_SIZE,
-                            ),
-                        )
-
-                        _image: pygame.Surface = map_data.get_tile_image_by_gid(_object.id)  # type: ignore
-
-                        _image.set_alpha(self.object_alpha)
-
-                        _object_surface.blit(
-                            _image,
-                            (
-                                0,  # type: ignore
-                                0,  # type: ignore
-                            ),
-                        )
-                        _object.properties["type"] = _object.name  # type: ignore
-                        Object(
-                            [self.sprite_group, self.object_group],  # type: ignore
-                            pygame.rect.Rect(
-                                _object.x, _object.y, _object.width, _object.height
-                            ),
-                            _object_surface,
-                            _object.properties,  # type: ignore
-                        )
-                    else:
-                        if _object.name is not None and _object.name == "spawnpoint":
-                            self.crawlers[
-                                int(_object.properties["num"]) - 1  # type: ignore
-                            ].position = (
-                                _object.x,
-                                _object.y,
-                            )
-                        else:
-                            _object.properties["type"] = _object.name  # type: ignore
-                            Object(
-                                self.object_group,  # type: ignore
-                                pygame.rect.Rect(
-                                    _object.x, _object.y, _object.width, _object.height
-                                ),
-                                None,
-                                _object.properties,  # type: ignore
-                            )
-
-        return _surface
+        return _chunk_cache
+
+    @customlogger.log_trace(customlogger.Levels.INFO)
+    def create_objects(
+        self,
+        map_data: MapData,
+        registry: ObjectRegistry,
+        sprite_group: pygame.sprite.Group,  # type: ignore
+        object_group: pygame.sprite.Group,  # type: ignore
+        spatial_index: SpatialIndex,
+    ) -> None:
+        """
+
+        The objects can be:
+
+            Visible, i.e. they have associated images and should be displayed; pods, cannisters etc.
+            Invisible, i.e. they acts as triggers or collision points; solids, terrain etc.
+
+        Spawnpoints are only used to place the crawlers, so no Object is created for them.
+
+        """
+
+        #  Loop over the tables in the registry, so that each object is created once.
+
+        for _table in registry:
+
+            if _table.type == c.MAP_OBJECT_SPAWNPOINT:
+                continue
+
+            for _row in range(len(_table)):
+
+                _rect: pygame.Rect = pygame.rect.Rect(*_table.rects[_row].tolist())
+                _properties: dict[str, Any] = _table.properties[_row]
+                _properties["type"] = _table.names[_row]
+
+                if _table.visible[_row]:
+
+                    _object_surface: pygame.Surface = pygame.Surface(
+                        (
+                            c.MAP_TILE_SIZE,
+                            c.MAP_TILE_SIZE,
+                        ),
+                    )
+
+                    _image: pygame.Surface = map_data.get_tile_image_by_gid(int(_table.ids[_row]))  # type: ignore
+
+                    _image.set_alpha(self.object_alpha)
+
+                    _object_surface.blit(
+                        _image,
+                        (
+                            0,  # type: ignore
+                            0,  # type: ignore
+                        ),
+                    )
+                    _sprite = Object(
+                        [sprite_group, object_group],  # type: ignore
+                        _rect,
+                        _object_surface,
+                        _properties,
+                    )
+                else:
+                    _sprite = Object(
+                        object_group,  # type: ignore
+                        _rect,
+                        None,
+                        _properties,
+                    )
+
+                spatial_index.insert(_sprite, _sprite.type)
 
     @customlogger.log_trace(customlogger.Levels.INFO)
-    def create_mini_map(self, map: pygame.Surface) -> pygame.Surface:
+    def create_mini_map(
+        self,
+        pyramid: MipPyramid,
+        report: Optional[Callable[[float], None]] = None,
+    ) -> pygame.Surface:
+
+        #  Build the mip pyramid, then take the smallest level for the mini map,
+        #  so that the whole map is never held at full size.
+
+        pyramid.build(report)
+
+        _smallest: ChunkCache = pyramid.levels[-1]
+        _reduced_map: pygame.Surface = pygame.Surface((_smallest.width, _smallest.height))
+        _smallest.draw(_reduced_map, pygame.Rect(0, 0, _smallest.width, _smallest.height))
 
         #  Scale the map for the mini_map.
 
         _mini_map = pygame.transform.scale(
-            map, (c.MINIMAP_SIZE[0] - 2, c.MINIMAP_SIZE[1] - 2)
+            _reduced_map, (c.MINIMAP_SIZE[0] - 2, c.MINIMAP_SIZE[1] - 2)
         )
 
         #  Draw grid on mini_map.
@@ -287,76 +543,3 @@ class MapManager:
             )
 
         return _mini_map
-
-    @customlogger.log_trace(customlogger.Levels.INFO)
-    def create_map_grid(self, map_data: pytmx.TiledMap) -> pygame.Surface:
-
-        #  Create a surface of the correct size for the map.
-
-        _surface: pygame.Surface = pygame.Surface(
-            (
-                map_data.width * map_data.tilewidth,
-                map_data.height * map_data.tileheight,
-            ),
-            pygame.SRCALPHA,
-        )
-
-        #  Number of tiles in map.
-
-        _cols: int = c.MAP_TILES_ACROSS
-        _rows: int = c.MAP_TILES_DOWN
-
-        #  Draw the grid.
-
-        for _row in range(0, _rows):
-            for _col in range(0, _cols):
-                _tile = pygame.Surface(
-                    (c.MAP_TILE_SIZE, c.MAP_TILE_SIZE), pygame.SRCALPHA
-                ).convert_alpha()
-                _tile.set_alpha(self.grid_alpha)
-
-                #  Draw grid round each tile.
-
-                pygame.draw.line(_tile, c.GRAY, (0, 0), (5, 0), 1)
-                pygame.draw.line(_tile, c.GRAY, (0, 0), (0, 5), 1)
-                pygame.draw.line(_tile, c.GRAY, (59, 0), (64, 0), 1)
-                pygame.draw.line(_tile, c.GRAY, (0, 59), (0, 64), 1)
-
-                #  Draw a heavier line for every tenth tile.
-
-                if (_col == 0) or (_col % 10 == 0):
-                    pygame.draw.line(_tile, c.GRAY, (0, 0), (0, 64), 1)
-
-                if (_row == 0) or (_row % 10 == 0):
-                    pygame.draw.line(_tile, c.GRAY, (0, 0), (64, 0), 1)
-
-                #  Add a label to the lower corner of every block of ten tiles.
-
-                if ((_col + 1) % 10 == 0) and ((_row + 1) % 10 == 0):
-                    pygame.draw.rect(
-                        _tile,
-                        c.GRAY,
-                        (0, _tile.get_height() - 20, _tile.get_width(), 20),
-                    )
-
-                    show_text(
-                        _tile,
-                        f"{_col+1}:{_row+1}",
-                        (0, _tile.get_height() - 20, _tile.get_width(), 20),
-                        layout_config.font,
-                        c.BLACK,
-                        True,
-                        y_offset=2,
-                    )
-
-                #  Blit the tile.
-
-                _surface.blit(
-                    _tile,
-                    (
-                        _col * c.MAP_TILE_SIZE,
-                        _row * c.MAP_TILE_SIZE,
-                    ),
-                )
-
-        return _surface
@@ -0,0 +1,184 @@
+#  The MipPyramid class.
+#  Holds the map at half, quarter, eighth... size, for the zoomed out views and the mini map.
+
+from typing import Callable, Iterator, Optional
+
+import pygame
+
+import crawler.constants as c
+import crawler.customlogger as customlogger
+from crawler.map.chunk_cache import ChunkCache
+
+
+class MipLevel(ChunkCache):
+    """MipLevel
+
+    One level of the MipPyramid.
+    A MipLevel is a ChunkCache whose chunks are rendered from the level above, rather than from the tiles.
+    Each chunk is the same size in pixels as a chunk of the level above, so covers four of its chunks,
+    which are each scaled to half size.
+
+    Args:
+        ChunkCache: the MipLevel subclasses the ChunkCache.
+    """
+
+    def __init__(self, source: ChunkCache, memory_budget: int = c.MAP_MIP_MEMORY_BUDGET) -> None:
+        """__init__
+
+        Initialise the MipLevel.
+
+        Args:
+            source (ChunkCache): the level above, twice the size of this level.
+            memory_budget (int): the maximum number of bytes of chunks to keep. Defaults to c.MAP_MIP_MEMORY_BUDGET.
+        """
+        super().__init__(
+            (source.cols, source.rows),
+            (source.tile_width, source.tile_height),
+            [],
+            lambda gid: None,
+            chunk_tiles=source.chunk_tiles,
+            memory_budget=memory_budget,
+        )
+
+        self.source: ChunkCache = source
+
+        #  The level is half the size of the level above, but the chunks are the same size.
+
+        self.width = -(-source.width // 2)
+        self.height = -(-source.height // 2)
+        self.chunk_width = source.chunk_width
+        self.chunk_height = source.chunk_height
+        self.chunks_across = -(-self.width // self.chunk_width)
+        self.chunks_down = -(-self.height // self.chunk_height)
+
+    def children(self, chunk: tuple[int, int]) -> Iterator[tuple[int, int]]:
+        """children
+
+        Gets the chunks of the level above that make up a chunk.
+
+        Args:
+            chunk (tuple[int, int]): the chunk column and row.
+
+        Yields:
+            tuple[int, int]: the chunk column and row in the level above.
+        """
+        for _row in range(chunk[1] * 2, min(chunk[1] * 2 + 2, self.source.chunks_down)):
+            for _col in range(chunk[0] * 2, min(chunk[0] * 2 + 2, self.source.chunks_across)):
+                yield (_col, _row)
+
+    def render_chunk(self, chunk: tuple[int, int]) -> pygame.Surface:
+        """render_chunk
+
+        Renders a chunk by scaling down the chunks of the level above, without caching it.
+
+        Args:
+            chunk (tuple[int, int]): the chunk column and row.
+
+        Returns:
+            pygame.Surface: the rendered chunk.
+        """
+        _rect: pygame.Rect = self.chunk_rect(chunk)
+        _surface: pygame.Surface = pygame.Surface(_rect.size)
+
+        for _child in self.children(chunk):
+            _child_rect: pygame.Rect = self.source.chunk_rect(_child)
+
+            #  The full size chunks are not added to their cache, they are only rendered if needed,
+            #  so that building the pyramid doesn't fill the cache the main view draws from.
+
+            _child_surface: Optional[pygame.Surface]
+            if isinstance(self.source, MipLevel):
+                _child_surface = self.source.get_chunk(_child)
+            else:
+                _child_surface = self.source.peek_chunk(_child)
+                if _child_surface is None:
+                    _child_surface = self.source.render_chunk(_child)
+
+            _surface.blit(
+                pygame.transform.smoothscale(
+                    _child_surface,
+                    (-(-_child_rect.width // 2), -(-_child_rect.height // 2)),
+                ),
+                (_child_rect.left // 2 - _rect.left, _child_rect.top // 2 - _rect.top),
+            )
+
+        return _surface
+
+
+class MipPyramid:
+    """MipPyramid
+
+    The MipPyramid holds the map at full size, in the ChunkCache, and then at half, quarter, eighth... size,
+    down to the smallest level that is still larger than the mini map.
+    The chunks of each level are only rendered when needed, from the level above.
+    """
+
+    @customlogger.log_trace(customlogger.Levels.INFO)
+    def __init__(self, chunk_cache: ChunkCache, smallest_size: tuple[int, int] = c.MINIMAP_SIZE) -> None:
+        """__init__
+
+        Initialise the MipPyramid.
+
+        Args:
+            chunk_cache (ChunkCache): the full size map.
+            smallest_size (tuple[int, int]): the size below which no more levels are made. Defaults to c.MINIMAP_SIZE.
+        """
+
+        self.levels: list[ChunkCache] = [chunk_cache]
+
+        while (
+            -(-self.levels[-1].width // 2) >= smallest_size[0]
+            and -(-self.levels[-1].height // 2) >= smallest_size[1]
+        ):
+            self.levels.append(MipLevel(self.levels[-1]))
+
+    def level(self, zoom: int) -> ChunkCache:
+        """level
+
+        Gets the level for a zoom level, the nearest level if there is no exact one.
+
+        Args:
+            zoom (int): the zoom level, 0 is full size, 1 is half size etc.
+
+        Returns:
+            ChunkCache: the level.
+        """
+        return self.levels[min(max(zoom, 0), len(self.levels) - 1)]
+
+    def build(self, report: Optional[Callable[[float], None]] = None) -> None:
+        """build
+
+        Renders every level below full size, working depth first from the smallest level,
+        so that each chunk of each level is rendered only once,
+        and its four children are always still in the cache when it is rendered.
+        Only the mip levels are changed, so this can run while the full size level is being drawn.
+
+        Args:
+            report (Optional[Callable[[float], None]]): called with the fraction of the full size chunks rendered. Defaults to None.
+        """
+
+        if len(self.levels) == 1:
+            return
+
+        _total: int = self.levels[0].chunks_across * self.levels[0].chunks_down
+        _rendered: int = 0
+
+        def build_chunk(level: MipLevel, chunk: tuple[int, int]) -> None:
+            nonlocal _rendered
+
+            _children: list[tuple[int, int]] = list(level.children(chunk))
+
+            if isinstance(level.source, MipLevel):
+                for _child in _children:
+                    build_chunk(level.source, _child)
+
+            level.get_chunk(chunk)
+
+            if not isinstance(level.source, MipLevel):
+                _rendered += len(_children)
+                if report is not None:
+                    report(_rendered / _total)
+
+        _smallest: MipLevel = self.levels[-1]  # type: ignore
+        for _chunk in _smallest.chunks_in_rect(pygame.Rect(0, 0, _smallest.width, _smallest.height)):
+            build_chunk(_smallest, _chunk)
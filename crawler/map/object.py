@@ -4,7 +4,6 @@
 from typing import Any, Optional
 
 import pygame
-import pytmx  # type: ignore
 
 
 class Object(pygame.sprite.Sprite):
@@ -32,3 +31,5 @@ class Object(pygame.sprite.Sprite):
         self.name: str = "object"
         self.rect: pygame.rect.Rect = rect
         self.image: Optional[pygame.Surface] = image
+        self.properties: dict[str, Any] = properties
+        self.type: Optional[str] = properties.get("type")
@@ -0,0 +1,263 @@
+#  The ObjectRegistry class.
+#  Holds the objects of the map by type, each type in its own table of arrays.
+
+from typing import Any, Iterable, Iterator, Optional
+
+import numpy as np
+
+import crawler.constants as c
+from crawler.map.map_cache import MapObject
+
+
+class ObjectTable:
+    """ObjectTable
+
+    The ObjectTable holds all the objects of one type, one row per object.
+    The ids and rectangles are held in arrays, so that all the objects of a type can be
+    worked on together, and the other properties are held in a list alongside.
+    Objects that are removed, such as collected pods, keep their row but are marked inactive.
+    """
+
+    def __init__(self, object_type: str, objects: list[MapObject]) -> None:
+        """__init__
+
+        Initialise the ObjectTable.
+
+        Args:
+            object_type (str): the type of the objects.
+            objects (list[MapObject]): the objects of that type, from the map.
+        """
+
+        self.type: str = object_type
+
+        self.ids: np.ndarray = np.array([_object.id for _object in objects], dtype=np.int32)
+        self.rects: np.ndarray = np.array(
+            [(_object.x, _object.y, _object.width, _object.height) for _object in objects],
+            dtype=np.float32,
+        ).reshape(-1, 4)
+        self.visible: np.ndarray = np.array(
+            [bool(_object.visible) for _object in objects], dtype=bool
+        )
+        self.active: np.ndarray = np.ones(len(objects), dtype=bool)
+        self.names: list[Optional[str]] = [_object.name for _object in objects]
+        self.properties: list[dict[str, Any]] = [_object.properties for _object in objects]
+
+        #  The row of each object, by id.
+
+        self._rows: dict[int, int] = {int(_id): _row for _row, _id in enumerate(self.ids)}
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __contains__(self, id: int) -> bool:
+        return id in self._rows
+
+    def row(self, id: int) -> int:
+        """row
+
+        Gets the row of an object.
+
+        Args:
+            id (int): the object id.
+
+        Raises:
+            KeyError: if there is no object with that id in the table.
+
+        Returns:
+            int: the row.
+        """
+        return self._rows[id]
+
+    def remove(self, id: int) -> None:
+        """remove
+
+        Marks an object inactive.
+
+        Args:
+            id (int): the object id.
+        """
+        self.active[self._rows[id]] = False
+
+    def tile(self, row: int) -> tuple[int, int]:
+        """tile
+
+        Gets the tile under the centre of an object.
+
+        Args:
+            row (int): the row of the object.
+
+        Returns:
+            tuple[int, int]: the tile column and row.
+        """
+        _x, _y, _width, _height = self.rects[row].tolist()
+
+        return (int(_x + _width / 2) // c.MAP_TILE_SIZE, int(_y + _height / 2) // c.MAP_TILE_SIZE)
+
+    def tiles(self) -> dict[int, tuple[int, int]]:
+        """tiles
+
+        Gets the tiles under the centres of the active objects.
+
+        Returns:
+            dict[int, tuple[int, int]]: the tile column and row of each object, by id.
+        """
+        return {
+            int(self.ids[_row]): self.tile(_row) for _row in np.flatnonzero(self.active).tolist()
+        }
+
+    def position(self, row: int) -> tuple[int, int]:
+        """position
+
+        Gets the position of an object.
+
+        Args:
+            row (int): the row of the object.
+
+        Returns:
+            tuple[int, int]: the top left of the object, in pixels.
+        """
+        return (int(self.rects[row, 0]), int(self.rects[row, 1]))
+
+    def positions(self) -> list[tuple[int, int]]:
+        """positions
+
+        Gets the positions of all the active objects.
+
+        Returns:
+            list[tuple[int, int]]: the top left of each object, in pixels.
+        """
+        return [(int(_x), int(_y)) for _x, _y in self.rects[self.active, :2].tolist()]
+
+
+class ObjectRegistry:
+    """ObjectRegistry
+
+    The ObjectRegistry sorts the objects of the map into tables by type;
+    spawnpoints, pods, salvage, solids and triggers, with any other object counted as a trigger.
+    The objects are read in a single pass, so the registry is built in time linear in the number of objects.
+    """
+
+    def __init__(self, objects: Iterable[MapObject] = ()) -> None:
+        """__init__
+
+        Initialise the ObjectRegistry.
+
+        Args:
+            objects (Iterable[MapObject]): the objects from the map. Defaults to none.
+        """
+
+        #  Sort the objects by type, then build each table once.
+
+        _sorted: dict[str, list[MapObject]] = {_type: [] for _type in c.MAP_OBJECT_TYPES}
+
+        for _object in objects:
+            _sorted[self.type_of(_object)].append(_object)
+
+        self.tables: dict[str, ObjectTable] = {
+            _type: ObjectTable(_type, _objects) for _type, _objects in _sorted.items()
+        }
+
+        #  The type of each object, by id.
+
+        self._types: dict[int, str] = {
+            int(_id): _type for _type, _table in self.tables.items() for _id in _table.ids
+        }
+
+    def __len__(self) -> int:
+        return len(self._types)
+
+    def __contains__(self, id: int) -> bool:
+        return id in self._types
+
+    def __iter__(self) -> Iterator[ObjectTable]:
+        return iter(self.tables.values())
+
+    @staticmethod
+    def type_of(map_object: MapObject) -> str:
+        """type_of
+
+        Gets the registry type of a map object, from its name.
+
+        Args:
+            map_object (MapObject): the object.
+
+        Returns:
+            str: the type, c.MAP_OBJECT_TRIGGER if the name is not one of the other types.
+        """
+        if map_object.name in c.MAP_OBJECT_TYPES:
+            return map_object.name  # type: ignore
+        return c.MAP_OBJECT_TRIGGER
+
+    def table(self, object_type: str) -> ObjectTable:
+        """table
+
+        Gets the table for a type of object.
+
+        Args:
+            object_type (str): the type.
+
+        Raises:
+            KeyError: if the type is not one of c.MAP_OBJECT_TYPES.
+
+        Returns:
+            ObjectTable: the table.
+        """
+        return self.tables[object_type]
+
+    def lookup(self, id: int) -> tuple[ObjectTable, int]:
+        """lookup
+
+        Finds an object by id.
+
+        Args:
+            id (int): the object id.
+
+        Raises:
+            KeyError: if there is no object with that id.
+
+        Returns:
+            tuple[ObjectTable, int]: the table holding the object, and its row.
+        """
+        _table: ObjectTable = self.tables[self._types[id]]
+        return (_table, _table.row(id))
+
+    def remove(self, id: int) -> None:
+        """remove
+
+        Marks an object inactive, so it is no longer found by type.
+
+        Args:
+            id (int): the object id.
+
+        Raises:
+            KeyError: if there is no object with that id.
+        """
+        self.tables[self._types[id]].remove(id)
+
+    def positions(self, object_type: str) -> list[tuple[int, int]]:
+        """positions
+
+        Gets the positions of all the active objects of a type.
+
+        Args:
+            object_type (str): the type.
+
+        Returns:
+            list[tuple[int, int]]: the top left of each object, in pixels.
+        """
+        return self.tables[object_type].positions()
+
+    def spawn_positions(self) -> dict[int, tuple[int, int]]:
+        """spawn_positions
+
+        Gets the positions of the spawnpoints, by crawler number.
+
+        Returns:
+            dict[int, tuple[int, int]]: the top left of each spawnpoint, in pixels.
+        """
+        _table: ObjectTable = self.tables[c.MAP_OBJECT_SPAWNPOINT]
+
+        return {
+            int(_table.properties[_row]["num"]): _table.position(_row)
+            for _row in range(len(_table))
+        }
@@ -0,0 +1,1007 @@
+#  The Pathfinder class.
+#  Finds routes across the tile grid of the map, around the solids and over the cheapest terrain.
+
+import heapq
+import math
+import queue
+import threading
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+from typing import Optional
+
+import numpy as np
+import pygame
+
+import crawler.constants as c
+import crawler.customlogger as customlogger
+from crawler.map.object_registry import ObjectRegistry
+from crawler.map.terrain import TerrainMap
+
+#  The eight directions a crawler can move between tiles.
+
+DIRECTIONS: tuple[tuple[int, int], ...] = (
+    (1, 0),
+    (-1, 0),
+    (0, 1),
+    (0, -1),
+    (1, 1),
+    (1, -1),
+    (-1, 1),
+    (-1, -1),
+)
+
+SQRT2: float = math.sqrt(2)
+
+
+def octile(a: tuple[int, int], b: tuple[int, int]) -> float:
+    """octile
+
+    Gets the length of the shortest route between two tiles on an open grid,
+    moving in the eight directions.
+
+    Args:
+        a (tuple[int, int]): the first tile column and row.
+        b (tuple[int, int]): the second tile column and row.
+
+    Returns:
+        float: the distance, in tiles.
+    """
+    _dx: int = abs(a[0] - b[0])
+    _dy: int = abs(a[1] - b[1])
+
+    return max(_dx, _dy) + (SQRT2 - 1) * min(_dx, _dy)
+
+
+def route_tiles(waypoints: list[tuple[int, int]]) -> list[tuple[int, int]]:
+    """route_tiles
+
+    Gets every tile along a route, from the waypoints.
+    Each leg of a route is a straight or diagonal line.
+
+    Args:
+        waypoints (list[tuple[int, int]]): the tiles at which the route turns.
+
+    Returns:
+        list[tuple[int, int]]: the tiles.
+    """
+    _tiles: list[tuple[int, int]] = waypoints[:1]
+
+    for _from, _to in zip(waypoints, waypoints[1:]):
+        _dx: int = (_to[0] > _from[0]) - (_to[0] < _from[0])
+        _dy: int = (_to[1] > _from[1]) - (_to[1] < _from[1])
+        _x, _y = _from
+        while (_x, _y) != _to:
+            _x += _dx
+            _y += _dy
+            _tiles.append((_x, _y))
+
+    return _tiles
+
+
+@dataclass(frozen=True)
+class CostGrid:
+    """CostGrid
+
+    A snapshot of the CostField, which the searches read.
+    The CostField replaces its CostGrid when the map changes, rather than changing it,
+    so a search on the worker thread always sees a consistent grid.
+    """
+
+    walkable: np.ndarray
+    cost: np.ndarray
+    uniform: bool
+    version: int
+
+    #  For each straight direction, the tiles at which a jump stops; blocked tiles and forced neighbours.
+    #  The vertical directions are stored transposed, so every jump scans a contiguous row.
+
+    stops: dict[tuple[int, int], np.ndarray] = field(default_factory=dict)
+
+    @property
+    def cols(self) -> int:
+        return self.walkable.shape[1]
+
+    @property
+    def rows(self) -> int:
+        return self.walkable.shape[0]
+
+    def is_walkable(self, x: int, y: int) -> bool:
+        return 0 <= x < self.cols and 0 <= y < self.rows and bool(self.walkable[y, x])
+
+
+def build_cost_grid(walkable: np.ndarray, cost: np.ndarray, version: int) -> CostGrid:
+    """build_cost_grid
+
+    Builds a CostGrid, working out where jumps stop.
+
+    Args:
+        walkable (np.ndarray): True for the tiles a crawler can be on, indexed [row, col].
+        cost (np.ndarray): the cost of crossing each tile, indexed [row, col].
+        version (int): the version of the CostField.
+
+    Returns:
+        CostGrid: the grid.
+    """
+
+    _rows, _cols = walkable.shape
+
+    #  Pad the grid, so the neighbours of the edge tiles are off the map and not walkable.
+
+    _padded: np.ndarray = np.zeros((_rows + 2, _cols + 2), dtype=bool)
+    _padded[1:-1, 1:-1] = walkable
+
+    def near(dx: int, dy: int) -> np.ndarray:
+        return _padded[1 + dy : _rows + 1 + dy, 1 + dx : _cols + 1 + dx]
+
+    #  A tile has a forced neighbour when a wall beside the route ends,
+    #  so a jump has to stop there to look around the corner.
+
+    _forced: dict[tuple[int, int], np.ndarray] = {
+        (1, 0): (near(0, -1) & ~near(-1, -1)) | (near(0, 1) & ~near(-1, 1)),
+        (-1, 0): (near(0, -1) & ~near(1, -1)) | (near(0, 1) & ~near(1, 1)),
+        (0, 1): (near(-1, 0) & ~near(-1, -1)) | (near(1, 0) & ~near(1, -1)),
+        (0, -1): (near(-1, 0) & ~near(-1, 1)) | (near(1, 0) & ~near(1, 1)),
+    }
+
+    _stops: dict[tuple[int, int], np.ndarray] = {}
+    for _direction, _forced_tiles in _forced.items():
+        _stop: np.ndarray = ~walkable | _forced_tiles
+        _stops[_direction] = np.ascontiguousarray(_stop if _direction[1] == 0 else _stop.T)
+
+    _costs: np.ndarray = cost[walkable]
+
+    return CostGrid(
+        walkable=walkable,
+        cost=cost,
+        uniform=bool(_costs.size == 0 or np.all(_costs == _costs[0])),
+        version=version,
+        stops=_stops,
+    )
+
+
+class CostField:
+    """CostField
+
+    The CostField holds, for every tile of the map, whether a crawler can be on the tile,
+    and the cost of crossing it.
+    A tile is blocked if the crawler would hit a solid with its centre on the centre of the tile,
+    and the cost of a tile is the time taken to cross it at the speed the engine allows on its terrain.
+    """
+
+    @customlogger.log_trace(customlogger.Levels.INFO)
+    def __init__(self, registry: ObjectRegistry, terrain_map: TerrainMap) -> None:
+        """__init__
+
+        Initialise the CostField, from the solids in the registry and the terrain.
+
+        Args:
+            registry (ObjectRegistry): the map objects.
+            terrain_map (TerrainMap): the terrain.
+        """
+
+        self.cols: int = terrain_map.cols
+        self.rows: int = terrain_map.rows
+        self.tile_width: int = terrain_map.tile_width
+        self.tile_height: int = terrain_map.tile_height
+
+        #  The solids, as left, top, right, bottom.
+
+        _rects: np.ndarray = registry.table(c.MAP_OBJECT_SOLID).rects.astype(np.int64)
+        self.solids: np.ndarray = np.column_stack(
+            (_rects[:, 0], _rects[:, 1], _rects[:, 0] + _rects[:, 2], _rects[:, 1] + _rects[:, 3])
+        ).reshape(-1, 4)
+
+        self.terrain: np.ndarray = terrain_map.data.copy()
+
+        _walkable: np.ndarray = np.ones((self.rows, self.cols), dtype=bool)
+        self.rasterise(_walkable, pygame.Rect(0, 0, self.cols, self.rows))
+
+        self.grid: CostGrid = build_cost_grid(_walkable, self.tile_costs(self.terrain), 0)
+
+    @staticmethod
+    def tile_costs(terrain: np.ndarray) -> np.ndarray:
+        """tile_costs
+
+        Gets the cost of crossing tiles from their terrain.
+
+        Args:
+            terrain (np.ndarray): the terrain levels.
+
+        Returns:
+            np.ndarray: the costs.
+        """
+        return np.asarray(c.PATH_TERRAIN_COSTS, dtype=np.float32)[terrain]
+
+    def rasterise(self, walkable: np.ndarray, tiles: pygame.Rect) -> None:
+        """rasterise
+
+        Works out which tiles in an area are blocked by the solids.
+
+        Args:
+            walkable (np.ndarray): the walkable tiles, changed in place.
+            tiles (pygame.Rect): the area, in tiles.
+        """
+
+        _half_width: int = c.CRAWLER_HIT_RECT[2] // 2
+        _half_height: int = c.CRAWLER_HIT_RECT[3] // 2
+
+        #  The hit rectangle of a crawler on the centre of each tile in the area.
+
+        _centres_x: np.ndarray = np.arange(tiles.left, tiles.right) * self.tile_width + self.tile_width // 2
+        _centres_y: np.ndarray = np.arange(tiles.top, tiles.bottom) * self.tile_height + self.tile_height // 2
+
+        _area: np.ndarray = walkable[tiles.top : tiles.bottom, tiles.left : tiles.right]
+        _area[:] = True
+
+        #  The crawler is kept off the bottom row of the map, see Kinematics.integrate.
+
+        if tiles.bottom == self.rows:
+            walkable[self.rows - 1, tiles.left : tiles.right] = False
+
+        for _left, _top, _right, _bottom in self.solids.tolist():
+            _cols: np.ndarray = (_centres_x - _half_width < _right) & (_left < _centres_x + _half_width)
+            _rows: np.ndarray = (_centres_y - _half_height < _bottom) & (_top < _centres_y + _half_height)
+            if _cols.any() and _rows.any():
+                _area[np.ix_(_rows, _cols)] = False
+
+    def tiles_under(self, rect: pygame.Rect) -> pygame.Rect:
+        """tiles_under
+
+        Gets the tiles whose walkability could be changed by a solid.
+
+        Args:
+            rect (pygame.Rect): the solid, in pixels.
+
+        Returns:
+            pygame.Rect: the tiles, clipped to the map.
+        """
+        _half_width: int = c.CRAWLER_HIT_RECT[2] // 2
+        _half_height: int = c.CRAWLER_HIT_RECT[3] // 2
+
+        _left: int = (rect.left - _half_width) // self.tile_width
+        _top: int = (rect.top - _half_height) // self.tile_height
+        _right: int = (rect.right + _half_width) // self.tile_width + 1
+        _bottom: int = (rect.bottom + _half_height) // self.tile_height + 1
+
+        return pygame.Rect(_left, _top, _right - _left, _bottom - _top).clip(
+            pygame.Rect(0, 0, self.cols, self.rows)
+        )
+
+    def add_solid(self, rect: pygame.Rect) -> np.ndarray:
+        """add_solid
+
+        Adds a solid, blocking the tiles under it.
+
+        Args:
+            rect (pygame.Rect): the solid, in pixels.
+
+        Returns:
+            np.ndarray: the tiles changed, as an array of [col, row].
+        """
+        self.solids = np.vstack((self.solids, [[rect.left, rect.top, rect.right, rect.bottom]]))
+
+        return self.refresh(self.tiles_under(rect))
+
+    def remove_solid(self, rect: pygame.Rect) -> np.ndarray:
+        """remove_solid
+
+        Removes a solid, unblocking the tiles under it if no other solid covers them.
+
+        Args:
+            rect (pygame.Rect): the solid, in pixels.
+
+        Returns:
+            np.ndarray: the tiles changed, as an array of [col, row].
+        """
+        _matches: np.ndarray = np.all(
+            self.solids == [rect.left, rect.top, rect.right, rect.bottom], axis=1
+        )
+        if not _matches.any():
+            return np.zeros((0, 2), dtype=np.int64)
+
+        self.solids = np.delete(self.solids, int(np.argmax(_matches)), axis=0)
+
+        return self.refresh(self.tiles_under(rect))
+
+    def set_terrain(self, tiles: pygame.Rect, level: int) -> np.ndarray:
+        """set_terrain
+
+        Sets the terrain of an area.
+
+        Args:
+            tiles (pygame.Rect): the area, in tiles.
+            level (int): the terrain level.
+
+        Returns:
+            np.ndarray: the tiles changed, as an array of [col, row].
+        """
+        tiles = tiles.clip(pygame.Rect(0, 0, self.cols, self.rows))
+        self.terrain[tiles.top : tiles.bottom, tiles.left : tiles.right] = TerrainMap.clamp(level)
+
+        return self.refresh(tiles)
+
+    def refresh(self, tiles: pygame.Rect) -> np.ndarray:
+        """refresh
+
+        Works out the tiles in an area again, and replaces the CostGrid if any have changed.
+
+        Args:
+            tiles (pygame.Rect): the area, in tiles.
+
+        Returns:
+            np.ndarray: the tiles changed, as an array of [col, row].
+        """
+        _walkable: np.ndarray = self.grid.walkable.copy()
+        self.rasterise(_walkable, tiles)
+        _cost: np.ndarray = self.tile_costs(self.terrain)
+
+        _changed: np.ndarray = (_walkable != self.grid.walkable) | (_cost != self.grid.cost)
+        if not _changed.any():
+            return np.zeros((0, 2), dtype=np.int64)
+
+        self.grid = build_cost_grid(_walkable, _cost, self.grid.version + 1)
+
+        return np.argwhere(_changed)[:, ::-1]
+
+    def spawn_positions(self, spawnpoints: dict[int, tuple[int, int]], count: int) -> dict[int, tuple[int, int]]:
+        """spawn_positions
+
+        Gets where to place a fleet of crawlers; at their spawnpoints, and any crawlers without one
+        on the walkable tiles nearest the spawnpoints, nearest first, so the fleet gathers around them.
+
+        Args:
+            spawnpoints (dict[int, tuple[int, int]]): the top left of each spawnpoint, in pixels, by crawler number.
+            count (int): the number of crawlers.
+
+        Returns:
+            dict[int, tuple[int, int]]: the top left of the tile for each crawler, in pixels, by crawler number.
+
+        Raises:
+            ValueError: if there aren't enough walkable tiles.
+        """
+
+        _positions: dict[int, tuple[int, int]] = {
+            _number: _position for _number, _position in spawnpoints.items() if _number <= count
+        }
+        _unplaced: list[int] = [_number for _number in range(count, 0, -1) if _number not in _positions]
+
+        #  Search outwards from all the spawnpoints at once.
+
+        _tiles: deque[tuple[int, int]] = deque(
+            (_x // self.tile_width, _y // self.tile_height) for _x, _y in spawnpoints.values()
+        )
+        _seen: set[tuple[int, int]] = set(_tiles)
+
+        while _unplaced and _tiles:
+            _x, _y = _tiles.popleft()
+            for _dx, _dy in DIRECTIONS:
+                _tile: tuple[int, int] = (_x + _dx, _y + _dy)
+                if _tile in _seen or not self.grid.is_walkable(*_tile):
+                    continue
+                _seen.add(_tile)
+                _tiles.append(_tile)
+                if _unplaced:
+                    _positions[_unplaced.pop()] = (_tile[0] * self.tile_width, _tile[1] * self.tile_height)
+
+        if _unplaced:
+            raise ValueError(f"The map only has room for {count - len(_unplaced)} crawlers.")
+
+        return _positions
+
+
+# SEARCHES ####################################################################
+
+
+def jump_straight(
+    grid: CostGrid, x: int, y: int, dx: int, dy: int, goal: tuple[int, int]
+) -> Optional[tuple[int, int]]:
+    """jump_straight
+
+    Jumps along a row or column from a tile, to the first tile with a forced neighbour, or the goal.
+
+    Args:
+        grid (CostGrid): the grid.
+        x (int): the column of the first tile to look at.
+        y (int): the row of the first tile to look at.
+        dx (int): the column direction.
+        dy (int): the row direction.
+        goal (tuple[int, int]): the goal tile.
+
+    Returns:
+        Optional[tuple[int, int]]: the tile jumped to, or None if the jump hit a wall.
+    """
+
+    #  Get the tiles ahead as a single line, and find the first stop with numpy.
+
+    if dy == 0:
+        if not 0 <= y < grid.rows or not 0 <= x < grid.cols:
+            return None
+        _line: np.ndarray = grid.stops[(dx, 0)][y]
+        _along, _goal_along, _on_line = x, goal[0], goal[1] == y
+        _step: int = dx
+    else:
+        if not 0 <= x < grid.cols or not 0 <= y < grid.rows:
+            return None
+        _line = grid.stops[(0, dy)][x]
+        _along, _goal_along, _on_line = y, goal[1], goal[0] == x
+        _step = dy
+
+    _ahead: np.ndarray = _line[_along:] if _step > 0 else _line[_along::-1]
+    _goal_distance: int = (_goal_along - _along) * _step if _on_line else -1
+
+    _first: int = int(np.argmax(_ahead)) if _ahead.size else 0
+    _found: bool = bool(_ahead.size) and bool(_ahead[_first])
+
+    if _goal_distance >= 0 and (not _found or _goal_distance <= _first):
+        return goal
+
+    if not _found:
+        return None
+
+    _x: int = x + _first * dx
+    _y: int = y + _first * dy
+
+    return (_x, _y) if grid.walkable[_y, _x] else None
+
+
+def jump(
+    grid: CostGrid, x: int, y: int, dx: int, dy: int, goal: tuple[int, int]
+) -> Optional[tuple[int, int]]:
+    """jump
+
+    Jumps from a tile in a direction, to the next jump point.
+    Diagonal moves are only made when both tiles beside the move are walkable,
+    so that the crawler never cuts the corner of a solid.
+
+    Args:
+        grid (CostGrid): the grid.
+        x (int): the column of the first tile to look at.
+        y (int): the row of the first tile to look at.
+        dx (int): the column direction.
+        dy (int): the row direction.
+        goal (tuple[int, int]): the goal tile.
+
+    Returns:
+        Optional[tuple[int, int]]: the jump point, or None if there is none in that direction.
+    """
+
+    if dx == 0 or dy == 0:
+        return jump_straight(grid, x, y, dx, dy, goal)
+
+    while True:
+        if not grid.is_walkable(x, y):
+            return None
+
+        if (x, y) == goal:
+            return goal
+
+        if (
+            jump_straight(grid, x + dx, y, dx, 0, goal) is not None
+            or jump_straight(grid, x, y + dy, 0, dy, goal) is not None
+        ):
+            return (x, y)
+
+        if not (grid.is_walkable(x + dx, y) and grid.is_walkable(x, y + dy)):
+            return None
+
+        x += dx
+        y += dy
+
+
+def neighbours(
+    grid: CostGrid, tile: tuple[int, int], parent: Optional[tuple[int, int]]
+) -> list[tuple[int, int]]:
+    """neighbours
+
+    Gets the directions worth searching from a tile, given the direction it was reached from.
+
+    Args:
+        grid (CostGrid): the grid.
+        tile (tuple[int, int]): the tile.
+        parent (Optional[tuple[int, int]]): the tile it was reached from, None for the start.
+
+    Returns:
+        list[tuple[int, int]]: the directions.
+    """
+
+    _x, _y = tile
+    walkable = grid.is_walkable
+
+    if parent is None:
+        return [
+            (_dx, _dy)
+            for _dx, _dy in DIRECTIONS
+            if walkable(_x + _dx, _y + _dy)
+            and (_dx == 0 or _dy == 0 or (walkable(_x + _dx, _y) and walkable(_x, _y + _dy)))
+        ]
+
+    _dx: int = (_x > parent[0]) - (_x < parent[0])
+    _dy: int = (_y > parent[1]) - (_y < parent[1])
+    _directions: list[tuple[int, int]] = []
+
+    if _dx != 0 and _dy != 0:
+        if walkable(_x, _y + _dy):
+            _directions.append((0, _dy))
+        if walkable(_x + _dx, _y):
+            _directions.append((_dx, 0))
+        if walkable(_x, _y + _dy) and walkable(_x + _dx, _y):
+            _directions.append((_dx, _dy))
+
+    elif _dx != 0:
+        _ahead: bool = walkable(_x + _dx, _y)
+        _below: bool = walkable(_x, _y + 1)
+        _above: bool = walkable(_x, _y - 1)
+        if _ahead:
+            _directions.append((_dx, 0))
+            if _below:
+                _directions.append((_dx, 1))
+            if _above:
+                _directions.append((_dx, -1))
+        if _below:
+            _directions.append((0, 1))
+        if _above:
+            _directions.append((0, -1))
+
+    else:
+        _ahead = walkable(_x, _y + _dy)
+        _right: bool = walkable(_x + 1, _y)
+        _left: bool = walkable(_x - 1, _y)
+        if _ahead:
+            _directions.append((0, _dy))
+            if _right:
+                _directions.append((1, _dy))
+            if _left:
+                _directions.append((-1, _dy))
+        if _right:
+            _directions.append((1, 0))
+        if _left:
+            _directions.append((-1, 0))
+
+    return _directions
+
+
+def trace(
+    parents: dict[tuple[int, int], Optional[tuple[int, int]]], goal: tuple[int, int]
+) -> list[tuple[int, int]]:
+    """trace
+
+    Follows the parents back from the goal to get the route.
+
+    Args:
+        parents (dict[tuple[int, int], Optional[tuple[int, int]]]): the tile each tile was reached from.
+        goal (tuple[int, int]): the goal tile.
+
+    Returns:
+        list[tuple[int, int]]: the route from the start to the goal.
+    """
+    _route: list[tuple[int, int]] = []
+    _tile: Optional[tuple[int, int]] = goal
+
+    while _tile is not None:
+        _route.append(_tile)
+        _tile = parents[_tile]
+
+    _route.reverse()
+
+    return _route
+
+
+def jump_point_search(
+    grid: CostGrid, start: tuple[int, int], goal: tuple[int, int]
+) -> Optional[tuple[list[tuple[int, int]], float]]:
+    """jump_point_search
+
+    Finds the shortest route with A*, using jump point search to skip over open ground.
+    Only valid when every walkable tile costs the same.
+
+    Args:
+        grid (CostGrid): the grid.
+        start (tuple[int, int]): the start tile.
+        goal (tuple[int, int]): the goal tile.
+
+    Returns:
+        Optional[tuple[list[tuple[int, int]], float]]: the waypoints and the cost of the route,
+        or None if there is no route.
+    """
+
+    _unit: float = float(grid.cost[goal[1], goal[0]])
+
+    _open: list[tuple[float, int, tuple[int, int]]] = [(octile(start, goal) * _unit, 0, start)]
+    _costs: dict[tuple[int, int], float] = {start: 0}
+    _parents: dict[tuple[int, int], Optional[tuple[int, int]]] = {start: None}
+    _closed: set[tuple[int, int]] = set()
+    _count: int = 0
+
+    while _open:
+        _, _, _tile = heapq.heappop(_open)
+
+        if _tile == goal:
+            return trace(_parents, goal), _costs[goal]
+
+        if _tile in _closed:
+            continue
+        _closed.add(_tile)
+
+        for _dx, _dy in neighbours(grid, _tile, _parents[_tile]):
+            _jump_point = jump(grid, _tile[0] + _dx, _tile[1] + _dy, _dx, _dy, goal)
+            if _jump_point is None or _jump_point in _closed:
+                continue
+
+            _cost: float = _costs[_tile] + octile(_tile, _jump_point) * _unit
+            if _cost < _costs.get(_jump_point, math.inf):
+                _costs[_jump_point] = _cost
+                _parents[_jump_point] = _tile
+                _count += 1
+                heapq.heappush(
+                    _open, (_cost + octile(_jump_point, goal) * _unit, _count, _jump_point)
+                )
+
+    return None
+
+
+def a_star_search(
+    grid: CostGrid, start: tuple[int, int], goal: tuple[int, int]
+) -> Optional[tuple[list[tuple[int, int]], float]]:
+    """a_star_search
+
+    Finds the cheapest route with A*, tile by tile, for when the terrain costs vary.
+
+    Args:
+        grid (CostGrid): the grid.
+        start (tuple[int, int]): the start tile.
+        goal (tuple[int, int]): the goal tile.
+
+    Returns:
+        Optional[tuple[list[tuple[int, int]], float]]: the waypoints and the cost of the route,
+        or None if there is no route.
+    """
+
+    _tile_cost: list[list[float]] = grid.cost.tolist()
+    _min_cost: float = float(grid.cost[grid.walkable].min())
+
+    _open: list[tuple[float, int, tuple[int, int]]] = [(octile(start, goal) * _min_cost, 0, start)]
+    _costs: dict[tuple[int, int], float] = {start: 0}
+    _parents: dict[tuple[int, int], Optional[tuple[int, int]]] = {start: None}
+    _closed: set[tuple[int, int]] = set()
+    _count: int = 0
+
+    while _open:
+        _, _, _tile = heapq.heappop(_open)
+
+        if _tile == goal:
+            return simplify(trace(_parents, goal)), _costs[goal]
+
+        if _tile in _closed:
+            continue
+        _closed.add(_tile)
+
+        _x, _y = _tile
+        for _dx, _dy in neighbours(grid, _tile, None):
+            _next: tuple[int, int] = (_x + _dx, _y + _dy)
+            if _next in _closed:
+                continue
+
+            #  Half of each tile is crossed on the way from centre to centre.
+
+            _cost: float = _costs[_tile] + (SQRT2 if _dx and _dy else 1) * (
+                _tile_cost[_y][_x] + _tile_cost[_next[1]][_next[0]]
+            ) / 2
+            if _cost < _costs.get(_next, math.inf):
+                _costs[_next] = _cost
+                _parents[_next] = _tile
+                _count += 1
+                heapq.heappush(_open, (_cost + octile(_next, goal) * _min_cost, _count, _next))
+
+    return None
+
+
+def simplify(route: list[tuple[int, int]]) -> list[tuple[int, int]]:
+    """simplify
+
+    Removes the tiles from a route where it goes straight on, leaving the waypoints.
+
+    Args:
+        route (list[tuple[int, int]]): the tiles of the route.
+
+    Returns:
+        list[tuple[int, int]]: the waypoints.
+    """
+    _waypoints: list[tuple[int, int]] = route[:1]
+
+    for _index in range(1, len(route) - 1):
+        _before: tuple[int, int] = (route[_index][0] - route[_index - 1][0], route[_index][1] - route[_index - 1][1])
+        _after: tuple[int, int] = (route[_index + 1][0] - route[_index][0], route[_index + 1][1] - route[_index][1])
+        if _before != _after:
+            _waypoints.append(route[_index])
+
+    if len(route) > 1:
+        _waypoints.append(route[-1])
+
+    return _waypoints
+
+
+# PATHFINDER ##################################################################
+
+
+class PathRequest:
+    """PathRequest
+
+    A request for a route, which may be answered at once or later by the worker thread.
+    """
+
+    def __init__(self, start: tuple[int, int], goal: tuple[int, int]) -> None:
+        """__init__
+
+        Initialise the PathRequest.
+
+        Args:
+            start (tuple[int, int]): the start tile.
+            goal (tuple[int, int]): the goal tile.
+        """
+
+        self.start: tuple[int, int] = start
+        self.goal: tuple[int, int] = goal
+        self.waypoints: Optional[list[tuple[int, int]]] = None
+        self.cancelled: bool = False
+        self._done: threading.Event = threading.Event()
+
+    @property
+    def done(self) -> bool:
+        return self._done.is_set()
+
+    def finish(self, waypoints: Optional[list[tuple[int, int]]]) -> None:
+        self.waypoints = waypoints
+        self._done.set()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        return self._done.wait(timeout)
+
+
+class Pathfinder:
+    """Pathfinder
+
+    The Pathfinder answers requests for routes between tiles.
+    When every tile costs the same it uses jump point search, otherwise A* tile by tile.
+    Routes are cached, and when the map changes only the cached routes the change could affect are dropped.
+    Short routes are found at once on the calling thread, long routes on a worker thread.
+    """
+
+    @customlogger.log_trace(customlogger.Levels.INFO)
+    def __init__(
+        self,
+        cost_field: CostField,
+        cache_size: int = c.PATH_CACHE_SIZE,
+        worker_distance: float = c.PATH_WORKER_DISTANCE,
+    ) -> None:
+        """__init__
+
+        Initialise the Pathfinder.
+
+        Args:
+            cost_field (CostField): the cost of each tile.
+            cache_size (int): the number of routes to cache. Defaults to c.PATH_CACHE_SIZE.
+            worker_distance (float): the distance, in tiles, beyond which routes are found on the worker thread.
+                Defaults to c.PATH_WORKER_DISTANCE.
+        """
+
+        self.cost_field: CostField = cost_field
+        self.cache_size: int = cache_size
+        self.worker_distance: float = worker_distance
+
+        #  The cache maps start and goal to the waypoints and cost of the route, None if there is no route.
+
+        self._cache: OrderedDict[
+            tuple[tuple[int, int], tuple[int, int]],
+            Optional[tuple[list[tuple[int, int]], float]],
+        ] = OrderedDict()
+        self._lock: threading.Lock = threading.Lock()
+
+        self._requests: queue.Queue[Optional[PathRequest]] = queue.Queue()
+        self._worker: Optional[threading.Thread] = None
+
+    # SEARCHING ###############################################################
+
+    def find_path(
+        self, start: tuple[int, int], goal: tuple[int, int]
+    ) -> Optional[list[tuple[int, int]]]:
+        """find_path
+
+        Finds a route on the calling thread.
+
+        Args:
+            start (tuple[int, int]): the start tile.
+            goal (tuple[int, int]): the goal tile.
+
+        Returns:
+            Optional[list[tuple[int, int]]]: the waypoints, from the start to the goal, or None if there is no route.
+        """
+
+        _key: tuple[tuple[int, int], tuple[int, int]] = (start, goal)
+
+        with self._lock:
+            if _key in self._cache:
+                self._cache.move_to_end(_key)
+                _cached = self._cache[_key]
+                return None if _cached is None else list(_cached[0])
+
+        _grid: CostGrid = self.cost_field.grid
+        _result: Optional[tuple[list[tuple[int, int]], float]] = self.search(_grid, start, goal)
+
+        #  Only cache the route if the map hasn't changed during the search.
+
+        with self._lock:
+            if _grid is self.cost_field.grid:
+                self._cache[_key] = _result
+                while len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+
+        return None if _result is None else list(_result[0])
+
+    @staticmethod
+    def search(
+        grid: CostGrid, start: tuple[int, int], goal: tuple[int, int]
+    ) -> Optional[tuple[list[tuple[int, int]], float]]:
+        """search
+
+        Searches a grid for a route.
+
+        Args:
+            grid (CostGrid): the grid.
+            start (tuple[int, int]): the start tile.
+            goal (tuple[int, int]): the goal tile.
+
+        Returns:
+            Optional[tuple[list[tuple[int, int]], float]]: the waypoints and the cost of the route,
+            or None if there is no route.
+        """
+
+        if not (0 <= start[0] < grid.cols and 0 <= start[1] < grid.rows):
+            return None
+
+        if not grid.is_walkable(*goal):
+            return None
+
+        if start == goal:
+            return [start], 0
+
+        if grid.uniform:
+            return jump_point_search(grid, start, goal)
+
+        return a_star_search(grid, start, goal)
+
+    def request(self, start: tuple[int, int], goal: tuple[int, int]) -> PathRequest:
+        """request
+
+        Requests a route. Short routes, and cached routes, are found at once;
+        long routes are passed to the worker thread, and the request is done when it has been found.
+
+        Args:
+            start (tuple[int, int]): the start tile.
+            goal (tuple[int, int]): the goal tile.
+
+        Returns:
+            PathRequest: the request.
+        """
+
+        _request: PathRequest = PathRequest(start, goal)
+
+        with self._lock:
+            _cached: bool = (start, goal) in self._cache
+
+        if _cached or octile(start, goal) <= self.worker_distance:
+            _request.finish(self.find_path(start, goal))
+            return _request
+
+        if self._worker is None:
+            self._worker = threading.Thread(target=self.run, name="pathfinder", daemon=True)
+            self._worker.start()
+
+        self._requests.put(_request)
+
+        return _request
+
+    def run(self) -> None:
+        """run
+
+        Answers the requests passed to the worker thread, until stopped.
+        """
+
+        while True:
+            _request: Optional[PathRequest] = self._requests.get()
+            if _request is None:
+                return
+
+            if _request.cancelled:
+                _request.finish(None)
+                continue
+
+            try:
+                _request.finish(self.find_path(_request.start, _request.goal))
+            except Exception as _error:
+                customlogger.log_message(
+                    f"Pathfinding failed from {_request.start} to {_request.goal}: {_error!r}",
+                    customlogger.Levels.ERROR,
+                )
+                _request.finish(None)
+
+    def stop(self) -> None:
+        """stop
+
+        Stops the worker thread.
+        """
+        if self._worker is not None:
+            self._requests.put(None)
+            self._worker = None
+
+    # MAP CHANGES #############################################################
+
+    def add_solid(self, rect: pygame.Rect) -> None:
+        """add_solid
+
+        Adds a solid to the map, and drops the cached routes it blocks.
+
+        Args:
+            rect (pygame.Rect): the solid, in pixels.
+        """
+        self.invalidate(self.cost_field.add_solid(rect))
+
+    def remove_solid(self, rect: pygame.Rect) -> None:
+        """remove_solid
+
+        Removes a solid from the map, and drops the cached routes it could shorten.
+
+        Args:
+            rect (pygame.Rect): the solid, in pixels.
+        """
+        self.invalidate(self.cost_field.remove_solid(rect))
+
+    def set_terrain(self, tiles: pygame.Rect, level: int) -> None:
+        """set_terrain
+
+        Sets the terrain of an area of the map, and drops the cached routes it could change.
+
+        Args:
+            tiles (pygame.Rect): the area, in tiles.
+            level (int): the terrain level.
+        """
+        self.invalidate(self.cost_field.set_terrain(tiles, level))
+
+    def invalidate(self, tiles: np.ndarray) -> None:
+        """invalidate
+
+        Drops the cached routes that a change to some tiles could affect.
+        A route is dropped if it crosses a changed tile, which may now be blocked or dearer,
+        or if a route through a changed tile could be cheaper than it, as that tile may now be open or cheaper.
+        Routes that were not found are always dropped.
+
+        Args:
+            tiles (np.ndarray): the changed tiles, as an array of [col, row].
+        """
+
+        if len(tiles) == 0:
+            return
+
+        _changed: set[tuple[int, int]] = {(int(_col), int(_row)) for _col, _row in tiles.tolist()}
+        _cols: np.ndarray = tiles[:, 0]
+        _rows: np.ndarray = tiles[:, 1]
+
+        def octiles(tile: tuple[int, int]) -> np.ndarray:
+            _dx: np.ndarray = np.abs(_cols - tile[0])
+            _dy: np.ndarray = np.abs(_rows - tile[1])
+            return np.maximum(_dx, _dy) + (SQRT2 - 1) * np.minimum(_dx, _dy)
+
+        _min_cost: float = min(c.PATH_TERRAIN_COSTS)
+
+        with self._lock:
+            for _key in list(self._cache):
+                _cached = self._cache[_key]
+
+                if _cached is None:
+                    del self._cache[_key]
+                    continue
+
+                _waypoints, _cost = _cached
+                if not _changed.isdisjoint(route_tiles(_waypoints)) or np.any(
+                    (octiles(_key[0]) + octiles(_key[1])) * _min_cost < _cost
+                ):
+                    del self._cache[_key]
@@ -0,0 +1,221 @@
+#  The SpatialIndex class.
+#  A uniform grid hash over the map objects, so that they can be found by area.
+
+from typing import Any, Iterator, Optional
+
+import pygame
+
+import crawler.constants as c
+
+
+class SpatialIndex:
+    """SpatialIndex
+
+    The SpatialIndex divides the map into square cells, and records which objects overlap each cell.
+    There is a separate grid for each type of object, so a query for one type
+    never looks at objects of another.
+    Queries only look at the cells under the area being queried, so their cost depends
+    on the number of objects nearby rather than the number of objects on the map.
+    """
+
+    def __init__(self, cell_size: int = c.SPATIAL_INDEX_CELL_SIZE) -> None:
+        """__init__
+
+        Initialise the SpatialIndex.
+
+        Args:
+            cell_size (int): the width and height of a cell, in pixels. Defaults to c.SPATIAL_INDEX_CELL_SIZE.
+        """
+
+        self.cell_size: int = cell_size
+
+        #  The grids, by object type, mapping each cell to the objects that overlap it.
+
+        self._grids: dict[Optional[str], dict[tuple[int, int], list[Any]]] = {}
+        self._count: int = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    # HELPER METHODS ##########################################################
+
+    def cells_in_rect(self, rect: pygame.Rect) -> Iterator[tuple[int, int]]:
+        """cells_in_rect
+
+        Gets the cells that overlap an area of the map.
+
+        Args:
+            rect (pygame.Rect): the area of the map, in pixels.
+
+        Yields:
+            tuple[int, int]: the cell column and row.
+        """
+        _first_col: int = rect.left // self.cell_size
+        _first_row: int = rect.top // self.cell_size
+        _last_col: int = (rect.right - 1) // self.cell_size if rect.width else _first_col
+        _last_row: int = (rect.bottom - 1) // self.cell_size if rect.height else _first_row
+
+        for _row in range(_first_row, _last_row + 1):
+            for _col in range(_first_col, _last_col + 1):
+                yield (_col, _row)
+
+    def get_grids(
+        self, types: Optional[str | tuple[str, ...]]
+    ) -> list[dict[tuple[int, int], list[Any]]]:
+        """get_grids
+
+        Gets the grids to search for the given types.
+
+        Args:
+            types (Optional[str | tuple[str, ...]]): the type, or types, of object; None for all types.
+
+        Returns:
+            list[dict[tuple[int, int], list[Any]]]: the grids.
+        """
+        if types is None:
+            return list(self._grids.values())
+
+        if isinstance(types, str):
+            types = (types,)
+
+        return [self._grids[_type] for _type in types if _type in self._grids]
+
+    # INDEX METHODS ###########################################################
+
+    def insert(self, item: Any, type: Optional[str] = None) -> None:
+        """insert
+
+        Adds an object to the index.
+        The object must have a rect, which must not change while the object is in the index.
+
+        Args:
+            item (Any): the object.
+            type (Optional[str]): the type of the object. Defaults to None.
+        """
+        _grid: dict[tuple[int, int], list[Any]] = self._grids.setdefault(type, {})
+
+        for _cell in self.cells_in_rect(item.rect):
+            _grid.setdefault(_cell, []).append(item)
+
+        self._count += 1
+
+    def remove(self, item: Any, type: Optional[str] = None) -> None:
+        """remove
+
+        Removes an object from the index.
+
+        Args:
+            item (Any): the object.
+            type (Optional[str]): the type the object was added with. Defaults to None.
+        """
+        _grid: Optional[dict[tuple[int, int], list[Any]]] = self._grids.get(type)
+
+        if _grid is None:
+            return
+
+        _removed: bool = False
+        for _cell in self.cells_in_rect(item.rect):
+            _items: Optional[list[Any]] = _grid.get(_cell)
+            if _items is not None and item in _items:
+                _items.remove(item)
+                _removed = True
+                if not _items:
+                    del _grid[_cell]
+
+        if _removed:
+            self._count -= 1
+
+    # QUERY METHODS ###########################################################
+
+    def query_rect(
+        self, rect: pygame.Rect, types: Optional[str | tuple[str, ...]] = None
+    ) -> list[Any]:
+        """query_rect
+
+        Gets the objects that overlap an area of the map.
+
+        Args:
+            rect (pygame.Rect): the area of the map, in pixels.
+            types (Optional[str | tuple[str, ...]]): the type, or types, of object; None for all types. Defaults to None.
+
+        Returns:
+            list[Any]: the objects.
+        """
+        _found: list[Any] = []
+        _seen: set[int] = set()
+
+        for _grid in self.get_grids(types):
+            for _cell in self.cells_in_rect(rect):
+                for _item in _grid.get(_cell, ()):
+                    if id(_item) not in _seen and _item.rect.colliderect(rect):
+                        _seen.add(id(_item))
+                        _found.append(_item)
+
+        return _found
+
+    def query_point(
+        self, point: tuple[float, float], types: Optional[str | tuple[str, ...]] = None
+    ) -> list[Any]:
+        """query_point
+
+        Gets the objects that contain a point on the map.
+
+        Args:
+            point (tuple[float, float]): the point, in pixels.
+            types (Optional[str | tuple[str, ...]]): the type, or types, of object; None for all types. Defaults to None.
+
+        Returns:
+            list[Any]: the objects.
+        """
+        _cell: tuple[int, int] = (
+            int(point[0] // self.cell_size),
+            int(point[1] // self.cell_size),
+        )
+
+        return [
+            _item
+            for _grid in self.get_grids(types)
+            for _item in _grid.get(_cell, ())
+            if _item.rect.collidepoint(point)
+        ]
+
+    def query_radius(
+        self,
+        centre: tuple[float, float],
+        radius: float,
+        types: Optional[str | tuple[str, ...]] = None,
+    ) -> list[Any]:
+        """query_radius
+
+        Gets the objects that are within a distance of a point on the map.
+        An object is within the distance if any part of its rect is.
+
+        Args:
+            centre (tuple[float, float]): the point, in pixels.
+            radius (float): the distance, in pixels.
+            types (Optional[str | tuple[str, ...]]): the type, or types, of object; None for all types. Defaults to None.
+
+        Returns:
+            list[Any]: the objects.
+        """
+        _bounds: pygame.Rect = pygame.Rect(
+            int(centre[0] - radius) - 1,
+            int(centre[1] - radius) - 1,
+            int(radius * 2) + 3,
+            int(radius * 2) + 3,
+        )
+        _radius_squared: float = radius * radius
+
+        _found: list[Any] = []
+
+        for _item in self.query_rect(_bounds, types):
+
+            #  Find the distance to the closest point of the rect.
+
+            _dx: float = max(_item.rect.left - centre[0], 0, centre[0] - _item.rect.right)
+            _dy: float = max(_item.rect.top - centre[1], 0, centre[1] - _item.rect.bottom)
+
+            if _dx * _dx + _dy * _dy <= _radius_squared:
+                _found.append(_item)
+
+        return _found
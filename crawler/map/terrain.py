@@ -0,0 +1,99 @@
+#  The TerrainMap class.
+#  Holds the terrain level of every tile of the map.
+
+import numpy as np
+import pygame
+
+import crawler.constants as c
+import crawler.customlogger as customlogger
+from crawler.map.map_cache import MapData
+
+
+class TerrainMap:
+    """TerrainMap
+
+    The TerrainMap holds the terrain level of every tile of the map, in a single byte per tile,
+    so that the terrain under a crawler can be looked up without searching the map objects.
+
+    The terrain comes from the "terrain" property of the tiles in the tile layers,
+    and from invisible "terrain" objects, which set the terrain of every tile they cover.
+    """
+
+    @customlogger.log_trace(customlogger.Levels.INFO)
+    def __init__(self, map_data: MapData) -> None:
+        """__init__
+
+        Initialise the TerrainMap, rasterising the terrain from the map data.
+
+        Args:
+            map_data (MapData): the map.
+        """
+
+        self.cols: int = map_data.width
+        self.rows: int = map_data.height
+        self.tile_width: int = map_data.tilewidth
+        self.tile_height: int = map_data.tileheight
+
+        self.data: np.ndarray = np.zeros((self.rows, self.cols), dtype=np.uint8)
+
+        #  Set the terrain from the tile properties, each layer overriding the layers below it.
+
+        _levels: np.ndarray = np.zeros(len(map_data.images) or 1, dtype=np.uint8)
+        _has_level: np.ndarray = np.zeros(len(_levels), dtype=bool)
+
+        for _gid, _properties in map_data.tile_properties.items():
+            if c.TERRAIN_PROPERTY in _properties and 0 <= _gid < len(_levels):
+                _levels[_gid] = self.clamp(_properties[c.TERRAIN_PROPERTY])
+                _has_level[_gid] = True
+
+        if _has_level.any():
+            for _layer in map_data.tile_layers:
+                _gids: np.ndarray = np.minimum(_layer.data, len(_levels) - 1)  # type: ignore
+                _mask: np.ndarray = _has_level[_gids]
+                self.data[_mask] = _levels[_gids][_mask]
+
+        #  Set the terrain under the terrain objects.
+
+        for _object in map_data.objects:
+            if _object.name == c.TERRAIN_PROPERTY and not _object.visible:
+                _rect: pygame.Rect = pygame.Rect(
+                    _object.x, _object.y, _object.width, _object.height
+                )
+                self.data[
+                    max(0, _rect.top // self.tile_height) : max(
+                        0, -(-_rect.bottom // self.tile_height)
+                    ),
+                    max(0, _rect.left // self.tile_width) : max(
+                        0, -(-_rect.right // self.tile_width)
+                    ),
+                ] = self.clamp(_object.properties.get(c.TERRAIN_PROPERTY, 0))
+
+    @staticmethod
+    def clamp(level: int) -> int:
+        """clamp
+
+        Limits a terrain level to the levels the engine understands.
+
+        Args:
+            level (int): the terrain level.
+
+        Returns:
+            int: the terrain level.
+        """
+        return max(0, min(int(level), c.TERRAIN_LEVEL_MAX))
+
+    def level_at(self, position: tuple[float, float]) -> int:
+        """level_at
+
+        Gets the terrain level of the tile at a position.
+
+        Args:
+            position (tuple[float, float]): the position on the map, in pixels.
+
+        Returns:
+            int: the terrain level.
+        """
+        _col: int = min(max(int(position[0]) // self.tile_width, 0), self.cols - 1)
+        _row: int = min(max(int(position[1]) // self.tile_height, 0), self.rows - 1)
+
+        return int(self.data[_row, _col])
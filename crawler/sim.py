@@ -0,0 +1,501 @@
+#  The sim.py file provides a headless entry point; it runs the crawlers on the map, without a display,
+#  as fast as the simulation allows, and reports what happens to them.
+#  e.g. python -m crawler.sim --hours 2 --sample 300 --csv curves.csv
+
+import argparse
+import csv
+import time
+from enum import IntEnum
+from typing import Any, Optional
+
+import pygame
+
+import crawler.constants as c
+import crawler.customlogger as customlogger
+from crawler.clock import SimulationClock
+from crawler.crawler.crawler import Crawler
+from crawler.crawler.fleet import Fleet
+from crawler.crawler.kinematics import Kinematics
+from crawler.map.dispatcher import Dispatcher
+from crawler.map.map_cache import MapData, load_map
+from crawler.map.object import Object
+from crawler.map.object_registry import ObjectRegistry
+from crawler.map.pathfinding import CostField, Pathfinder
+from crawler.map.spatial_index import SpatialIndex
+from crawler.map.terrain import TerrainMap
+
+#  The columns of the resource curves.
+
+CURVE_FIELDS: list[str] = ["time", "crawler", "oxygen", "power", "heat", "terrain", "personnel", "failed"]
+
+
+class Simulation:
+    """Simulation
+
+    The Simulation runs the crawlers on the map without a display.
+    Only the parts of the map the crawlers use are loaded; the solids, terrain and routes, and no images,
+    and the crawlers are stepped on a SimulationClock as fast as possible.
+
+    Module status changes, module failures and personnel deaths are recorded as events as they happen,
+    and the levels of each crawler are sampled at intervals, for the resource curves.
+
+    Only the crawlers that are moving are stepped; one standing still owes the steps it hasn't been stepped for,
+    and its systems are moved on by its SystemScheduler from one event to the next, or to the next sample,
+    whichever comes first, while the others move. While every crawler is standing still,
+    the simulation jumps to the next step at which one of their systems is due to update.
+    """
+
+    @customlogger.log_trace(customlogger.Levels.INFO)
+    def __init__(self, filename: str = c.LEVEL_ONE_MAP_FILENAME, crawlers: int = 9) -> None:
+        """__init__
+
+        Initialise the Simulation, loading the map and placing the crawlers at their spawnpoints.
+
+        Args:
+            filename (str): the file from which to read the map. Defaults to c.LEVEL_ONE_MAP_FILENAME.
+            crawlers (int): the number of crawlers; those without a spawnpoint are placed around them. Defaults to 9.
+
+        Raises:
+            ValueError: if there isn't room on the map for the crawlers.
+        """
+
+        self.clock: SimulationClock = SimulationClock()
+        self.events: list[tuple[float, str, str]] = []
+        self.curves: list[dict[str, Any]] = []
+        self.dispatcher: Optional[Dispatcher] = None
+
+        #  Load the map data, and build the registry, collision index, terrain and routes from it.
+
+        _map_data: MapData = load_map(filename)
+
+        self.registry: ObjectRegistry = ObjectRegistry(_map_data.objects)
+        self.terrain_map: TerrainMap = TerrainMap(_map_data)
+        self.spatial_index: SpatialIndex = SpatialIndex()
+        self.pathfinder: Pathfinder = Pathfinder(CostField(self.registry, self.terrain_map))
+
+        for _table in self.registry:
+            if _table.type == c.MAP_OBJECT_SPAWNPOINT:
+                continue
+            for _row in range(len(_table)):
+                _object: Object = Object(
+                    [],  # type: ignore
+                    pygame.Rect(*_table.rects[_row].tolist()),
+                    None,
+                    dict(_table.properties[_row], type=_table.names[_row]),
+                )
+                self.spatial_index.insert(_object, _object.type)
+
+        #  Create the crawlers at, or around, their spawnpoints.
+
+        _spawn_positions: dict[int, tuple[int, int]] = self.pathfinder.cost_field.spawn_positions(
+            self.registry.spawn_positions(), crawlers
+        )
+
+        self.crawlers: list[Crawler] = []
+
+        for _number in range(crawlers):
+            _crawler: Crawler = Crawler(_number)
+            _crawler.position = _spawn_positions[_number + 1]
+            _crawler.spatial_index = self.spatial_index
+            _crawler.terrain_map = self.terrain_map
+            _crawler.pathfinder = self.pathfinder
+            self.crawlers.append(_crawler)
+
+        #  The crawlers are moved together, in one Kinematics.
+
+        Kinematics.join(self.crawlers)
+
+        #  The steps each crawler owes for standing still, and the step at which its systems are next due to update.
+
+        self.owed: list[int] = [0] * len(self.crawlers)
+        self.due: list[int] = [0] * len(self.crawlers)
+
+        #  The last status of each module and person, to spot changes.
+
+        self._statuses: list[list[IntEnum]] = [self.statuses(_crawler) for _crawler in self.crawlers]
+
+        #  The highest heat of each crawler, and when its power first failed and its crew first died, if they have.
+
+        self.peak_heat: list[int] = [_crawler.system.heat_sink.heat for _crawler in self.crawlers]
+        self.power_failed: list[Optional[float]] = [None] * len(self.crawlers)
+        self.first_death: list[Optional[float]] = [None] * len(self.crawlers)
+
+    @staticmethod
+    def statuses(crawler: Crawler) -> list[IntEnum]:
+        """statuses
+
+        Gets the status of each module and person of a crawler.
+
+        Args:
+            crawler (Crawler): the crawler.
+
+        Returns:
+            list[IntEnum]: the statuses, modules first, in slot order.
+        """
+        return [_module.status for _module in Fleet.modules_of(crawler.system)] + [
+            _person.status for _person in crawler.system.hold.personnel_slots
+        ]
+
+    def dispatch(self, target_type: str) -> None:
+        """dispatch
+
+        Sends the crawlers to the nearest pods or salvage, working out the flow fields first if need be.
+
+        Args:
+            target_type (str): c.MAP_OBJECT_POD or c.MAP_OBJECT_SALVAGE.
+        """
+
+        if self.dispatcher is None:
+            self.dispatcher = Dispatcher(self.registry, self.pathfinder.cost_field.grid)
+
+        for _crawler, _id in self.dispatcher.dispatch(self.crawlers, target_type):
+            self.event(_crawler, f"dispatched to {target_type} {_id}")
+
+    def event(self, crawler: Crawler, text: str, time: Optional[float] = None) -> None:
+        """event
+
+        Records an event.
+
+        Args:
+            crawler (Crawler): the crawler it happened to.
+            text (str): what happened.
+            time (Optional[float]): when it happened. Defaults to the time of the last step.
+        """
+        self.events.append((self.clock.time if time is None else time, crawler.identifier, text))
+
+    def stationary(self) -> bool:
+        """stationary
+
+        Checks if the crawlers are all standing still, with no targets to collect,
+        so that stepping them would only update their systems.
+
+        Returns:
+            bool: True if they are.
+        """
+        return all(_crawler.stationary for _crawler in self.crawlers) and (
+            self.dispatcher is None or not self.dispatcher.claims
+        )
+
+    def step(self, every_step: bool = False, until: Optional[int] = None) -> None:
+        """step
+
+        Advances the simulation by one step, checking for events after each update of the systems.
+        The crawlers standing still aren't stepped, but owe the step, and their systems are only updated when due.
+
+        Args:
+            every_step (bool): step the crawlers even while they are standing still. Defaults to False.
+            until (Optional[int]): the step up to which the systems of crawlers standing still
+                can be moved on at once. Defaults to this step.
+        """
+
+        _moving: list[Crawler] = []
+        _stepped: list[bool] = [False] * len(self.crawlers)
+
+        for _index, _crawler in enumerate(self.crawlers):
+            if not every_step and _crawler.stationary and not _crawler.autopilot.active:
+                self.owed[_index] += 1
+                continue
+
+            #  Settle the steps owed if the crawler has started moving.
+
+            self.settle(_index)
+            _moving.append(_crawler)
+            _stepped[_index] = True
+
+        Crawler.update_all(_moving, self.clock.step)
+
+        self.clock.ticks += 1
+
+        if self.dispatcher is not None:
+            for _crawler, _id in self.dispatcher.update():
+                self.event(_crawler, f"collected {self.registry.lookup(_id)[0].type} {_id}")
+
+        if self.clock.ticks % c.SYSTEM_UPDATE_STEPS == 0:
+            for _index in range(len(self.crawlers)):
+                if _stepped[_index]:
+                    self.check(_index, self.clock.time)
+                elif self.due[_index] <= self.clock.ticks:
+                    self.update(_index, self.clock.ticks if until is None else until)
+
+    def update(self, index: int, until: int) -> None:
+        """update
+
+        Updates the systems of a crawler standing still, and moves them on by as many of the following updates,
+        up to a step, as its SystemScheduler finds steady.
+
+        Args:
+            index (int): the index of the crawler.
+            until (int): the step of the last update to move on by.
+        """
+
+        _crawler: Crawler = self.crawlers[index]
+
+        self.settle(index)
+        _crawler.system.journal.time = self.clock.time
+        _updates: int = _crawler.scheduler.update((until - self.clock.ticks) // c.SYSTEM_UPDATE_STEPS + 1)
+        self.due[index] = self.clock.ticks + _updates * c.SYSTEM_UPDATE_STEPS
+
+        self.check(index, self.clock.time)
+
+    def settle(self, index: int) -> None:
+        """settle
+
+        Moves a crawler on by the steps it owes for standing still; its systems have been updated already.
+
+        Args:
+            index (int): the index of the crawler.
+        """
+
+        if self.owed[index]:
+            self.crawlers[index].updateTerrain()
+            self.crawlers[index].steps += self.owed[index]
+            self.owed[index] = 0
+
+    def next_update(self) -> int:
+        """next_update
+
+        Gets the next step at which the systems of a crawler standing still are due to update.
+
+        Returns:
+            int: the step.
+        """
+        return max(min(self.due), (self.clock.ticks // c.SYSTEM_UPDATE_STEPS + 1) * c.SYSTEM_UPDATE_STEPS)
+
+    def check(self, index: int, time: float) -> None:
+        """check
+
+        Records the modules and personnel of a crawler whose status has changed since the last check.
+
+        Args:
+            index (int): the index of the crawler.
+            time (float): the time of the last update of its systems.
+        """
+
+        _crawler: Crawler = self.crawlers[index]
+        _index: int = index
+
+        self.peak_heat[_index] = max(self.peak_heat[_index], _crawler.system.heat_sink.heat)
+
+        #  The power has failed once the cells run dry, or a module first goes offline for want of power.
+
+        if self.power_failed[_index] is None and (
+            _crawler.system.cells.actual_power <= 0
+            or any(
+                _module.status is c.MODULE_STATUS_OFFLINE_DUE_TO_POWER_DEFICIENCY
+                for _module in Fleet.modules_of(_crawler.system)
+            )
+        ):
+            self.power_failed[_index] = time
+
+        _statuses: list[IntEnum] = self.statuses(_crawler)
+
+        if _statuses != self._statuses[_index]:
+
+            _names: list[str] = [_module.name for _module in Fleet.modules_of(_crawler.system)] + [
+                f"{_person.name}, {_person.role}," for _person in _crawler.system.hold.personnel_slots
+            ]
+
+            for _name, _before, _after in zip(_names, self._statuses[_index], _statuses):
+                if _before == _after:
+                    continue
+                if _after is c.MODULE_STATUS_FAILED_DUE_TO_HEAT_DAMAGE:
+                    self.event(_crawler, f"{_name} has failed due to heat damage", time)
+                elif _after is c.PERSONNEL_STATUS_DECEASED:
+                    self.event(_crawler, f"{_name} is deceased", time)
+                    if self.first_death[_index] is None:
+                        self.first_death[_index] = time
+                else:
+                    self.event(_crawler, f"{_name} {_before} -> {_after}", time)
+
+            self._statuses[_index] = _statuses
+
+    def sample(self) -> None:
+        """sample
+
+        Records the levels of each crawler, for the resource curves.
+        """
+
+        for _crawler in self.crawlers:
+            _system = _crawler.system
+            self.curves.append(
+                {
+                    "time": round(self.clock.time, 3),
+                    "crawler": _crawler.identifier,
+                    "oxygen": _system.oxygen.oxygen,
+                    "power": _system.cells.power,
+                    "heat": _system.heat_sink.heat,
+                    "terrain": _system.engine.terrain,
+                    "personnel": sum(
+                        _person.status != c.PERSONNEL_STATUS_DECEASED for _person in _system.hold.personnel_slots
+                    ),
+                    "failed": sum(
+                        _module.status == c.MODULE_STATUS_FAILED_DUE_TO_HEAT_DAMAGE
+                        for _module in Fleet.modules_of(_system)
+                    ),
+                }
+            )
+
+    def run(self, seconds: float, sample_interval: float, every_step: bool = False) -> None:
+        """run
+
+        Runs the simulation for a length of game time.
+
+        Args:
+            seconds (float): the game time, in seconds.
+            sample_interval (float): the game time between samples of the resource curves, in seconds.
+            every_step (bool): step the crawlers even while they are standing still. Defaults to False.
+        """
+
+        _end: int = self.clock.ticks + round(seconds / self.clock.step)
+        _sample_steps: int = max(round(sample_interval / self.clock.step), 1)
+
+        if self.clock.ticks == 0:
+            self.sample()
+
+        while self.clock.ticks < _end:
+            _until: int = min((self.clock.ticks // _sample_steps + 1) * _sample_steps, _end)
+
+            #  Nothing happens while the crawlers are all standing still, until one's systems are due to update.
+
+            if not every_step and self.stationary():
+                _steps: int = min(self.next_update(), _until) - 1 - self.clock.ticks
+                for _index in range(len(self.crawlers)):
+                    self.owed[_index] += _steps
+                self.clock.ticks += _steps
+
+            self.step(every_step, _until)
+
+            if self.clock.ticks % _sample_steps == 0:
+                for _index in range(len(self.crawlers)):
+                    self.settle(_index)
+                self.sample()
+
+        for _index in range(len(self.crawlers)):
+            self.settle(_index)
+
+    def summary(self) -> dict[str, Any]:
+        """summary
+
+        Sums up the run so far across the crawlers.
+
+        Returns:
+            dict[str, Any]: the earliest times a crawler's power failed and a person died, or None if none has,
+                the highest heat, the fraction of the personnel alive, and the number of modules failed.
+        """
+
+        _power_failed: list[float] = [_time for _time in self.power_failed if _time is not None]
+        _first_death: list[float] = [_time for _time in self.first_death if _time is not None]
+        _personnel: list[str] = [
+            _person.status for _crawler in self.crawlers for _person in _crawler.system.hold.personnel_slots
+        ]
+
+        return {
+            "power_failed": min(_power_failed) if _power_failed else None,
+            "first_death": min(_first_death) if _first_death else None,
+            "peak_heat": max(self.peak_heat, default=0),
+            "survival": (
+                sum(_status != c.PERSONNEL_STATUS_DECEASED for _status in _personnel) / len(_personnel)
+                if _personnel
+                else 1.0
+            ),
+            "failed_modules": sum(
+                _module.status == c.MODULE_STATUS_FAILED_DUE_TO_HEAT_DAMAGE
+                for _crawler in self.crawlers
+                for _module in Fleet.modules_of(_crawler.system)
+            ),
+        }
+
+    def stop(self) -> None:
+        """stop
+
+        Stops the pathfinder's worker thread.
+        """
+        self.pathfinder.stop()
+
+
+def format_time(seconds: float) -> str:
+    """format_time
+
+    Formats a game time as hours, minutes and seconds.
+
+    Args:
+        seconds (float): the time.
+
+    Returns:
+        str: the time, e.g. 01:05:30.
+    """
+    _minutes, _seconds = divmod(int(seconds), 60)
+    _hours, _minutes = divmod(_minutes, 60)
+    return f"{_hours:02}:{_minutes:02}:{_seconds:02}"
+
+
+def main(args: Optional[list[str]] = None) -> None:
+    """main
+
+    The headless program entry.
+
+    Args:
+        args (Optional[list[str]]): the command line arguments. Defaults to sys.argv.
+    """
+
+    _parser: argparse.ArgumentParser = argparse.ArgumentParser(
+        prog="python -m crawler.sim", description="Run the crawlers without a display."
+    )
+    _parser.add_argument("--hours", type=float, default=1, help="game time to simulate, in hours")
+    _parser.add_argument("--crawlers", type=int, default=9, help="number of crawlers")
+    _parser.add_argument("--sample", type=float, default=60, help="seconds of game time between samples")
+    _parser.add_argument("--dispatch", choices=[c.MAP_OBJECT_POD, c.MAP_OBJECT_SALVAGE], help="send the crawlers out first")
+    _parser.add_argument("--map", default=c.LEVEL_ONE_MAP_FILENAME, help="map file")
+    _parser.add_argument("--csv", help="file to write the resource curves to")
+    _parser.add_argument("--every-step", action="store_true", help="step the crawlers even while they stand still")
+    _options: argparse.Namespace = _parser.parse_args(args)
+
+    _start: float = time.perf_counter()
+
+    _simulation: Simulation = Simulation(_options.map, _options.crawlers)
+    if _options.dispatch is not None:
+        _simulation.dispatch(_options.dispatch)
+
+    _loaded: float = time.perf_counter()
+    _simulation.run(_options.hours * 3600, _options.sample, _options.every_step)
+    _finished: float = time.perf_counter()
+
+    _simulation.stop()
+
+    #  Report the events, then the curves as the mean and lowest level across the crawlers.
+
+    print(f"Events ({len(_simulation.events)}):")
+    for _time, _identifier, _text in _simulation.events:
+        print(f"  {format_time(_time)}  {_identifier}  {_text}")
+
+    print("Resource curves, mean / lowest across the crawlers:")
+    print(f"  {'time':>8}  {'oxygen':>9}  {'power':>9}  {'heat':>9}  {'personnel':>9}  {'failed':>6}")
+
+    _times: list[float] = sorted({_sample["time"] for _sample in _simulation.curves})
+    for _time in _times:
+        _samples: list[dict[str, Any]] = [_sample for _sample in _simulation.curves if _sample["time"] == _time]
+
+        def mean_lowest(field: str) -> str:
+            _values: list[int] = [_sample[field] for _sample in _samples]
+            return f"{sum(_values) / len(_values):5.1f}/{min(_values):3}"
+
+        print(
+            f"  {format_time(_time):>8}  {mean_lowest('oxygen'):>9}  {mean_lowest('power'):>9}  {mean_lowest('heat'):>9}"
+            f"  {sum(_sample['personnel'] for _sample in _samples):>9}  {sum(_sample['failed'] for _sample in _samples):>6}"
+        )
+
+    if _options.csv is not None:
+        with open(_options.csv, "w", newline="") as _file:
+            _writer = csv.DictWriter(_file, fieldnames=CURVE_FIELDS)
+            _writer.writeheader()
+            _writer.writerows(_simulation.curves)
+
+    print(
+        f"Simulated {format_time(_simulation.clock.time)} of {len(_simulation.crawlers)} crawlers"
+        f" in {_finished - _loaded:.1f}s ({_simulation.clock.time / max(_finished - _loaded, 1e-9):.0f}x),"
+        f" after loading in {_loaded - _start:.1f}s."
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,12 +1,18 @@
 #  The Main game state.
 
+from typing import Mapping
+
 import pygame  # type: ignore
 import pygame.event  # type: ignore
 
 import crawler.constants as c
 import crawler.customlogger as customlogger
+from crawler.asset_manager import asset_manager
+from crawler.clock import SimulationClock
+from crawler.config import root_config
 from crawler.console.console import Console
 from crawler.crawler.crawler import Crawler
+from crawler.crawler.lod import LODScheduler
 from crawler.map.map_manager import MapManager
 from crawler.states.state import State
 from crawler.terminal.terminal_manager import TerminalManager
@@ -54,9 +60,15 @@ class Main(State):
         self.connecting: bool = False
         self.connecting_timer: float = 0
 
-        for number in range(9):
+        #  The crawlers are simulated in fixed steps, whatever the frame rate.
+
+        self.clock: SimulationClock = SimulationClock()
+
+        for number in range(root_config.fleet_size):
             self.crawlers.append(Crawler(number))  #  type: ignore
 
+        self.lod: LODScheduler = LODScheduler(self.crawlers)
+
         #  Send message to terminal.
         self.terminal_manager: TerminalManager = TerminalManager()
         self.terminal_manager.message(1, f"Connecting to crawler CRWLR01...")
@@ -69,7 +81,11 @@ class Main(State):
 
         #  Initialise the Console.
 
-        self.console: Console = Console(self.quit)
+        self.console: Console = Console(self.quit, len(self.crawlers))
+
+        #  Log how the assets were loaded.
+
+        asset_manager.log_stats()
 
     def handleKeyEvent(self, event: pygame.event.Event) -> None:  # type: ignore
         """handleKeyEvent
@@ -84,6 +100,16 @@ class Main(State):
         _handled: bool = False
         _handled = self.console.handleKeyEvent(event)
 
+        #  Page up and page down zoom the map in and out.
+
+        if _handled is False and event.type == pygame.KEYDOWN:
+            if event.key == pygame.K_PAGEUP:
+                self.map_manager.zoom(-1)
+                _handled = True
+            elif event.key == pygame.K_PAGEDOWN:
+                self.map_manager.zoom(1)
+                _handled = True
+
         if (
             _handled is False
             and self.console.confirmation.showing is False
@@ -125,8 +151,19 @@ class Main(State):
             dt (float): delta time
         """
 
-        for _crawler in self.crawlers:
-            _crawler.update(dt)
+        #  Take over the map once it has loaded, and report any targets collected.
+
+        for _level, _text in self.map_manager.update():
+            self.terminal_manager.message(_level, _text)
+
+        #  Only the crawlers in view, and the one being driven, are updated every step and drawn.
+
+        self.lod.update(
+            self.clock,
+            self.clock.advance(dt),
+            None if self.map_manager.camera is None else self.map_manager.camera.viewport,
+            int(self.current_crawler_number) - 1,
+        )
 
         _signal: bool = False
         if self.map_manager.loaded is True:
@@ -143,9 +180,12 @@ class Main(State):
 
         _crawler_num: int = int(self.current_crawler_number) - 1
 
-        _short_reports: list[dict[str, int]] = []
-        for _crawler in self.crawlers:
-            _short_reports.append(_crawler.system.short_report())
+        #  The reports are only rebuilt when a crawler's system has changed, every few steps, not every frame,
+        #  and only the crawlers on the crawler panel's page are shown, however many there are.
+
+        _short_reports: list[Mapping[str, int]] = [
+            self.crawlers[_index].system.short_report() for _index in self.console.crawlers_panel.page_numbers
+        ]
 
         self.console.update(
             dt,
@@ -154,17 +194,14 @@ class Main(State):
             self.terminal_manager,
             self.crawlers[_crawler_num].identifier,
             (
-                int(self.crawlers[_crawler_num].position.x),
-                int(self.crawlers[_crawler_num].position.y),
+                int(self.crawlers[_crawler_num].render_position.x),
+                int(self.crawlers[_crawler_num].render_position.y),
             ),
             _short_reports,
             self.crawlers[_crawler_num].system.long_report(),
             self.crawlers[_crawler_num].system.module_report(),
             self.crawlers[_crawler_num].system.personnel_report(),
-            self.map_manager.pod_locations,
-            self.map_manager.salvage_locations,
         )
-        self.crawlers[_crawler_num].system.short_report()
         self.terminal_manager.update(
             self.crawlers,
             self.current_crawler_number,
@@ -175,6 +212,7 @@ class Main(State):
             self.console.toggle_module_report,
             self.console.command_line.set_command_buffer,
             self.console.do_scan,
+            self.map_manager.dispatch,
         )
 
     def render(self, display: pygame.Surface, actualFPS: float) -> None:  # type: ignore
@@ -190,6 +228,7 @@ class Main(State):
         self.console.render(display, actualFPS)
 
     def quit(self) -> None:
+        self.map_manager.cancel()
         self._done = True
 
     def checkDone(self) -> bool:
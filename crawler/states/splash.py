@@ -7,9 +7,11 @@ import pygame.event  # type: ignore
 
 import crawler.constants as c
 import crawler.customlogger as customlogger
+from crawler.asset_manager import asset_manager
 from crawler.config import layout_config
 from crawler.console.console_gui_components.base import Base
 from crawler.console.console_tools.show_text import show_text
+from crawler.crawler.crawler import Crawler
 from crawler.states.state import State
 
 
@@ -49,6 +51,10 @@ class Splash(State):
         self.panel_rect: tuple[int, int, int, int] = c.SCREEN_PANEL_RECT
         self.panel: Base = Base()
 
+        #  Start loading the crawlers' art while the splash and intro screens are shown.
+
+        asset_manager.preload([_path for _art in range(c.CRAWLER_ART_COUNT) for _path in Crawler.frame_paths(_art)])
+
     def handleKeyEvent(self, event: pygame.event.Event) -> None:  # type: ignore
         """handleKeyEvent
 
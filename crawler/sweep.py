@@ -0,0 +1,265 @@
+#  The sweep.py file provides a parameter sweep of the module balancing constants;
+#  it runs a headless Simulation for each combination of values, across all the cores, and tables the results.
+#  e.g. python -m crawler.sweep --grid MAX_CELLS_SUPPLY=5000,10000,20000 --random COOLER_HEAT_WITHDRAWL=0:4 --samples 100
+
+import argparse
+import csv
+import itertools
+import os
+import random
+import sys
+import time
+from concurrent.futures import Future, ProcessPoolExecutor, as_completed
+from typing import Any, Optional
+
+import numpy as np
+
+import crawler.constants as c
+import crawler.crawler.system as system
+import crawler.customlogger as customlogger
+from crawler.map.dispatcher import Dispatcher
+from crawler.sim import Simulation
+
+#  The balancing constants that can be swept, with their default values.
+
+PARAMETERS: dict[str, int] = {
+    _name: _value
+    for _name, _value in vars(system).items()
+    if _name.isupper() and isinstance(_value, int) and not isinstance(_value, bool)
+}
+
+#  The results of each point, after the parameters.
+
+RESULT_FIELDS: list[str] = ["power_failed", "first_death", "peak_heat", "survival", "failed_modules"]
+
+#  The flow fields of each map, worked out once in each worker process.
+
+_dispatchers: dict[str, Dispatcher] = {}
+
+
+def parse_values(text: str) -> tuple[str, str]:
+    """parse_values
+
+    Splits a NAME=VALUES argument, checking the name is a balancing constant.
+
+    Args:
+        text (str): the argument.
+
+    Raises:
+        argparse.ArgumentTypeError: if the argument is not NAME=VALUES, or NAME is not a balancing constant.
+
+    Returns:
+        tuple[str, str]: the name and the values.
+    """
+    _name, _equals, _values = text.partition("=")
+    if not _equals or not _values:
+        raise argparse.ArgumentTypeError(f"Expected NAME=VALUES, got {text}.")
+    if _name not in PARAMETERS:
+        raise argparse.ArgumentTypeError(f"{_name} is not one of {', '.join(PARAMETERS)}.")
+    return (_name, _values)
+
+
+def make_points(
+    grid: list[tuple[str, str]],
+    ranges: list[tuple[str, str]],
+    samples: int,
+    seed: Optional[int],
+) -> list[dict[str, int]]:
+    """make_points
+
+    Makes the points of the sweep; every combination of the grid values,
+    each with a number of random draws from the ranges.
+
+    Args:
+        grid (list[tuple[str, str]]): each name, and its values separated by commas.
+        ranges (list[tuple[str, str]]): each name, and its lowest and highest values separated by a colon.
+        samples (int): the number of random draws, for each combination of the grid values.
+        seed (Optional[int]): the random seed.
+
+    Raises:
+        ValueError: if the values are not whole numbers.
+
+    Returns:
+        list[dict[str, int]]: the value of each swept parameter, for each point.
+    """
+
+    _random: random.Random = random.Random(seed)
+
+    _grid: list[list[tuple[str, int]]] = [
+        [(_name, int(_value)) for _value in _values.split(",")] for _name, _values in grid
+    ]
+    _ranges: list[tuple[str, int, int]] = [
+        (_name, *(int(_value) for _value in _values.split(":", 1))) for _name, _values in ranges  # type: ignore
+    ]
+
+    _points: list[dict[str, int]] = []
+
+    for _combination in itertools.product(*_grid):
+        for _ in range(samples if _ranges else 1):
+            _point: dict[str, int] = dict(_combination)
+            for _name, _lowest, _highest in _ranges:
+                _point[_name] = _random.randint(_lowest, _highest)
+            _points.append(_point)
+
+    return _points
+
+
+def initialise_worker() -> None:
+    #  Only log warnings from the workers, so they don't all write every trace to the log.
+    customlogger.log_level("WARNING")
+
+
+def run_point(
+    index: int,
+    parameters: dict[str, int],
+    minutes: float,
+    crawlers: int,
+    dispatch: Optional[str],
+    filename: str,
+) -> dict[str, Any]:
+    """run_point
+
+    Runs one point of the sweep, in a worker process.
+
+    Args:
+        index (int): the number of the point.
+        parameters (dict[str, int]): the value of each swept parameter.
+        minutes (float): the game time to simulate, in minutes.
+        crawlers (int): the number of crawlers.
+        dispatch (Optional[str]): the type of target to send the crawlers to first, if any.
+        filename (str): the map file.
+
+    Returns:
+        dict[str, Any]: the point, its parameters and its results.
+    """
+
+    #  The System reads the constants each time one is created, so set them all first.
+
+    for _name, _default in PARAMETERS.items():
+        setattr(system, _name, parameters.get(_name, _default))
+
+    _simulation: Simulation = Simulation(filename, crawlers)
+
+    if dispatch is not None:
+        if filename not in _dispatchers:
+            _dispatchers[filename] = Dispatcher(_simulation.registry, _simulation.pathfinder.cost_field.grid)
+        _simulation.dispatcher = _dispatchers[filename].fork(_simulation.registry)
+        _simulation.dispatch(dispatch)
+
+    _simulation.run(minutes * 60, minutes * 60)
+    _simulation.stop()
+
+    return {"point": index, **parameters, **_simulation.summary()}
+
+
+def save_npy(filename: str, names: list[str], rows: list[dict[str, Any]]) -> None:
+    """save_npy
+
+    Saves the results as a structured NumPy array, in point order, with missing times as nan.
+
+    Args:
+        filename (str): the file.
+        names (list[str]): the swept parameters.
+        rows (list[dict[str, Any]]): the results.
+    """
+
+    _dtype: list[tuple[str, Any]] = (
+        [("point", np.int32)]
+        + [(_name, np.int64) for _name in names]
+        + [(_field, np.float64) for _field in RESULT_FIELDS]
+    )
+    _table: np.ndarray = np.zeros(len(rows), dtype=_dtype)
+
+    for _row, _result in enumerate(sorted(rows, key=lambda _result: _result["point"])):
+        _table[_row] = tuple(
+            np.nan if _result[_field] is None else _result[_field] for _field, _ in _dtype
+        )
+
+    np.save(filename, _table)
+
+
+def main(args: Optional[list[str]] = None) -> None:
+    """main
+
+    The sweep program entry.
+
+    Args:
+        args (Optional[list[str]]): the command line arguments. Defaults to sys.argv.
+    """
+
+    _parser: argparse.ArgumentParser = argparse.ArgumentParser(
+        prog="python -m crawler.sweep",
+        description="Run a headless simulation for each combination of balancing constants.",
+        epilog=f"Constants: {', '.join(f'{_name}={_value}' for _name, _value in PARAMETERS.items())}",
+    )
+    _parser.add_argument("--grid", type=parse_values, action="append", default=[], metavar="NAME=V1,V2,...")
+    _parser.add_argument("--random", type=parse_values, action="append", default=[], metavar="NAME=LOW:HIGH")
+    _parser.add_argument("--samples", type=int, default=10, help="random draws for each grid combination")
+    _parser.add_argument("--seed", type=int, help="random seed")
+    _parser.add_argument("--minutes", type=float, default=30, help="game time to simulate for each point")
+    _parser.add_argument("--crawlers", type=int, default=1, help="number of crawlers")
+    _parser.add_argument("--dispatch", choices=[c.MAP_OBJECT_POD, c.MAP_OBJECT_SALVAGE], help="send the crawlers out first")
+    _parser.add_argument("--map", default=c.LEVEL_ONE_MAP_FILENAME, help="map file")
+    _parser.add_argument("--workers", type=int, default=os.cpu_count(), help="worker processes")
+    _parser.add_argument("--csv", default="sweep.csv", help="file the results are streamed to")
+    _parser.add_argument("--npy", help="file to save the results to as a NumPy table, once finished")
+    _options: argparse.Namespace = _parser.parse_args(args)
+
+    try:
+        _points: list[dict[str, int]] = make_points(_options.grid, _options.random, _options.samples, _options.seed)
+    except ValueError as _error:
+        _parser.error(str(_error))
+
+    _names: list[str] = list(dict.fromkeys(_name for _name, _ in _options.grid + _options.random))
+    _rows: list[dict[str, Any]] = []
+    _start: float = time.perf_counter()
+
+    with open(_options.csv, "w", newline="") as _file, ProcessPoolExecutor(
+        _options.workers, initializer=initialise_worker
+    ) as _executor:
+
+        _writer = csv.DictWriter(_file, fieldnames=["point", *_names, *RESULT_FIELDS])
+        _writer.writeheader()
+
+        _futures: list[Future[dict[str, Any]]] = [
+            _executor.submit(
+                run_point,
+                _index,
+                _point,
+                _options.minutes,
+                _options.crawlers,
+                _options.dispatch,
+                _options.map,
+            )
+            for _index, _point in enumerate(_points)
+        ]
+
+        #  Write each result as soon as it is ready.
+
+        for _future in as_completed(_futures):
+            _result: dict[str, Any] = _future.result()
+            _writer.writerow(_result)
+            _file.flush()
+            _rows.append(_result)
+
+            print(
+                f"\r{len(_rows)}/{len(_points)} points, {time.perf_counter() - _start:.0f}s",
+                end="",
+                file=sys.stderr,
+            )
+
+    print(file=sys.stderr)
+
+    if _options.npy is not None:
+        save_npy(_options.npy, _names, _rows)
+
+    print(
+        f"Ran {len(_rows)} points of {_options.minutes:g} minutes on {_options.workers} workers"
+        f" in {time.perf_counter() - _start:.1f}s, results in {_options.csv}"
+        + (f" and {_options.npy}" if _options.npy is not None else "")
+        + "."
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,10 @@
 #  Process command executes commands from the console terminal.
 
-from typing import Callable
+from typing import Callable, Optional
 
+import crawler.constants as c
 from crawler.crawler.crawler import Crawler
+from crawler.crawler.modules.reporting.log import Entry
 
 
 def show_hold(
@@ -248,6 +250,73 @@ def show(
     return buffer
 
 
+def parse_time(text: str) -> Optional[float]:
+    #  Parses a game time given as minutes, or minutes:seconds, returning None if it is neither.
+
+    _parts: list[str] = text.split(":")
+
+    if len(_parts) > 2 or not all(_part.isdigit() for _part in _parts):
+        return None
+
+    return int(_parts[0]) * 60 + (int(_parts[1]) if len(_parts) == 2 else 0)
+
+
+def show_log(
+    buffer: list[tuple[int, str]],
+    command: str,
+    crawlers: list[Crawler],
+) -> list[tuple[int, str]]:
+    command = command.strip()
+
+    #  The crawler number, optionally followed by the earliest and latest times to show,
+    #  as minutes or minutes:seconds; without them the latest entries are shown.
+
+    _parts: list[str] = command.split()
+
+    if len(_parts) == 0 or len(_parts) > 3:
+        return buffer + [(3, f"*** Invalid log request: {command}")]
+
+    if not _parts[0].isdigit():
+        return buffer + [(3, f"*** Invalid crawler number: {_parts[0]}")]
+
+    crawler_num: int = int(_parts[0])
+
+    if crawler_num > len(crawlers) or crawler_num < 1:
+        return buffer + [(3, f"*** Unrecognised crawler number: {crawler_num}")]
+
+    _times: list[Optional[float]] = [parse_time(_part) for _part in _parts[1:]]
+
+    for _part, _time in zip(_parts[1:], _times):
+        if _time is None:
+            return buffer + [(3, f"*** Invalid time: {_part}")]
+
+    _crawler: Crawler = crawlers[crawler_num - 1]
+
+    if len(_times) == 0:
+        _entries: list[Entry] = _crawler.system.journal.latest(c.JOURNAL_LINES_TO_SHOW)
+    else:
+        _entries = _crawler.system.journal.between(*_times)  # type: ignore
+
+    buffer += [(2, f"Log for {_crawler.identifier}")]
+
+    if len(_entries) == 0:
+        return buffer + [(2, "   No entries")]
+
+    if len(_entries) > c.JOURNAL_LINES_TO_SHOW:
+        buffer += [(2, f"   ... {len(_entries) - c.JOURNAL_LINES_TO_SHOW} earlier entries")]
+
+    for _time, _subsystem, _severity, _message in _entries[-c.JOURNAL_LINES_TO_SHOW :]:
+        _minutes, _seconds = divmod(int(_time), 60)
+        buffer += [
+            (
+                3 if _severity == 3 else 2,
+                f"   {_minutes:3}:{_seconds:02}  {_subsystem:20} {_message}",
+            )
+        ]
+
+    return buffer
+
+
 def scan(
     buffer: list[tuple[int, str]],
     command: str,
@@ -265,6 +334,73 @@ def scan(
     return buffer
 
 
+def goto(
+    buffer: list[tuple[int, str]],
+    command: str,
+    crawlers: list[Crawler],
+    current_crawler: int,
+) -> list[tuple[int, str]]:
+    command = command.strip()
+
+    #  The destination is given as on the map grid, col:row counting from 1,
+    #  optionally followed by the crawler number.
+
+    _parts: list[str] = command.split()
+
+    if len(_parts) == 0 or len(_parts) > 2:
+        return buffer + [(3, f"*** Invalid destination: {command}")]
+
+    _coordinates: list[str] = _parts[0].split(":")
+
+    if len(_coordinates) != 2 or not all(_part.isdigit() for _part in _coordinates):
+        return buffer + [(3, f"*** Invalid destination: {_parts[0]}")]
+
+    _col, _row = int(_coordinates[0]), int(_coordinates[1])
+
+    if _col < 1 or _col > c.MAP_TILES_ACROSS or _row < 1 or _row > c.MAP_TILES_DOWN:
+        return buffer + [(3, f"*** Destination off map: {_col}:{_row}")]
+
+    crawler_num: int = current_crawler
+
+    if len(_parts) == 2:
+        if _parts[1].isdigit():
+            crawler_num = int(_parts[1])
+        else:
+            return buffer + [(3, f"*** Invalid crawler number: {_parts[1]}")]
+
+    if crawler_num > len(crawlers) or crawler_num < 1:
+        return buffer + [(3, f"*** Unrecognised crawler number: {crawler_num}")]
+
+    _crawler: Crawler = crawlers[crawler_num - 1]
+
+    if _crawler.goto((_col - 1, _row - 1)) is False:
+        return buffer + [(3, f"*** No signal from {_crawler.identifier}")]
+
+    if _crawler.autopilot.active is False:
+        return buffer + [(3, f"*** No route to {_col}:{_row} for {_crawler.identifier}")]
+
+    buffer += [(2, f"Autopilot engaged for {_crawler.identifier}, heading to {_col}:{_row}")]
+
+    return buffer
+
+
+def dispatch(
+    buffer: list[tuple[int, str]],
+    command: str,
+    start_dispatch: Callable[[str], list[tuple[int, str]]],
+) -> list[tuple[int, str]]:
+    command = command.strip()
+
+    if command.lower().startswith("-p"):
+        buffer += start_dispatch("p")
+    elif command.lower().startswith("-s"):
+        buffer += start_dispatch("s")
+    else:
+        buffer += [(3, f"*** Unrecognised dispatch target: {command}")]
+
+    return buffer
+
+
 def describe_module(
     module: str, buffer: list[tuple[int, str]], num: str, crawlers: list[Crawler]
 ) -> list[tuple[int, str]]:
@@ -437,6 +573,7 @@ def process_command(
     toggle_personnel: Callable[[], None],
     toggle_modules: Callable[[], None],
     start_scan: Callable[[str], None],
+    start_dispatch: Callable[[str], list[tuple[int, str]]],
 ) -> list[tuple[int, str]]:
 
     if command.lower() == "help":
@@ -456,7 +593,19 @@ def process_command(
         buffer.append(
             (2, "   describe module1 n........ describe module1 (etc.) in crawler n")
         )
+        buffer.append(
+            (2, "   dispatch -p............... send idle crawlers to nearest pods")
+        )
+        buffer.append(
+            (2, "   dispatch -s............... send idle crawlers to nearest salvage")
+        )
+        buffer.append(
+            (2, "   goto col:row n............ autopilot crawler 'n' to col:row")
+        )
         buffer.append((2, "   help...................... list available comands"))
+        buffer.append(
+            (2, "   log n [from [to]]......... show the log for crawler 'n', times as mm:ss")
+        )
         buffer.append((2, "   modules................... show module status panel"))
         buffer.append((2, "   options................... show options panel"))
         buffer.append((2, "   personnel................. show personnel status panel"))
@@ -505,6 +654,18 @@ def process_command(
         buffer = describe(buffer, command[9:], crawlers)
         return buffer
 
+    elif command.lower().startswith("dispatch"):
+        buffer = dispatch(buffer, command[9:], start_dispatch)
+        return buffer
+
+    elif command.lower().startswith("goto"):
+        buffer = goto(buffer, command[5:], crawlers, current_crawler)
+        return buffer
+
+    elif command.lower().startswith("log"):
+        buffer = show_log(buffer, command[4:], crawlers)
+        return buffer
+
     elif command.lower() == "modules":
         toggle_modules()
         return buffer
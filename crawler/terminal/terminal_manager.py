@@ -63,6 +63,8 @@ class TerminalManager:
                     self.command += " "
                 if event.key == pygame.K_MINUS:
                     self.command += "-"
+                if event.unicode == ":":
+                    self.command += ":"
 
             elif (_keys[pygame.K_RALT] or _keys[pygame.K_LALT]) and _keys[pygame.K_UP]:
                 self.restore_from_command_history(-1)
@@ -84,6 +86,7 @@ class TerminalManager:
                     self.toggle_personnel,
                     self.toggle_modules,
                     self.start_scan,
+                    self.start_dispatch,
                 )
                 self.buffer_index = len(self.buffer) - c.TERMINAL_LINES_TO_SHOW
                 if self.buffer_index < 0:
@@ -105,6 +108,7 @@ class TerminalManager:
         toggle_modules: Callable[[], None],
         set_command_buffer: Callable[[str], None],
         start_scan: Callable[[str], None],
+        start_dispatch: Callable[[str], list[tuple[int, str]]],
     ) -> None:
         self.crawlers = crawlers
         self.current_crawler = current_crawler
@@ -115,6 +119,7 @@ class TerminalManager:
         self.toggle_modules: Callable[[], None] = toggle_modules
         self.set_command_buffer: Callable[[str], None] = set_command_buffer
         self.start_scan: Callable[[str], None] = start_scan
+        self.start_dispatch: Callable[[str], list[tuple[int, str]]] = start_dispatch
 
     def message(self, level: int, text: str) -> None:
         self.buffer += [(level, text)]
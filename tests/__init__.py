@@ -0,0 +1,2 @@
+#  The tests of the game's fast paths against the code they stand in for,
+#  e.g. python -m unittest discover -s tests -t .
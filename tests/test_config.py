@@ -0,0 +1,41 @@
+#  Tests reading the fleet size from the root config.
+
+import configparser
+import unittest
+
+import crawler.constants as c
+from crawler.config import RootConfig
+
+
+def root_config(size: str) -> RootConfig:
+    """root_config
+
+    Creates a root config with a fleet size entry.
+
+    Args:
+        size (str): the entry.
+
+    Returns:
+        RootConfig: the root config.
+    """
+
+    _config: RootConfig = RootConfig()
+    _config.root_config = configparser.ConfigParser()
+    _config.root_config["fleet"] = {"size": size}
+
+    return _config
+
+
+class TestRootConfig(unittest.TestCase):
+    """TestRootConfig
+
+    Checks the fleet size is read from the config, and falls back to the default if it isn't a whole number above zero.
+    """
+
+    def test_fleet_size(self) -> None:
+        self.assertEqual(root_config("4").fleet_size, 4)
+
+    def test_invalid_fleet_size_falls_back(self) -> None:
+        for _size in ("0", "-3", "abc", "2.5"):
+            with self.subTest(size=_size):
+                self.assertEqual(root_config(_size).fleet_size, c.DEFAULT_FLEET_SIZE)
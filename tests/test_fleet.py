@@ -0,0 +1,75 @@
+#  Tests the Fleet against the systems it holds.
+
+import unittest
+from unittest import mock
+
+import numpy as np
+
+import crawler.crawler.system as system
+from crawler.crawler.fleet import Fleet
+from crawler.crawler.system import System
+
+
+def varied_systems(crawlers: int, generator: np.random.Generator) -> list[System]:
+    """varied_systems
+
+    Creates systems with random supply levels, terrain and optional modules online,
+    so that modules go offline and online, overheat and fail.
+
+    Args:
+        crawlers (int): the number of systems.
+        generator (np.random.Generator): the random numbers.
+
+    Returns:
+        list[System]: the systems.
+    """
+
+    _systems: list[System] = [System() for _ in range(crawlers)]
+
+    for _system in _systems:
+        _system.oxygen.actual_oxygen = int(generator.integers(0, _system.oxygen.max_oxygen))
+        _system.cells.actual_power = int(generator.integers(0, _system.cells.max_power))
+        _system.heat_sink.actual_heat = int(generator.integers(20, _system.heat_sink.max_heat))
+        _system.engine.terrain = int(generator.integers(0, 4))
+        for _module in _system.optional_modules:
+            if generator.random() < 0.5:
+                _module.toggle_online()
+
+    return _systems
+
+
+class TestFleet(unittest.TestCase):
+    """TestFleet
+
+    Steps a fleet of varied systems both ways, with System.update and with a Fleet,
+    and checks that they stay the same, with the flow solver and with the modules updated in order.
+    """
+
+    def test_step_matches_system_update(self) -> None:
+        for _flow in ("SOLVER", "ORDERED"):
+            with self.subTest(flow=_flow), mock.patch.object(system, "FLOW", _flow):
+                _random: np.random.Generator = np.random.default_rng(0)
+                _systems: list[System] = varied_systems(9, _random)
+                _fleet: Fleet = Fleet.from_systems(_systems)
+
+                for _tick in range(400):
+                    _terrain: np.ndarray = _random.integers(0, 4, size=len(_systems))
+
+                    for _system, _crawler_terrain in zip(_systems, _terrain.tolist()):
+                        _system.engine.terrain = _crawler_terrain
+                        _system.update()
+                    _fleet.step(_terrain)
+
+                    _expected: dict[str, np.ndarray] = Fleet.from_systems(_systems).state()
+                    for _name, _array in _fleet.state().items():
+                        np.testing.assert_array_equal(_array, _expected[_name], f"Tick {_tick}: {_name} differs.")
+
+    def test_from_systems_rejects_mixed_flows(self) -> None:
+        with mock.patch.object(system, "FLOW", "SOLVER"):
+            _solved: System = System()
+        with mock.patch.object(system, "FLOW", "ORDERED"):
+            _ordered: System = System()
+
+        with self.assertRaises(ValueError):
+            Fleet.from_systems([_solved, _ordered])
+
@@ -0,0 +1,148 @@
+#  Tests the sharing out of the supplies by the FlowSolver, and solve against solve_array.
+
+import unittest
+from unittest import mock
+
+import numpy as np
+
+import crawler.constants as c
+import crawler.crawler.system as system
+from crawler.crawler.flow import allocate, allocate_array, solve, solve_array
+from crawler.crawler.fleet import Fleet
+from crawler.crawler.system import System
+
+
+def random_requests(generator: np.random.Generator, modules: int, highest: int) -> list[tuple[int, bool]]:
+    """random_requests
+
+    Creates random requests, with amounts from none to the most the supply can hold.
+
+    Args:
+        generator (np.random.Generator): the random numbers.
+        modules (int): the number of requests.
+        highest (int): the highest the supply can be.
+
+    Returns:
+        list[tuple[int, bool]]: each amount asked for, and whether it is essential.
+    """
+    return [
+        (int(generator.choice([0, 1, 2, 1000, int(generator.integers(highest))])), bool(generator.random() < 0.5))
+        for _ in range(modules)
+    ]
+
+
+class TestAllocate(unittest.TestCase):
+    """TestAllocate
+
+    Checks that a supply that can't meet every request is all given out, whatever the order of the requests.
+    """
+
+    def test_leftover_is_given_out(self) -> None:
+        self.assertEqual(allocate([(3, True), (3, True), (3, True)], 5), [2, 2, 1])
+        self.assertEqual(allocate([(3, False), (1, True), (3, False)], 4), [2, 1, 1])
+
+    def test_leftover_goes_by_key_not_order(self) -> None:
+        self.assertEqual(allocate([(3, True), (3, True), (3, True)], 5, [2, 1, 0]), [1, 2, 2])
+
+    def test_allocate_array_matches_allocate(self) -> None:
+        _random: np.random.Generator = np.random.default_rng(0)
+        _requested: np.ndarray = _random.integers(0, 10, size=(500, 6))
+        _essential: np.ndarray = _random.random((500, 6)) < 0.5
+        _budget: np.ndarray = _random.integers(-5, 60, size=500)
+
+        _granted: np.ndarray = allocate_array(_requested, _essential, _budget)
+
+        for _row in range(len(_budget)):
+            self.assertEqual(
+                _granted[_row].tolist(),
+                allocate(list(zip(_requested[_row].tolist(), _essential[_row].tolist())), int(_budget[_row])),
+            )
+
+    def test_low_power_drains(self) -> None:
+        with mock.patch.object(system, "FLOW", "SOLVER"):
+            _system: System = System()
+        _system.cells.actual_power = 5
+
+        for _ in range(3):
+            _system.update()
+
+        self.assertEqual(_system.cells.actual_power, 0)
+        self.assertTrue(
+            all(
+                _module.status != c.MODULE_STATUS_ONLINE
+                for _module in Fleet.modules_of(_system)
+                if _module.power_supply is not None and _module.power_withdrawal
+            )
+        )
+
+
+class TestSolve(unittest.TestCase):
+    """TestSolve
+
+    Resolves random supplies with solve, with the requests in order and shuffled, and with solve_array,
+    and checks that they agree and the levels stay within bounds.
+    """
+
+    def test_solve(self) -> None:
+        _random: np.random.Generator = np.random.default_rng(0)
+        _modules: int = 8
+
+        _levels: list[int] = []
+        _bounds: list[tuple[int, int]] = []
+        _accepts: list[bool] = []
+        _requests: list[tuple[list[tuple[int, bool]], list[tuple[int, bool]]]] = []
+        _results: list[tuple[int, list[bool], list[bool]]] = []
+
+        for _supply in range(2000):
+            _lowest: int = int(_random.choice([0, 20]))
+            _highest: int = int(_random.choice([100, 10000]))
+            _level: int = int(_random.integers(_lowest, _highest + 1))
+            _accept: bool = bool(_random.random() < 0.8)
+            _withdrawals: list[tuple[int, bool]] = random_requests(_random, _modules, _highest)
+            _deposits: list[tuple[int, bool]] = random_requests(_random, _modules, _highest)
+
+            _result: tuple[int, list[bool], list[bool]] = solve(
+                _level, (_lowest, _highest), _accept, _withdrawals, _deposits
+            )
+            self.assertTrue(_lowest <= _result[0] <= _highest, f"Supply {_supply}: level {_result[0]} is out of bounds.")
+
+            #  The same requests in another order, keeping their keys, must have the same outcomes.
+
+            _order: list[int] = _random.permutation(_modules).tolist()
+            _shuffled: tuple[int, list[bool], list[bool]] = solve(
+                _level,
+                (_lowest, _highest),
+                _accept,
+                [_withdrawals[_index] for _index in _order],
+                [_deposits[_index] for _index in _order],
+                _order,
+            )
+            self.assertEqual(
+                _shuffled,
+                (_result[0], [_result[1][_index] for _index in _order], [_result[2][_index] for _index in _order]),
+                f"Supply {_supply}: the order of the requests changed the outcome.",
+            )
+
+            _levels.append(_level)
+            _bounds.append((_lowest, _highest))
+            _accepts.append(_accept)
+            _requests.append((_withdrawals, _deposits))
+            _results.append(_result)
+
+        _array_levels, _withdrawn, _deposited = solve_array(
+            np.array(_levels, dtype=np.int64),
+            np.array([_lowest for _lowest, _ in _bounds], dtype=np.int64),
+            np.array([_highest for _, _highest in _bounds], dtype=np.int64),
+            np.array(_accepts, dtype=bool),
+            np.array([[_amount for _amount, _ in _withdrawals] for _withdrawals, _ in _requests], dtype=np.int64),
+            np.array([[_essential for _, _essential in _withdrawals] for _withdrawals, _ in _requests], dtype=bool),
+            np.array([[_amount for _amount, _ in _deposits] for _, _deposits in _requests], dtype=np.int64),
+            np.array([[_essential for _, _essential in _deposits] for _, _deposits in _requests], dtype=bool),
+        )
+
+        for _row, _result in enumerate(_results):
+            self.assertEqual(
+                (int(_array_levels[_row]), _withdrawn[_row].tolist(), _deposited[_row].tolist()),
+                _result,
+                f"Supply {_row}: solve_array differs from solve.",
+            )
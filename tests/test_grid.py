@@ -0,0 +1,36 @@
+#  Tests drawing the Grid.
+
+import unittest
+from unittest import mock
+
+import pygame
+
+from crawler.map.grid import Grid
+
+
+class TestGrid(unittest.TestCase):
+    """TestGrid
+
+    Checks the labels are scaled once for each zoom, rather than every time the view moves.
+    """
+
+    def setUp(self) -> None:
+        pygame.init()
+        self.grid: Grid = Grid(pygame.sprite.Group(), (60, 60), 255)  # type: ignore
+
+    def test_labels_scaled_once_a_zoom(self) -> None:
+        with (
+            mock.patch("crawler.map.grid.layout_config", font=pygame.font.Font(None, 20)),
+            mock.patch("crawler.map.grid.pygame.transform.smoothscale", wraps=pygame.transform.smoothscale) as _scale,
+        ):
+            self.grid.update_view(pygame.Rect(0, 0, 1920, 1080), 1)
+            _scaled: int = _scale.call_count
+            _image: pygame.Surface = self.grid.image.copy()
+
+            for _offset in range(1, 10):
+                self.grid.update_view(pygame.Rect(_offset * 2, 0, 1920, 1080), 1)
+            self.grid.update_view(pygame.Rect(0, 0, 1920, 1080), 1)
+
+        self.assertGreater(_scaled, 0)
+        self.assertEqual(_scale.call_count, _scaled)
+        self.assertEqual(pygame.image.tobytes(self.grid.image, "RGBA"), pygame.image.tobytes(_image, "RGBA"))
@@ -0,0 +1,50 @@
+#  Tests the Journal against a plain list of entries.
+
+import unittest
+
+import numpy as np
+
+from crawler.crawler.modules.reporting.log import Entry, Journal
+
+
+class TestJournal(unittest.TestCase):
+    """TestJournal
+
+    Logs varied messages to a Journal, and to a plain list, and checks the Journal keeps the same last entries,
+    finds the same entries between times, and has the same latest message for each subsystem.
+    """
+
+    def test_journal_matches_history(self) -> None:
+        _random: np.random.Generator = np.random.default_rng(0)
+        _capacity: int = 64
+        _journal: Journal = Journal(_capacity)
+        _history: list[Entry] = []
+        _latest: dict[str, tuple[str, int, int]] = {}
+
+        for _index in range(5000):
+            _journal.time += float(_random.choice([0, 0, 0.25, 1]))
+            _subsystem: str = f"Module {_random.integers(6) + 1}"
+            _message: str = f"Message {_random.integers(4)}"
+            _percent: int = int(_random.integers(101))
+            _level: int = int(_random.integers(4))
+
+            _journal.log(_subsystem, _message, _percent, _level)
+
+            #  Only a change of message or level is kept in the history.
+
+            if _subsystem not in _latest or (_latest[_subsystem][0], _latest[_subsystem][2]) != (_message, _level):
+                _history.append((_journal.time, _subsystem, _level, _message))
+            _latest[_subsystem] = (_message, _percent, _level)
+
+            self.assertEqual(len(_journal), min(len(_history), _capacity), f"Message {_index}")
+            self.assertEqual(_journal.latest(_capacity), _history[-_capacity:], f"Message {_index}")
+
+            _start: float = float(_random.uniform(0, _journal.time))
+            _end: float = float(_random.uniform(_start, _journal.time))
+            self.assertEqual(
+                _journal.between(_start, _end),
+                [_entry for _entry in _history[-_capacity:] if _start <= _entry[0] <= _end],
+                f"Message {_index}",
+            )
+
+        self.assertEqual(_journal.messages, _latest)
@@ -0,0 +1,82 @@
+#  Tests the Kinematics against moving each crawler with Vector2, as Crawler used to.
+
+import unittest
+
+import numpy as np
+import pygame
+
+import crawler.constants as c
+from crawler.crawler.kinematics import BOTTOM, LEFT, RIGHT, TOP, Kinematics
+from crawler.crawler.modules.engine import Engine
+from crawler.crawler.system import System
+
+
+class TestKinematics(unittest.TestCase):
+    """TestKinematics
+
+    Moves crawlers with random headings, turns, terrain, speeds and time steps, some up against the edges
+    of the map, both with a Kinematics and one at a time with Vector2 and the speed of an Engine,
+    and checks they end up in exactly the same places.
+    """
+
+    def test_integrate_matches_vector2(self) -> None:
+        _crawlers: int = 200
+        _engine: Engine = System().engine
+        _random: np.random.Generator = np.random.default_rng(0)
+        _kinematics: Kinematics = Kinematics()
+        _rows: np.ndarray = np.array([_kinematics.add() for _ in range(_crawlers)])
+
+        _positions: list[pygame.Vector2] = []
+        _rots: list[int] = []
+
+        for _row in _rows:
+            _position: pygame.Vector2 = pygame.Vector2(
+                float(_random.choice([LEFT, RIGHT, _random.uniform(LEFT, RIGHT)])),
+                float(_random.choice([TOP, BOTTOM, _random.uniform(TOP, BOTTOM)])),
+            )
+            _kinematics.position[_row] = _position
+            _positions.append(_position)
+            _rots.append(int(_random.integers(360)))
+            _kinematics.rot[_row] = _rots[-1]
+
+        for _step in range(500):
+            _dt: np.ndarray = c.SIMULATION_STEP * _random.choice([1, 1, 4, 7], size=_crawlers)
+
+            _kinematics.rot_speed[_rows] = _random.choice(
+                [0, 0, c.CRAWLER_ROTATION_SPEED, -c.CRAWLER_ROTATION_SPEED], size=_crawlers
+            )
+            _kinematics.terrain[_rows] = _random.integers(4, size=_crawlers)
+            _kinematics.moving[_rows] = _random.random(_crawlers) < 0.8
+            _kinematics.reversing[_rows] = _random.random(_crawlers) < 0.3
+
+            #  By the rows, and by a slice of them.
+
+            _moved: np.ndarray = _kinematics.integrate(_rows if _step % 2 else slice(0, _crawlers), _dt)
+
+            #  The same, one crawler at a time.
+
+            for _row in _rows.tolist():
+                _rots[_row] = int((_rots[_row] + (float(_kinematics.rot_speed[_row]) * _dt[_row])) % 360)
+
+                _engine.terrain = int(_kinematics.terrain[_row])
+                _engine.moving = bool(_kinematics.moving[_row])
+                _engine.reversing = bool(_kinematics.reversing[_row])
+                _speed: int = _engine.speed
+
+                _velocity: pygame.Vector2 = pygame.Vector2(0, 0)
+                if _kinematics.moving[_row]:
+                    _velocity = pygame.Vector2(-_speed if _kinematics.reversing[_row] else _speed, 0).rotate(
+                        -_rots[_row]
+                    )
+
+                _previous: pygame.Vector2 = pygame.Vector2(_positions[_row])
+                _positions[_row] += _velocity * _dt[_row]
+                _positions[_row].x = min(max(_positions[_row].x, LEFT), RIGHT)
+                _positions[_row].y = min(max(_positions[_row].y, TOP), BOTTOM)
+
+                _message: str = f"Step {_step}, crawler {_row}"
+                self.assertEqual(_kinematics.rot[_row], _rots[_row], _message)
+                self.assertEqual(tuple(_kinematics.velocity[_row]), tuple(_velocity), _message)
+                self.assertEqual(tuple(_kinematics.position[_row]), tuple(_positions[_row]), _message)
+                self.assertEqual(tuple(_kinematics.previous[_row]), tuple(_previous), _message)
+                self.assertEqual(bool(_moved[_row]), _positions[_row] != _previous, _message)
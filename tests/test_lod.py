@@ -0,0 +1,82 @@
+#  Tests the LODScheduler against updating every crawler every step.
+
+import unittest
+
+import numpy as np
+import pygame
+
+import crawler.constants as c
+from crawler.crawler.crawler import Crawler
+from crawler.crawler.kinematics import Kinematics
+from crawler.crawler.lod import LODScheduler
+from crawler.sim import Simulation
+
+
+class TestLODScheduler(unittest.TestCase):
+    """TestLODScheduler
+
+    Checks that moving a crawler's animation frame on by a number of steps at once matches moving it on
+    one step at a time, and that crawlers standing still in the background, their steady system updates skipped,
+    end up with the same journals, and statuses, as if each had been updated every step.
+    """
+
+    def test_frames_at_once_match_one_at_a_time(self) -> None:
+        _random: np.random.Generator = np.random.default_rng(0)
+
+        #  Two crawlers with the same frames, moving, one moved on by a number of steps and the other a step at a time.
+
+        _at_once, _one_at_a_time = Crawler(0), Crawler(0)
+        _kinematics: Kinematics = Kinematics.join([_at_once, _one_at_a_time])
+        _kinematics.velocity[_at_once.row] = (1, 0)
+        _kinematics.velocity[_one_at_a_time.row] = (1, 0)
+
+        for _index in range(1000):
+            _reversing: bool = bool(_random.random() < 0.5)
+            _steps: int = int(_random.integers(1, 30))
+
+            _at_once.system.engine.reversing = _reversing
+            _at_once.setNextFrame(_steps)
+
+            _one_at_a_time.system.engine.reversing = _reversing
+            for _ in range(_steps):
+                _one_at_a_time.setNextFrame()
+
+            self.assertIs(_at_once.crawlerImage, _one_at_a_time.crawlerImage, f"Move {_index}")
+
+    def test_background_matches_every_step(self) -> None:
+        _random: np.random.Generator = np.random.default_rng(0)
+
+        _stepped: Simulation = Simulation()
+        _scheduled: Simulation = Simulation()
+
+        try:
+
+            #  The crawlers standing still, all but the first in the background, at frame rates that vary.
+
+            _lod: LODScheduler = LODScheduler(_scheduled.crawlers, margin=0)
+
+            for _ in range(2000):
+                _dt: float = float(_random.uniform(0.002, 0.05))
+                for _ in range(_stepped.clock.advance(_dt)):
+                    for _crawler in _stepped.crawlers:
+                        _crawler.update(_stepped.clock.step)
+                _lod.update(_scheduled.clock, _scheduled.clock.advance(_dt), pygame.Rect(0, 0, 1, 1), 0)
+
+            #  Settle what is owed, so both have run the same steps.
+
+            for _index in range(len(_scheduled.crawlers)):
+                if _lod.owed[_index]:
+                    _lod.settle(_index, _scheduled.clock.step, _lod.owed[_index])
+
+            self.assertGreater(_lod.skips, 0)
+            self.assertGreater(sum(_crawler.scheduler.skipped for _crawler in _scheduled.crawlers), 0)
+
+            for _a, _b in zip(_stepped.crawlers, _scheduled.crawlers):
+                self.assertEqual(_a.steps, _b.steps)
+                self.assertEqual(
+                    _a.system.journal.latest(c.JOURNAL_CAPACITY), _b.system.journal.latest(c.JOURNAL_CAPACITY)
+                )
+                self.assertEqual(Simulation.statuses(_a), Simulation.statuses(_b))
+        finally:
+            _stepped.stop()
+            _scheduled.stop()
@@ -0,0 +1,85 @@
+#  Tests the SystemScheduler against System.update.
+
+import unittest
+from unittest import mock
+
+import numpy as np
+
+from crawler.crawler import system
+from crawler.crawler.scheduler import SystemScheduler
+from crawler.crawler.system import System
+from tests.test_fleet import varied_systems
+
+
+class TestSystemScheduler(unittest.TestCase):
+    """TestSystemScheduler
+
+    Moves varied systems on with a SystemScheduler, and copies of them with System.update,
+    in uneven amounts, and checks that they stay the same, with the flow solver and with the modules
+    updated in order; and that the steady updates left over are dropped once the system is changed.
+    """
+
+    def test_advance_matches_system_update(self) -> None:
+        for _flow in ("SOLVER", "ORDERED"):
+            with self.subTest(flow=_flow), mock.patch.object(system, "FLOW", _flow):
+                _scheduled: list[System] = varied_systems(10, np.random.default_rng(0))
+                _plain: list[System] = varied_systems(10, np.random.default_rng(0))
+                _random: np.random.Generator = np.random.default_rng(1)
+
+                for _index, (_system, _copy) in enumerate(zip(_scheduled, _plain)):
+                    _scheduler: SystemScheduler = SystemScheduler(_system)
+                    _done: int = 0
+
+                    while _done < 5000:
+                        _amount: int = min(int(_random.integers(1, 2000)), 5000 - _done)
+                        _scheduler.advance(_amount)
+                        for _ in range(_amount):
+                            _copy.update()
+                        _done += _amount
+
+                        _message: str = f"System {_index} differs after {_done} updates."
+                        _expected: SystemScheduler = SystemScheduler(_copy)
+                        self.assertEqual(_scheduler.state(), _expected.state(), _message)
+                        self.assertEqual(_scheduler.levels(), _expected.levels(), _message)
+
+    def test_moving_engine_skips(self) -> None:
+
+        #  A running engine moves the heat every update; the heat is steady too, until it reaches 80%.
+
+        _system: System = System()
+        _copy: System = System()
+        for _crawler_system in (_system, _copy):
+            _crawler_system.engine.moving = True
+            _crawler_system.engine.terrain = 3
+
+        _scheduler: SystemScheduler = SystemScheduler(_system)
+        _scheduler.advance(2000)
+        for _ in range(2000):
+            _copy.update()
+
+        self.assertGreater(_scheduler.skipped, 0)
+        self.assertEqual(_scheduler.levels(), SystemScheduler(_copy).levels())
+        self.assertEqual(_scheduler.state(), SystemScheduler(_copy).state())
+
+    def test_change_drops_steady_updates(self) -> None:
+        _system: System = System()
+        _copy: System = System()
+        _scheduler: SystemScheduler = SystemScheduler(_system)
+
+        #  One update at a time, so that steady updates are left over between calls.
+
+        for _update in range(600):
+            if _update == 300:
+                for _toggled in (_system, _copy):
+                    _toggled.toggle_online(_toggled.optional_modules[0])
+            _scheduler.update(1)
+            _copy.update()
+
+            self.assertEqual(_scheduler.levels(), SystemScheduler(_copy).levels(), f"Update {_update}")
+
+    def test_advance_skips_steady_updates(self) -> None:
+        _scheduler: SystemScheduler = SystemScheduler(System())
+        _scheduler.advance(5000)
+
+        self.assertEqual(_scheduler.updates + _scheduler.skipped, 5000)
+        self.assertGreater(_scheduler.skipped, 0)
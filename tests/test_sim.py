@@ -0,0 +1,54 @@
+#  Tests the Simulation, skipping the crawlers standing still, against stepping every crawler every step.
+
+import unittest
+from typing import Any, Optional
+
+import crawler.constants as c
+from crawler.sim import Simulation
+
+
+def run(seconds: float, dispatch: Optional[str], every_step: bool) -> tuple[Any, ...]:
+    """run
+
+    Runs a simulation of the first level.
+
+    Args:
+        seconds (float): the game time, in seconds.
+        dispatch (Optional[str]): what to send the crawlers out to first, if anything.
+        every_step (bool): step the crawlers even while they are standing still.
+
+    Returns:
+        tuple[Any, ...]: the events, curves, summary and ticks.
+    """
+
+    _simulation: Simulation = Simulation(c.LEVEL_ONE_MAP_FILENAME, 9)
+    try:
+        if dispatch is not None:
+            _simulation.dispatch(dispatch)
+        _simulation.run(seconds, 60, every_step)
+        return _simulation.events, _simulation.curves, _simulation.summary(), _simulation.clock.ticks
+    finally:
+        _simulation.stop()
+
+
+class TestSimulation(unittest.TestCase):
+    """TestSimulation
+
+    Runs the simulation with and without stepping the crawlers standing still, and checks the runs are the same.
+    """
+
+    def test_stationary_matches_every_step(self) -> None:
+        self.assertEqual(run(600, None, False), run(600, None, True))
+
+    def test_dispatched_matches_every_step(self) -> None:
+        self.assertEqual(run(600, c.MAP_OBJECT_SALVAGE, False), run(600, c.MAP_OBJECT_SALVAGE, True))
+
+    def test_power_failure_is_recorded(self) -> None:
+        _simulation: Simulation = Simulation(c.LEVEL_ONE_MAP_FILENAME, 1)
+        try:
+            _simulation.crawlers[0].system.cells.actual_power = 100
+            _simulation.run(60, 60)
+        finally:
+            _simulation.stop()
+
+        self.assertIsNotNone(_simulation.summary()["power_failed"])
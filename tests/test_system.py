@@ -0,0 +1,29 @@
+#  Tests the System's cached reports.
+
+import unittest
+
+from crawler.crawler.system import System
+
+
+class TestSystem(unittest.TestCase):
+    """TestSystem
+
+    Checks the short report is shared until the system changes, and can't be changed by its readers.
+    """
+
+    def test_short_report_is_shared_and_read_only(self) -> None:
+        _system: System = System()
+        _report = _system.short_report()
+
+        self.assertIs(_system.short_report(), _report)
+        with self.assertRaises(TypeError):
+            _report["cells"] = 0  # type: ignore
+
+    def test_short_report_rebuilt_after_change(self) -> None:
+        _system: System = System()
+        _report = _system.short_report()
+
+        _system.engine.terrain = 3
+
+        self.assertIsNot(_system.short_report(), _report)
+        self.assertEqual(_system.short_report()["terrain"], 3)